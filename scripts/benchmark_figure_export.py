@@ -0,0 +1,70 @@
+"""Benchmarks exporting plotly figures to PNG with the export pool
+
+Compares exporting a batch of figures one at a time with plotly's `to_image`
+(how figures used to be exported) against exporting them concurrently with the
+`PlotlyExportPool` used by `Figure`.
+
+Usage:
+    python scripts/benchmark_figure_export.py [--figures 100] [--workers 4]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import plotly.graph_objs as go
+
+from validmind.vm_models.figure_export import DEFAULT_MAX_WORKERS, PlotlyExportPool
+
+
+def make_figures(n):
+    rng = np.random.default_rng(0)
+
+    return [
+        go.Figure(
+            [
+                go.Scatter(y=rng.normal(size=500).cumsum(), name="series"),
+                go.Histogram(x=rng.normal(size=2000), name="distribution"),
+            ],
+            layout={"title": f"Figure {i}"},
+        )
+        for i in range(n)
+    ]
+
+
+def benchmark(name, export, figures):
+    # warm up (start the kaleido processes) so we only time the exports
+    export(figures[:1])
+
+    start = time.perf_counter()
+    images = export(figures)
+    elapsed = time.perf_counter() - start
+
+    assert all(image.startswith(b"\x89PNG") for image in images)
+    print(f"{name}: {elapsed:.2f}s ({len(figures) / elapsed:.1f} figures/s)")
+
+    return elapsed
+
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--figures", type=int, default=100)
+parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+args = parser.parse_args()
+
+figures = make_figures(args.figures)
+
+serial = benchmark(
+    "to_image (serial)",
+    lambda figures: [figure.to_image(format="png") for figure in figures],
+    figures,
+)
+
+pool = PlotlyExportPool(max_workers=args.workers)
+# warm up every worker, not just the first one
+pool.export(figures[: args.workers])
+try:
+    pooled = benchmark(f"export pool ({args.workers} workers)", pool.export, figures)
+finally:
+    pool.shutdown()
+
+print(f"speedup: {serial / pooled:.2f}x")
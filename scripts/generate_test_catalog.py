@@ -0,0 +1,128 @@
+"""Generates the catalog of test metadata in validmind/tests/__catalog__.py
+
+The catalog lets `list_tests`, `describe_test`, `list_tags` and `list_tasks` answer
+without importing every test module. The metadata of function tests whose
+dependencies aren't installed is read from their source instead (install all
+extras to regenerate everything from the loaded tests).
+
+Usage:
+    python scripts/generate_test_catalog.py
+"""
+
+import ast
+from pathlib import Path
+
+from validmind.__version__ import __version__
+from validmind.errors import MissingDependencyError
+from validmind.tests._store import test_store
+from validmind.tests.decorator import _input_type_map
+from validmind.tests.load import _get_test_metadata, load_test
+
+base_path = Path(__file__).parent.parent / "validmind" / "tests"
+catalog_path = base_path / "__catalog__.py"
+
+
+def parse_test_module(test_id):
+    path = base_path.joinpath(*test_id.split(".")[1:]).with_suffix(".py")
+
+    return ast.parse(path.read_text())
+
+
+def get_dependencies(test_id):
+    """Find the `MissingDependencyError` raised by a test module if an import fails"""
+    for node in ast.walk(parse_test_module(test_id)):
+        if not isinstance(node, ast.Raise) or not isinstance(node.exc, ast.Call):
+            continue
+
+        if getattr(node.exc.func, "id", None) != "MissingDependencyError":
+            continue
+
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.exc.keywords}
+
+        return kwargs.get("required_dependencies", []), kwargs.get("extra")
+
+    return [], None
+
+
+def get_source_metadata(test_id):
+    """Read the metadata of a function test from its source without importing it
+
+    Mirrors how the `test` decorator builds the test class from the function.
+    """
+    name = test_id.split(".")[-1]
+    func = next(
+        node
+        for node in parse_test_module(test_id).body
+        if isinstance(node, ast.FunctionDef) and node.name == name
+    )
+
+    decorators = {
+        decorator.func.id: [ast.literal_eval(arg) for arg in decorator.args]
+        for decorator in func.decorator_list
+        if isinstance(decorator, ast.Call)
+    }
+
+    args = func.args.args
+    defaults = [None] * (len(args) - len(func.args.defaults)) + [
+        ast.literal_eval(default) for default in func.args.defaults
+    ]
+
+    return {
+        "description": ast.get_docstring(func).strip(),
+        "required_inputs": [arg.arg for arg in args if arg.arg in _input_type_map],
+        "default_params": {
+            arg.arg: default
+            for arg, default in zip(args, defaults)
+            if arg.arg not in _input_type_map
+        },
+        "tasks": decorators.get("tasks", []),
+        "tags": decorators.get("tags", []),
+    }
+
+
+tests = {}
+
+for test_id in sorted(test_store.get_test_ids()):
+    try:
+        metadata = _get_test_metadata(load_test(test_id))
+    except MissingDependencyError:
+        print(f"Reading metadata for {test_id} from source as it can't be imported")
+        metadata = get_source_metadata(test_id)
+
+    required_dependencies, extra = get_dependencies(test_id)
+    metadata["required_dependencies"] = required_dependencies
+    metadata["extra"] = extra
+
+    # make sure the metadata can be written out as python literals
+    assert ast.literal_eval(repr(metadata)) == metadata, test_id
+
+    tests[test_id] = metadata
+
+
+entries = "".join(
+    f"    {test_id!r}: {{\n"
+    + "".join(f"        {key!r}: {value!r},\n" for key, value in metadata.items())
+    + "    },\n"
+    for test_id, metadata in tests.items()
+)
+
+source = f'''# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""Metadata for the built-in tests.
+
+This module is auto-generated by running `make generate-test-catalog`.
+Should not be modified manually.
+"""
+
+VERSION = "{__version__}"
+
+TESTS = {{
+{entries}}}
+'''
+
+with open(catalog_path, "w") as f:
+    f.write(source)
+
+print(f"Generated catalog of {len(tests)} tests and saved in {catalog_path}")
@@ -2,10 +2,13 @@ import asyncio
 import json
 import os
 import unittest
+from collections import defaultdict
 from unittest.mock import MagicMock, Mock, patch
 
 import matplotlib.pyplot as plt
+from aiohttp import web
 from aiohttp.formdata import FormData
+from aiohttp.test_utils import TestServer
 
 # simluate environment variables being set
 os.environ["VM_API_KEY"] = "your_api_key"
@@ -26,6 +29,10 @@ from validmind.vm_models.figure import Figure
 loop = asyncio.new_event_loop()
 
 
+def tearDownModule():
+    loop.close()
+
+
 def mock_figure():
     fig = plt.figure()
     plt.plot([1, 2, 3])
@@ -44,11 +51,12 @@ class MockResponse:
 
 
 class MockAsyncResponse:
-    def __init__(self, status, text=None, json=None):
+    def __init__(self, status, text=None, json=None, headers=None):
         self.status = status
         self.status_code = status
         self._text = text
         self._json = json
+        self.headers = headers or {}
 
     async def text(self):
         return self._text
@@ -64,9 +72,6 @@ class MockAsyncResponse:
 
 
 class TestAPIClient(unittest.TestCase):
-    def tearDownClass():
-        loop.close()
-
     def run_async(self, func, *args, **kwargs):
         return loop.run_until_complete(func(*args, **kwargs))
 
@@ -219,6 +224,269 @@ class TestAPIClient(unittest.TestCase):
             url, data=json.dumps({"key": "value", "inputs": ["input1"]})
         )
 
+    @patch("validmind.api_client._get_retry_delay", return_value=0)
+    @patch("aiohttp.ClientSession.post")
+    def test_post_retries_transient_errors(self, mock_post, mock_delay):
+        mock_post.side_effect = [
+            MockAsyncResponse(503, text="Service Unavailable"),
+            MockAsyncResponse(
+                429, text="Too Many Requests", headers={"Retry-After": "1"}
+            ),
+            MockAsyncResponse(200, json={"cuid": "abc1234"}),
+        ]
+
+        response = self.run_async(api_client.log_figure, mock_figure())
+
+        self.assertEqual(response, {"cuid": "abc1234"})
+        self.assertEqual(mock_post.call_count, 3)
+        mock_delay.assert_called_with(1, "1")
+
+        # each attempt sends a new form since a form can only be sent once
+        forms = [call[1]["data"] for call in mock_post.call_args_list]
+        self.assertEqual(len(set(map(id, forms))), 3)
+
+    @patch("validmind.api_client._get_retry_delay", return_value=0)
+    @patch("aiohttp.ClientSession.post")
+    def test_post_does_not_retry_client_errors(self, mock_post, mock_delay):
+        mock_post.return_value = MockAsyncResponse(
+            400, text=json.dumps({"code": "invalid_json", "message": "Bad JSON"})
+        )
+
+        with self.assertRaises(APIRequestError):
+            self.run_async(api_client.log_metadata, "1234", text="Some Text")
+
+        mock_post.assert_called_once()
+        mock_delay.assert_not_called()
+
+    @patch("validmind.api_client._get_retry_delay", return_value=0)
+    @patch("aiohttp.ClientSession.post")
+    def test_post_does_not_retry_requests_that_may_have_been_handled(
+        self, mock_post, mock_delay
+    ):
+        # the API may have logged the result before the gateway error or timeout
+        for error in [
+            MockAsyncResponse(504, text="Gateway Timeout"),
+            asyncio.TimeoutError(),
+        ]:
+            mock_post.reset_mock()
+            mock_post.side_effect = [error, MockAsyncResponse(200, json={})]
+
+            with self.assertRaises((APIRequestError, asyncio.TimeoutError)):
+                self.run_async(api_client.log_metadata, "1234", text="Some Text")
+
+            mock_post.assert_called_once()
+
+        mock_delay.assert_not_called()
+
+    @patch("validmind.api_client._get_retry_delay", return_value=0)
+    @patch("aiohttp.ClientSession.get")
+    def test_get_retries_gateway_errors(self, mock_get, mock_delay):
+        mock_get.side_effect = [
+            MockAsyncResponse(504, text="Gateway Timeout"),
+            asyncio.TimeoutError(),
+            MockAsyncResponse(200, json=[{"cuid": "1234"}]),
+        ]
+
+        response = self.run_async(api_client.get_metadata, "content_id")
+
+        self.assertEqual(response, [{"cuid": "1234"}])
+        self.assertEqual(mock_get.call_count, 3)
+
+
+class MockAPIServer:
+    """Local stand-in for the ValidMind API to test the API client offline
+
+    Records the requests sent to the logging endpoints and returns canned responses.
+    `failures` sets how many times an endpoint fails with the given status before
+    succeeding e.g. `{"log_metrics": (503, 2)}`.
+    """
+
+    ENDPOINTS = [
+        "log_figure",
+        "log_input",
+        "log_metadata",
+        "log_metrics",
+        "log_test_results",
+        "log_unit_metric",
+    ]
+
+    def __init__(self, failures=None, invalid_keys=None):
+        self.requests = defaultdict(list)
+        self.failures = dict(failures or {})
+        self.invalid_keys = set(invalid_keys or [])
+
+        app = web.Application()
+        for endpoint in self.ENDPOINTS:
+            app.router.add_post(f"/{endpoint}", self._handler(endpoint))
+
+        self._server = TestServer(app)
+
+    @property
+    def url(self):
+        return str(self._server.make_url("/"))
+
+    async def start(self):
+        await self._server.start_server()
+
+    async def close(self):
+        await self._server.close()
+
+    def _handler(self, endpoint):
+        async def handler(request):
+            if request.content_type == "multipart/form-data":
+                body = dict(await request.post())
+            else:
+                body = json.loads(await request.text())
+
+            self.requests[endpoint].append(
+                {"params": dict(request.query), "body": body}
+            )
+
+            if isinstance(body, list) and any(
+                item.get("key") in self.invalid_keys for item in body
+            ):
+                return web.Response(status=400, text="Invalid metric")
+
+            status, count = self.failures.get(endpoint, (200, 0))
+            if count > 0:
+                self.failures[endpoint] = (status, count - 1)
+                return web.Response(status=status, text="Service Unavailable")
+
+            return web.json_response(
+                {"cuid": f"{endpoint}-{len(self.requests[endpoint])}"}
+            )
+
+        return handler
+
+
+class TestAPIClientBatching(unittest.TestCase):
+    """Test request coalescing against a local stand-in for the API"""
+
+    def setUp(self):
+        self.server = MockAPIServer(failures={"log_figure": (503, 1)})
+        loop.run_until_complete(self.server.start())
+
+        self._api_host = api_client._api_host
+        api_client._api_host = self.server.url
+
+    def tearDown(self):
+        loop.run_until_complete(self.server.close())
+        api_client._api_host = self._api_host
+
+    def run_async(self, func, *args, **kwargs):
+        return loop.run_until_complete(func(*args, **kwargs))
+
+    def test_log_metric_results_are_batched(self):
+        metrics = [
+            Mock(serialize=MagicMock(return_value={"key": f"metric_{i}"}))
+            for i in range(120)
+        ]
+
+        async def log_all():
+            return await asyncio.gather(
+                *[api_client.log_metric_result(m, inputs=["input1"]) for m in metrics],
+                api_client.log_metric_result(
+                    metrics[0], inputs=["input1"], section_id="section"
+                ),
+            )
+
+        responses = self.run_async(log_all)
+
+        requests = self.server.requests["log_metrics"]
+        # 120 metrics are sent in batches of 50 and the one with a section_id on its own
+        self.assertEqual(sorted(len(r["body"]) for r in requests), [1, 20, 50, 50])
+        self.assertEqual(
+            [r["params"] for r in requests if len(r["body"]) == 1],
+            [{"section_id": "section"}],
+        )
+        self.assertEqual(
+            sorted(m["key"] for r in requests if not r["params"] for m in r["body"]),
+            sorted(f"metric_{i}" for i in range(120)),
+        )
+        self.assertEqual(len(responses), 121)
+
+    def test_invalid_item_only_fails_its_caller(self):
+        self.server.invalid_keys = {"metric_2"}
+        metrics = [
+            Mock(serialize=MagicMock(return_value={"key": f"metric_{i}"}))
+            for i in range(5)
+        ]
+
+        async def log_all():
+            return api_client._get_batcher(), await asyncio.gather(
+                *[api_client.log_metric_result(m, inputs=["input1"]) for m in metrics],
+                return_exceptions=True,
+            )
+
+        batcher, responses = self.run_async(log_all)
+
+        # the rejected batch is sent again one item at a time
+        requests = self.server.requests["log_metrics"]
+        self.assertEqual([len(r["body"]) for r in requests], [5, 1, 1, 1, 1, 1])
+        self.assertIsInstance(responses[2], APIRequestError)
+        self.assertTrue(
+            all(isinstance(r, dict) for i, r in enumerate(responses) if i != 2)
+        )
+        # the batcher keeps a reference to its send tasks until they are done
+        self.assertEqual(batcher._tasks, set())
+
+    def test_failed_batch_is_not_resent(self):
+        # the API may have stored the batch before the gateway error
+        self.server.failures["log_metrics"] = (502, 1)
+        metrics = [
+            Mock(serialize=MagicMock(return_value={"key": f"metric_{i}"}))
+            for i in range(5)
+        ]
+
+        async def log_all():
+            return await asyncio.gather(
+                *[api_client.log_metric_result(m, inputs=["input1"]) for m in metrics],
+                return_exceptions=True,
+            )
+
+        responses = self.run_async(log_all)
+
+        self.assertEqual(len(self.server.requests["log_metrics"]), 1)
+        self.assertTrue(all(isinstance(r, APIRequestError) for r in responses))
+        self.assertEqual(responses[0].status, 502)
+
+    @patch("validmind.api_client._get_retry_delay", return_value=0)
+    def test_log_figure_retries(self, mock_delay):
+        response = self.run_async(api_client.log_figure, mock_figure())
+
+        self.assertEqual(len(self.server.requests["log_figure"]), 2)
+        self.assertEqual(response, {"cuid": "log_figure-2"})
+
+        # multipart form is sent in full on the retry
+        body = self.server.requests["log_figure"][1]["body"]
+        self.assertEqual(body["key"], "key")
+        self.assertEqual(body["image"].filename, "key.png")
+
+
+class TestCloseSession(unittest.TestCase):
+    def test_session_of_closed_loop_is_closed(self):
+        async def get_session():
+            return api_client._get_session()
+
+        def run_and_close(coro):
+            # like `asyncio.run` without unsetting the current event loop, which
+            # `run_async` relies on in the tests run after this one
+            _loop = asyncio.new_event_loop()
+            try:
+                return _loop.run_until_complete(coro)
+            finally:
+                _loop.close()
+
+        # the loop is closed with the session still open
+        session = run_and_close(get_session())
+        self.assertFalse(session.closed)
+
+        api_client._close_session()
+        self.assertTrue(session.closed)
+
+        # a new session is created the next time one is needed
+        self.assertIsNot(run_and_close(get_session()), session)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+"""
+Unit tests for the artifacts shared between tests through the TestContext
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from validmind.tests.artifacts import correlation_matrix, value_counts
+from validmind.tests.load import load_test
+from validmind.tests.run import _run_test_class
+from validmind.vm_models.dataset.dataset import DataFrameDataset
+from validmind.vm_models.dataset.profile import pearson_correlation
+from validmind.vm_models.dataset.utils import fingerprint_values
+from validmind.vm_models.test_context import ArtifactCache, TestContext
+
+
+class TestArtifactCache(TestCase):
+    def test_computes_once_across_threads(self):
+        cache = ArtifactCache()
+        calls = []
+        lock = threading.Lock()
+
+        def compute():
+            with lock:
+                calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: cache.get("key", compute), range(8)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestArtifacts(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "a": np.arange(10, dtype=float),
+                "b": np.arange(10, dtype=float) ** 2,
+                "c": list("xyxyxyxyxz"),
+                "target": [0, 1] * 5,
+            }
+        )
+        self.dataset = DataFrameDataset(raw_dataset=self.df, target_column="target")
+
+    def test_artifact_without_context(self):
+        self.assertIsNot(
+            correlation_matrix(self.dataset), correlation_matrix(self.dataset)
+        )
+        pd.testing.assert_frame_equal(
+            correlation_matrix(self.dataset), self.df.corr(numeric_only=True)
+        )
+
+    def test_artifact_is_shared_within_context(self):
+        context = TestContext()
+
+        with context.activate():
+            corr = correlation_matrix(self.dataset)
+            self.assertIs(correlation_matrix(self.dataset), corr)
+
+            # different arguments are different artifacts
+            self.assertIsNot(
+                value_counts(self.dataset, "c"), value_counts(self.dataset, "target")
+            )
+
+        self.assertEqual(len(context.artifacts), 3)
+
+        # the context is only active within the block
+        self.assertIsNot(correlation_matrix(self.dataset), corr)
+
+    def test_artifact_changes_with_dataset(self):
+        context = TestContext()
+
+        with context.activate():
+            counts = value_counts(self.dataset, "c")
+
+            # a different dataset with the same column
+            other_df = self.df.copy()
+            other_df["c"] = list("xxxxxxxxxx")
+            other = DataFrameDataset(raw_dataset=other_df, target_column="target")
+            self.assertEqual(value_counts(other, "c").to_dict(), {"x": 10})
+
+            # the same dataset after a column is added: only the artifacts that
+            # read all the columns change
+            self.dataset.add_extra_column("d", np.ones(10))
+            self.assertIs(value_counts(self.dataset, "c"), counts)
+            self.assertIn("d", correlation_matrix(self.dataset).columns)
+
+    def test_artifact_key_only_hashes_columns_read(self):
+        context = TestContext()
+
+        with context.activate(), patch.object(
+            self.dataset, "fingerprint", wraps=self.dataset.fingerprint
+        ) as mock_fingerprint:
+            counts = value_counts(self.dataset, "c")
+            mock_fingerprint.assert_called_once()
+            self.assertEqual(mock_fingerprint.call_args.args, (["c"],))
+
+            # changing a column the artifact doesn't read keeps the artifact
+            self.df.loc[0, "a"] = 100.0
+            self.assertIs(value_counts(self.dataset, "c"), counts)
+
+        # the user's data is assumed not to change during a run so changes to it are
+        # picked up by the next run
+        self.df.loc[0, "c"] = "z"
+        with TestContext().activate():
+            self.assertEqual(value_counts(self.dataset, "c")["z"], 2)
+
+    def test_artifact_lookup_hashes_shared_columns_once(self):
+        context = TestContext()
+
+        with context.activate(), patch(
+            "validmind.vm_models.dataset.dataset.fingerprint_values",
+            wraps=fingerprint_values,
+        ) as mock_fingerprint_values:
+            counts = value_counts(self.dataset, "c")
+            calls = mock_fingerprint_values.call_count
+            self.assertGreater(calls, 0)
+
+            # finding the cached artifact doesn't hash the data again
+            self.assertIs(value_counts(self.dataset, "c"), counts)
+            self.assertEqual(mock_fingerprint_values.call_count, calls)
+
+    def test_tests_share_artifacts(self):
+        context = TestContext()
+
+        with patch(
+            "validmind.tests.artifacts.pearson_correlation",
+            wraps=pearson_correlation,
+        ) as mock_corr:
+            for test_id in [
+                "validmind.data_validation.PearsonCorrelationMatrix",
+                "validmind.data_validation.HighPearsonCorrelation",
+            ]:
+                _run_test_class(
+                    load_test(test_id),
+                    test_id=test_id,
+                    inputs={"dataset": self.dataset},
+                    generate_description=False,
+                    context=context,
+                )
+
+        self.assertEqual(mock_corr.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,7 +17,9 @@ from validmind import (
     get_test_suite,
     run_documentation_tests,
 )
-from validmind.errors import UnsupportedModelError
+from validmind.errors import APIRequestError, UnsupportedModelError
+from validmind.input_registry import input_registry
+from validmind.utils import wait_for_background_tasks
 
 
 @dataclass
@@ -67,6 +69,10 @@ class MockedConfig:
 
 
 class TestInitDataset(TestCase):
+    def tearDown(self):
+        # inputs are logged in the background so wait for them while mocks are active
+        wait_for_background_tasks()
+
     @mock.patch(
         "validmind.client.log_input",
         return_value="1234",
@@ -90,6 +96,41 @@ class TestInitDataset(TestCase):
         self.assertIsInstance(vm_dataset.df, pd.DataFrame)
         self.assertTrue(vm_dataset.df.equals(pd.DataFrame(arr)))
 
+    @mock.patch(
+        "validmind.client.log_input",
+        return_value="1234",
+    )
+    def test_init_dataset_logs_in_background(self, mock_log_input):
+        # Test that the dataset metadata is logged in the background from a snapshot
+        df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        vm_dataset = init_dataset(df, input_id="ds", target_column="col1", __log=True)
+        vm_dataset.add_extra_column("extra", [4, 5, 6])
+
+        wait_for_background_tasks()
+
+        mock_log_input.assert_called_once()
+        metadata = mock_log_input.call_args.kwargs["metadata"]
+        self.assertEqual(mock_log_input.call_args.kwargs["input_id"], "ds")
+        self.assertEqual(metadata["num_rows"], 3)
+        self.assertEqual(metadata["schema"], {"col2": "object", "col1": "int64"})
+        self.assertEqual(len(metadata["description"]), 11)
+
+    @mock.patch(
+        "validmind.client.log_input",
+        side_effect=APIRequestError("Failed to log input"),
+    )
+    def test_init_dataset_background_error_is_raised(self, mock_log_input):
+        df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        init_dataset(df, input_id="ds", target_column="col1", __log=True)
+
+        # only raised to whoever waits on the input e.g. before logging its results
+        wait_for_background_tasks()
+        with self.assertRaises(APIRequestError):
+            input_registry.wait_until_logged(["ds"])
+
+        init_dataset(df, input_id="other", target_column="col1", __log=False)
+        input_registry.wait_until_logged(["other"])
+
     # TODO: Test initializing a PyTorch tensor
 
 
@@ -3,6 +3,7 @@ Unit tests for VMDataset class
 """
 
 import unittest
+from io import BytesIO
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -16,6 +17,7 @@ from validmind.client import init_model
 from validmind.errors import MissingOrInvalidModelPredictFnError
 from validmind.models import MetadataModel
 from validmind.vm_models.dataset.dataset import DataFrameDataset
+from validmind.vm_models.dataset.tensors import TensorArray, TensorDtype
 from validmind.vm_models.model import ModelAttributes, VMModel
 
 
@@ -38,6 +40,122 @@ class TestTabularDataset(TestCase):
         np.testing.assert_array_equal(vm_dataset._raw_dataset, self.df.values)
         pd.testing.assert_frame_equal(vm_dataset.df, self.df)
 
+    def test_init_dataset_pandas_preserves_columns(self):
+        """
+        Test that a DataFrameDataset keeps the original dtypes and column buffers
+        """
+        df = pd.DataFrame(
+            {
+                "num": np.arange(5, dtype=np.int32),
+                "cat": pd.Categorical(list("abcab")),
+                "flt": np.linspace(0, 1, 5),
+                "target": [0, 1, 0, 1, 0],
+            }
+        )
+        vm_dataset = DataFrameDataset(raw_dataset=df, target_column="target")
+
+        # dtypes are kept as-is (no round trip through an object array)
+        pd.testing.assert_series_equal(vm_dataset._df.dtypes, df.dtypes)
+        self.assertEqual(vm_dataset.feature_columns_categorical, ["cat"])
+
+        # the dataset and its accessors share memory with the user's dataframe
+        self.assertTrue(np.shares_memory(vm_dataset._df["flt"].values, df["flt"]))
+        self.assertTrue(np.shares_memory(vm_dataset.x_df()["num"].values, df["num"]))
+        self.assertTrue(np.shares_memory(vm_dataset.y, df["target"].values))
+
+        # adding columns to the dataset doesn't modify the user's dataframe
+        vm_dataset.add_extra_column("extra", np.ones(5))
+        self.assertNotIn("extra", df.columns)
+
+    def test_dataset_copy_on_write(self):
+        """
+        Test that a dataset in copy-on-write mode returns read-only views from `df`
+        """
+        df = pd.DataFrame({"col1": [1.0, 2.0, 3.0], "target": [0, 1, 0]})
+        vm_dataset = DataFrameDataset(raw_dataset=df, target_column="target")
+
+        # by default `df` is a copy of the dataset
+        self.assertFalse(np.shares_memory(vm_dataset.df["col1"].values, df["col1"]))
+
+        vm_dataset.copy_on_write = True
+        view = vm_dataset.df
+        self.assertTrue(np.shares_memory(view["col1"].values, df["col1"]))
+        pd.testing.assert_frame_equal(view, df)
+
+        # element-wise writes are rejected, column replacement leaves the source alone
+        with self.assertRaises(ValueError):
+            view.loc[0, "col1"] = 10.0
+        view["col1"] = 0.0
+        self.assertEqual(df["col1"].tolist(), [1.0, 2.0, 3.0])
+
+    def test_dataset_with_options_shares_data(self):
+        """
+        Test that `with_options()` returns a dataset sharing the column data
+        """
+        df = pd.DataFrame(
+            {"col1": [1.0, 2.0, 3.0], "col2": [4, 5, 6], "target": [0, 1, 0]}
+        )
+        vm_dataset = DataFrameDataset(raw_dataset=df, target_column="target")
+
+        new = vm_dataset.with_options(columns=["col1", "target"], copy_on_write=True)
+        self.assertEqual(new.feature_columns, ["col1"])
+        self.assertTrue(new.copy_on_write)
+        self.assertTrue(
+            np.shares_memory(new._df["col1"].values, vm_dataset._df["col1"])
+        )
+
+        # the original dataset is left untouched
+        self.assertEqual(vm_dataset.feature_columns, ["col1", "col2"])
+        self.assertFalse(vm_dataset.copy_on_write)
+        new.add_extra_column("extra", np.ones(3))
+        self.assertNotIn("extra", vm_dataset._df.columns)
+        self.assertNotIn("extra", vm_dataset.columns)
+
+    def test_dataset_fingerprint(self):
+        """
+        Test that the fingerprint is exact and is updated when columns are replaced
+        """
+        vm_dataset = DataFrameDataset(raw_dataset=self.df, target_column="target")
+        fingerprint = vm_dataset.fingerprint()
+
+        # same data gives the same fingerprint
+        self.assertEqual(
+            DataFrameDataset(raw_dataset=self.df.copy()).fingerprint(), fingerprint
+        )
+
+        # a single changed value gives a different one
+        df = self.df.copy()
+        df.loc[2, "col2"] = "d"
+        self.assertNotEqual(DataFrameDataset(raw_dataset=df).fingerprint(), fingerprint)
+
+        vm_dataset.add_extra_column("extra", [1, 2, 3])
+        self.assertNotEqual(vm_dataset.fingerprint(), fingerprint)
+        self.assertEqual(
+            vm_dataset.fingerprint(["col1", "col2", "target"]), fingerprint
+        )
+
+        extra_fingerprint = vm_dataset.fingerprint()
+        vm_dataset.add_extra_column("extra", [1, 2, 4])
+        self.assertNotEqual(vm_dataset.fingerprint(), extra_fingerprint)
+
+    def test_dataset_fingerprint_shared_data(self):
+        """
+        Test that the fingerprint follows in-place changes to the user's dataframe
+        """
+        df = pd.DataFrame({"col1": [1.0, 2.0, 3.0], "target": [0, 1, 0]})
+        vm_dataset = DataFrameDataset(raw_dataset=df, target_column="target")
+        fingerprint = vm_dataset.fingerprint()
+
+        df.loc[0, "col1"] = 100.0
+        self.assertEqual(vm_dataset._df.loc[0, "col1"], 100.0)
+        self.assertNotEqual(vm_dataset.fingerprint(), fingerprint)
+
+        # the hashes of columns added to the dataset are cached
+        vm_dataset.add_extra_column("extra", np.ones(3))
+        vm_dataset.fingerprint()
+        self.assertIn("extra", vm_dataset._fingerprints)
+        self.assertNotIn("col1", vm_dataset._fingerprints)
+
     def test_init_dataset_pandas_target_column(self):
         """
         Test that a DataFrameDataset provides access to the target column
@@ -284,6 +402,155 @@ class TestTabularDataset(TestCase):
         # Probabilities are not auto-assigned if prediction_values are provided
         self.assertTrue("logreg_probabilities" not in vm_dataset._df.columns)
 
+    def test_assign_predictions_chunked(self):
+        """
+        Test assigning predictions in chunks and resuming after an interruption
+        """
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"x1": rng.normal(size=100), "x2": rng.normal(size=100)})
+        df["y"] = (df["x1"] + df["x2"] > 0).astype(int)
+        vm_dataset = DataFrameDataset(
+            raw_dataset=df, target_column="y", feature_columns=["x1", "x2"]
+        )
+
+        model = LogisticRegression()
+        model.fit(vm_dataset.x, vm_dataset.y.ravel())
+        vm_model = init_model(input_id="logreg", model=model, __log=False)
+
+        predict_proba = model.predict_proba
+        calls = []
+
+        def interrupted_predict_proba(X):
+            calls.append(len(X))
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return predict_proba(X)
+
+        with patch.object(model, "predict_proba", interrupted_predict_proba):
+            with self.assertRaises(KeyboardInterrupt):
+                vm_dataset.assign_predictions(model=vm_model, chunk_size=30)
+
+            # resumes from the last completed chunk
+            vm_dataset.assign_predictions(model=vm_model, chunk_size=30)
+
+        self.assertEqual(calls, [30, 30, 30, 30, 10])
+        self.assertEqual(vm_dataset._prediction_checkpoints, {})
+
+        # labels are derived from the probabilities so predict() isn't needed
+        np.testing.assert_array_equal(
+            vm_dataset.y_pred(vm_model), model.predict(vm_dataset.x)
+        )
+        np.testing.assert_allclose(
+            vm_dataset.y_prob(vm_model), model.predict_proba(vm_dataset.x)[:, 1]
+        )
+
+    def test_assign_predictions_chunked_new_arguments(self):
+        """
+        Test that an interrupted call isn't resumed with different model arguments
+        """
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"x1": rng.normal(size=100), "x2": rng.normal(size=100)})
+        df["y"] = (df["x1"] + df["x2"] > 0).astype(int)
+        vm_dataset = DataFrameDataset(
+            raw_dataset=df, target_column="y", feature_columns=["x1", "x2"]
+        )
+
+        model = LogisticRegression()
+        model.fit(vm_dataset.x, vm_dataset.y.ravel())
+        vm_model = init_model(input_id="logreg", model=model, __log=False)
+
+        predict = model.predict
+        calls = []
+
+        def interrupted_predict(X, threshold=0.5):
+            calls.append((len(X), threshold))
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return predict(X)
+
+        with patch.object(model, "predict", interrupted_predict):
+            with self.assertRaises(KeyboardInterrupt):
+                vm_dataset.assign_predictions(
+                    model=vm_model, chunk_size=30, threshold=0.5
+                )
+
+            # same argument names with different values start over
+            vm_dataset.assign_predictions(model=vm_model, chunk_size=30, threshold=0.7)
+
+        self.assertEqual(calls[3:], [(30, 0.7), (30, 0.7), (30, 0.7), (10, 0.7)])
+        self.assertEqual(vm_dataset._prediction_checkpoints, {})
+
+    def test_assign_vector_predictions(self):
+        """
+        Test that vector predictions are stored in a contiguous array and returned without copying
+        """
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(3, 8)).astype(np.float32)
+        vm_dataset = DataFrameDataset(raw_dataset=self.df, target_column="target")
+        vm_model = MetadataModel(
+            input_id="embedder",
+            attributes=ModelAttributes(architecture="Embeddings", language="Python"),
+        )
+
+        vm_dataset.assign_predictions(model=vm_model, prediction_values=embeddings)
+
+        column = vm_dataset._df["embedder_prediction"]
+        self.assertIsInstance(column.array, TensorArray)
+        self.assertEqual(column.dtype, TensorDtype(np.float32, (8,)))
+        np.testing.assert_array_equal(column.iloc[1], embeddings[1])
+
+        y_pred = vm_dataset.y_pred(vm_model)
+        np.testing.assert_array_equal(y_pred, embeddings)
+        self.assertTrue(np.shares_memory(y_pred, vm_dataset.y_pred(vm_model)))
+        self.assertFalse(y_pred.flags.writeable)
+
+        # the dataset keeps its own copy of the values
+        embeddings[0] = 0
+        self.assertNotEqual(y_pred[0, 0], 0)
+
+        fingerprint = vm_dataset.fingerprint()
+        vm_dataset.assign_predictions(
+            model=vm_model, prediction_values=np.asarray(y_pred) + 1
+        )
+        self.assertNotEqual(vm_dataset.fingerprint(), fingerprint)
+
+        # columns of lists are stacked when used as predictions
+        df = self.df.copy()
+        df["embedding"] = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        vm_dataset = DataFrameDataset(raw_dataset=df, target_column="target")
+        vm_dataset.assign_predictions(model=vm_model, prediction_column="embedding")
+        np.testing.assert_array_equal(
+            vm_dataset.y_pred(vm_model), [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        )
+
+    def test_vector_column_operations(self):
+        """
+        Test missing values, Arrow conversion and groupby on columns of vectors
+        """
+        values = np.arange(8, dtype=float).reshape(4, 2)
+        values[1] = np.nan
+        df = pd.DataFrame({"a": [1, 1, 2, 2], "v": TensorArray(values)})
+
+        # rows of NaNs output by a model aren't missing values, reindexed rows are
+        self.assertEqual(df["v"].isna().tolist(), [False, False, False, False])
+        reindexed = df.reindex([0, 1, 5])
+        self.assertEqual(reindexed["v"].isna().tolist(), [False, False, True])
+        self.assertEqual(list(reindexed.dropna().index), [0, 1])
+        self.assertEqual(reindexed["v"].value_counts().sum(), 2)
+
+        # parquet round trip keeps the dtype
+        buffer = BytesIO()
+        df.to_parquet(buffer)
+        pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(buffer.getvalue())), df)
+
+        # rows of groups can be selected or collected but not reduced by pandas
+        pd.testing.assert_frame_equal(df.groupby("a").nth(0), df.iloc[[0, 2]])
+        self.assertEqual(df.groupby("a").head(1)["v"].dtype, df["v"].dtype)
+        collected = df.groupby("a")["v"].agg(list)
+        np.testing.assert_array_equal(collected[2], values[2:])
+        with self.assertRaisesRegex(ValueError, "Must produce aggregated value"):
+            df.groupby("a").first()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+"""
+Unit tests for the Figure class
+"""
+
+import base64
+import gc
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import Future
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import plotly.graph_objs as go
+
+from validmind.vm_models import figure as figure_module
+from validmind.vm_models.figure import Figure, configure_render_cache, render_figures
+from validmind.vm_models.figure_export import PlotlyExportPool
+
+
+def mock_matplotlib_figure():
+    fig = plt.figure()
+    plt.plot([1, 2, 3])
+    plt.close(fig)
+
+    return fig
+
+
+class TestFigureRenderCache(TestCase):
+    def tearDown(self):
+        configure_render_cache(None)
+
+    def test_matplotlib_figure_rendered_once(self):
+        fig = mock_matplotlib_figure()
+        figure = Figure(key="key", figure=fig)
+
+        with patch.object(fig, "savefig", wraps=fig.savefig) as mock_savefig:
+            figure.to_widget()
+            files = figure.serialize_files()
+            url = figure._get_b64_url()
+
+        mock_savefig.assert_called_once()
+
+        png = files["image"][1]
+        self.assertTrue(png.startswith(b"\x89PNG"))
+        self.assertEqual(url, f"data:image/png;base64,{base64.b64encode(png).decode()}")
+
+    def test_plotly_figure_rendered_once(self):
+        figure = Figure(key="key", figure=go.Figure(go.Bar(x=[1, 2], y=[3, 4])))
+
+        # a single worker pool exports with plotly's `to_image`
+        with patch(
+            "validmind.vm_models.figure.get_export_pool",
+            return_value=PlotlyExportPool(max_workers=1),
+        ), patch.object(
+            type(figure.figure), "to_image", return_value=b"png"
+        ) as mock_to_image, patch.object(
+            type(figure.figure), "to_json", return_value='{"data": []}'
+        ) as mock_to_json:
+            figure.serialize_files()
+            files = figure.serialize_files()
+            url = figure._get_b64_url()
+
+        mock_to_image.assert_called_once()
+        mock_to_json.assert_called_once()
+        self.assertEqual(files["image"][1], b"png")
+        self.assertEqual(files["json_image"][1], b'{"data": []}')
+        self.assertEqual(
+            url, f"data:image/png;base64,{base64.b64encode(b'png').decode()}"
+        )
+
+    def test_replaced_figure_is_rendered_again(self):
+        figure = Figure(key="key", figure=mock_matplotlib_figure())
+        png = figure._render()
+
+        figure.figure = b"\x89PNG other image"
+
+        self.assertNotEqual(figure._render(), png)
+        self.assertEqual(figure.serialize_files()["image"][1], figure.figure)
+
+    def test_render_cache_spills_to_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            configure_render_cache(cache_dir)
+
+            figure = Figure(key="key", figure=mock_matplotlib_figure())
+            png = figure.serialize_files()["image"][1]
+
+            paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+            self.assertEqual(len(paths), 1)
+            self.assertEqual(figure._renders["png"], paths[0])
+            with open(paths[0], "rb") as f:
+                self.assertEqual(f.read(), png)
+
+            self.assertEqual(figure._get_b64_url()[22:], base64.b64encode(png).decode())
+
+            # spilled files are removed along with the figure
+            del figure
+            gc.collect()
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_pickled_figure_drops_renders(self):
+        figure = Figure(key="key", figure=mock_matplotlib_figure())
+        figure._render()
+
+        unpickled = pickle.loads(pickle.dumps(figure))
+
+        self.assertEqual(unpickled._renders, {})
+        self.assertTrue(unpickled._render().startswith(b"\x89PNG"))
+        self.assertIs(figure_module._render_cache_dir, None)
+
+
+class TestPlotlyExportPool(TestCase):
+    def test_export_concurrently(self):
+        figures = [go.Figure(go.Bar(x=[1, 2], y=[i, 4])) for i in range(4)]
+
+        pool = PlotlyExportPool(max_workers=2)
+        try:
+            images = pool.export(figures)
+
+            # each worker keeps its own kaleido process for every export
+            self.assertEqual(len(pool._scopes), 2)
+            self.assertEqual(pool.export(figures[:1]), images[:1])
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(images[0], figures[0].to_image(format="png"))
+        self.assertEqual(len(set(images)), 4)
+
+    def test_export_without_kaleido_scopes(self):
+        # kaleido >= 1.0 has no scopes so figures are exported with `to_image`
+        figure = go.Figure(go.Bar(x=[1, 2], y=[3, 4]))
+        pool = PlotlyExportPool(max_workers=2)
+
+        with patch(
+            "validmind.vm_models.figure_export._has_kaleido_scopes", return_value=False
+        ), patch.object(
+            go.Figure, "to_image", return_value=b"plotly png"
+        ) as mock_to_image:
+            self.assertFalse(pool.concurrent)
+            self.assertEqual(pool.export([figure]), [b"plotly png"])
+
+        mock_to_image.assert_called_once_with(format="png")
+        self.assertIsNone(pool._executor)
+
+    def test_render_figures(self):
+        figures = [
+            Figure(key="plotly", figure=go.Figure(go.Bar(x=[1, 2], y=[3, 4]))),
+            Figure(key="matplotlib", figure=mock_matplotlib_figure()),
+            Figure(key="png", figure=b"\x89PNG image"),
+        ]
+
+        future = Future()
+        future.set_result(b"plotly png")
+        pool = MagicMock(submit=MagicMock(return_value=future))
+
+        with patch("validmind.vm_models.figure.get_export_pool", return_value=pool):
+            render_figures(figures)
+            render_figures(figures)
+
+        # plotly figures are submitted to the pool in a batch and only once
+        pool.submit.assert_called_once_with(figures[0].figure)
+        self.assertEqual(figures[0].serialize_files()["image"][1], b"plotly png")
+        self.assertIn("png", figures[1]._renders)
+
+
+if __name__ == "__main__":
+    unittest.main()
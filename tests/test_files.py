@@ -0,0 +1,206 @@
+"""
+Unit tests for datasets read from Parquet and Arrow IPC files
+"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from validmind.vm_models.dataset import FileDataset, files
+from validmind.vm_models.dataset.files import read_dataset_files
+
+
+def mock_dataframe(n=1000):
+    rng = np.random.default_rng(0)
+
+    df = pd.DataFrame(
+        {
+            "float": rng.normal(size=n),
+            "float_nan": np.where(rng.random(n) < 0.2, np.nan, rng.gamma(2, size=n)),
+            "int": rng.integers(0, 100, n),
+            "int_null": pd.array(
+                np.where(rng.random(n) < 0.1, None, rng.integers(0, 5, n)),
+                dtype="Int64",
+            ),
+            "bool": rng.random(n) < 0.4,
+            "str": rng.choice(["a", "b", "c"], n).astype(object),
+            "date": pd.to_datetime("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 100, n), unit="D"),
+            "date_tz": pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC"),
+            "target": rng.integers(0, 2, n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "str"] = None
+
+    return df
+
+
+def arrow_table(df):
+    # without pandas metadata, like files written by other tools
+    return pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata()
+
+
+def memory_mapped(series):
+    # tz-aware datetimes are boxed by `to_numpy` so check their backing array
+    base = getattr(series.array, "_ndarray", None)
+    if base is None:
+        base = series.to_numpy()
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+
+    return base is not None
+
+
+class TestReadDatasetFiles(TestCase):
+    def setUp(self):
+        self.df = mock_dataframe()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        patcher = patch.object(
+            files, "DATASET_CACHE_DIR", os.path.join(self.tmp_dir.name, "cache")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # small batches so the columns are converted in several steps
+        patcher = patch.object(files, "_BATCH_ROWS", 128)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def test_parquet(self):
+        pq.write_table(arrow_table(self.df), self.path("data.parquet"))
+        df = read_dataset_files(self.path("data.parquet"))
+
+        pd.testing.assert_frame_equal(df, pd.read_parquet(self.path("data.parquet")))
+        self.assertFalse(df["float"].to_numpy().flags.writeable)
+
+        for column in ["float", "int", "int_null", "bool", "date", "date_tz"]:
+            self.assertTrue(memory_mapped(df[column]), column)
+
+    def test_arrow_ipc_and_directories(self):
+        feather.write_feather(arrow_table(self.df), self.path("data.feather"))
+        pd.testing.assert_frame_equal(
+            read_dataset_files(self.path("data.feather")),
+            pd.read_feather(self.path("data.feather")),
+        )
+
+        os.makedirs(self.path("parts"))
+        for i, start in enumerate(range(0, len(self.df), 300)):
+            pq.write_table(
+                arrow_table(self.df.iloc[start : start + 300]),
+                self.path(f"parts/part-{i}.parquet"),
+            )
+        pd.testing.assert_frame_equal(
+            read_dataset_files(self.path("parts")), self.df.astype({"int_null": float})
+        )
+
+    def test_boolean_with_nulls(self):
+        df = pd.DataFrame({"flag": pd.array([True, None, False, None], "boolean")})
+        df.to_parquet(self.path("data.parquet"))
+
+        pd.testing.assert_frame_equal(read_dataset_files(self.path("data.parquet")), df)
+
+    def test_columns_are_converted_once(self):
+        self.df.to_parquet(self.path("data.parquet"))
+
+        with patch.object(
+            files, "_convert_columns", wraps=files._convert_columns
+        ) as mock_convert:
+            df = read_dataset_files(self.path("data.parquet"), columns=["int", "str"])
+            self.assertEqual(list(df.columns), ["int", "str"])
+
+            read_dataset_files(self.path("data.parquet"), columns=["str"])
+            self.assertEqual(mock_convert.call_count, 1)
+
+            # only the new columns are converted
+            read_dataset_files(self.path("data.parquet"), columns=["float", "int"])
+            self.assertEqual(mock_convert.call_count, 2)
+            self.assertEqual(
+                [field.name for field in mock_convert.call_args[0][1]], ["float"]
+            )
+
+        with self.assertRaises(ValueError):
+            read_dataset_files(self.path("data.parquet"), columns=["missing"])
+
+        with self.assertRaises(ValueError):
+            read_dataset_files(self.path("data.csv"))
+
+    def test_stale_versions_are_evicted(self):
+        cache_dir = files.DATASET_CACHE_DIR
+        self.df.to_parquet(self.path("data.parquet"))
+        read_dataset_files(self.path("data.parquet"))
+        (files_key,) = os.listdir(cache_dir)
+        (version,) = os.listdir(os.path.join(cache_dir, files_key))
+
+        # a new version of the file replaces the columns converted from the old one
+        df = self.df.iloc[:100]
+        df.to_parquet(self.path("data.parquet"))
+        os.utime(self.path("data.parquet"), ns=(0, 0))
+        self.assertEqual(len(read_dataset_files(self.path("data.parquet"))), 100)
+        self.assertEqual(os.listdir(cache_dir), [files_key])
+        self.assertNotIn(version, os.listdir(os.path.join(cache_dir, files_key)))
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, files_key))), 1)
+
+        files.clear_dataset_cache()
+        self.assertFalse(os.path.exists(cache_dir))
+        self.assertEqual(len(read_dataset_files(self.path("data.parquet"))), 100)
+
+    def test_concurrent_conversions(self):
+        pq.write_table(arrow_table(self.df), self.path("data.parquet"))
+        columns = [["float", "int"], ["float", "str"], ["date"], ["int_null"]]
+
+        with ThreadPoolExecutor(max_workers=len(columns)) as executor:
+            dfs = list(
+                executor.map(
+                    lambda c: read_dataset_files(self.path("data.parquet"), columns=c),
+                    columns,
+                )
+            )
+
+        expected = pd.read_parquet(self.path("data.parquet"))
+        for df, c in zip(dfs, columns):
+            pd.testing.assert_frame_equal(df, expected[c])
+
+        # no temporary files are left behind and every column is readable
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        for _, _, names in os.walk(cache_dir):
+            self.assertFalse([name for name in names if name.endswith(".tmp")])
+            self.assertFalse([name for name in names if ".tmp." in name])
+
+        pd.testing.assert_frame_equal(
+            read_dataset_files(self.path("data.parquet")), expected
+        )
+
+    def test_file_dataset(self):
+        self.df.to_parquet(self.path("data.parquet"))
+
+        dataset = FileDataset(
+            self.path("data.parquet"),
+            columns=["float", "int", "str", "target"],
+            target_column="target",
+        )
+
+        self.assertTrue(dataset.copy_on_write)
+        self.assertEqual(dataset.feature_columns, ["float", "int", "str"])
+        self.assertTrue(memory_mapped(dataset.df["float"]))
+        pd.testing.assert_frame_equal(
+            dataset.df, self.df[["float", "int", "str", "target"]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ Unit tests for the framewor's init() method
 """
 
 import os
+import subprocess
+import sys
 import unittest
 
 from unittest import mock
@@ -114,5 +116,60 @@ class TestFrameworkInit(unittest.TestCase):
         self.assertIsNone(client_ok)
 
 
+class TestFrameworkImport(unittest.TestCase):
+    # modules that are only needed to run tests or display results in a notebook
+    DEFERRED_MODULES = [
+        "IPython",
+        "ipywidgets",
+        "jinja2",
+        "matplotlib",
+        "mistune",
+        "numba",
+        "plotly",
+        "polars",
+        "seaborn",
+    ]
+
+    def test_import_defers_heavy_modules(self):
+        """
+        Test that `import validmind` doesn't import plotting or notebook libraries
+        """
+        code = (
+            "import sys, validmind; "
+            f"print(','.join(m for m in {self.DEFERRED_MODULES!r} if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(output.stdout.strip(), "")
+
+    def test_import_time(self):
+        """
+        Test that `import validmind` stays within a (generous) time budget
+        """
+        # ~1s here; importing the deferred modules up front took over 3s
+        budget = float(os.getenv("VALIDMIND_IMPORT_TIME_BUDGET", 2.5))
+        code = (
+            "import time; start = time.perf_counter(); import validmind; "
+            "print(time.perf_counter() - start)"
+        )
+
+        # best of a few runs so a slow disk cache on the first one doesn't count
+        durations = [
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", code],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.splitlines()[-1]
+            )
+            for _ in range(3)
+        ]
+
+        self.assertLess(min(durations), budget)
+
+
 if __name__ == "__main__":
     unittest.main()
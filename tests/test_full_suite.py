@@ -83,6 +83,26 @@ class TestFullTestSuite(unittest.TestCase):
 
         self.assertIsInstance(suite, TestSuite)
 
+        # running the tests in parallel should produce the same results in the same order
+        parallel_suite = vm.run_test_suite(
+            "classifier_full_suite",
+            config=customer_churn.get_demo_test_config(
+                vm.get_test_suite("classifier_full_suite")
+            ),
+            fail_fast=True,
+            max_workers=4,
+        )
+
+        self.assertIsInstance(parallel_suite, TestSuite)
+        self.assertEqual(
+            [type(test.result) for test in suite.get_tests()],
+            [type(test.result) for test in parallel_suite.get_tests()],
+        )
+        self.assertEqual(
+            [test.result.result_id for test in suite.get_tests()],
+            [test.result.result_id for test in parallel_suite.get_tests()],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,199 @@
+"""
+Unit tests for the model wrappers in validmind.models
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from validmind.client import init_model
+from validmind.models import FoundationModel, FunctionModel, Prompt
+from validmind.vm_models.dataset.dataset import DataFrameDataset
+
+
+class TestFunctionModel(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {"x1": np.arange(10), "x2": np.arange(10) * 2.0, "y": [0, 1] * 5}
+        )
+
+    def test_predict_row_by_row(self):
+        """
+        Test that the predict function receives one dictionary per row by default
+        """
+        model = FunctionModel(
+            input_id="fn", predict_fn=lambda row: row["x1"] + row["x2"]
+        )
+
+        predictions = model.predict(self.df[["x1", "x2"]])
+
+        self.assertEqual(predictions, list(self.df["x1"] + self.df["x2"]))
+
+    def test_predict_batch_dataframe(self):
+        """
+        Test that the predict function receives dataframe chunks in batch mode
+        """
+        chunks = []
+
+        def predict_fn(chunk):
+            chunks.append(chunk)
+            return chunk["x1"] + chunk["x2"]
+
+        model = FunctionModel(input_id="fn", predict_fn=predict_fn, batch_size=4)
+        predictions = model.predict(self.df[["x1", "x2"]])
+
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        self.assertIsInstance(chunks[0], pd.DataFrame)
+        np.testing.assert_array_equal(predictions, self.df["x1"] + self.df["x2"])
+
+    def test_predict_batch_dict(self):
+        """
+        Test that the predict function receives columnar dicts in `dict` batch format
+        """
+
+        def predict_fn(chunk):
+            self.assertIsInstance(chunk["x1"], np.ndarray)
+            return chunk["x1"] * chunk["x2"]
+
+        model = FunctionModel(
+            input_id="fn", predict_fn=predict_fn, batch_size=3, batch_format="dict"
+        )
+        predictions = model.predict(self.df[["x1", "x2"]])
+
+        np.testing.assert_array_equal(predictions, self.df["x1"] * self.df["x2"])
+
+    def test_predict_batch_invalid_output(self):
+        """
+        Test that batch mode checks the number of predictions returned
+        """
+        model = FunctionModel(input_id="fn", predict_fn=lambda chunk: [1], batch_size=4)
+
+        with self.assertRaises(ValueError):
+            model.predict(self.df[["x1", "x2"]])
+
+        with self.assertRaises(ValueError):
+            FunctionModel(predict_fn=lambda x: x, batch_format="arrow")
+
+    def test_assign_predictions_batch(self):
+        """
+        Test assigning predictions from a batched function model to a dataset
+        """
+        vm_dataset = DataFrameDataset(
+            raw_dataset=self.df, target_column="y", feature_columns=["x1", "x2"]
+        )
+        vm_model = init_model(
+            input_id="fn",
+            predict_fn=lambda chunk: (chunk["x1"] > 4).astype(int),
+            batch_size=3,
+            __log=False,
+        )
+
+        vm_dataset.assign_predictions(model=vm_model)
+
+        np.testing.assert_array_equal(
+            vm_dataset.y_pred(vm_model), (self.df["x1"] > 4).astype(int)
+        )
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FakeLLM:
+    """Local stand-in for an LLM endpoint that tracks concurrent calls
+
+    Every `rate_limit_every`-th call fails with a rate limit error.
+    """
+
+    def __init__(self, latency=0.02, rate_limit_every=None):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.calls += 1
+            if self.rate_limit_every and self.calls % self.rate_limit_every == 0:
+                raise RateLimitError("Rate limit exceeded")
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _exit(self):
+        with self._lock:
+            self.active -= 1
+
+    def __call__(self, prompt):
+        self._enter()
+        time.sleep(self.latency)
+        self._exit()
+        return prompt.upper()
+
+    async def acall(self, prompt):
+        self._enter()
+        await asyncio.sleep(self.latency)
+        self._exit()
+        return prompt.upper()
+
+
+class TestFoundationModel(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({"text": [f"prompt {i}" for i in range(20)]})
+        self.prompt = Prompt(template="say {text}", variables=["text"])
+        self.expected = [f"SAY PROMPT {i}" for i in range(20)]
+
+    def test_predict_sequential(self):
+        llm = FakeLLM(latency=0)
+        model = FoundationModel(predict_fn=llm, prompt=self.prompt)
+
+        self.assertEqual(model.predict(self.df), self.expected)
+        self.assertEqual(llm.max_active, 1)
+
+    @patch("validmind.models.foundation.get_rate_limit_delay", return_value=0)
+    def test_predict_thread_pool(self, mock_delay):
+        llm = FakeLLM(rate_limit_every=7)
+        model = FoundationModel(predict_fn=llm, prompt=self.prompt, max_concurrency=5)
+
+        # predictions keep the order of the input rows and rate limited calls are retried
+        self.assertEqual(model.predict(self.df), self.expected)
+        self.assertEqual(llm.max_active, 5)
+        self.assertGreater(llm.calls, 20)
+
+    @patch("validmind.models.foundation.get_rate_limit_delay", return_value=0)
+    def test_predict_coroutine(self, mock_delay):
+        llm = FakeLLM(rate_limit_every=5)
+        model = FoundationModel(
+            predict_fn=llm.acall, prompt=self.prompt, max_concurrency=4
+        )
+
+        self.assertEqual(model.predict(self.df), self.expected)
+        self.assertEqual(llm.max_active, 4)
+
+        # also works when called from a running event loop (e.g. in a notebook)
+        async def predict():
+            return model.predict(self.df)
+
+        self.assertEqual(asyncio.run(predict()), self.expected)
+
+    def test_predict_raises_other_errors(self):
+        def predict_fn(prompt):
+            raise ValueError("Invalid prompt")
+
+        model = FoundationModel(
+            predict_fn=predict_fn, prompt=self.prompt, max_concurrency=2
+        )
+
+        with self.assertRaises(ValueError):
+            model.predict(self.df)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,264 @@
+"""
+Unit tests for polars datasets and the artifacts computed with polars
+"""
+
+import unittest
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from sklearn.linear_model import LogisticRegression
+
+from validmind.client import init_model
+from validmind.tests import artifacts
+from validmind.tests.load import load_test
+from validmind.tests.run import _run_test_class
+from validmind.vm_models.dataset import DataFrameDataset, PolarsDataset
+from validmind.vm_models.dataset.tensors import TensorDtype
+from validmind.vm_models.test_context import TestContext
+
+
+def mock_frame(n=1000):
+    rng = np.random.default_rng(0)
+    row = pl.int_range(pl.len())
+
+    return pl.DataFrame(
+        {
+            "float": rng.normal(size=n),
+            "float_nan": np.where(rng.random(n) < 0.2, np.nan, rng.gamma(2, size=n)),
+            "int": np.where(rng.random(n) < 0.3, 0, rng.integers(1, 100, n)),
+            "f32": rng.normal(size=n).astype(np.float32),
+            "bool": rng.random(n) < 0.4,
+            "str": rng.choice(["a", "b", "c"], n),
+            "category": rng.choice(["x", "y"], n),
+            "date": pd.to_datetime("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 100, n), unit="D"),
+            "target": rng.integers(0, 2, n),
+        }
+    ).with_columns(
+        # nulls as well as NaNs in float columns
+        pl.when(row % 11 == 0)
+        .then(None)
+        .otherwise(pl.col("float_nan"))
+        .alias("float_nan"),
+        pl.when(row % 7 == 0).then(None).otherwise(pl.col("int")).alias("int_null"),
+        pl.when(row % 5 == 0).then(None).otherwise(pl.col("bool")).alias("bool_null"),
+        pl.when(row % 9 == 0).then(None).otherwise(pl.col("str")).alias("str"),
+        pl.col("category").cast(pl.Categorical),
+    )
+
+
+class TestPolarsArtifacts(TestCase):
+    def setUp(self):
+        self.frame = mock_frame()
+        self.expected = DataFrameDataset(
+            raw_dataset=self.frame.to_pandas(), target_column="target"
+        )
+
+    def datasets(self):
+        for frame in [self.frame, self.frame.lazy()]:
+            yield PolarsDataset(frame, target_column="target")
+
+    def test_metadata(self):
+        for dataset in self.datasets():
+            self.assertEqual(dataset.columns, self.expected.columns)
+            self.assertEqual(
+                dataset.feature_columns_numeric, self.expected.feature_columns_numeric
+            )
+            self.assertEqual(
+                dataset.feature_columns_categorical,
+                self.expected.feature_columns_categorical,
+            )
+            pd.testing.assert_frame_equal(dataset.df, self.expected.df)
+
+    def test_profile(self):
+        expected = artifacts.profile(self.expected)
+
+        for dataset in self.datasets():
+            profile = artifacts.profile(dataset)
+
+            self.assertEqual(profile.n_rows, expected.n_rows)
+            self.assertEqual(list(profile.columns), list(expected.columns))
+
+            for name, column in profile.columns.items():
+                self.assertEqual(str(column.dtype), str(expected[name].dtype))
+                self.assertEqual(column.count, expected[name].count)
+                self.assertEqual(column.n_distinct, expected[name].n_distinct)
+                pd.testing.assert_series_equal(
+                    column.value_counts.sort_index(),
+                    expected[name].value_counts.sort_index(),
+                    check_index_type=False,
+                )
+
+                if column.is_numeric and name != "bool":
+                    self.assertEqual(column.n_zeros, expected[name].n_zeros)
+                    pd.testing.assert_series_equal(
+                        column.describe(), expected[name].describe(), rtol=1e-12
+                    )
+                    np.testing.assert_allclose(
+                        column.skewness, expected[name].skewness, rtol=1e-9
+                    )
+
+            # unique values in order of first appearance, including nulls
+            np.testing.assert_array_equal(profile["str"].unique, expected["str"].unique)
+
+            self.assertIsNone(dataset._pandas)
+
+    def test_correlation_matrix(self):
+        for dataset in self.datasets():
+            pd.testing.assert_frame_equal(
+                artifacts.correlation_matrix(dataset),
+                artifacts.correlation_matrix(self.expected),
+                rtol=1e-9,
+            )
+            self.assertIsNone(dataset._pandas)
+
+    def test_value_counts_and_group_stats(self):
+        for dataset in self.datasets():
+            for column in ["str", "int_null", "bool_null", "float_nan", "date"]:
+                pd.testing.assert_series_equal(
+                    artifacts.value_counts(dataset, column).sort_index(),
+                    artifacts.value_counts(self.expected, column).sort_index(),
+                )
+
+            for by, column in [("str", "float_nan"), (["int_null", "target"], None)]:
+                pd.testing.assert_frame_equal(
+                    artifacts.group_stats(dataset, by, column),
+                    artifacts.group_stats(self.expected, by, column),
+                )
+
+            self.assertIsNone(dataset._pandas)
+
+    def test_group_stats_of_unsupported_dtypes(self):
+        rng = np.random.default_rng(0)
+        values = np.where(rng.random(100) < 0.2, None, rng.normal(size=100))
+        frame = pl.DataFrame(
+            {
+                "key": rng.choice(["a", "b"], 100),
+                "object": pl.Series(values, dtype=pl.Object),
+            }
+        ).with_columns(pl.col("key").cast(pl.Categorical).alias("category"))
+        dataset = PolarsDataset(frame)
+        df = frame.to_pandas()
+
+        for by, column in [("key", "object"), ("category", None)]:
+            pd.testing.assert_frame_equal(
+                artifacts.group_stats(dataset, by, column),
+                artifacts.group_stats(DataFrameDataset(raw_dataset=df), by, column),
+            )
+
+    def test_tests_dont_convert_to_pandas(self):
+        dataset = PolarsDataset(self.frame.lazy(), target_column="target")
+        context = TestContext()
+
+        for test_id in [
+            "validmind.data_validation.DescriptiveStatistics",
+            "validmind.data_validation.MissingValues",
+            "validmind.data_validation.ClassImbalance",
+            "validmind.data_validation.PearsonCorrelationMatrix",
+            "validmind.data_validation.TargetRateBarPlots",
+        ]:
+            _run_test_class(
+                load_test(test_id),
+                test_id=test_id,
+                inputs={"dataset": dataset},
+                generate_description=False,
+                context=context,
+            )
+
+        self.assertIsNone(dataset._pandas)
+
+
+class TestPolarsDataset(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frame = pl.DataFrame(
+            {
+                "a": rng.normal(size=100),
+                "b": rng.integers(0, 5, 100),
+                "target": rng.integers(0, 2, 100),
+            }
+        )
+
+    def test_assign_predictions(self):
+        dataset = PolarsDataset(self.frame.lazy(), target_column="target")
+        fingerprint = dataset.fingerprint()
+
+        model = init_model(
+            input_id="model",
+            model=LogisticRegression().fit(dataset.x, dataset.y),
+            __log=False,
+        )
+        dataset.assign_predictions(model)
+
+        expected = DataFrameDataset(
+            raw_dataset=self.frame.to_pandas(), target_column="target"
+        )
+        expected.assign_predictions(model)
+
+        np.testing.assert_array_equal(dataset.x, expected.x)
+        np.testing.assert_array_equal(dataset.y, expected.y)
+        np.testing.assert_array_equal(dataset.y_pred(model), expected.y_pred(model))
+        np.testing.assert_array_equal(dataset.y_prob(model), expected.y_prob(model))
+        self.assertIsNone(dataset._pandas)
+
+        # new columns change the fingerprint of the whole dataset only
+        self.assertNotEqual(dataset.fingerprint(), fingerprint)
+        self.assertEqual(dataset.fingerprint(["a", "b", "target"]), fingerprint)
+
+        pd.testing.assert_frame_equal(dataset._df, expected._df)
+
+        with self.assertRaises(ValueError):
+            dataset.add_extra_column("extra", np.arange(10))
+
+    def test_vector_columns(self):
+        embeddings = np.random.default_rng(1).normal(size=(100, 4))
+        frame = self.frame.with_columns(
+            pl.Series("vector", np.arange(200).reshape(100, 2)),
+            pl.Series("vector_null", [[1, 2], None] * 50, dtype=pl.Array(pl.Int64, 2)),
+        )
+        dataset = PolarsDataset(frame, target_column="target")
+        dataset.add_extra_column("embedding", embeddings)
+
+        self.assertEqual(dataset._dtypes["vector"], TensorDtype(np.int64, (2,)))
+        self.assertEqual(dataset._dtypes["vector_null"], TensorDtype(np.float64, (2,)))
+        self.assertEqual(dataset._dtypes["embedding"], TensorDtype(np.float64, (4,)))
+
+        df = dataset.df
+        self.assertEqual(df.dtypes.to_dict(), dataset._dtypes)
+        np.testing.assert_array_equal(
+            df["embedding"].array.to_tensor(), embeddings, strict=True
+        )
+        self.assertTrue(np.isnan(df["vector_null"].iloc[1]).all())
+        # null arrays are missing values
+        self.assertEqual(df["vector_null"].isna().sum(), 50)
+
+        model = init_model(
+            input_id="model",
+            model=LogisticRegression().fit(self.frame[["a", "b"]], dataset.y),
+            __log=False,
+        )
+        dataset.assign_predictions(
+            model, prediction_column="embedding", probability_column="vector"
+        )
+        np.testing.assert_array_equal(dataset.y_pred(model), embeddings)
+        np.testing.assert_array_equal(
+            dataset.y_prob(model), np.arange(200).reshape(100, 2)
+        )
+
+    def test_with_options_shares_frame(self):
+        dataset = PolarsDataset(self.frame, target_column="target")
+        subset = dataset.with_options(columns=["a", "target"])
+
+        self.assertIs(subset.lazy(), dataset.lazy())
+        self.assertEqual(subset.feature_columns, ["a"])
+        self.assertIsNone(subset._pandas)
+
+        subset.add_extra_column("extra", np.arange(100))
+        self.assertNotIn("extra", dataset.columns)
+        self.assertNotIn("extra", dataset.lazy().collect_schema().names())
+
+
+if __name__ == "__main__":
+    unittest.main()
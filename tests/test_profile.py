@@ -0,0 +1,382 @@
+"""
+Unit tests for the single-pass dataset profiler
+"""
+
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from validmind.tests.load import load_test
+from validmind.tests.run import _run_test_class
+from validmind.vm_models.dataset.dataset import DataFrameDataset
+from validmind.vm_models.dataset.profile import (
+    DatasetProfiler,
+    configure_profiling,
+    pearson_correlation,
+    profile_chunks,
+    profile_dataframe,
+)
+from validmind.vm_models.test_context import TestContext
+
+PERCENTILES = [0.25, 0.5, 0.75, 0.9, 0.95]
+
+
+def mock_dataframe(n=1000):
+    rng = np.random.default_rng(0)
+
+    df = pd.DataFrame(
+        {
+            "float": rng.normal(size=n),
+            "float_nan": np.where(rng.random(n) < 0.2, np.nan, rng.gamma(2, size=n)),
+            "int": np.where(rng.random(n) < 0.3, 0, rng.integers(1, 100, n)),
+            "bool": rng.random(n) < 0.4,
+            "constant": np.ones(n),
+            "empty": np.full(n, np.nan),
+            "str": rng.choice(["a", "b", "c"], n).astype(object),
+            "category": pd.Categorical(
+                rng.choice(["x", "y"], n), categories=["x", "y", "z"]
+            ),
+            "date": pd.to_datetime("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 100, n), unit="D"),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "str"] = None
+
+    return df
+
+
+class TestDatasetProfile(TestCase):
+    def setUp(self):
+        self.df = mock_dataframe()
+
+    def assert_matches_pandas(self, profile, exact=True):
+        self.assertEqual(profile.n_rows, len(self.df))
+        self.assertEqual(list(profile.columns), list(self.df.columns))
+
+        for name, series in self.df.items():
+            column = profile[name]
+
+            self.assertEqual(column.count, series.count())
+            self.assertEqual(column.n_missing, series.isna().sum())
+            self.assertEqual(column.n_distinct, series.nunique())
+            pd.testing.assert_series_equal(
+                column.value_counts.sort_index(),
+                series.value_counts().sort_index(),
+                check_index_type=False,
+            )
+
+            if not column.is_numeric or name == "bool":
+                continue
+
+            self.assertEqual(column.n_zeros, (series == 0).sum())
+
+            values = series.dropna().to_numpy()
+            for bins in ["sturges", 5, 50]:
+                if len(values):
+                    hist, edges = column.histogram(bins)
+                    expected_hist, expected_edges = np.histogram(values, bins=bins)
+                    np.testing.assert_array_equal(hist, expected_hist)
+                    np.testing.assert_array_equal(edges, expected_edges)
+
+            if exact:
+                pd.testing.assert_series_equal(
+                    column.describe(PERCENTILES),
+                    series.describe(percentiles=PERCENTILES),
+                    check_exact=True,
+                )
+            else:
+                pd.testing.assert_series_equal(
+                    column.describe(PERCENTILES),
+                    series.describe(percentiles=PERCENTILES),
+                    rtol=1e-12,
+                )
+
+            np.testing.assert_allclose(column.skewness, series.skew(), rtol=1e-12)
+
+    def test_profile_dataframe(self):
+        self.assert_matches_pandas(profile_dataframe(self.df))
+
+    def test_profile_dataframe_in_chunks(self):
+        self.assert_matches_pandas(profile_dataframe(self.df, chunk_size=97), False)
+
+    def test_profile_chunks(self):
+        profile = profile_chunks(
+            self.df.iloc[start : start + 300] for start in range(0, len(self.df), 300)
+        )
+
+        self.assert_matches_pandas(profile, False)
+
+    def test_non_numeric_columns(self):
+        profile = profile_dataframe(self.df, chunk_size=100)
+
+        # unique values are kept in order of first appearance, including nulls
+        np.testing.assert_array_equal(
+            pd.Series(profile["str"].unique), pd.Series(self.df["str"].unique())
+        )
+
+        # unused categories are counted but aren't distinct values
+        self.assertEqual(profile["category"].value_counts["z"], 0)
+        self.assertEqual(profile["category"].n_distinct, 2)
+
+        self.assertEqual(profile["date"].min, self.df["date"].min())
+        self.assertEqual(profile["date"].max, self.df["date"].max())
+
+
+class TestNullableColumns(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        missing = rng.random(n) < 0.2
+
+        self.df = pd.DataFrame(
+            {
+                "int": pd.array(
+                    np.where(missing, None, rng.integers(0, 10, n)), dtype="Int64"
+                ),
+                "float": pd.array(
+                    np.where(missing, None, rng.normal(size=n)), dtype="Float64"
+                ),
+                "date": pd.to_datetime("2024-01-01")
+                + pd.to_timedelta(rng.integers(0, 100, n), unit="D"),
+                "target": rng.integers(0, 2, n),
+            }
+        )
+
+    def test_profile_nullable_numeric_columns(self):
+        profile = profile_dataframe(self.df, chunk_size=64)
+
+        for name in ["int", "float"]:
+            column, series = profile[name], self.df[name]
+
+            self.assertTrue(column.is_numeric)
+            self.assertEqual(column.dtype, series.dtype)
+            self.assertEqual(column.count, series.count())
+            pd.testing.assert_series_equal(
+                column.describe(PERCENTILES),
+                series.astype(float).describe(percentiles=PERCENTILES),
+                rtol=1e-12,
+            )
+            pd.testing.assert_series_equal(
+                column.value_counts.sort_index(),
+                series.value_counts().sort_index(),
+                check_dtype=False,
+            )
+
+        with self.assertRaises(TypeError):
+            profile["date"].describe()
+
+    def test_formatted_tests(self):
+        dataset = DataFrameDataset(raw_dataset=self.df, target_column="target")
+
+        for test_id in [
+            "validmind.data_validation.DescriptiveStatistics",
+            "validmind.data_validation.TabularDescriptionTables",
+        ]:
+            result = _run_test_class(
+                load_test(test_id),
+                test_id=test_id,
+                inputs={"dataset": dataset},
+                generate_description=False,
+                context=TestContext(),
+            )
+            self.assertTrue(result.metric.summary.results)
+
+
+class TestApproximateProfile(TestCase):
+    def setUp(self):
+        self.df = mock_dataframe(20_000)
+        rng = np.random.default_rng(1)
+        self.df["float"] = np.where(
+            rng.random(len(self.df)) < 0.1, np.nan, self.df["float"]
+        )
+        self.df["id"] = rng.permutation(len(self.df)).astype(str)
+
+    def profile(self, df, **kwargs):
+        profiler = DatasetProfiler(approximate=True, max_tracked_values=500, **kwargs)
+        for start in range(0, len(df), 3000):
+            profiler.update(df.iloc[start : start + 3000])
+
+        return profiler
+
+    def test_low_cardinality_columns_are_exact(self):
+        profile = self.profile(self.df).finalize()
+
+        for name in ["int", "bool", "str", "category", "date"]:
+            column, series = profile[name], self.df[name]
+
+            self.assertFalse(column.approximate)
+            self.assertEqual(column.distinct_error, 0)
+            self.assertEqual(column.n_distinct, series.nunique())
+            pd.testing.assert_series_equal(
+                column.value_counts.sort_index(),
+                series.value_counts().sort_index(),
+                check_index_type=False,
+            )
+
+        np.testing.assert_array_equal(
+            profile["int"].quantile(PERCENTILES), self.df["int"].quantile(PERCENTILES)
+        )
+
+    def test_high_cardinality_columns_are_estimated(self):
+        profile = self.profile(self.df).finalize()
+
+        for name in ["float", "float_nan", "id"]:
+            column, series = profile[name], self.df[name]
+            expected = series.nunique()
+
+            self.assertTrue(column.approximate)
+            self.assertLessEqual(
+                abs(column.n_distinct - expected) / expected, column.distinct_error
+            )
+            self.assertEqual(column.count, series.count())
+
+            # tracked values are undercounted by at most the count error
+            counts = series.value_counts()
+            errors = counts[column.value_counts.index] - column.value_counts
+            self.assertTrue(((errors >= 0) & (errors <= column.count_error)).all())
+            self.assertLessEqual(column.count_error, len(series) / 501)
+
+        column, series = profile["float"], self.df["float"].dropna()
+
+        # moments and the range are still exact
+        np.testing.assert_allclose(column.mean, series.mean(), rtol=1e-12)
+        np.testing.assert_allclose(column.std, series.std(), rtol=1e-12)
+        self.assertEqual(column.min, series.min())
+        self.assertEqual(column.max, series.max())
+
+        ranks = np.searchsorted(np.sort(series), column.quantile(PERCENTILES))
+        self.assertLessEqual(
+            np.abs(ranks / len(series) - PERCENTILES).max(), column.rank_error
+        )
+
+        hist, edges = column.histogram("sturges")
+        np.testing.assert_array_equal(edges, np.histogram(series, "sturges")[1])
+        self.assertEqual(hist.sum(), len(series))
+
+    def test_merge_profilers(self):
+        expected = self.profile(self.df).finalize()
+
+        profiler = DatasetProfiler(approximate=True, max_tracked_values=500)
+        for start, end in [(0, 7000), (7000, 15000), (15000, 20000)]:
+            profiler.merge(self.profile(self.df.iloc[start:end]))
+        profile = profiler.finalize()
+
+        self.assertEqual(profile.n_rows, expected.n_rows)
+        for name in ["float", "id"]:
+            self.assertEqual(profile[name].count, expected[name].count)
+            self.assertEqual(profile[name].n_distinct, expected[name].n_distinct)
+
+        # exact profiles merge to the same result as a single pass
+        workers = [DatasetProfiler(approximate=False) for _ in range(3)]
+        for i, worker in enumerate(workers):
+            worker.update(self.df.iloc[i::3])
+            if i:
+                workers[0].merge(worker)
+        merged = workers[0].finalize()
+
+        for name in ["float", "float_nan", "int"]:
+            pd.testing.assert_series_equal(
+                merged[name].describe(PERCENTILES),
+                self.df[name].describe(percentiles=PERCENTILES),
+                rtol=1e-12,
+            )
+
+        with self.assertRaises(ValueError):
+            workers[0].merge(self.profile(self.df.iloc[:10]))
+
+    def test_results_report_error_bounds(self):
+        dataset = DataFrameDataset(raw_dataset=self.df.drop(columns=["date"]))
+
+        def run(test_id):
+            return (
+                _run_test_class(
+                    load_test(test_id),
+                    test_id=test_id,
+                    inputs={"dataset": dataset},
+                    generate_description=False,
+                    context=TestContext(),
+                )
+                .test_results.summary.results[0]
+                .data
+            )
+
+        self.assertNotIn(
+            "Unique Values Error (±%)",
+            pd.DataFrame(run("validmind.data_validation.UniqueRows")).columns,
+        )
+
+        configure_profiling(approximate=True, max_tracked_values=500)
+        try:
+            table = pd.DataFrame(run("validmind.data_validation.UniqueRows"))
+        finally:
+            configure_profiling()
+
+        errors = table.set_index("Column")["Unique Values Error (±%)"]
+        self.assertEqual(errors["int"], 0)
+        self.assertAlmostEqual(errors["id"], 100 * 2.576 * 1.04 / 128)
+
+
+class TestPearsonCorrelation(TestCase):
+    def setUp(self):
+        self.df = mock_dataframe()
+        rng = np.random.default_rng(1)
+        self.df["correlated"] = self.df["float"] * 2 + rng.normal(size=len(self.df))
+        self.df["shifted"] = self.df["float_nan"] + 1e6
+
+    def test_matches_pandas(self):
+        expected = self.df.corr(numeric_only=True)
+
+        for chunk_size in [None, 97]:
+            pd.testing.assert_frame_equal(
+                pearson_correlation(self.df, chunk_size=chunk_size),
+                expected,
+                rtol=1e-9,
+            )
+
+    def test_pairwise_complete_rows(self):
+        df = pd.DataFrame(
+            {
+                "a": [1.0, 2.0, 3.0, 4.0, np.nan],
+                "b": [2.0, 4.0, np.nan, 8.0, 10.0],
+                "c": [np.nan, np.nan, 1.0, 1.0, 2.0],
+            }
+        )
+
+        pd.testing.assert_frame_equal(
+            pearson_correlation(df, chunk_size=2), df.corr(), rtol=1e-9
+        )
+
+
+class TestProfileArtifact(TestCase):
+    def test_tests_share_profile(self):
+        dataset = DataFrameDataset(
+            raw_dataset=mock_dataframe(100).drop(columns=["date"]),
+            target_column="bool",
+        )
+        context = TestContext()
+
+        with patch(
+            "validmind.tests.artifacts.profile_dataframe", wraps=profile_dataframe
+        ) as mock_profile:
+            for test_id in [
+                "validmind.data_validation.MissingValues",
+                "validmind.data_validation.UniqueRows",
+                "validmind.data_validation.Skewness",
+                "validmind.data_validation.DescriptiveStatistics",
+            ]:
+                _run_test_class(
+                    load_test(test_id),
+                    test_id=test_id,
+                    inputs={"dataset": dataset},
+                    generate_description=False,
+                    context=context,
+                )
+
+        mock_profile.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for serializing test results to JSON
+"""
+
+import json
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from validmind.utils import NumpyEncoder
+from validmind.vm_models.test.result_summary import (
+    ResultSummary,
+    ResultTable,
+    ResultTableMetadata,
+)
+
+
+class TestNumpyEncoder(TestCase):
+    def test_encode(self):
+        obj = {
+            "int": np.int64(1),
+            "float": np.float32(0.5),
+            "bool": np.bool_(True),
+            "array": np.array([1, 2]),
+            "timestamp": pd.Timestamp("2024-01-01"),
+            "interval": pd.Interval(0, 1),
+            "nested": [{"nan": float("nan"), "inf": np.float64("inf")}],
+        }
+
+        self.assertEqual(
+            json.loads(json.dumps(obj, cls=NumpyEncoder, allow_nan=False)),
+            {
+                "int": 1,
+                "float": 0.5,
+                "bool": True,
+                "array": [1, 2],
+                "timestamp": "2024-01-01 00:00:00",
+                "interval": "[0, 1]",
+                "nested": [{"nan": None, "inf": None}],
+            },
+        )
+
+    def test_encode_keeps_options(self):
+        obj = {"b": [1.5, float("nan")], "a": np.int64(2)}
+
+        self.assertEqual(
+            json.dumps(obj, cls=NumpyEncoder, sort_keys=True, indent=2),
+            json.dumps({"a": 2, "b": [1.5, None]}, sort_keys=True, indent=2),
+        )
+
+    def test_encode_only_walks_objects_with_nan(self):
+        with patch("validmind.utils.nan_to_none", side_effect=lambda obj: obj) as mock:
+            json.dumps({"a": [1.5, np.float64(2.5)]}, cls=NumpyEncoder)
+            mock.assert_not_called()
+
+            json.dumps({"a": [1.5, float("nan")]}, cls=NumpyEncoder)
+            mock.assert_called_once()
+
+
+class TestResultTable(TestCase):
+    def setUp(self):
+        self.table = ResultTable(
+            data=pd.DataFrame(
+                {
+                    "Column": ["a", "b", "c"],
+                    "Value": [1.23456789, np.nan, np.inf],
+                    "Count": [1, 2, 3],
+                }
+            ),
+            metadata=ResultTableMetadata(title="Table"),
+        )
+
+    def test_serialize(self):
+        self.assertEqual(
+            self.table.serialize(),
+            {
+                "type": "table",
+                "data": [
+                    {"Column": "a", "Value": 1.2346, "Count": 1},
+                    {"Column": "b", "Value": None, "Count": 2},
+                    {"Column": "c", "Value": None, "Count": 3},
+                ],
+                "metadata": {"title": "Table"},
+            },
+        )
+
+        # the original data is left as-is
+        self.assertTrue(np.isnan(self.table.data["Value"][1]))
+        pd.testing.assert_frame_equal(
+            self.table.serialize(as_df=True)["data"], self.table.data.round(4)
+        )
+
+    def test_serialize_is_memoized(self):
+        summary = ResultSummary(results=[self.table])
+
+        with patch(
+            "validmind.vm_models.test.result_summary._to_records",
+            wraps=lambda df: df.to_dict(orient="records"),
+        ) as mock_to_records:
+            first = summary.serialize()
+            self.assertIs(summary.serialize()[0]["data"], first[0]["data"])
+            self.assertEqual(mock_to_records.call_count, 1)
+
+            # replacing the data serializes the table again
+            self.table.data = [{"Column": "d", "Value": 1.0}]
+            self.assertEqual(
+                summary.serialize()[0]["data"], [{"Column": "d", "Value": 1.0}]
+            )
+            self.assertEqual(mock_to_records.call_count, 2)
+
+    def test_serialize_nullable_columns(self):
+        table = ResultTable(
+            data=pd.DataFrame(
+                {
+                    "Float": pd.array([1.5, None, np.inf], dtype="Float64"),
+                    "Int": pd.array([1, None, 3], dtype="Int64"),
+                }
+            )
+        )
+
+        self.assertEqual(
+            table.serialize()["data"],
+            [
+                {"Float": 1.5, "Int": 1},
+                {"Float": None, "Int": None},
+                {"Float": None, "Int": 3},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the approximate distinct count and quantile sketches
+"""
+
+import unittest
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from validmind.vm_models.dataset.sketches import HyperLogLog, KLLSketch
+
+
+class TestHyperLogLog(TestCase):
+    def test_count_within_error_bound(self):
+        rng = np.random.default_rng(0)
+
+        for n in [10, 1_000, 100_000]:
+            values = rng.integers(0, n, 3 * n)
+            expected = len(np.unique(values))
+
+            sketch = HyperLogLog()
+            sketch.update(values)
+
+            self.assertLessEqual(
+                abs(sketch.count() - expected) / expected, sketch.error_bound
+            )
+
+    def test_merge(self):
+        values = pd.Series(np.arange(50_000).astype(str))
+
+        sketch = HyperLogLog()
+        sketch.update(values)
+
+        merged = HyperLogLog()
+        for chunk in np.array_split(values, 7):
+            other = HyperLogLog()
+            other.update(chunk)
+            merged.merge(other)
+
+        np.testing.assert_array_equal(merged.registers, sketch.registers)
+
+        with self.assertRaises(ValueError):
+            merged.merge(HyperLogLog(precision=10))
+
+    def test_equal_values_hash_the_same(self):
+        sketch = HyperLogLog()
+        sketch.update(np.array([0.0, -0.0, 1.5]))
+        sketch.update(np.array([1.5]))
+
+        self.assertAlmostEqual(sketch.count(), 2, delta=0.01)
+
+
+class TestKLLSketch(TestCase):
+    def setUp(self):
+        self.values = np.random.default_rng(0).normal(size=200_000)
+        self.q = np.linspace(0, 1, 21)
+
+    def assert_rank_error_within_bound(self, sketch):
+        self.assertEqual(sketch.n, len(self.values))
+
+        ranks = np.searchsorted(np.sort(self.values), sketch.quantile(self.q))
+        errors = np.abs(ranks / len(self.values) - self.q)
+
+        self.assertLessEqual(errors.max(), sketch.normalized_rank_error)
+
+    def test_quantiles_within_error_bound(self):
+        sketch = KLLSketch()
+        for chunk in np.array_split(self.values, 13):
+            sketch.update(chunk)
+
+        self.assert_rank_error_within_bound(sketch)
+
+        # memory doesn't grow with the number of values
+        self.assertLess(sum(len(level) for level in sketch.levels), 3 * sketch.k)
+
+    def test_merge(self):
+        sketch = KLLSketch()
+        for seed, chunk in enumerate(np.array_split(self.values, 4)):
+            other = KLLSketch(seed=seed)
+            other.update(chunk)
+            sketch.merge(other)
+
+        self.assert_rank_error_within_bound(sketch)
+
+    def test_histogram(self):
+        sketch = KLLSketch()
+        sketch.update(self.values)
+
+        hist, edges = sketch.histogram(10, (self.values.min(), self.values.max()))
+        expected_hist, expected_edges = np.histogram(self.values, bins=10)
+
+        np.testing.assert_array_equal(edges, expected_edges)
+        self.assertEqual(hist.sum(), len(self.values))
+        self.assertLessEqual(
+            np.abs(hist - expected_hist).max(),
+            2 * sketch.normalized_rank_error * len(self.values),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
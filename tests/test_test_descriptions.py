@@ -0,0 +1,240 @@
+"""
+Unit tests for generating test result descriptions with an LLM
+"""
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from openai import OpenAI
+from PIL import Image
+
+from validmind.ai import test_descriptions
+from validmind.ai.test_descriptions import (
+    background_generate_description,
+    generate_description,
+)
+from validmind.unit_metrics.cache import LRUCache, SQLiteStore
+from validmind.vm_models.figure import Figure
+
+
+class FakeOpenAIServer:
+    """Local server that implements the OpenAI chat completions endpoint
+
+    Records every request, tracks the number of concurrent requests and responds
+    with a rate limit error (HTTP 429) to the first `rate_limited` requests.
+    """
+
+    def __init__(self, rate_limited=0, delay=0):
+        self.requests = []
+        self.rate_limited = rate_limited
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+                with server._lock:
+                    server.requests.append(body)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    n = len(server.requests)
+                    rate_limited = n <= server.rate_limited
+
+                time.sleep(server.delay)
+
+                with server._lock:
+                    server.in_flight -= 1
+
+                if rate_limited:
+                    self._respond(
+                        429,
+                        {"error": {"message": "Rate limit", "type": "rate_limit"}},
+                        {"Retry-After": "0"},
+                    )
+                    return
+
+                self._respond(
+                    200,
+                    {
+                        "id": "chatcmpl-1",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": f"Description {n}",
+                                },
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    },
+                )
+
+            def _respond(self, status, body, headers=None):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/v1"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def png_image(width, height):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color=(200, 100, 50)).save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+class TestGenerateDescription(TestCase):
+    def setUp(self):
+        self.server = FakeOpenAIServer()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmpdir.name, "descriptions.db")
+
+        client = OpenAI(base_url=self.server.url, api_key="test")
+        patches = [
+            patch(
+                "validmind.ai.utils.get_client_and_model",
+                return_value=(client, "gpt-4o"),
+            ),
+            patch(
+                "validmind.ai.test_descriptions._get_cache",
+                side_effect=lambda: self.cache,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        self.cache = LRUCache(store=SQLiteStore(self.cache_path))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.tmpdir.cleanup()
+
+    def generate(self, summary, test_id="validmind.data_validation.ClassImbalance"):
+        return generate_description(
+            test_id=test_id,
+            test_description="Checks the class balance",
+            test_summary=summary,
+        )
+
+    def test_descriptions_are_cached(self):
+        self.assertEqual(self.generate("summary"), "Description 1")
+        self.assertEqual(self.generate("summary"), "Description 1")
+        self.assertEqual(len(self.server.requests), 1)
+
+        # a new process re-running the unchanged test uses the persisted description
+        self.cache = LRUCache(store=SQLiteStore(self.cache_path))
+        self.assertEqual(self.generate("summary"), "Description 1")
+        self.assertEqual(len(self.server.requests), 1)
+
+        # a different result or test needs a new description
+        self.assertEqual(self.generate("other summary"), "Description 2")
+        self.assertEqual(
+            self.generate("summary", test_id="validmind.data_validation.Skewness"),
+            "Description 3",
+        )
+        self.assertEqual(len(self.server.requests), 3)
+
+    @patch("validmind.ai.test_descriptions.get_rate_limit_delay", return_value=0)
+    def test_rate_limited_requests_are_retried(self, mock_delay):
+        self.server.rate_limited = 2
+
+        self.assertEqual(self.generate("summary"), "Description 3")
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(mock_delay.call_count, 2)
+
+    def test_concurrency_is_capped(self):
+        self.server.delay = 0.1
+
+        futures = [
+            background_generate_description(
+                test_id="validmind.data_validation.ClassImbalance",
+                test_description="Checks the class balance",
+                test_summary=f"summary {i}",
+            )
+            for i in range(3 * test_descriptions.MAX_CONCURRENCY)
+        ]
+        descriptions = {future.get_description() for future in futures}
+
+        self.assertEqual(len(descriptions), 3 * test_descriptions.MAX_CONCURRENCY)
+        self.assertLessEqual(
+            self.server.max_in_flight, test_descriptions.MAX_CONCURRENCY
+        )
+
+    def test_figures_are_downscaled(self):
+        figure = Figure(key="key", figure=png_image(2400, 1200))
+
+        generate_description(
+            test_id="validmind.data_validation.ClassImbalance",
+            test_description="Checks the class balance",
+            test_summary=None,
+            figures=[figure],
+        )
+
+        content = self.server.requests[0]["messages"][1]["content"]
+        url = next(c["image_url"]["url"] for c in content if c["type"] == "image_url")
+        image = Image.open(BytesIO(base64.b64decode(url.split(",")[1])))
+
+        self.assertEqual(image.size, (1024, 512))
+
+
+class TestDescriptionsCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(test_descriptions.configure_cache)
+
+    def test_descriptions_are_only_persisted_when_configured(self):
+        # `__cache` is set directly since the env var is only read on first use
+        setattr(test_descriptions, "__cache", None)
+        with patch.dict(os.environ, clear=False) as env:
+            env.pop("VALIDMIND_LLM_DESCRIPTIONS_CACHE_PATH", None)
+            self.assertIsNone(test_descriptions._get_cache().store)
+
+        path = os.path.join(self.tmpdir.name, "descriptions.db")
+        setattr(test_descriptions, "__cache", None)
+        with patch.dict(os.environ, {"VALIDMIND_LLM_DESCRIPTIONS_CACHE_PATH": path}):
+            self.assertIsNotNone(test_descriptions._get_cache().store)
+
+        test_descriptions.configure_cache(path=path)
+        self.assertIsNotNone(test_descriptions._get_cache().store)
+
+        test_descriptions.configure_cache()
+        self.assertIsNone(test_descriptions._get_cache().store)
+
+
+if __name__ == "__main__":
+    unittest.main()
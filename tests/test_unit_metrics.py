@@ -0,0 +1,147 @@
+"""
+Unit tests for the unit metric results cache
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+import validmind.unit_metrics as unit_metrics
+from validmind.client import init_dataset, init_model
+from validmind.unit_metrics.cache import LRUCache, SQLiteStore
+
+
+class TestUnitMetricsCache(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = unit_metrics.unit_metric_results_cache
+
+    def tearDown(self):
+        unit_metrics.unit_metric_results_cache = self.cache
+        self.tmp_dir.cleanup()
+
+    def test_lru_eviction(self):
+        cache = LRUCache(max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)  # "a" is now the most recently used
+
+        cache["c"] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+
+    def test_sqlite_store(self):
+        path = os.path.join(self.tmp_dir.name, "results.db")
+
+        store = SQLiteStore(path, max_size=2)
+        store.set("a", (0.5, ["dataset"], {}))
+        store.set("b", (0.6, ["dataset"], {}))
+        store.get("a")
+        store.set("c", (0.7, ["dataset"], {}))
+
+        # a new in-memory cache picks up results persisted by an earlier one
+        cache = LRUCache(store=SQLiteStore(path))
+        self.assertEqual(len(cache.store), 2)
+        self.assertEqual(cache["a"], (0.5, ["dataset"], {}))
+        self.assertNotIn("b", cache)
+
+    def test_run_metric_uses_persisted_results(self):
+        df = pd.DataFrame({"x": np.arange(20) / 20, "y": [0] * 10 + [1] * 10})
+        vm_dataset = init_dataset(df, input_id="ds", target_column="y", __log=False)
+        model = LogisticRegression().fit(df[["x"]].to_numpy(), df["y"])
+        vm_model = init_model(model, input_id="model", __log=False)
+        vm_dataset.assign_predictions(vm_model)
+
+        path = os.path.join(self.tmp_dir.name, "results.db")
+        metric_id = "validmind.unit_metrics.classification.Accuracy"
+        inputs = {"dataset": vm_dataset, "model": vm_model}
+
+        unit_metrics.configure_cache(path=path)
+        value = unit_metrics.run_metric(metric_id, inputs=inputs, value_only=True)
+
+        # simulate a new process with an empty in-memory cache
+        unit_metrics.configure_cache(path=path)
+        with patch.object(unit_metrics, "load_metric") as mock_load_metric:
+            cached_value = unit_metrics.run_metric(
+                metric_id, inputs=inputs, value_only=True
+            )
+            mock_load_metric.assert_not_called()
+
+        self.assertEqual(cached_value, value)
+
+    def test_persisted_results_key_on_version_source_and_model(self):
+        df = pd.DataFrame({"x": np.arange(20) / 20, "y": [0] * 10 + [1] * 10})
+        vm_dataset = init_dataset(df, input_id="ds", target_column="y", __log=False)
+        model = LogisticRegression().fit(df[["x"]].to_numpy(), df["y"])
+        vm_model = init_model(model, input_id="model", __log=False)
+        vm_dataset.assign_predictions(vm_model)
+
+        metric_id = "validmind.unit_metrics.classification.Accuracy"
+        inputs = {"dataset": vm_dataset, "model": vm_model}
+        fingerprint = unit_metrics._serialize_model(vm_model)
+        key = unit_metrics._get_metric_cache_key(metric_id, inputs, {}, fingerprint)
+
+        with patch.object(unit_metrics, "__version__", "0.0.0"):
+            self.assertNotEqual(
+                unit_metrics._get_metric_cache_key(metric_id, inputs, {}, fingerprint),
+                key,
+            )
+
+        with patch.object(unit_metrics, "_serialize_metric_source", return_value=""):
+            self.assertNotEqual(
+                unit_metrics._get_metric_cache_key(metric_id, inputs, {}, fingerprint),
+                key,
+            )
+
+        # a different model logged with the same input_id
+        other = LogisticRegression(C=0.01).fit(df[["x"]].to_numpy(), df["y"])
+        other_fingerprint = unit_metrics._serialize_model(
+            init_model(other, input_id="model", __log=False)
+        )
+        self.assertNotEqual(other_fingerprint, fingerprint)
+
+    def test_metric_source_is_hashed_once(self):
+        metric_id = "validmind.unit_metrics.classification.Accuracy"
+        unit_metrics._serialize_metric_source.cache_clear()
+
+        with patch.object(
+            unit_metrics, "find_spec", wraps=unit_metrics.find_spec
+        ) as mock_find_spec:
+            source = unit_metrics._serialize_metric_source(metric_id)
+            self.assertEqual(unit_metrics._serialize_metric_source(metric_id), source)
+            mock_find_spec.assert_called_once_with(metric_id)
+
+        self.assertNotEqual(source, "")
+
+    def test_unpicklable_model_results_are_not_persisted(self):
+        df = pd.DataFrame({"x": np.arange(20) / 20, "y": [0] * 10 + [1] * 10})
+        vm_dataset = init_dataset(df, input_id="ds", target_column="y", __log=False)
+        model = LogisticRegression().fit(df[["x"]].to_numpy(), df["y"])
+        vm_model = init_model(model, input_id="model", __log=False)
+        vm_dataset.assign_predictions(vm_model)
+
+        path = os.path.join(self.tmp_dir.name, "results.db")
+        metric_id = "validmind.unit_metrics.classification.Accuracy"
+        inputs = {"dataset": vm_dataset, "model": vm_model}
+
+        unit_metrics.configure_cache(path=path)
+        with patch.object(unit_metrics, "_serialize_model", return_value=None):
+            value = unit_metrics.run_metric(metric_id, inputs=inputs, value_only=True)
+
+        # kept in memory but not written to the store
+        self.assertEqual(len(unit_metrics.unit_metric_results_cache), 1)
+        self.assertEqual(len(unit_metrics.unit_metric_results_cache.store), 0)
+        self.assertIsNotNone(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,33 @@
 Unit tests for ValidMind tests module
 """
 
+import json
+import subprocess
+import sys
+import types
 import unittest
 from unittest import TestCase
+from unittest.mock import patch
 
+import pandas as pd
+
+from validmind import init_dataset
 from validmind.vm_models import Test
-from validmind.tests import list_tests, load_test, describe_test, register_test_provider
+from validmind.tests import (
+    list_tags,
+    list_tasks,
+    list_tests,
+    load_test,
+    describe_test,
+    register_test_provider,
+    run_test,
+)
+from validmind.__version__ import __version__
+from validmind.errors import MissingDependencyError
+from validmind.tests import __catalog__
+from validmind.tests._store import test_store
+from validmind.tests.load import _get_test_metadata
+from validmind.tests.utils import uses_pyplot
 
 
 class TestTestsModule(TestCase):
@@ -42,6 +64,56 @@ class TestTestsModule(TestCase):
         self.assertTrue("Required Inputs" in description)
         self.assertTrue("Params" in description)
 
+    @patch("validmind.tests.load.load_test", wraps=load_test)
+    def test_list_tests_from_catalog(self, mock_load_test):
+        tests = list_tests(pretty=False)
+        tags = list_tags()
+        tasks = list_tasks()
+        describe_test("validmind.data_validation.ClassImbalance", raw=True)
+
+        # only tests missing from the catalog are loaded to get their metadata
+        self.assertTrue(
+            all(
+                call.args[0] not in __catalog__.TESTS
+                for call in mock_load_test.call_args_list
+            )
+        )
+        self.assertIn("validmind.data_validation.ClassImbalance", tests)
+        self.assertIn("tabular_data", tags)
+        self.assertIn("classification", tasks)
+
+    def test_catalog_matches_tests(self):
+        """
+        Test that the generated catalog is up to date with every built-in test
+        """
+        self.assertEqual(__catalog__.VERSION, __version__)
+        self.assertEqual(set(__catalog__.TESTS), set(test_store.get_test_ids()))
+
+        for test_id, catalog_metadata in __catalog__.TESTS.items():
+            with self.subTest(test_id=test_id):
+                metadata = dict(catalog_metadata)
+                required_dependencies = metadata.pop("required_dependencies")
+                extra = metadata.pop("extra")
+
+                try:
+                    test = load_test(test_id)
+                except MissingDependencyError as e:
+                    # the rest of the metadata was read from the test's source
+                    self.assertEqual(required_dependencies, e.required_dependencies)
+                    self.assertEqual(extra, e.extra)
+                    continue
+
+                self.assertEqual(metadata, _get_test_metadata(test))
+
+    @patch("validmind.tests.load.load_test", wraps=load_test)
+    def test_list_tests_outdated_catalog(self, mock_load_test):
+        with patch.object(__catalog__, "VERSION", "0.0.0"):
+            tests = list_tests(filter="ClassImbalance", pretty=False)
+
+        self.assertEqual(tests, ["validmind.data_validation.ClassImbalance"])
+        loaded = {call.args[0] for call in mock_load_test.call_args_list}
+        self.assertTrue(set(__catalog__.TESTS).issubset(loaded))
+
     def test_test_provider_registration(self):
         class TestProvider:
             def load_test(self, test_id):
@@ -54,6 +126,111 @@ class TestTestsModule(TestCase):
         test = load_test(test_id="fake.fake_test_id")
         self.assertEqual(test.test_id, "fake.fake_test_id")
 
+    def test_run_test_param_grid_parallel(self):
+        df = pd.DataFrame({"x": range(100), "y": [0] * 85 + [1] * 15})
+        dataset = init_dataset(df, target_column="y", __log=False)
+        param_grid = {"min_percent_threshold": [5, 10, 20, 30]}
+
+        results = [
+            run_test(
+                "validmind.data_validation.ClassImbalance",
+                inputs={"dataset": dataset},
+                param_grid=param_grid,
+                show=False,
+                max_workers=max_workers,
+                __generate_description=False,
+            )
+            for max_workers in [None, 4]
+        ]
+
+        sequential, parallel = [r.test_results.summary.serialize() for r in results]
+        # the results of the parallel runs are combined in the order of the grid
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(
+            [row["min_percent_threshold"] for row in parallel[0]["data"]],
+            [5, 5, 10, 10, 20, 20, 30, 30],
+        )
+        self.assertEqual(len(results[1].figures), 4)
+
+    def test_uses_pyplot_through_helper_module(self):
+        helpers = types.ModuleType("validmind.tests._fake_plot_helpers")
+        exec(
+            "import matplotlib.pyplot as plt\n"
+            "def plot_values(values):\n"
+            "    return plt.plot(values)\n",
+            vars(helpers),
+        )
+        self.addCleanup(sys.modules.pop, helpers.__name__, None)
+        sys.modules[helpers.__name__] = helpers
+
+        def make_test(func):
+            namespace = {"helper": func}
+            exec("def run(self):\n    return helper([1, 2, 3])\n", namespace)
+
+            return type("FakeTest", (), {"run": namespace["run"]})
+
+        self.assertTrue(uses_pyplot(make_test(helpers.plot_values)))
+        self.assertFalse(uses_pyplot(make_test(len)))
+        self.assertTrue(
+            uses_pyplot(
+                load_test("validmind.model_validation.sklearn.SHAPGlobalImportance")
+            )
+        )
+        self.assertFalse(
+            uses_pyplot(load_test("validmind.data_validation.ClassImbalance"))
+        )
+
+
+class TestTestModuleImports(TestCase):
+    # optional and heavy libraries that test modules only import when they run
+    DEFERRED_MODULES = [
+        "arch",
+        "datasets",
+        "evaluate",
+        "langdetect",
+        "nltk",
+        "numba",
+        "rouge",
+        "scorecardpy",
+        "shap",
+        "textblob",
+        "torch",
+        "transformers",
+        "ydata_profiling",
+    ]
+
+    # imports each test module in turn and reports the deferred modules it imported
+    SCRIPT = """
+import importlib, json, sys
+from validmind.tests import __catalog__
+
+deferred, imported = json.loads(sys.argv[1]), {}
+for test_id, metadata in __catalog__.TESTS.items():
+    if metadata["required_dependencies"]:
+        continue  # tests with optional dependencies check for them on import
+
+    before = set(sys.modules)
+    importlib.import_module("validmind.tests." + test_id.split(".", 1)[1])
+    new = [m for m in deferred if m in sys.modules and m not in before]
+    if new:
+        imported[test_id] = new
+
+print(json.dumps(imported))
+"""
+
+    def test_test_modules_defer_heavy_imports(self):
+        """
+        Test that loading a test doesn't import the heavy libraries it only needs to run
+        """
+        output = subprocess.run(
+            [sys.executable, "-c", self.SCRIPT, json.dumps(self.DEFERRED_MODULES)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(json.loads(output.stdout.strip().splitlines()[-1]), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,14 +38,6 @@ After you have pasted the code snippet into your development source code and exe
 library will register with ValidMind. You can now use the Library to document and test your models,
 and to upload to the ValidMind Platform.
 """
-import warnings
-
-# Ignore Numba warnings. We are not requiring this package directly
-from numba.core.errors import NumbaDeprecationWarning, NumbaPendingDeprecationWarning
-
-warnings.simplefilter("ignore", category=NumbaDeprecationWarning)
-warnings.simplefilter("ignore", category=NumbaPendingDeprecationWarning)
-
 from .__version__ import __version__  # noqa: E402
 from .api_client import init, log_metric, reload
 from .client import (  # noqa: E402
@@ -2,20 +2,35 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
+import base64
+import hashlib
+import json
 import os
 import re
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from typing import Union
 
-from jinja2 import Template
-
-from validmind.utils import md_to_html
+from validmind.utils import get_rate_limit_delay, is_rate_limit_error, md_to_html
 
 from ..client_config import client_config
 from ..logging import get_logger
 
-__executor = ThreadPoolExecutor()
+# maximum number of descriptions that are generated at the same time
+MAX_CONCURRENCY = int(os.getenv("VALIDMIND_LLM_DESCRIPTIONS_MAX_CONCURRENCY", 4))
+# number of times a rate limited (HTTP 429) request is retried
+MAX_RETRIES = int(os.getenv("VALIDMIND_LLM_DESCRIPTIONS_MAX_RETRIES", 5))
+# figures are downscaled so that their longest side is at most this many pixels
+MAX_IMAGE_SIZE = 1024
+
+__executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENCY, thread_name_prefix="vm-description"
+)
 __prompt = None
+__cache = None
+__cache_lock = threading.Lock()
 
 logger = get_logger(__name__)
 
@@ -24,10 +39,105 @@ AI_REVISION_NAME = "Generated by ValidMind AI"
 DEFAULT_REVISION_NAME = "Default Description"
 
 
+def _create_cache(path=None):
+    # TODO: fix circular import
+    from validmind.unit_metrics.cache import LRUCache, SQLiteStore
+
+    store = None
+    if path:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            store = SQLiteStore(path)
+        except Exception as e:
+            logger.warning(f"Failed to open the LLM descriptions cache: {e}")
+
+    return LRUCache(store=store)
+
+
+def _get_cache():
+    """Get the cache of generated descriptions
+
+    Descriptions are cached in memory. They are only persisted (so re-running
+    unchanged tests in a new process doesn't call the LLM again) when a path is set
+    with `configure_cache` or the `VALIDMIND_LLM_DESCRIPTIONS_CACHE_PATH` environment
+    variable.
+    """
+    global __cache
+
+    with __cache_lock:
+        if __cache is None:
+            __cache = _create_cache(os.getenv("VALIDMIND_LLM_DESCRIPTIONS_CACHE_PATH"))
+
+        return __cache
+
+
+def configure_cache(path=None):
+    """Configure the cache of generated test result descriptions
+
+    Args:
+        path (str, optional): Path to a sqlite database to persist descriptions to.
+            Defaults to None, which only caches descriptions in memory.
+    """
+    global __cache
+
+    with __cache_lock:
+        __cache = _create_cache(path)
+
+
+def _get_cache_key(test_id: str, model: str, messages: list) -> str:
+    # the messages hold everything the description depends on (summary, figures,
+    # metric and prompt) so the key changes whenever any of them changes
+    digest = hashlib.sha256(
+        json.dumps(messages, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+    return f"{test_id}:{model}:{digest}"
+
+
+def _downscale_image(png: bytes) -> str:
+    """Downscale a PNG image to `MAX_IMAGE_SIZE` and return it as a base64 URL"""
+    from PIL import Image
+
+    image = Image.open(BytesIO(png))
+
+    if max(image.size) > MAX_IMAGE_SIZE:
+        image.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE))
+        buffer = BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+        png = buffer.getvalue()
+
+    return f"data:image/png;base64,{base64.b64encode(png).decode('utf-8')}"
+
+
+def _create_completion(client, model: str, messages: list) -> str:
+    """Create a chat completion, backing off and retrying when rate limited"""
+    # the retries are handled here instead of by the client so they're counted
+    # against MAX_RETRIES and respect Retry-After
+    client = client.with_options(max_retries=0)
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                temperature=0.0,
+                messages=messages,
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt == MAX_RETRIES:
+                raise e
+
+            delay = get_rate_limit_delay(e, attempt)
+            logger.debug(f"Rate limited by the LLM, retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
 def _load_prompt():
     global __prompt
 
     if not __prompt:
+        from jinja2 import Template
+
         folder_path = os.path.join(os.path.dirname(__file__), "test_result_description")
         with open(os.path.join(folder_path, "system.jinja"), "r") as f:
             system_prompt = f.read()
@@ -104,6 +214,7 @@ def generate_description(
 
     # TODO: fix circular import
     from validmind.ai.utils import get_client_and_model
+    from validmind.vm_models.figure import render_figures
 
     client, model = get_client_and_model()
 
@@ -124,25 +235,32 @@ def generate_description(
             test_summary = metric_summary
 
     figures = [] if test_summary else figures
+    render_figures(figures)
 
     input_data = {
         "test_name": test_name,
         "test_description": test_description,
         "summary": test_summary,
-        "figures": [figure._get_b64_url() for figure in figures],
+        "figures": [_downscale_image(figure._render("png")) for figure in figures],
     }
     system, user = _load_prompt()
 
-    response = client.chat.completions.create(
-        model=model,
-        temperature=0.0,
-        messages=[
-            prompt_to_message("system", system.render(input_data)),
-            prompt_to_message("user", user.render(input_data)),
-        ],
-    )
+    messages = [
+        prompt_to_message("system", system.render(input_data)),
+        prompt_to_message("user", user.render(input_data)),
+    ]
+
+    cache = _get_cache()
+    key = _get_cache_key(test_id, model, messages)
+
+    description = cache.get(key)
+    if description is None:
+        description = _create_completion(client, model, messages)
+        cache[key] = description
+    else:
+        logger.debug(f"Using cached description for {test_id}")
 
-    return response.choices[0].message.content
+    return description
 
 
 def background_generate_description(
@@ -11,6 +11,8 @@ import asyncio
 import atexit
 import json
 import os
+import random
+import weakref
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode, urljoin
@@ -20,9 +22,18 @@ import requests
 from aiohttp import FormData
 
 from .client_config import client_config
-from .errors import MissingAPICredentialsError, MissingModelIdError, raise_api_error
+from .errors import (
+    APIRequestError,
+    InvalidAPICredentialsError,
+    InvalidMetricResultsError,
+    InvalidRequestBodyError,
+    InvalidTestResultsError,
+    MissingAPICredentialsError,
+    MissingModelIdError,
+    raise_api_error,
+)
 from .logging import get_logger, init_sentry, send_single_error
-from .utils import NumpyEncoder, run_async
+from .utils import NumpyEncoder, run_async, wait_for_background_tasks
 from .vm_models import Figure, MetricResult, ThresholdTestResults
 
 # TODO: can't import types from vm_models because of circular dependency
@@ -35,21 +46,56 @@ _api_host = os.getenv("VM_API_HOST")
 _model_cuid = os.getenv("VM_API_MODEL")
 _monitoring = False
 
-__api_session: Optional[aiohttp.ClientSession] = None
+# maximum number of requests in flight and retries for transient request failures
+_max_concurrent_requests = int(os.getenv("VM_API_MAX_CONCURRENT_REQUESTS", 8))
+_max_retries = int(os.getenv("VM_API_MAX_RETRIES", 3))
+
+# rate limiting and gateway errors are worth retrying, other errors are not. A POST
+# that hit a gateway error or timed out may still have been handled by the API so
+# POSTs are only retried when the request was rejected before being handled
+_RETRY_STATUS_CODES = (429, 502, 503, 504)
+_RETRY_STATUS_CODES_POST = (429, 503)
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_MAX = 30
+
+# metric results sent to the same endpoint within `_batch_max_delay` seconds are
+# coalesced into bulk requests of up to `_batch_max_size` results
+_batch_max_size = int(os.getenv("VM_API_BATCH_MAX_SIZE", 50))
+_batch_max_delay = float(os.getenv("VM_API_BATCH_MAX_DELAY", 0.05))
+
+# asyncio primitives are bound to an event loop so we keep one session, semaphore
+# and batcher per loop (e.g. background logging runs in its own loop and thread)
+__api_sessions = weakref.WeakKeyDictionary()
+__api_semaphores = weakref.WeakKeyDictionary()
+__api_batchers = weakref.WeakKeyDictionary()
 
 
 @atexit.register
 def _close_session():
-    """Closes the async client session at exit"""
-    global __api_session
+    """Closes the async client sessions at exit"""
+    # errors of background tasks have already been logged
+    wait_for_background_tasks()
+
+    for loop, session in list(__api_sessions.items()):
+        if session.closed:
+            continue
 
-    if __api_session and not __api_session.closed:
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(__api_session.close())
+            if loop.is_closed():
+                # the loop was closed with the session open (e.g. by `asyncio.run`)
+                # so its connections can only be released from a new loop
+                close_loop = asyncio.new_event_loop()
+                try:
+                    close_loop.run_until_complete(session.close())
+                finally:
+                    close_loop.close()
+            elif loop.is_running():
+                # running in another thread (e.g. a notebook's loop)
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(
+                    timeout=5
+                )
             else:
-                loop.run_until_complete(__api_session.close())
+                loop.run_until_complete(session.close())
         except Exception as e:
             logger.exception("Error closing aiohttp session at exit: %s", e)
 
@@ -72,16 +118,17 @@ def _get_api_headers() -> Dict[str, str]:
 
 
 def _get_session() -> aiohttp.ClientSession:
-    """Initializes the async client session"""
-    global __api_session
+    """Initializes the async client session for the running event loop"""
+    loop = asyncio.get_running_loop()
+    session = __api_sessions.get(loop)
 
-    if not __api_session or __api_session.closed:
-        __api_session = aiohttp.ClientSession(
+    if not session or session.closed:
+        session = __api_sessions[loop] = aiohttp.ClientSession(
             headers=_get_api_headers(),
             timeout=aiohttp.ClientTimeout(total=30),
         )
 
-    return __api_session
+    return session
 
 
 def _get_url(
@@ -101,17 +148,79 @@ def _get_url(
     return urljoin(_api_host, endpoint)
 
 
+def _get_semaphore() -> asyncio.Semaphore:
+    """Returns the semaphore that bounds the number of concurrent API requests"""
+    loop = asyncio.get_running_loop()
+
+    if loop not in __api_semaphores:
+        __api_semaphores[loop] = asyncio.Semaphore(_max_concurrent_requests)
+
+    return __api_semaphores[loop]
+
+
+def _get_retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with jitter, honoring the `Retry-After` header if present"""
+    try:
+        return min(float(retry_after), _RETRY_BACKOFF_MAX)
+    except (TypeError, ValueError):
+        delay = min(_RETRY_BACKOFF_BASE * 2**attempt, _RETRY_BACKOFF_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
+
+async def _request(method: str, url: str, get_data=None) -> Dict[str, Any]:
+    """Sends a request to the API
+
+    At most `_max_concurrent_requests` requests are sent at once. Connection errors,
+    timeouts and rate limiting or gateway errors are retried up to `_max_retries` times
+    with exponential backoff. Since POSTs aren't idempotent, they're only retried on
+    rate limiting, unavailability or failing to connect to the API so a result isn't
+    logged twice. `get_data` is called for each attempt since request bodies (e.g.
+    multipart forms) can only be sent once.
+    """
+    session = _get_session()
+    idempotent = method == "get"
+    send = session.get if idempotent else session.post
+    retry_status_codes = _RETRY_STATUS_CODES if idempotent else _RETRY_STATUS_CODES_POST
+
+    async with _get_semaphore():
+        for attempt in range(_max_retries + 1):
+            retry_after = None
+            try:
+                kwargs = {"data": get_data()} if get_data else {}
+
+                async with send(url, **kwargs) as r:
+                    if r.status == 200:
+                        return await r.json()
+
+                    if r.status not in retry_status_codes or attempt == _max_retries:
+                        raise_api_error(await r.text(), status=r.status)
+
+                    retry_after = r.headers.get("Retry-After")
+                    reason = f"status {r.status}"
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # the request was never sent if the connection couldn't be made
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+
+                if attempt == _max_retries or (sent and not idempotent):
+                    raise e
+
+                reason = f"{e.__class__.__name__}: {e}"
+
+            delay = _get_retry_delay(attempt, retry_after)
+            logger.debug(
+                f"Request to {url} failed ({reason}). Retrying in {delay:.2f}s "
+                f"(attempt {attempt + 1} of {_max_retries})"
+            )
+            await asyncio.sleep(delay)
+
+
 async def _get(
     endpoint: str, params: Optional[Dict[str, str]] = None
 ) -> Dict[str, Any]:
     url = _get_url(endpoint, params)
-    session = _get_session()
 
-    async with session.get(url) as r:
-        if r.status != 200:
-            raise_api_error(await r.text())
-
-        return await r.json()
+    return await _request("get", url)
 
 
 async def _post(
@@ -121,32 +230,145 @@ async def _post(
     files: Optional[Dict[str, Tuple[str, BytesIO, str]]] = None,
 ) -> Dict[str, Any]:
     url = _get_url(endpoint, params)
-    session = _get_session()
 
     if not isinstance(data, (dict)) and files is not None:
         raise ValueError("Cannot pass both non-json data and file objects to _post")
 
-    if files:
+    def get_data():
+        if not files:
+            return data
+
         _data = FormData()
 
         for key, value in (data or {}).items():
             _data.add_field(key, value)
 
         for key, file_info in (files or {}).items():
+            if hasattr(file_info[1], "seek"):
+                file_info[1].seek(0)  # rewind file objects when retrying
+
             _data.add_field(
                 key,
                 file_info[1],
                 filename=file_info[0],
                 content_type=file_info[2] if len(file_info) > 2 else None,
             )
-    else:
-        _data = data
 
-    async with session.post(url, data=_data) as r:
-        if r.status != 200:
-            raise_api_error(await r.text())
+        return _data
+
+    return await _request("post", url, get_data)
+
+
+def _is_validation_error(error: APIRequestError) -> bool:
+    """Check if the API rejected a request because of its contents"""
+    if isinstance(error, InvalidAPICredentialsError):
+        return False
+
+    if isinstance(
+        error,
+        (InvalidMetricResultsError, InvalidRequestBodyError, InvalidTestResultsError),
+    ):
+        return True
+
+    return (
+        error.status is not None and 400 <= error.status < 500 and error.status != 429
+    )
+
+
+class _RequestBatcher:
+    """Coalesces JSON items sent to the same bulk endpoint into a single request
+
+    Items are queued per endpoint and request params and are sent as a JSON list once
+    `_batch_max_size` items are queued or `_batch_max_delay` seconds after the first
+    item was queued, whichever comes first. Each caller receives the response (or
+    error) of the request its item was sent in. If the API rejects the contents of a
+    batch, its items are sent again one by one so that only the callers of invalid
+    items get an error. Any other error is raised to the callers of all the items.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._timers = {}
+        # the event loop only keeps weak references to tasks
+        self._tasks = set()
+
+    async def add(self, endpoint: str, params: Dict[str, Any], item: str):
+        """Queue a JSON-serialized item and wait for the request it is sent in"""
+        loop = asyncio.get_running_loop()
+        key = (endpoint, tuple(sorted(params.items())))
+
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append((item, future))
+
+        if len(self._pending[key]) >= _batch_max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(_batch_max_delay, self._flush, key)
+
+        return await future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.ensure_future(self._send(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key, batch):
+        endpoint, params = key
+        logger.debug(f"Sending {len(batch)} items to {endpoint} in a single request")
+
+        try:
+            response = await _post(
+                endpoint,
+                params=dict(params),
+                data=f"[{', '.join(item for item, _ in batch)}]",
+            )
+        except APIRequestError as e:
+            if len(batch) == 1 or not _is_validation_error(e):
+                # e.g. a gateway error: the batch may have been stored already so
+                # sending its items again could log them twice
+                for _, future in batch:
+                    self._set_result(future, error=e)
+                return
+
+            # find the items that were rejected by sending each one on its own
+            logger.debug(
+                f"Batch of {len(batch)} items to {endpoint} was rejected ({e}). "
+                "Sending the items individually"
+            )
+            await asyncio.gather(*[self._send(key, [entry]) for entry in batch])
+        except Exception as e:
+            # e.g. the API can't be reached so sending the items again won't help
+            for _, future in batch:
+                self._set_result(future, error=e)
+        else:
+            for _, future in batch:
+                self._set_result(future, response)
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, response=None, error=None):
+        if future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(response)
 
-        return await r.json()
+
+def _get_batcher() -> _RequestBatcher:
+    """Returns the request batcher for the running event loop"""
+    loop = asyncio.get_running_loop()
+
+    if loop not in __api_batchers:
+        __api_batchers[loop] = _RequestBatcher()
+
+    return __api_batchers[loop]
 
 
 def _ping() -> Dict[str, Any]:
@@ -188,6 +410,8 @@ def init(
     api_host: Optional[str] = None,
     model: Optional[str] = None,
     monitoring=False,
+    max_concurrent_requests: Optional[int] = None,
+    max_retries: Optional[int] = None,
 ):
     """
     Initializes the API client instances and calls the /ping endpoint to ensure
@@ -203,11 +427,18 @@ def init(
         api_secret (str, optional): The API secret. Defaults to None.
         api_host (str, optional): The API host. Defaults to None.
         monitoring (str, optional): The ongoing monitoring flag. Defaults to False.
+        max_concurrent_requests (int, optional): The maximum number of requests sent to the
+            API at once when logging results. Defaults to the `VM_API_MAX_CONCURRENT_REQUESTS`
+            environment variable or 8.
+        max_retries (int, optional): The number of times a request that failed due to a
+            connection error, timeout or rate limiting is retried. Defaults to the
+            `VM_API_MAX_RETRIES` environment variable or 3.
 
     Raises:
         ValueError: If the API key and secret are not provided
     """
     global _api_key, _api_secret, _api_host, _model_cuid, _monitoring
+    global _max_concurrent_requests, _max_retries
 
     if api_key == "...":
         # special case to detect when running a notebook placeholder (...)
@@ -229,6 +460,13 @@ def init(
 
     _monitoring = monitoring
 
+    if max_concurrent_requests is not None:
+        _max_concurrent_requests = max_concurrent_requests
+        __api_semaphores.clear()
+
+    if max_retries is not None:
+        _max_retries = max_retries
+
     reload()
 
 
@@ -353,10 +591,12 @@ async def log_metric_result(
         metric_data["output_template"] = output_template
 
     try:
-        return await _post(
+        # the log_metrics endpoint accepts a list of metrics so results logged at
+        # the same time (e.g. when logging a test suite) are sent together
+        return await _get_batcher().add(
             "log_metrics",
-            params=request_params,
-            data=json.dumps([metric_data], cls=NumpyEncoder, allow_nan=False),
+            request_params,
+            json.dumps(metric_data, cls=NumpyEncoder, allow_nan=False),
         )
     except Exception as e:
         logger.error("Error logging metrics to ValidMind API")
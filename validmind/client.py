@@ -6,8 +6,10 @@
 Client interface for all data and model validation functions
 """
 
+import os
+import sys
+
 import pandas as pd
-import polars as pl
 
 from .api_client import log_input as log_input
 from .client_config import client_config
@@ -26,9 +28,15 @@ from .models.r_model import RModel
 from .template import get_template_test_suite
 from .template import preview_template as _preview_template
 from .test_suites import get_by_id as get_test_suite_by_id
-from .utils import get_dataset_info, get_model_info
+from .utils import get_dataset_info, get_model_info, run_in_background
 from .vm_models import TestInput, TestSuite, TestSuiteRunner
-from .vm_models.dataset import DataFrameDataset, PolarsDataset, TorchDataset, VMDataset
+from .vm_models.dataset import (
+    DataFrameDataset,
+    FileDataset,
+    PolarsDataset,
+    TorchDataset,
+    VMDataset,
+)
 from .vm_models.model import (
     ModelAttributes,
     VMModel,
@@ -41,6 +49,13 @@ pd.option_context("format.precision", 2)
 logger = get_logger(__name__)
 
 
+def _is_polars_dataframe(dataset) -> bool:
+    # a polars dataframe can only exist if polars was already imported
+    pl = sys.modules.get("polars")
+
+    return pl is not None and isinstance(dataset, (pl.DataFrame, pl.LazyFrame))
+
+
 def init_dataset(
     dataset,
     model=None,
@@ -55,6 +70,7 @@ def init_dataset(
     class_labels: dict = None,
     type: str = None,
     input_id: str = None,
+    copy_on_write: bool = None,
     __log=True,
 ) -> VMDataset:
     """
@@ -64,12 +80,22 @@ def init_dataset(
 
     The following dataset types are supported:
     - Pandas DataFrame
-    - Polars DataFrame
+    - Polars DataFrame or LazyFrame
     - Numpy ndarray
     - Torch TensorDataset
+    - Path to a Parquet file, an Arrow IPC (Feather v2) file or a directory of them
+
+    Pandas DataFrames and Numpy arrays are not copied: the dataset shares their
+    column buffers, so modifying them in place after calling `init_dataset` also
+    modifies the dataset. Call `.copy()` on them first to keep the dataset fixed.
+
+    Datasets read from files are memory-mapped so only the columns and row ranges
+    that tests read are loaded into memory (see `validmind.vm_models.dataset.files`).
+    Polars datasets are kept as polars frames and the statistics tests share are
+    computed by polars (see `validmind.vm_models.dataset.polars_ops`).
 
     Args:
-        dataset : dataset from various python libraries
+        dataset : dataset from various python libraries or path to dataset files
         model (VMModel): ValidMind model object
         targets (vm.vm.DatasetTargets): A list of target variables
         target_column (str): The name of the target column in the dataset
@@ -82,6 +108,12 @@ def init_dataset(
             this will be set to `dataset` but if you are passing this dataset as a
             test input using some other key than `dataset`, then you should set
             this to the same key.
+        columns (list): The column names of a Numpy ndarray, or the columns to read
+            from dataset files (defaults to all columns)
+        copy_on_write (bool): If True, `dataset.df` returns read-only views over the
+            dataset columns instead of copying the whole dataset on every access.
+            Tests that need to modify the dataframe should call `.copy()` on it.
+            Defaults to True for datasets read from files and False otherwise.
 
     Raises:
         ValueError: If the dataset type is not supported
@@ -112,7 +144,7 @@ def init_dataset(
             target_class_labels=class_labels,
             date_time_index=date_time_index,
         )
-    elif isinstance(dataset, pl.DataFrame):
+    elif _is_polars_dataframe(dataset):
         logger.info("Polars dataset detected. Initializing VM Dataset instance...")
         vm_dataset = PolarsDataset(
             input_id=input_id,
@@ -142,6 +174,20 @@ def init_dataset(
             target_class_labels=class_labels,
             date_time_index=date_time_index,
         )
+    elif isinstance(dataset, (str, os.PathLike)):
+        logger.info("Dataset files detected. Initializing VM Dataset instance...")
+        vm_dataset = FileDataset(
+            input_id=input_id,
+            path=dataset,
+            model=model,
+            columns=columns,
+            target_column=target_column,
+            feature_columns=feature_columns,
+            text_column=text_column,
+            extra_columns=extra_columns,
+            target_class_labels=class_labels,
+            date_time_index=date_time_index,
+        )
     elif dataset_class == "TensorDataset":
         logger.info("Torch TensorDataset detected. Initializing VM Dataset instance...")
         vm_dataset = TorchDataset(
@@ -162,11 +208,16 @@ def init_dataset(
             "Only Pandas datasets and Tensor Datasets are supported at the moment."
         )
 
+    if copy_on_write is not None:
+        vm_dataset.copy_on_write = copy_on_write
+
     if __log:
-        log_input(
-            input_id=input_id,
-            type="dataset",
-            metadata=get_dataset_info(vm_dataset),
+        # log from a snapshot that shares the data with the dataset in the background
+        # so the user doesn't have to wait for the summary statistics to be computed
+        snapshot = vm_dataset._shallow_copy()
+        snapshot.copy_on_write = True
+        vm_dataset._log_future = run_in_background(
+            _log_dataset_input, input_id, snapshot
         )
 
     input_registry.add(key=input_id, obj=vm_dataset)
@@ -174,6 +225,14 @@ def init_dataset(
     return vm_dataset
 
 
+def _log_dataset_input(input_id: str, dataset: VMDataset):
+    log_input(
+        input_id=input_id,
+        type="dataset",
+        metadata=get_dataset_info(dataset),
+    )
+
+
 def init_model(
     model: object = None,
     input_id: str = "model",
@@ -367,7 +426,13 @@ def get_test_suite(
 
 
 def run_test_suite(
-    test_suite_id, send=True, fail_fast=False, config=None, inputs=None, **kwargs
+    test_suite_id,
+    send=True,
+    fail_fast=False,
+    config=None,
+    inputs=None,
+    max_workers=None,
+    **kwargs,
 ):
     """High Level function for running a test suite
 
@@ -385,6 +450,8 @@ def run_test_suite(
         inputs (dict, optional): A dictionary of test inputs to pass to the TestSuite e.g. `model`, `dataset`
             `models` etc. These inputs will be accessible by any test in the test suite. See the test
             documentation or `vm.describe_test()` for more details on the inputs required for each.
+        max_workers (int, optional): Number of threads to run the tests in parallel. Tests are run
+            sequentially if not provided. Defaults to None.
         **kwargs: backwards compatibility for passing in test inputs using keyword arguments
 
     Raises:
@@ -411,7 +478,7 @@ def run_test_suite(
         suite=suite,
         input=TestInput({**kwargs, **(inputs or {})}),
         config=config or {},
-    ).run(fail_fast=fail_fast, send=send)
+    ).run(fail_fast=fail_fast, send=send, max_workers=max_workers)
 
     return suite
 
@@ -434,7 +501,13 @@ def preview_template():
 
 
 def run_documentation_tests(
-    section=None, send=True, fail_fast=False, inputs=None, config=None, **kwargs
+    section=None,
+    send=True,
+    fail_fast=False,
+    inputs=None,
+    config=None,
+    max_workers=None,
+    **kwargs,
 ):
     """Collect and run all the tests associated with a template
 
@@ -448,6 +521,8 @@ def run_documentation_tests(
         fail_fast (bool, optional): Whether to stop running tests after the first failure. Defaults to False.
         inputs (dict, optional): A dictionary of test inputs to pass to the TestSuite
         config: A dictionary of test parameters to override the defaults
+        max_workers (int, optional): Number of threads to run the tests in parallel. Tests are run
+            sequentially if not provided. Defaults to None.
         **kwargs: backwards compatibility for passing in test inputs using keyword arguments
 
     Returns:
@@ -477,6 +552,7 @@ def run_documentation_tests(
             fail_fast=fail_fast,
             inputs=inputs,
             config=config,
+            max_workers=max_workers,
             **kwargs,
         )
         test_suites[_section] = test_suite
@@ -489,7 +565,14 @@ def run_documentation_tests(
 
 
 def _run_documentation_section(
-    template, section, send=True, fail_fast=False, config=None, inputs=None, **kwargs
+    template,
+    section,
+    send=True,
+    fail_fast=False,
+    config=None,
+    inputs=None,
+    max_workers=None,
+    **kwargs,
 ):
     """Run all tests in a template section
 
@@ -503,6 +586,7 @@ def _run_documentation_section(
         fail_fast (bool, optional): Whether to stop running tests after the first failure. Defaults to False.
         config: A dictionary of test parameters to override the defaults
         inputs: A dictionary of test inputs to pass to the TestSuite
+        max_workers (int, optional): Number of threads to run the tests in parallel
         **kwargs: backwards compatibility for passing in test inputs using keyword arguments
 
     Returns:
@@ -514,6 +598,6 @@ def _run_documentation_section(
         suite=test_suite,
         input=TestInput({**kwargs, **(inputs or {})}),
         config=config,
-    ).run(send=send, fail_fast=fail_fast)
+    ).run(send=send, fail_fast=fail_fast, max_workers=max_workers)
 
     return test_suite
@@ -29,7 +29,8 @@ class APIRequestError(BaseError):
     Generic error for API request errors that are not known.
     """
 
-    pass
+    # HTTP status of the response, if known
+    status = None
 
 
 class GetTestSuiteError(BaseError):
@@ -324,10 +325,12 @@ class SkipTestError(BaseError):
     pass
 
 
-def raise_api_error(error_string):
+def raise_api_error(error_string, status=None):
     """
     Safely try to parse JSON from the response message in case the API
     returns a non-JSON string or if the API returns a non-standard error
+
+    The HTTP `status` of the response, if given, is kept on the error.
     """
     try:
         json_response = json.loads(error_string)
@@ -350,7 +353,10 @@ def raise_api_error(error_string):
     }
 
     error_class = error_map.get(api_code, APIRequestError)
-    raise error_class(api_description)
+    error = error_class(api_description)
+    error.status = status
+
+    raise error
 
 
 def should_raise_on_fail_fast(error) -> bool:
@@ -33,6 +33,22 @@ class InputRegistry:
             )
         return input_obj
 
+    def wait_until_logged(self, keys):
+        """Wait for inputs that are logged in the background to be logged
+
+        Args:
+            keys (list): The ids of the inputs (or the inputs themselves)
+
+        Raises:
+            Exception: The error raised when logging one of the inputs
+        """
+        for key in keys or []:
+            key = key if isinstance(key, str) else getattr(key, "input_id", None)
+            future = getattr(self.registry.get(key), "_log_future", None)
+
+            if future is not None:
+                future.result()
+
     def list_input_objects(self):
         return self.registry.keys()
 
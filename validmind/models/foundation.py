@@ -2,12 +2,17 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import pandas as pd
 
 from validmind.logging import get_logger
 from validmind.models.function import FunctionModel
+from validmind.utils import get_rate_limit_delay, is_rate_limit_error
 
 logger = get_logger(__name__)
 
@@ -24,14 +29,27 @@ class FoundationModel(FunctionModel):
     This class wraps a predict function that is user-defined and adapts it to works
     with ValidMind's model interface for the purpose of model eval and documentation
 
+    Prompts are sent one at a time by default. Setting `max_concurrency` sends up to
+    that many prompts at once: on a thread pool for regular functions or on an event
+    loop when `predict_fn` is a coroutine function. Calls that fail due to rate limiting
+    (HTTP 429) are retried with exponential backoff. Predictions are always returned in
+    the same order as the input rows.
+
     Attributes:
         predict_fn (callable): The predict function that should take a prompt as input
           and return the result from the model
         prompt (Prompt): The prompt object that defines the prompt template and the
           variables (if any)
         name (str, optional): The name of the model. Defaults to name of the predict_fn
+        max_concurrency (int, optional): The maximum number of concurrent calls to the
+          predict_fn. Defaults to None (sequential calls)
+        max_retries (int, optional): The number of times a rate limited call is retried.
+          Defaults to 5
     """
 
+    max_concurrency: int = None
+    max_retries: int = 5
+
     def __post_init__(self):
         super().__post_init__()
 
@@ -50,8 +68,57 @@ class FoundationModel(FunctionModel):
             else self.prompt.template
         )
 
+    def _call(self, prompt: str):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.predict_fn(prompt)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise e
+
+                delay = get_rate_limit_delay(e, attempt)
+                logger.debug(f"Rate limited by the model, retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+    async def _acall(self, prompt: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await self.predict_fn(prompt)
+                except Exception as e:
+                    if not is_rate_limit_error(e) or attempt == self.max_retries:
+                        raise e
+
+                    delay = get_rate_limit_delay(e, attempt)
+                    logger.debug(f"Rate limited by the model, retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+
+    async def _apredict(self, prompts: list):
+        semaphore = asyncio.Semaphore(self.max_concurrency or 1)
+
+        return await asyncio.gather(
+            *[self._acall(prompt, semaphore) for prompt in prompts]
+        )
+
     def predict(self, X: pd.DataFrame):
         """
         Predict method for the model. This is a wrapper around the model's
         """
-        return [self.predict_fn(self._build_prompt(x[1])) for x in X.iterrows()]
+        prompts = [self._build_prompt(x[1]) for x in X.iterrows()]
+
+        if inspect.iscoroutinefunction(self.predict_fn):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._apredict(prompts))
+
+            # we can't block on the running loop (e.g. in a notebook) so the calls
+            # are run on a new event loop in a separate thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, self._apredict(prompts)).result()
+
+        if not self.max_concurrency or self.max_concurrency <= 1:
+            return [self._call(prompt) for prompt in prompts]
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(self._call, prompts))
@@ -2,6 +2,8 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
+import numpy as np
+
 from validmind.vm_models.model import VMModel
 
 
@@ -26,21 +28,55 @@ class FunctionModel(VMModel):
     """
     FunctionModel class wraps a user-defined predict function
 
+    By default, the predict function is called once per row with a dictionary of input
+    features. Setting `batch_size` switches to batch mode where the predict function is
+    called once per chunk of `batch_size` rows and must return one prediction per row.
+
     Attributes:
         predict_fn (callable): The predict function that should take a dictionary of
-            input features and return a prediction.
+            input features and return a prediction. In batch mode, it takes a chunk of
+            rows (see `batch_format`) and returns a sequence of predictions.
         input_id (str, optional): The input ID for the model. Defaults to None.
         name (str, optional): The name of the model. Defaults to the name of the predict_fn.
         prompt (Prompt, optional): If using a prompt, the prompt object that defines the template
             and the variables (if any). Defaults to None.
+        batch_size (int, optional): The number of rows passed to the predict function at
+            once. Defaults to None (one row at a time).
+        batch_format (str, optional): How each chunk of rows is passed to the predict function
+            in batch mode: `"dataframe"` for a pandas DataFrame or `"dict"` for a dictionary
+            mapping column names to numpy arrays. Defaults to `"dataframe"`.
     """
 
+    batch_size: int = None
+    batch_format: str = "dataframe"
+
     def __post_init__(self):
         if not hasattr(self, "predict_fn") or not callable(self.predict_fn):
             raise ValueError("FunctionModel requires a callable predict_fn")
 
+        if self.batch_format not in ["dataframe", "dict"]:
+            raise ValueError("`batch_format` must be one of 'dataframe' or 'dict'")
+
         self.name = self.name or self.predict_fn.__name__
 
+    def _predict_batch(self, X):
+        predictions = []
+
+        for start in range(0, len(X), self.batch_size):
+            chunk = X.iloc[start : start + self.batch_size]
+            if self.batch_format == "dict":
+                chunk = {col: chunk[col].to_numpy() for col in chunk.columns}
+
+            chunk_predictions = np.asarray(self.predict_fn(chunk))
+            if len(chunk_predictions) != min(self.batch_size, len(X) - start):
+                raise ValueError(
+                    "The predict function must return one prediction per row in batch mode"
+                )
+
+            predictions.append(chunk_predictions)
+
+        return np.concatenate(predictions) if predictions else np.array([])
+
     def predict(self, X):
         """Compute predictions for the input (X)
 
@@ -48,6 +84,9 @@ class FunctionModel(VMModel):
             X (pandas.DataFrame): The input features to predict on
 
         Returns:
-            list: The predictions
+            list or np.ndarray: The predictions (a numpy array in batch mode)
         """
+        if self.batch_size:
+            return self._predict_batch(X)
+
         return [self.predict_fn(x) for x in X.to_dict(orient="records")]
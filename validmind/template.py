@@ -2,17 +2,17 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-from ipywidgets import HTML, Accordion, VBox
-
 from .html_templates.content_blocks import (
     failed_content_block_html,
     non_test_content_block_html,
 )
 from .logging import get_logger
 from .tests import LoadTestError, describe_test
-from .utils import display, is_notebook
+from .utils import display, is_notebook, lazy_import
 from .vm_models import TestSuite
 
+ipywidgets = lazy_import("ipywidgets")
+
 logger = get_logger(__name__)
 
 CONTENT_TYPE_MAP = {
@@ -57,7 +57,7 @@ def _create_content_widget(content):
     content_type = CONTENT_TYPE_MAP[content["content_type"]]
 
     if content["content_type"] not in ["metric", "test"]:
-        return HTML(
+        return ipywidgets.HTML(
             non_test_content_block_html.format(
                 content_id=content["content_id"],
                 content_type=content_type,
@@ -67,19 +67,21 @@ def _create_content_widget(content):
     try:
         test_html = describe_test(test_id=content["content_id"], show=False)
     except LoadTestError:
-        return HTML(failed_content_block_html.format(test_id=content["content_id"]))
+        return ipywidgets.HTML(
+            failed_content_block_html.format(test_id=content["content_id"])
+        )
 
-    return Accordion(
-        children=[HTML(test_html)],
+    return ipywidgets.Accordion(
+        children=[ipywidgets.HTML(test_html)],
         titles=[f"{content_type} Block: '{content['content_id']}'"],
     )
 
 
 def _create_sub_section_widget(sub_sections, section_number):
     if not sub_sections:
-        return HTML("<p>Empty Section</p>")
+        return ipywidgets.HTML("<p>Empty Section</p>")
 
-    accordion = Accordion()
+    accordion = ipywidgets.Accordion()
 
     for i, section in enumerate(sub_sections):
         if section["sections"]:
@@ -90,7 +92,7 @@ def _create_sub_section_widget(sub_sections, section_number):
                 ),
             )
         elif contents := section.get("contents", []):
-            contents_widget = VBox(
+            contents_widget = ipywidgets.VBox(
                 [_create_content_widget(content) for content in contents]
             )
 
@@ -101,7 +103,7 @@ def _create_sub_section_widget(sub_sections, section_number):
         else:
             accordion.children = (
                 *accordion.children,
-                HTML("<p>Empty Section</p>"),
+                ipywidgets.HTML("<p>Empty Section</p>"),
             )
 
         accordion.set_title(
@@ -112,14 +114,14 @@ def _create_sub_section_widget(sub_sections, section_number):
 
 
 def _create_section_widget(tree):
-    widget = Accordion()
+    widget = ipywidgets.Accordion()
     for i, section in enumerate(tree):
         sub_widget = None
         if section.get("sections"):
             sub_widget = _create_sub_section_widget(section["sections"], i + 1)
 
         if section.get("contents"):
-            contents_widget = VBox(
+            contents_widget = ipywidgets.VBox(
                 [_create_content_widget(content) for content in section["contents"]]
             )
             if sub_widget:
@@ -131,7 +133,7 @@ def _create_section_widget(tree):
                 sub_widget = contents_widget
 
         if not sub_widget:
-            sub_widget = HTML("<p>Empty Section</p>")
+            sub_widget = ipywidgets.HTML("<p>Empty Section</p>")
 
         widget.children = (*widget.children, sub_widget)
         widget.set_title(i, f"{i + 1}. {section['title']} ('{section['id']}')")
@@ -0,0 +1,1803 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""Metadata for the built-in tests.
+
+This module is auto-generated by running `make generate-test-catalog`.
+Should not be modified manually.
+"""
+
+VERSION = "2.5.22"
+
+TESTS = {
+    "validmind.data_validation.ACFandPACFPlot": {
+        "description": "Analyzes time series data using Autocorrelation Function (ACF) and Partial Autocorrelation Function (PACF) plots to\nreveal trends and correlations.\n\n### Purpose\n\nThe ACF (Autocorrelation Function) and PACF (Partial Autocorrelation Function) plot test is employed to analyze\ntime series data in machine learning models. It illuminates the correlation of the data over time by plotting the\ncorrelation of the series with its own lags (ACF), and the correlations after removing effects already accounted\nfor by earlier lags (PACF). This information can identify trends, such as seasonality, degrees of autocorrelation,\nand inform the selection of order parameters for AutoRegressive Integrated Moving Average (ARIMA) models.\n\n### Test Mechanism\n\nThe `ACFandPACFPlot` test accepts a dataset with a time-based index. It first confirms the index is of a datetime\ntype, then handles any NaN values. The test subsequently generates ACF and PACF plots for each column in the\ndataset, producing a subplot for each. If the dataset doesn't include key columns, an error is returned.\n\n### Signs of High Risk\n\n- Sudden drops in the correlation at a specific lag might signal a model at high risk.\n- Consistent high correlation across multiple lags could also indicate non-stationarity in the data, which may\nsuggest that a model estimated on this data won't generalize well to future, unknown data.\n\n### Strengths\n\n- ACF and PACF plots offer clear graphical representations of the correlations in time series data.\n- These plots are effective at revealing important data characteristics such as seasonality, trends, and\ncorrelation patterns.\n- The insights from these plots aid in better model configuration, particularly in the selection of ARIMA model\nparameters.\n\n### Limitations\n\n- ACF and PACF plots are exclusively for time series data and hence, can't be applied to all ML models.\n- These plots require large, consistent datasets as gaps could lead to misleading results.\n- The plots can only represent linear correlations and fail to capture any non-linear relationships within the data.\n- The plots might be difficult for non-experts to interpret and should not replace more advanced analyses.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "forecasting",
+            "statistical_test",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ADF": {
+        "description": "Assesses the stationarity of a time series dataset using the Augmented Dickey-Fuller (ADF) test.\n\n### Purpose\n\nThe Augmented Dickey-Fuller (ADF) test metric is used to determine the order of integration, i.e., the stationarity\nof a given time series dataset. The stationary property of data is pivotal in many machine learning models as it\nimpacts the reliability and effectiveness of predictions and forecasts.\n\n### Test Mechanism\n\nThe ADF test is executed using the `adfuller` function from the `statsmodels` library on each feature of the\ndataset. Multiple outputs are generated for each run, including the ADF test statistic and p-value, count of lags\nused, the number of observations considered in the test, critical values at various confidence levels, and the\ninformation criterion. These results are stored for each feature for subsequent analysis.\n\n### Signs of High Risk\n\n- An inflated ADF statistic and high p-value (generally above 0.05) indicate a high risk to the model's performance\ndue to the presence of a unit root indicating non-stationarity.\n- Non-stationarity might result in untrustworthy or insufficient forecasts.\n\n### Strengths\n\n- The ADF test is robust to sophisticated correlations within the data, making it suitable for settings where data\ndisplays complex stochastic behavior.\n- It provides explicit outputs like test statistics, critical values, and information criterion, enhancing\nunderstanding and transparency in the model validation process.\n\n### Limitations\n\n- The ADF test might demonstrate low statistical power, making it challenging to differentiate between a unit root\nand near-unit-root processes, potentially causing false negatives.\n- It assumes the data follows an autoregressive process, which might not always be the case.\n- The test struggles with time series data that have structural breaks.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "statsmodels",
+            "forecasting",
+            "statistical_test",
+            "stationarity",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.AutoAR": {
+        "description": "Automatically identifies the optimal Autoregressive (AR) order for a time series using BIC and AIC criteria.\n\n### Purpose\n\nThe AutoAR test is intended to automatically identify the Autoregressive (AR) order of a time series by utilizing\nthe Bayesian Information Criterion (BIC) and Akaike Information Criterion (AIC). AR order is crucial in forecasting\ntasks as it dictates the quantity of prior terms in the sequence to use for predicting the current term. The\nobjective is to select the most fitting AR model that encapsulates the trend and seasonality in the time series\ndata.\n\n### Test Mechanism\n\nThe test mechanism operates by iterating through a possible range of AR orders up to a defined maximum. An AR model\nis fitted for each order, and the corresponding BIC and AIC are computed. BIC and AIC statistical measures are\ndesigned to penalize models for complexity, preferring simpler models that fit the data proficiently. To verify the\nstationarity of the time series, the Augmented Dickey-Fuller test is executed. The AR order, BIC, and AIC findings\nare compiled into a dataframe for effortless comparison. Then, the AR order with the smallest BIC is established as\nthe desirable order for each variable.\n\n### Signs of High Risk\n\n- An augmented Dickey Fuller test p-value > 0.05, indicating the time series isn't stationary, may lead to\ninaccurate results.\n- Problems with the model fitting procedure, such as computational or convergence issues.\n- Continuous selection of the maximum specified AR order may suggest an insufficient set limit.\n\n### Strengths\n\n- The test independently pinpoints the optimal AR order, thereby reducing potential human bias.\n- It strikes a balance between model simplicity and goodness-of-fit to avoid overfitting.\n- Has the capability to account for stationarity in a time series, an essential aspect for dependable AR modeling.\n- The results are aggregated into a comprehensive table, enabling an easy interpretation.\n\n### Limitations\n\n- The tests need a stationary time series input.\n- They presume a linear relationship between the series and its lags.\n- The search for the best model is constrained by the maximum AR order supplied in the parameters. Therefore, a low\nmax_ar_order could result in subpar outcomes.\n- AIC and BIC may not always agree on the selection of the best model. This potentially requires the user to juggle\ninterpretational choices.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_ar_order": 3},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "statsmodels", "forecasting", "statistical_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.AutoMA": {
+        "description": "Automatically selects the optimal Moving Average (MA) order for each variable in a time series dataset based on\nminimal BIC and AIC values.\n\n### Purpose\n\nThe `AutoMA` metric serves an essential role of automated decision-making for selecting the optimal Moving Average\n(MA) order for every variable in a given time series dataset. The selection is dependent on the minimalization of\nBIC (Bayesian Information Criterion) and AIC (Akaike Information Criterion); these are established statistical\ntools used for model selection. Furthermore, prior to the commencement of the model fitting process, the algorithm\nconducts a stationarity test (Augmented Dickey-Fuller test) on each series.\n\n### Test Mechanism\n\nStarting off, the `AutoMA` algorithm checks whether the `max_ma_order` parameter has been provided. It consequently\nloops through all variables in the dataset, carrying out the Dickey-Fuller test for stationarity. For each\nstationary variable, it fits an ARIMA model for orders running from 0 to `max_ma_order`. The result is a list\nshowcasing the BIC and AIC values of the ARIMA models based on different orders. The MA order, which yields the\nsmallest BIC, is chosen as the 'best MA order' for every single variable. The final results include a table\nsummarizing the auto MA analysis and another table listing the best MA order for each variable.\n\n### Signs of High Risk\n\n- When a series is non-stationary (p-value>0.05 in the Dickey-Fuller test), the produced result could be inaccurate.\n- Any error that arises in the process of fitting the ARIMA models, especially with a higher MA order, can\npotentially indicate risks and might need further investigation.\n\n### Strengths\n\n- The metric facilitates automation in the process of selecting the MA order for time series forecasting. This\nsignificantly saves time and reduces efforts conventionally necessary for manual hyperparameter tuning.\n- The use of both BIC and AIC enhances the likelihood of selecting the most suitable model.\n- The metric ascertains the stationarity of the series prior to model fitting, thus ensuring that the underlying\nassumptions of the MA model are fulfilled.\n\n### Limitations\n\n- If the time series fails to be stationary, the metric may yield inaccurate results. Consequently, it necessitates\npre-processing steps to stabilize the series before fitting the ARIMA model.\n- The metric adopts a rudimentary model selection process based on BIC and doesn't consider other potential model\nselection strategies. Depending on the specific dataset, other strategies could be more appropriate.\n- The 'max_ma_order' parameter must be manually input which doesn't always guarantee optimal performance,\nespecially when configured too low.\n- The computation time increases with the rise in `max_ma_order`, hence, the metric may become computationally\ncostly for larger values.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_ma_order": 3},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "statsmodels", "forecasting", "statistical_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.AutoSeasonality": {
+        "description": "Automatically identifies and quantifies optimal seasonality in time series data to improve forecasting model\nperformance.\n\n### Purpose\n\nThe AutoSeasonality test aims to automatically detect and identify the best seasonal order or period for each\nvariable in a time series dataset. This detection helps to quantify periodic patterns and seasonality that reoccur\nat fixed intervals in the data. Understanding the seasonality component can drastically improve prediction\naccuracy, which is especially significant for forecasting-based models.\n\n### Test Mechanism\n\nThis test uses the seasonal decomposition method from the Statsmodels Python library. The function takes the\n'additive' model type for each variable and applies it within the prescribed range of 'min_period' and\n'max_period'. It decomposes the seasonality for each period in the range and calculates the mean residual error for\neach period. The seasonal period that results in the minimum residuals is marked as the 'Best Period'. The test\nresults include the 'Best Period', the calculated residual errors, and a determination of 'Seasonality' or 'No\nSeasonality'.\n\n### Signs of High Risk\n\n- If the optimal seasonal period (or 'Best Period') is consistently at the maximum or minimum limit of the offered\nrange for a majority of variables, it may suggest that the range set does not adequately capture the true seasonal\npattern in the series.\n- A high average 'Residual Error' for the selected 'Best Period' could indicate issues with the model's performance.\n\n### Strengths\n\n- The metric offers an automatic approach to identifying and quantifying the optimal seasonality, providing a\nrobust method for analyzing time series datasets.\n- It is applicable to multiple variables in a dataset, providing a comprehensive evaluation of each variable's\nseasonality.\n- The use of concrete and measurable statistical methods improves the objectivity and reproducibility of the model.\n\n### Limitations\n\n- This AutoSeasonality metric may not be suitable if the time series data exhibits random walk behavior or lacks\nclear seasonality, as the seasonal decomposition model may not be appropriate.\n- The defined range for the seasonal period (min_period and max_period) can influence the outcomes. If the actual\nseasonality period lies outside this range, this method will not be able to identify the true seasonal order.\n- This metric may not be able to fully interpret complex patterns that go beyond the simple additive model for\nseasonal decomposition.\n- The tool may incorrectly infer seasonality if random fluctuations in the data match the predefined seasonal\nperiod range.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_period": 1, "max_period": 4},
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "forecasting",
+            "statistical_test",
+            "statsmodels",
+            "seasonality",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.AutoStationarity": {
+        "description": "Automates Augmented Dickey-Fuller test to assess stationarity across multiple time series in a DataFrame.\n\n### Purpose\n\nThe AutoStationarity metric is intended to automatically detect and evaluate the stationary nature of each time\nseries in a DataFrame. It incorporates the Augmented Dickey-Fuller (ADF) test, a statistical approach used to\nassess stationarity. Stationarity is a fundamental property suggesting that statistic features like mean and\nvariance remain unchanged over time. This is necessary for many time-series models.\n\n### Test Mechanism\n\nThe mechanism for the AutoStationarity test involves applying the Augmented Dicky-Fuller test to each time series\nwithin the given dataframe to assess if they are stationary. Every series in the dataframe is looped, using the ADF\ntest up to a defined maximum order (configurable and by default set to 5). The p-value resulting from the ADF test\nis compared against a predetermined threshold (also configurable and by default set to 0.05). The time series is\ndeemed stationary at its current differencing order if the p-value is less than the threshold.\n\n### Signs of High Risk\n\n- A significant number of series not achieving stationarity even at the maximum order of differencing can indicate\nhigh risk or potential failure in the model.\n- This could suggest the series may not be appropriately modeled by a stationary process, hence other modeling\napproaches might be required.\n\n### Strengths\n\n- The key strength in this metric lies in the automation of the ADF test, enabling mass stationarity analysis\nacross various time series and boosting the efficiency and credibility of the analysis.\n- The utilization of the ADF test, a widely accepted method for testing stationarity, lends authenticity to the\nresults derived.\n- The introduction of the max order and threshold parameters give users the autonomy to determine their preferred\nlevels of stringency in the tests.\n\n### Limitations\n\n- The Augmented Dickey-Fuller test and the stationarity test are not without their limitations. These tests are\npremised on the assumption that the series can be modeled by an autoregressive process, which may not always hold\ntrue.\n- The stationarity check is highly sensitive to the choice of threshold for the significance level; an extremely\nhigh or low threshold could lead to incorrect results regarding the stationarity properties.\n- There's also a risk of over-differencing if the maximum order is set too high, which could induce unnecessary\ncycles.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_order": 5, "threshold": 0.05},
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "statsmodels",
+            "forecasting",
+            "statistical_test",
+            "stationarity",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.BivariateScatterPlots": {
+        "description": "Generates bivariate scatterplots to visually inspect relationships between pairs of numerical predictor variables\nin machine learning classification tasks.\n\n### Purpose\n\nThis function is intended for visual inspection and monitoring of relationships between pairs of numerical\nvariables in a machine learning model targeting classification tasks. It helps in understanding how predictor\nvariables (features) interact with each other, which can inform feature selection, model-building strategies, and\nidentify potential biases or irregularities in the data.\n\n### Test Mechanism\n\nThe function creates scatter plots for each pair of numerical features in the dataset. It first filters out\nnon-numerical and binary features, ensuring the plots focus on meaningful numerical relationships. The resulting\nscatterplots are color-coded uniformly to avoid visual distraction, and the function returns a tuple of Plotly\nfigure objects, each representing a scatter plot for a pair of features.\n\n### Signs of High Risk\n\n- Visual patterns suggesting non-linear relationships, multicollinearity, clustering, or outlier points in the\nscatter plots.\n- Such issues could affect the assumptions and performance of certain models, especially those assuming linearity,\nlike logistic regression.\n\n### Strengths\n\n- Scatterplots provide an intuitive and visual tool to explore relationships between two variables.\n- They are useful for identifying outliers, variable associations, and trends, including non-linear patterns.\n- Supports visualization of binary or multi-class classification datasets, focusing on numerical features.\n\n### Limitations\n\n- Scatterplots are limited to bivariate analysis, showing relationships between only two variables at a time.\n- Not ideal for very large datasets where overlapping points can reduce the clarity of the visualization.\n- Scatterplots are exploratory tools and do not provide quantitative measures of model quality or performance.\n- Interpretation is subjective and relies on the domain knowledge and judgment of the viewer.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "numerical_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.BoxPierce": {
+        "description": "Detects autocorrelation in time-series data through the Box-Pierce test to validate model performance.\n\n### Purpose\n\nThe Box-Pierce test is utilized to detect the presence of autocorrelation in a time-series dataset.\nAutocorrelation, or serial correlation, refers to the degree of similarity between observations based on the\ntemporal spacing between them. This test is essential for affirming the quality of a time-series model by ensuring\nthat the error terms in the model are random and do not adhere to a specific pattern.\n\n### Test Mechanism\n\nThe implementation of the Box-Pierce test involves calculating a test statistic along with a corresponding p-value\nderived from the dataset features. These quantities are used to test the null hypothesis that posits the data to be\nindependently distributed. This is achieved by iterating over every feature column in the time-series data and\napplying the `acorr_ljungbox` function of the statsmodels library. The function yields the Box-Pierce test\nstatistic as well as the respective p-value, all of which are cached as test results.\n\n### Signs of High Risk\n\n- A low p-value, typically under 0.05 as per statistical convention, throws the null hypothesis of independence\ninto question. This implies that the dataset potentially houses autocorrelations, thus indicating a high-risk\nscenario concerning model performance.\n- Large Box-Pierce test statistic values may indicate the presence of autocorrelation.\n\n### Strengths\n\n- Detects patterns in data that are supposed to be random, thereby ensuring no underlying autocorrelation.\n- Can be computed efficiently given its low computational complexity.\n- Can be widely applied to most regression problems, making it very versatile.\n\n### Limitations\n\n- Assumes homoscedasticity (constant variance) and normality of residuals, which may not always be the case in\nreal-world datasets.\n- May exhibit reduced power for detecting complex autocorrelation schemes such as higher-order or negative\ncorrelations.\n- It only provides a general indication of the existence of autocorrelation, without providing specific insights\ninto the nature or patterns of the detected autocorrelation.\n- In the presence of trends or seasonal patterns, the Box-Pierce test may yield misleading results.\n- Applicability is limited to time-series data, which limits its overall utility.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "forecasting", "statistical_test", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ChiSquaredFeaturesTable": {
+        "description": "Assesses the statistical association between categorical features and a target variable using the Chi-Squared test.\n\n### Purpose\n\nThe `ChiSquaredFeaturesTable` function is designed to evaluate the relationship between categorical features and a\ntarget variable in a dataset. It performs a Chi-Squared test of independence for each categorical feature to\ndetermine whether a statistically significant association exists with the target variable. This is particularly\nuseful in Model Risk Management for understanding the relevance of features and identifying potential biases in a\nclassification model.\n\n### Test Mechanism\n\nThe function creates a contingency table for each categorical feature and the target variable, then applies the\nChi-Squared test to compute the Chi-squared statistic and the p-value. The results for each feature include the\nvariable name, Chi-squared statistic, p-value, p-value threshold, and a pass/fail status based on whether the\np-value is below the specified threshold. The output is a DataFrame summarizing these results, sorted by p-value to\nhighlight the most statistically significant associations.\n\n### Signs of High Risk\n\n- High p-values (greater than the set threshold) indicate a lack of significant association between a feature and\nthe target variable, resulting in a 'Fail' status.\n- Features with a 'Fail' status might not be relevant for the model, which could negatively impact model\nperformance.\n\n### Strengths\n\n- Provides a clear, statistical assessment of the relationship between categorical features and the target variable.\n- Produces an easily interpretable summary with a 'Pass/Fail' outcome for each feature, helping in feature\nselection.\n- The p-value threshold is adjustable, allowing for flexibility in statistical rigor.\n\n### Limitations\n\n- Assumes the dataset is tabular and consists of categorical variables, which may not be suitable for all datasets.\n- The test is designed for classification tasks and is not applicable to regression problems.\n- As with all hypothesis tests, the Chi-Squared test can only detect associations, not causal relationships.\n- The choice of p-value threshold can affect the interpretation of feature relevance, and different thresholds may\nlead to different conclusions.",
+        "required_inputs": ["dataset"],
+        "default_params": {"p_threshold": 0.05},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "categorical_data", "statistical_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ClassImbalance": {
+        "description": "Evaluates and quantifies class distribution imbalance in a dataset used by a machine learning model.\n\n### Purpose\n\nThe Class Imbalance test is designed to evaluate the distribution of target classes in a dataset that's utilized by\na machine learning model. Specifically, it aims to ensure that the classes aren't overly skewed, which could lead\nto bias in the model's predictions. It's crucial to have a balanced training dataset to avoid creating a model\nthat's biased with high accuracy for the majority class and low accuracy for the minority class.\n\n### Test Mechanism\n\nThis Class Imbalance test operates by calculating the frequency (expressed as a percentage) of each class in the\ntarget column of the dataset. It then checks whether each class appears in at least a set minimum percentage of the\ntotal records. This minimum percentage is a modifiable parameter, but the default value is set to 10%.\n\n### Signs of High Risk\n\n- Any class that represents less than the pre-set minimum percentage threshold is marked as high risk, implying a\npotential class imbalance.\n- The function provides a pass/fail outcome for each class based on this criterion.\n- Fundamentally, if any class fails this test, it's highly likely that the dataset possesses imbalanced class\ndistribution.\n\n### Strengths\n\n- The test can spot under-represented classes that could affect the efficiency of a machine learning model.\n- The calculation is straightforward and swift.\n- The test is highly informative because it not only spots imbalance, but it also quantifies the degree of\nimbalance.\n- The adjustable threshold enables flexibility and adaptation to differing use-cases or domain-specific needs.\n- The test creates a visually insightful plot showing the classes and their corresponding proportions, enhancing\ninterpretability and comprehension of the data.\n\n### Limitations\n\n- The test might struggle to perform well or provide vital insights for datasets with a high number of classes. In\nsuch cases, the imbalance could be inevitable due to the inherent class distribution.\n- Sensitivity to the threshold value might result in faulty detection of imbalance if the threshold is set\nexcessively high.\n- Regardless of the percentage threshold, it doesn't account for varying costs or impacts of misclassifying\ndifferent classes, which might fluctuate based on specific applications or domains.\n- While it can identify imbalances in class distribution, it doesn't provide direct methods to address or correct\nthese imbalances.\n- The test is only applicable for classification operations and unsuitable for regression or clustering tasks.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_percent_threshold": 10},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "binary_classification", "multiclass_classification"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.DFGLSArch": {
+        "description": "Assesses stationarity in time series data using the Dickey-Fuller GLS test to determine the order of integration.\n\n### Purpose\n\nThe Dickey-Fuller GLS (DFGLS) test is utilized to determine the order of integration in time series data. For\nmachine learning models dealing with time series and forecasting, this metric evaluates the existence of a unit\nroot, thereby checking whether a time series is non-stationary. This analysis is a crucial initial step when\ndealing with time series data.\n\n### Test Mechanism\n\nThis code implements the Dickey-Fuller GLS unit root test on each attribute of the dataset. This process involves\niterating through every column of the dataset and applying the DFGLS test to assess the presence of a unit root.\nThe resulting information, including the test statistic ('stat'), the p-value ('pvalue'), the quantity of lagged\ndifferences utilized in the regression ('usedlag'), and the number of observations ('nobs'), is subsequently stored.\n\n### Signs of High Risk\n\n- A high p-value for the DFGLS test represents a high risk. Specifically, a p-value above a typical threshold of\n0.05 suggests that the time series data is quite likely to be non-stationary, thus presenting a high risk for\ngenerating unreliable forecasts.\n\n### Strengths\n\n- The Dickey-Fuller GLS test is a potent tool for checking the stationarity of time series data.\n- It helps to verify the assumptions of the models before the actual construction of the machine learning models\nproceeds.\n- The results produced by this metric offer a clear insight into whether the data is appropriate for specific\nmachine learning models, especially those demanding the stationarity of time series data.\n\n### Limitations\n\n- Despite its benefits, the DFGLS test does present some drawbacks. It can potentially lead to inaccurate\nconclusions if the time series data incorporates a structural break.\n- If the time series tends to follow a trend while still being stationary, the test might misinterpret it,\nnecessitating further detrending.\n- The test also presents challenges when dealing with shorter time series data or volatile data, not producing\nreliable results in these cases.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "forecasting", "unit_root_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.DatasetDescription": {
+        "description": 'Provides comprehensive analysis and statistical summaries of each field in a machine learning model\'s dataset.\n\n### Purpose\n\nThe test depicted in the script is meant to run a comprehensive analysis on a Machine Learning model\'s datasets.\nThe test or metric is implemented to obtain a complete summary of the fields in the dataset, including vital\nstatistics of each field such as count, distinct values, missing values, histograms for numerical, categorical,\nboolean, and text fields. This summary gives a comprehensive overview of the dataset to better understand the\ncharacteristics of the data that the model is trained on or evaluates.\n\n### Test Mechanism\n\nThe DatasetDescription class accomplishes the purpose as follows: firstly, the test method "run" infers the data\ntype of each column in the dataset and stores the details (id, column type). For each field, the\n"describe_dataset_field" method is invoked to collect statistical information about the field, including count,\nmissing value count and its proportion to the total, unique value count, and its proportion to the total. Depending\non the data type of a field, histograms are generated that reflect the distribution of data within the field.\nNumerical fields use the "get_numerical_histograms" method to calculate histogram distribution, whereas for\ncategorical, boolean and text fields, a histogram is computed with frequencies of each unique value in the\ndatasets. For unsupported types, an error is raised. Lastly, a summary table is built to aggregate all the\nstatistical insights and histograms of the fields in a dataset.\n\n### Signs of High Risk\n\n- High ratio of missing values to total values in one or more fields which may impact the quality of the\npredictions.\n- Unsupported data types in dataset fields.\n- Large number of unique values in the dataset\'s fields which might make it harder for the model to establish\npatterns.\n- Extreme skewness or irregular distribution of data as reflected in the histograms.\n\n### Strengths\n\n- Provides a detailed analysis of the dataset with versatile summaries like count, unique values, histograms, etc.\n- Flexibility in handling different types of data: numerical, categorical, boolean, and text.\n- Useful in detecting problems in the dataset like missing values, unsupported data types, irregular data\ndistribution, etc.\n- The summary gives a comprehensive understanding of dataset features allowing developers to make informed\ndecisions.\n\n### Limitations\n\n- The computation can be expensive from a resource standpoint, particularly for large datasets with numerous fields.\n- The histograms use an arbitrary number of bins which may not be the optimal number of bins for specific data\ndistribution.\n- Unsupported data types for columns will raise an error which may limit evaluating the dataset.\n- Fields with all null or missing values are not included in histogram computation.\n- This test only validates the quality of the dataset but doesn\'t address the model\'s performance directly.',
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": [
+            "classification",
+            "regression",
+            "text_classification",
+            "text_summarization",
+        ],
+        "tags": ["tabular_data", "time_series_data", "text_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.DatasetSplit": {
+        "description": "Evaluates and visualizes the distribution proportions among training, testing, and validation datasets of an ML\nmodel.\n\n### Purpose\n\nThe DatasetSplit test is designed to evaluate and visualize the distribution of data among training, testing, and\nvalidation datasets, if available, within a given machine learning model. The main purpose is to assess whether the\nmodel's datasets are split appropriately, as an imbalanced split might affect the model's ability to learn from the\ndata and generalize to unseen data.\n\n### Test Mechanism\n\nThe DatasetSplit test first calculates the total size of all available datasets in the model. Then, for each\nindividual dataset, the methodology involves determining the size of the dataset and its proportion relative to the\ntotal size. The results are then conveniently summarized in a table that shows dataset names, sizes, and\nproportions. Absolute size and proportion of the total dataset size are displayed for each individual dataset.\n\n### Signs of High Risk\n\n- A very small training dataset, which may result in the model not learning enough from the data.\n- A very large training dataset and a small test dataset, which may lead to model overfitting and poor\ngeneralization to unseen data.\n- A small or non-existent validation dataset, which might complicate the model's performance assessment.\n\n### Strengths\n\n- The DatasetSplit test provides a clear, understandable visualization of dataset split proportions, which can\nhighlight any potential imbalance in dataset splits quickly.\n- It covers a wide range of task types including classification, regression, and text-related tasks.\n- The metric is not tied to any specific data type and is applicable to tabular data, time series data, or text\ndata.\n\n### Limitations\n\n- The DatasetSplit test does not provide any insight into the quality or diversity of the data within each split,\njust the size and proportion.\n- The test does not give any recommendations or adjustments for imbalanced datasets.\n- Potential lack of compatibility with more complex modes of data splitting (for example, stratified or time-based\nsplits) could limit the applicability of this test.",
+        "required_inputs": ["datasets"],
+        "default_params": None,
+        "tasks": [
+            "classification",
+            "regression",
+            "text_classification",
+            "text_summarization",
+        ],
+        "tags": ["tabular_data", "time_series_data", "text_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.DescriptiveStatistics": {
+        "description": "Performs a detailed descriptive statistical analysis of both numerical and categorical data within a model's\ndataset.\n\n### Purpose\n\nThe purpose of the Descriptive Statistics metric is to provide a comprehensive summary of both numerical and\ncategorical data within a dataset. This involves statistics such as count, mean, standard deviation, minimum and\nmaximum values for numerical data. For categorical data, it calculates the count, number of unique values, most\ncommon value and its frequency, and the proportion of the most frequent value relative to the total. The goal is to\nvisualize the overall distribution of the variables in the dataset, aiding in understanding the model's behavior\nand predicting its performance.\n\n### Test Mechanism\n\nThe testing mechanism utilizes two in-built functions of pandas dataframes: `describe()` for numerical fields and\n`value_counts()` for categorical fields. The `describe()` function pulls out several summary statistics, while\n`value_counts()` accounts for unique values. The resulting data is formatted into two distinct tables, one for\nnumerical and another for categorical variable summaries. These tables provide a clear summary of the main\ncharacteristics of the variables, which can be instrumental in assessing the model's performance.\n\n### Signs of High Risk\n\n- Skewed data or significant outliers can represent high risk. For numerical data, this may be reflected via a\nsignificant difference between the mean and median (50% percentile).\n- For categorical data, a lack of diversity (low count of unique values), or overdominance of a single category\n(high frequency of the top value) can indicate high risk.\n\n### Strengths\n\n- Provides a comprehensive summary of the dataset, shedding light on the distribution and characteristics of the\nvariables under consideration.\n- It is a versatile and robust method, applicable to both numerical and categorical data.\n- Helps highlight crucial anomalies such as outliers, extreme skewness, or lack of diversity, which are vital in\nunderstanding model behavior during testing and validation.\n\n### Limitations\n\n- While this metric offers a high-level overview of the data, it may fail to detect subtle correlations or complex\npatterns.\n- Does not offer any insights on the relationship between variables.\n- Alone, descriptive statistics cannot be used to infer properties about future unseen data.\n- Should be used in conjunction with other statistical tests to provide a comprehensive understanding of the\nmodel's data.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "time_series_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.Duplicates": {
+        "description": "Tests dataset for duplicate entries, ensuring model reliability via data quality verification.\n\n### Purpose\n\nThe 'Duplicates' test is designed to check for duplicate rows within the dataset provided to the model. It serves\nas a measure of data quality, ensuring that the model isn't merely memorizing duplicate entries or being swayed by\nredundant information. This is an important step in the pre-processing of data for both classification and\nregression tasks.\n\n### Test Mechanism\n\nThis test operates by checking each row for duplicates in the dataset. If a text column is specified in the\ndataset, the test is conducted on this column; if not, the test is run on all feature columns. The number and\npercentage of duplicates are calculated and returned in a DataFrame. Additionally, a test is passed if the total\ncount of duplicates falls below a specified minimum threshold.\n\n### Signs of High Risk\n\n- A high number of duplicate rows in the dataset, which can lead to overfitting where the model performs well on\nthe training data but poorly on unseen data.\n- A high percentage of duplicate rows in the dataset, indicating potential problems with data collection or\nprocessing.\n\n### Strengths\n\n- Assists in improving the reliability of the model's training process by ensuring the training data is not\ncontaminated with duplicate entries, which can distort statistical analyses.\n- Provides both absolute numbers and percentage values of duplicate rows, giving a thorough overview of data\nquality.\n- Highly customizable as it allows for setting a user-defined minimum threshold to determine if the test has been\npassed.\n\n### Limitations\n\n- Does not distinguish between benign duplicates (i.e., coincidental identical entries in different rows) and\nproblematic duplicates originating from data collection or processing errors.\n- The test becomes more computationally intensive as the size of the dataset increases, which might not be suitable\nfor very large datasets.\n- Can only check for exact duplicates and may miss semantically similar information packaged differently.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_threshold": 1},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality", "text_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.EngleGrangerCoint": {
+        "description": "Assesses the degree of co-movement between pairs of time series data using the Engle-Granger cointegration test.\n\n### Purpose\n\nThe intent of this Engle-Granger cointegration test is to explore and quantify the degree of co-movement between\npairs of time series variables in a dataset. This is particularly useful in enhancing the accuracy of predictive\nregressions whenever the underlying variables are co-integrated, i.e., they move together over time.\n\n### Test Mechanism\n\nThe test first drops any non-applicable values from the input dataset and then iterates over each pair of variables\nto apply the Engle-Granger cointegration test. The test generates a 'p' value, which is then compared against a\npre-specified threshold (0.05 by default). The pair is labeled as 'Cointegrated' if the 'p' value is less than or\nequal to the threshold or 'Not cointegrated' otherwise. A summary table is returned by the metric showing\ncointegration results for each variable pair.\n\n### Signs of High Risk\n\n- A significant number of hypothesized cointegrated variables do not pass the test.\n- A considerable number of 'p' values are close to the threshold, indicating minor data fluctuations can switch the\ndecision between 'Cointegrated' and 'Not cointegrated'.\n\n### Strengths\n\n- Provides an effective way to analyze relationships between time series, particularly in contexts where it's\nessential to check if variables move together in a statistically significant manner.\n- Useful in various domains, especially finance or economics, where predictive models often hinge on understanding\nhow different variables move together over time.\n\n### Limitations\n\n- Assumes that the time series are integrated of the same order, which isn't always true in multivariate time\nseries datasets.\n- The presence of non-stationary characteristics in the series or structural breaks can result in falsely positive\nor negative cointegration results.\n- May not perform well for small sample sizes due to lack of statistical power and should be supplemented with\nother predictive indicators for a more robust model evaluation.",
+        "required_inputs": ["dataset"],
+        "default_params": {"threshold": 0.05},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "statistical_test", "forecasting"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.FeatureTargetCorrelationPlot": {
+        "description": "Visualizes the correlation between input features and the model's target output in a color-coded horizontal bar\nplot.\n\n### Purpose\n\nThis test is designed to graphically illustrate the correlations between distinct input features and the target\noutput of a Machine Learning model. Understanding how each feature influences the model's predictions is crucial—a\nhigher correlation indicates a stronger influence of the feature on the target variable. This correlation study is\nespecially advantageous during feature selection and for comprehending the model's operation.\n\n### Test Mechanism\n\nThis FeatureTargetCorrelationPlot test computes and presents the correlations between the features and the target\nvariable using a specific dataset. These correlations are calculated and are then graphically represented in a\nhorizontal bar plot, color-coded based on the strength of the correlation. A hovering template can also be utilized\nfor informative tooltips. It is possible to specify the features to be analyzed and adjust the graph's height\naccording to need.\n\n### Signs of High Risk\n\n- There are no strong correlations (either positive or negative) between features and the target variable. This\ncould suggest high risk as the supplied features do not appear to significantly impact the prediction output.\n- The presence of duplicated correlation values might hint at redundancy in the feature set.\n\n### Strengths\n\n- Provides visual assistance to interpreting correlations more effectively.\n- Gives a clear and simple tour of how each feature affects the model's target variable.\n- Beneficial for feature selection and grasping the model's prediction nature.\n- Precise correlation values for each feature are offered by the hover template, contributing to a granular-level\ncomprehension.\n\n### Limitations\n\n- The test only accepts numerical data, meaning variables of other types need to be prepared beforehand.\n- The plot assumes all correlations to be linear, thus non-linear relationships might not be captured effectively.\n- Not apt for models that employ complex feature interactions, like Decision Trees or Neural Networks, as the test\nmay not accurately reflect their importance.",
+        "required_inputs": ["dataset"],
+        "default_params": {"fig_height": 600},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "visualization", "correlation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.HighCardinality": {
+        "description": 'Assesses the number of unique values in categorical columns to detect high cardinality and potential overfitting.\n\n### Purpose\n\nThe “High Cardinality” test is used to evaluate the number of unique values present in the categorical columns of a\ndataset. In this context, high cardinality implies the presence of a large number of unique, non-repetitive values\nin the dataset.\n\n### Test Mechanism\n\nThe test first infers the dataset\'s type and then calculates an initial numeric threshold based on the test\nparameters. It only considers columns classified as "Categorical". For each of these columns, the number of\ndistinct values (n_distinct) and the percentage of distinct values (p_distinct) are calculated. The test will pass\nif n_distinct is less than the calculated numeric threshold. Lastly, the results, which include details such as\ncolumn name, number of distinct values, and pass/fail status, are compiled into a table.\n\n### Signs of High Risk\n\n- A large number of distinct values (high cardinality) in one or more categorical columns implies a high risk.\n- A column failing the test (n_distinct >= num_threshold) is another indicator of high risk.\n\n### Strengths\n\n- The High Cardinality test is effective in early detection of potential overfitting and unwanted noise.\n- It aids in identifying potential outliers and inconsistencies, thereby improving data quality.\n- The test can be applied to both classification and regression task types, demonstrating its versatility.\n\n### Limitations\n\n- The test is restricted to only "Categorical" data types and is thus not suitable for numerical or continuous\nfeatures, limiting its scope.\n- The test does not consider the relevance or importance of unique values in categorical features, potentially\ncausing it to overlook critical data points.\n- The threshold (both number and percent) used for the test is static and may not be optimal for diverse datasets\nand varied applications. Further mechanisms to adjust and refine this threshold could enhance its effectiveness.',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "num_threshold": 100,
+            "percent_threshold": 0.1,
+            "threshold_type": "percent",
+        },
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality", "categorical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.HighPearsonCorrelation": {
+        "description": "Identifies highly correlated feature pairs in a dataset suggesting feature redundancy or multicollinearity.\n\n### Purpose\n\nThe High Pearson Correlation test measures the linear relationship between features in a dataset, with the main\ngoal of identifying high correlations that might indicate feature redundancy or multicollinearity. Identification\nof such issues allows developers and risk management teams to properly deal with potential impacts on the machine\nlearning model's performance and interpretability.\n\n### Test Mechanism\n\nThe test works by generating pairwise Pearson correlations for all features in the dataset, then sorting and\neliminating duplicate and self-correlations. It assigns a Pass or Fail based on whether the absolute value of the\ncorrelation coefficient surpasses a pre-set threshold (defaulted at 0.3). It lastly returns the top ten strongest\ncorrelations regardless of passing or failing status.\n\n### Signs of High Risk\n\n- A high risk indication would be the presence of correlation coefficients exceeding the threshold.\n- If the features share a strong linear relationship, this could lead to potential multicollinearity and model\noverfitting.\n- Redundancy of variables can undermine the interpretability of the model due to uncertainty over the authenticity\nof individual variable's predictive power.\n\n### Strengths\n\n- Provides a quick and simple means of identifying relationships between feature pairs.\n- Generates a transparent output that displays pairs of correlated variables, the Pearson correlation coefficient,\nand a Pass or Fail status for each.\n- Aids in early identification of potential multicollinearity issues that may disrupt model training.\n\n### Limitations\n\n- Can only delineate linear relationships, failing to shed light on nonlinear relationships or dependencies.\n- Sensitive to outliers where a few outliers could notably affect the correlation coefficient.\n- Limited to identifying redundancy only within feature pairs; may fail to spot more complex relationships among\nthree or more variables.\n- The top 10 result filter might not fully capture the richness of the data; an option to configure the number of\nretained results could be helpful.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_threshold": 0.3},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality", "correlation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.IQROutliersBarPlot": {
+        "description": "Visualizes outlier distribution across percentiles in numerical data using the Interquartile Range (IQR) method.\n\n### Purpose\n\nThe InterQuartile Range Outliers Bar Plot (IQROutliersBarPlot) metric aims to visually analyze and evaluate the\nextent of outliers in numeric variables based on percentiles. Its primary purpose is to clarify the dataset's\ndistribution, flag possible abnormalities in it, and gauge potential risks associated with processing potentially\nskewed data, which can affect the machine learning model's predictive prowess.\n\n### Test Mechanism\n\nThe examination invokes a series of steps:\n\n1. For every numeric feature in the dataset, the 25th percentile (Q1) and 75th percentile (Q3) are calculated\nbefore deriving the Interquartile Range (IQR), the difference between Q1 and Q3.\n2. Subsequently, the metric calculates the lower and upper thresholds by subtracting Q1 from the `threshold` times\nIQR and adding Q3 to `threshold` times IQR, respectively. The default `threshold` is set at 1.5.\n3. Any value in the feature that falls below the lower threshold or exceeds the upper threshold is labeled as an\noutlier.\n4. The number of outliers are tallied for different percentiles, such as [0-25], [25-50], [50-75], and [75-100].\n5. These counts are employed to construct a bar plot for the feature, showcasing the distribution of outliers\nacross different percentiles.\n\n### Signs of High Risk\n\n- A prevalence of outliers in the data, potentially skewing its distribution.\n- Outliers dominating higher percentiles (75-100) which implies the presence of extreme values, capable of severely\ninfluencing the model's performance.\n- Certain features harboring most of their values as outliers, which signifies that these features might not\ncontribute positively to the model's forecasting ability.\n\n### Strengths\n\n- Effectively identifies outliers in the data through visual means, facilitating easier comprehension and offering\ninsights into the outliers' possible impact on the model.\n- Provides flexibility by accommodating all numeric features or a chosen subset.\n- Task-agnostic in nature; it is viable for both classification and regression tasks.\n- Can handle large datasets as its operation does not hinge on computationally heavy operations.\n\n### Limitations\n\n- Its application is limited to numerical variables and does not extend to categorical ones.\n- Relies on a predefined threshold (default being 1.5) for outlier identification, which may not be suitable for\nall cases.\n- Only reveals the presence and distribution of outliers and does not provide insights into how these outliers\nmight affect the model's predictive performance.\n- The assumption that data is unimodal and symmetric may not always hold true. In cases with non-normal\ndistributions, the results can be misleading.",
+        "required_inputs": ["dataset"],
+        "default_params": {"threshold": 1.5, "fig_width": 800},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "visualization", "numerical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.IQROutliersTable": {
+        "description": 'Determines and summarizes outliers in numerical features using the Interquartile Range method.\n\n### Purpose\n\nThe "Interquartile Range Outliers Table" (IQROutliersTable) metric is designed to identify and summarize outliers\nwithin numerical features of a dataset using the Interquartile Range (IQR) method. This exercise is crucial in the\npre-processing of data because outliers can substantially distort statistical analysis and impact the performance\nof machine learning models.\n\n### Test Mechanism\n\nThe IQR, which is the range separating the first quartile (25th percentile) from the third quartile (75th\npercentile), is calculated for each numerical feature within the dataset. An outlier is defined as a data point\nfalling below the "Q1 - 1.5 * IQR" or above "Q3 + 1.5 * IQR" range. The test computes the number of outliers and\ntheir summary statistics (minimum, 25th percentile, median, 75th percentile, and maximum values) for each numerical\nfeature. If no specific features are chosen, the test applies to all numerical features in the dataset. The default\noutlier threshold is set to 1.5 but can be customized by the user.\n\n### Signs of High Risk\n\n- A large number of outliers in multiple features.\n- Outliers significantly distanced from the mean value of variables.\n- Extremely high or low outlier values indicative of data entry errors or other data quality issues.\n\n### Strengths\n\n- Provides a comprehensive summary of outliers for each numerical feature, helping pinpoint features with potential\nquality issues.\n- The IQR method is robust to extremely high or low outlier values as it is based on quartile calculations.\n- Can be customized to work on selected features and set thresholds for outliers.\n\n### Limitations\n\n- Might cause false positives if the variable deviates from a normal or near-normal distribution, especially for\nskewed distributions.\n- Does not provide interpretation or recommendations for addressing outliers, relying on further analysis by users\nor data scientists.\n- Only applicable to numerical features, not categorical data.\n- Default thresholds may not be optimal for data with heavy pre-processing, manipulation, or inherently high\nkurtosis (heavy tails).',
+        "required_inputs": ["dataset"],
+        "default_params": {"threshold": 1.5},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "numerical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.IsolationForestOutliers": {
+        "description": "Detects outliers in a dataset using the Isolation Forest algorithm and visualizes results through scatter plots.\n\n### Purpose\n\nThe IsolationForestOutliers test is designed to identify anomalies or outliers in the model's dataset using the\nisolation forest algorithm. This algorithm assumes that anomalous data points can be isolated more quickly due to\ntheir distinctive properties. By creating isolation trees and identifying instances with shorter average path\nlengths, the test is able to pick out data points that differ from the majority.\n\n### Test Mechanism\n\nThe test uses the isolation forest algorithm, which builds an ensemble of isolation trees by randomly selecting\nfeatures and splitting the data based on random thresholds. It isolates anomalies rather than focusing on normal\ndata points. For each pair of variables, a scatter plot is generated which distinguishes the identified outliers\nfrom the inliers. The results of the test can be visualized using these scatter plots, illustrating the distinction\nbetween outliers and inliers.\n\n### Signs of High Risk\n\n- The presence of high contamination, indicating a large number of anomalies\n- Inability to detect clusters of anomalies that are close in the feature space\n- Misclassifying normal instances as anomalies\n- Failure to detect actual anomalies\n\n### Strengths\n\n- Ability to handle large, high-dimensional datasets\n- Efficiency in isolating anomalies instead of normal instances\n- Insensitivity to the underlying distribution of data\n- Ability to recognize anomalies even when they are not separated from the main data cloud through identifying\ndistinctive properties\n- Visually presents the test results for better understanding and interpretability\n\n### Limitations\n\n- Difficult to detect anomalies that are close to each other or prevalent in datasets\n- Dependency on the contamination parameter which may need fine-tuning to be effective\n- Potential failure in detecting collective anomalies if they behave similarly to normal data\n- Potential lack of precision in identifying which features contribute most to the anomalous behavior",
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "random_state": 0,
+            "contamination": 0.1,
+            "features_columns": None,
+        },
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "anomaly_detection"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.JarqueBera": {
+        "description": "Assesses normality of dataset features in an ML model using the Jarque-Bera test.\n\n### Purpose\n\nThe purpose of the Jarque-Bera test as implemented in this metric is to determine if the features in the dataset of\na given Machine Learning model follow a normal distribution. This is crucial for understanding the distribution and\nbehavior of the model's features, as numerous statistical methods assume normal distribution of the data.\n\n### Test Mechanism\n\nThe test mechanism involves computing the Jarque-Bera statistic, p-value, skew, and kurtosis for each feature in\nthe dataset. It utilizes the 'jarque_bera' function from the 'statsmodels' library in Python, storing the results\nin a dictionary. The test evaluates the skewness and kurtosis to ascertain whether the dataset follows a normal\ndistribution. A significant p-value (typically less than 0.05) implies that the data does not possess normal\ndistribution.\n\n### Signs of High Risk\n\n- A high Jarque-Bera statistic and a low p-value (usually less than 0.05) indicate high-risk conditions.\n- Such results suggest the data significantly deviates from a normal distribution. If a machine learning model\nexpects feature data to be normally distributed, these findings imply that it may not function as intended.\n\n### Strengths\n\n- Provides insights into the shape of the data distribution, helping determine whether a given set of data follows\na normal distribution.\n- Particularly useful for risk assessment for models that assume a normal distribution of data.\n- By measuring skewness and kurtosis, it provides additional insights into the nature and magnitude of a\ndistribution's deviation.\n\n### Limitations\n\n- Only checks for normality in the data distribution. It cannot provide insights into other types of distributions.\n- Datasets that aren't normally distributed but follow some other distribution might lead to inaccurate risk\nassessments.\n- Highly sensitive to large sample sizes, often rejecting the null hypothesis (that data is normally distributed)\neven for minor deviations in larger datasets.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": [
+            "tabular_data",
+            "data_distribution",
+            "statistical_test",
+            "statsmodels",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.KPSS": {
+        "description": "Assesses the stationarity of time-series data in a machine learning model using the KPSS unit root test.\n\n### Purpose\n\nThe KPSS (Kwiatkowski-Phillips-Schmidt-Shin) unit root test is utilized to ensure the stationarity of data within a\nmachine learning model. It specifically works on time-series data to establish the order of integration, which is\nessential for accurate forecasting. A fundamental requirement for any time series model is that the series should\nbe stationary.\n\n### Test Mechanism\n\nThis test calculates the KPSS score for each feature in the dataset. The KPSS score includes a statistic, a\np-value, a used lag, and critical values. The core principle behind the KPSS test is to evaluate the hypothesis\nthat an observable time series is stationary around a deterministic trend. If the computed statistic exceeds the\ncritical value, the null hypothesis (that the series is stationary) is rejected, indicating that the series is\nnon-stationary.\n\n### Signs of High Risk\n\n- High KPSS score, particularly if the calculated statistic is higher than the critical value.\n- Rejection of the null hypothesis, indicating that the series is recognized as non-stationary, can severely affect\nthe model's forecasting capability.\n\n### Strengths\n\n- Directly measures the stationarity of a series, fulfilling a key prerequisite for many time-series models.\n- The underlying logic of the test is intuitive and simple, making it easy to understand and accessible for both\ndevelopers and risk management teams.\n\n### Limitations\n\n- Assumes the absence of a unit root in the series and doesn't differentiate between series that are stationary and\nthose border-lining stationarity.\n- The test may have restricted power against certain alternatives.\n- The reliability of the test is contingent on the number of lags selected, which introduces potential bias in the\nmeasurement.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "forecasting",
+            "stationarity",
+            "unit_root_test",
+            "statsmodels",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.LJungBox": {
+        "description": "Assesses autocorrelations in dataset features by performing a Ljung-Box test on each feature.\n\n### Purpose\n\nThe Ljung-Box test is a type of statistical test utilized to ascertain whether there are autocorrelations within a\ngiven dataset that differ significantly from zero. In the context of a machine learning model, this test is\nprimarily used to evaluate data utilized in regression tasks, especially those involving time series and\nforecasting.\n\n### Test Mechanism\n\nThe test operates by iterating over each feature within the dataset and applying the `acorr_ljungbox`\nfunction from the `statsmodels.stats.diagnostic` library. This function calculates the Ljung-Box statistic and\np-value for each feature. These results are then stored in a pandas DataFrame where the columns are the feature names,\nstatistic, and p-value respectively. Generally, a lower p-value indicates a higher likelihood of significant\nautocorrelations within the feature.\n\n### Signs of High Risk\n\n- High Ljung-Box statistic values or low p-values.\n- Presence of significant autocorrelations in the respective features.\n- Potential for negative impact on model performance or bias if autocorrelations are not properly handled.\n\n### Strengths\n\n- Powerful tool for detecting autocorrelations within datasets, especially in time series data.\n- Provides quantitative measures (statistic and p-value) for precise evaluation.\n- Helps avoid issues related to autoregressive residuals and other challenges in regression models.\n\n### Limitations\n\n- Cannot detect all types of non-linearity or complex interrelationships among variables.\n- Testing individual features may not fully encapsulate the dynamics of the data if features interact with each other.\n- Designed more for traditional statistical models and may not be fully compatible with certain types of complex\n  machine learning models.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "forecasting", "statistical_test", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.LaggedCorrelationHeatmap": {
+        "description": "Assesses and visualizes correlation between target variable and lagged independent variables in a time-series\ndataset.\n\n### Purpose\n\nThe LaggedCorrelationHeatmap metric is utilized to appraise and illustrate the correlation between the target\nvariable and delayed copies (lags) of independent variables in a time-series dataset. It assists in revealing\nrelationships in time-series data where the influence of an independent variable on the dependent variable is not\nimmediate but occurs after a period (lags).\n\n### Test Mechanism\n\nTo execute this test, Python's Pandas library pairs with Plotly to perform computations and present the\nvisualization in the form of a heatmap. The test begins by extracting the target variable and corresponding\nindependent variables from the dataset. Then, generation of lags of independent variables takes place, followed by\nthe calculation of correlation between these lagged variables and the target variable. The outcome is a correlation\nmatrix that gets recorded and illustrated as a heatmap, where different color intensities represent the strength of\nthe correlation, making patterns easier to identify.\n\n### Signs of High Risk\n\n- Insignificant correlations across the heatmap, indicating a lack of noteworthy relationships between variables.\n- Correlations that break intuition or previous understanding, suggesting potential issues with the dataset or the\nmodel.\n\n### Strengths\n\n- This metric serves as an exceptional tool for exploring and visualizing time-dependent relationships between\nfeatures and the target variable in a time-series dataset.\n- It aids in identifying delayed effects that might go unnoticed with other correlation measures.\n- The heatmap offers an intuitive visual representation of time-dependent correlations and influences.\n\n### Limitations\n\n- The metric presumes linear relationships between variables, potentially ignoring non-linear relationships.\n- The correlation considered is linear; therefore, intricate non-linear interactions might be overlooked.\n- The metric is only applicable for time-series data, limiting its utility outside of this context.\n- The number of lags chosen can significantly influence the results; too many lags can render the heatmap difficult\nto interpret, while too few might overlook delayed effects.\n- This metric does not take into account any causal relationships, but merely demonstrates correlation.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.MissingValues": {
+        "description": 'Evaluates dataset quality by ensuring missing value ratio across all features does not exceed a set threshold.\n\n### Purpose\n\nThe Missing Values test is designed to evaluate the quality of a dataset by measuring the number of missing values\nacross all features. The objective is to ensure that the ratio of missing data to total data is less than a\npredefined threshold, defaulting to 1, in order to maintain the data quality necessary for reliable predictive\nstrength in a machine learning model.\n\n### Test Mechanism\n\nThe mechanism for this test involves iterating through each column of the dataset, counting missing values\n(represented as NaNs), and calculating the percentage they represent against the total number of rows. The test\nthen checks if these missing value counts are less than the predefined `min_threshold`. The results are shown in a\ntable summarizing each column, the number of missing values, the percentage of missing values in each column, and a\nPass/Fail status based on the threshold comparison.\n\n### Signs of High Risk\n\n- When the number of missing values in any column exceeds the `min_threshold` value.\n- Presence of missing values across many columns, leading to multiple instances of failing the threshold.\n\n### Strengths\n\n- Quick and granular identification of missing data across each feature in the dataset.\n- Provides an effective and straightforward means of maintaining data quality, essential for constructing efficient\nmachine learning models.\n\n### Limitations\n\n- Does not suggest the root causes of the missing values or recommend ways to impute or handle them.\n- May overlook features with significant missing data but still less than the `min_threshold`, potentially\nimpacting the model.\n- Does not account for data encoded as values like "-999" or "None," which might not technically classify as\nmissing but could bear similar implications.',
+        "required_inputs": ["dataset"],
+        "default_params": {"min_threshold": 1},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.MissingValuesBarPlot": {
+        "description": "Assesses the percentage and distribution of missing values in the dataset via a bar plot, with emphasis on\nidentifying high-risk columns based on a user-defined threshold.\n\n### Purpose\n\nThe 'MissingValuesBarPlot' metric provides a color-coded visual representation of the percentage of missing values\nfor each column in an ML model's dataset. The primary purpose of this metric is to easily identify and quantify\nmissing data, which are essential steps in data preprocessing. The presence of missing data can potentially skew\nthe model's predictions and decrease its accuracy. Additionally, this metric uses a pre-set threshold to categorize\nvarious columns into ones that contain missing data above the threshold (high risk) and below the threshold (less\nrisky).\n\n### Test Mechanism\n\nThe test mechanism involves scanning each column in the input dataset and calculating the percentage of missing\nvalues. It then compares each column's missing data percentage with the predefined threshold, categorizing columns\nwith missing data above the threshold as high-risk. The test generates a bar plot in which columns with missing\ndata are represented on the y-axis and their corresponding missing data percentages are displayed on the x-axis.\nThe color of each bar reflects the missing data percentage in relation to the threshold: grey for values below the\nthreshold and light coral for those exceeding it. The user-defined threshold is represented by a red dashed line on\nthe plot.\n\n### Signs of High Risk\n\n- Columns with higher percentages of missing values beyond the threshold are high-risk. These are visually\nrepresented by light coral bars on the bar plot.\n\n### Strengths\n\n- Helps in quickly identifying and quantifying missing data across all columns of the dataset.\n- Facilitates pattern recognition through visual representation.\n- Enables customization of the level of risk tolerance via a user-defined threshold.\n- Supports both classification and regression tasks, sharing its versatility.\n\n### Limitations\n\n- It only considers the quantity of missing values, not differentiating between different types of missingness\n(Missing completely at random - MCAR, Missing at random - MAR, Not Missing at random - NMAR).\n- It doesn't offer insights into potential approaches for handling missing entries, such as various imputation\nstrategies.\n- The metric does not consider possible impacts of the missing data on the model's accuracy or precision.\n- Interpretation of the findings and the next steps might require an expert understanding of the field.",
+        "required_inputs": ["dataset"],
+        "default_params": {"threshold": 80, "fig_height": 600},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.PearsonCorrelationMatrix": {
+        "description": "Evaluates linear dependency between numerical variables in a dataset via a Pearson Correlation coefficient heat map.\n\n### Purpose\n\nThis test is intended to evaluate the extent of linear dependency between all pairs of numerical variables in the\ngiven dataset. It provides the Pearson Correlation coefficient, which reveals any high correlations present. The\npurpose of doing this is to identify potential redundancy, as variables that are highly correlated can often be\nremoved to reduce the dimensionality of the dataset without significantly impacting the model's performance.\n\n### Test Mechanism\n\nThis metric test generates a correlation matrix for all numerical variables in the dataset using the Pearson\ncorrelation formula. A heat map is subsequently created to visualize this matrix effectively. The color of each\npoint on the heat map corresponds to the magnitude and direction (positive or negative) of the correlation, with a\nrange from -1 (perfect negative correlation) to 1 (perfect positive correlation). Any correlation coefficients\nhigher than 0.7 (in absolute terms) are indicated in white in the heat map, suggesting a high degree of correlation.\n\n### Signs of High Risk\n\n- A large number of variables in the dataset showing a high degree of correlation (coefficients approaching ±1).\nThis indicates redundancy within the dataset, suggesting that some variables may not be contributing new\ninformation to the model.\n- Potential risk of overfitting.\n\n### Strengths\n\n- Detects and quantifies the linearity of relationships between variables, aiding in identifying redundant\nvariables to simplify models and potentially improve performance.\n- The heatmap visualization provides an easy-to-understand overview of correlations, beneficial for users not\ncomfortable with numerical matrices.\n\n### Limitations\n\n- Limited to detecting linear relationships, potentially missing non-linear relationships which impede\nopportunities for dimensionality reduction.\n- Measures only the degree of linear relationship, not the strength of one variable's effect on another.\n- The 0.7 correlation threshold is arbitrary and might exclude valid dependencies with lower coefficients.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "numerical_data", "correlation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.PhillipsPerronArch": {
+        "description": "Assesses the stationarity of time series data in each feature of the ML model using the Phillips-Perron test.\n\n### Purpose\n\nThe Phillips-Perron (PP) test is used to determine the stationarity of time series data for each feature in a\ndataset, which is crucial for forecasting tasks. It tests the null hypothesis that a time series is unit-root\nnon-stationary. This is vital for understanding the stochastic behavior of the data and ensuring the robustness and\nvalidity of predictions generated by regression analysis models.\n\n### Test Mechanism\n\nThe PP test is conducted for each feature in the dataset as follows:\n- A data frame is created from the dataset.\n- For each column, the Phillips-Perron method calculates the test statistic, p-value, lags used, and number of\nobservations.\n- The results are then stored for each feature, providing a metric that indicates the stationarity of the time\nseries data.\n\n### Signs of High Risk\n\n- A high p-value, indicating that the series has a unit root and is non-stationary.\n- Test statistic values exceeding critical values, suggesting non-stationarity.\n- High 'usedlag' value, pointing towards autocorrelation issues that may degrade model performance.\n\n### Strengths\n\n- Resilience against heteroskedasticity in the error term.\n- Effective for long time series data.\n- Helps in determining whether the time series is stationary, aiding in the selection of suitable forecasting\nmodels.\n\n### Limitations\n\n- Applicable only within a univariate time series framework.\n- Relies on asymptotic theory, which may reduce the test’s power for small sample sizes.\n- Non-stationary time series must be converted to stationary series through differencing, potentially leading to\nloss of important data points.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": [
+            "time_series_data",
+            "forecasting",
+            "statistical_test",
+            "unit_root_test",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ProtectedClassesCombination": {
+        "description": "Visualizes combinations of protected classes and their corresponding error metric differences.\n\n### Purpose\n\nThis test aims to provide insights into how different combinations of protected classes affect various error metrics,\nparticularly the false negative rate (FNR) and false positive rate (FPR). By visualizing these combinations,\nit helps identify potential biases or disparities in model performance across different intersectional groups.\n\n### Test Mechanism\n\nThe test performs the following steps:\n1. Combines the specified protected class columns to create a single multi-class category.\n2. Calculates error metrics (FNR, FPR, etc.) for each combination of protected classes.\n3. Generates visualizations showing the distribution of these metrics across all class combinations.\n\n### Signs of High Risk\n\n- Large disparities in FNR or FPR across different protected class combinations.\n- Consistent patterns of higher error rates for specific combinations of protected attributes.\n- Unexpected or unexplainable variations in error metrics between similar group combinations.\n\n### Strengths\n\n- Provides a comprehensive view of intersectional fairness across multiple protected attributes.\n- Allows for easy identification of potentially problematic combinations of protected classes.\n- Visualizations make it easier to spot patterns or outliers in model performance across groups.\n\n### Limitations\n\n- May become complex and difficult to interpret with a large number of protected classes or combinations.\n- Does not provide statistical significance of observed differences.\n- Visualization alone may not capture all nuances of intersectional fairness.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"protected_classes": None},
+        "tasks": ["classification", "regression"],
+        "tags": ["bias_and_fairness"],
+        "required_dependencies": ["fairlearn"],
+        "extra": None,
+    },
+    "validmind.data_validation.ProtectedClassesDescription": {
+        "description": "Visualizes the distribution of protected classes in the dataset relative to the target variable\nand provides descriptive statistics.\n\n### Purpose\n\nThe ProtectedClassesDescription test aims to identify potential biases or significant differences in the\ndistribution of target outcomes across different protected classes. This visualization and statistical summary\nhelp in understanding the relationship between protected attributes and the target variable, which is crucial\nfor assessing fairness in machine learning models.\n\n### Test Mechanism\n\nThe function creates interactive stacked bar charts for each specified protected class using Plotly.\nAdditionally, it generates a single table of descriptive statistics for all protected classes, including:\n- Protected class and category\n- Count and percentage of each category within the protected class\n- Mean, median, and mode of the target variable for each category\n- Standard deviation of the target variable for each category\n- Minimum and maximum values of the target variable for each category\n\n### Signs of High Risk\n\n- Significant imbalances in the distribution of target outcomes across different categories of a protected class.\n- Large disparities in mean, median, or mode of the target variable across categories.\n- Underrepresentation or overrepresentation of certain groups within protected classes.\n- High standard deviations in certain categories, indicating potential volatility or outliers.\n\n### Strengths\n\n- Provides both visual and statistical representation of potential biases in the dataset.\n- Allows for easy identification of imbalances in target variable distribution across protected classes.\n- Interactive plots enable detailed exploration of the data.\n- Consolidated statistical summary provides quantitative measures to complement visual analysis.\n- Applicable to both classification and regression tasks.\n\n### Limitations\n\n- Does not provide advanced statistical measures of bias or fairness.\n- May become cluttered if there are many categories within a protected class or many unique target values.\n- Interpretation may require domain expertise to understand the implications of observed disparities.\n- Does not account for intersectionality or complex interactions between multiple protected attributes.",
+        "required_inputs": ["dataset"],
+        "default_params": {"protected_classes": None},
+        "tasks": ["classification", "regression"],
+        "tags": ["bias_and_fairness", "descriptive_statistics"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ProtectedClassesDisparity": {
+        "description": "Investigates disparities in model performance across different protected class segments.\n\n### Purpose\n\nThis test aims to identify and quantify potential biases in model outcomes by comparing various performance metrics\nacross different segments of protected classes. It helps in assessing whether the model produces discriminatory\noutcomes for certain groups, which is crucial for ensuring fairness in machine learning models.\n\n### Test Mechanism\n\nThe test performs the following steps:\n1. Calculates performance metrics (e.g., false negative rate, false positive rate, true positive rate) for each segment\n   of the specified protected classes.\n2. Computes disparity ratios by comparing these metrics between different segments and a reference group.\n3. Generates visualizations showing the disparities and their relation to a user-defined disparity tolerance threshold.\n4. Produces a comprehensive table with various disparity metrics for detailed analysis.\n\n### Signs of High Risk\n\n- Disparity ratios exceeding the specified disparity tolerance threshold.\n- Consistent patterns of higher error rates or lower performance for specific protected class segments.\n- Statistically significant differences in performance metrics across segments.\n\n### Strengths\n\n- Provides a comprehensive view of model fairness across multiple protected attributes and metrics.\n- Allows for easy identification of problematic disparities through visual and tabular representations.\n- Customizable disparity tolerance threshold to align with specific use-case requirements.\n- Applicable to various performance metrics, offering a multi-faceted analysis of model fairness.\n\n### Limitations\n\n- Relies on a predefined reference group for each protected class, which may not always be the most appropriate choice.\n- Does not account for intersectionality between different protected attributes.\n- The interpretation of results may require domain expertise to understand the implications of observed disparities.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {
+            "protected_classes": None,
+            "disparity_tolerance": 1.25,
+            "metrics": ["fnr", "fpr", "tpr"],
+        },
+        "tasks": ["classification", "regression"],
+        "tags": ["bias_and_fairness"],
+        "required_dependencies": ["aequitas"],
+        "extra": None,
+    },
+    "validmind.data_validation.ProtectedClassesThresholdOptimizer": {
+        "description": "Obtains a classifier by applying group-specific thresholds to the provided estimator.\n\n### Purpose\n\nThis test aims to optimize the fairness of a machine learning model by applying different\nclassification thresholds for different protected groups. It helps in mitigating bias and\nachieving more equitable outcomes across different demographic groups.\n\n### Test Mechanism\n\nThe test uses Fairlearn's ThresholdOptimizer to:\n1. Fit an optimizer on the training data, considering protected classes.\n2. Apply optimized thresholds to make predictions on the test data.\n3. Calculate and report various fairness metrics.\n4. Visualize the optimized thresholds.\n\n### Signs of High Risk\n\n- Large disparities in fairness metrics (e.g., Demographic Parity Ratio, Equalized Odds Ratio)\n  across different protected groups.\n- Significant differences in False Positive Rates (FPR) or True Positive Rates (TPR) between groups.\n- Thresholds that vary widely across different protected groups.\n\n### Strengths\n\n- Provides a post-processing method to improve model fairness without modifying the original model.\n- Allows for balancing multiple fairness criteria simultaneously.\n- Offers visual insights into the threshold optimization process.\n\n### Limitations\n\n- May lead to a decrease in overall model performance while improving fairness.\n- Requires access to protected attribute information at prediction time.\n- The effectiveness can vary depending on the chosen fairness constraint and objective.",
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "pipeline": None,
+            "protected_classes": None,
+            "X_train": None,
+            "y_train": None,
+        },
+        "tasks": ["classification", "regression"],
+        "tags": ["bias_and_fairness"],
+        "required_dependencies": ["fairlearn"],
+        "extra": None,
+    },
+    "validmind.data_validation.RollingStatsPlot": {
+        "description": "Evaluates the stationarity of time series data by plotting its rolling mean and standard deviation over a specified\nwindow.\n\n### Purpose\n\nThe `RollingStatsPlot` metric is employed to gauge the stationarity of time series data in a given dataset. This\nmetric specifically evaluates the rolling mean and rolling standard deviation of the dataset over a pre-specified\nwindow size. The rolling mean provides an understanding of the average trend in the data, while the rolling\nstandard deviation gauges the volatility of the data within the window. It is critical in preparing time series\ndata for modeling as it reveals key insights into data behavior across time.\n\n### Test Mechanism\n\nThis mechanism is comprised of two steps. Initially, the rolling mean and standard deviation for each of the\ndataset's columns are calculated over a window size, which can be user-specified or by default set to 12 data\npoints. Then, the calculated rolling mean and standard deviation are visualized via separate plots, illustrating\nthe trends and volatility in the dataset. A straightforward check is conducted to ensure the existence of columns\nin the dataset, and to verify that the given dataset has been indexed by its date and time—a necessary prerequisite\nfor time series analysis.\n\n### Signs of High Risk\n\n- The presence of non-stationary patterns in either the rolling mean or the rolling standard deviation plots, which\ncould indicate trends or seasonality in the data that may affect the performance of time series models.\n- Missing columns in the dataset, which would prevent the execution of this metric correctly.\n- The detection of NaN values in the dataset, which may need to be addressed before the metric can proceed\nsuccessfully.\n\n### Strengths\n\n- Offers visualizations of trending behavior and volatility within the data, facilitating a broader understanding\nof the dataset's inherent characteristics.\n- Checks of the dataset's integrity, such as the existence of all required columns and the availability of a\ndatetime index.\n- Adjusts to accommodate various window sizes, thus allowing accurate analysis of data with differing temporal\ngranularities.\n- Considers each column of the data individually, thereby accommodating multi-feature datasets.\n\n### Limitations\n\n- For all columns, a fixed-size window is utilized. This may not accurately capture patterns in datasets where\ndifferent features may require different optimal window sizes.\n- Requires the dataset to be indexed by date and time, hence it may not be usable for datasets without a timestamp\nindex.\n- Primarily serves for data visualization as it does not facilitate any quantitative measures for stationarity,\nsuch as through statistical tests. Therefore, the interpretation is subjective and depends heavily on modeler\ndiscretion.",
+        "required_inputs": ["dataset"],
+        "default_params": {"window_size": 12},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "visualization", "stationarity"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.RunsTest": {
+        "description": "Executes Runs Test on ML model to detect non-random patterns in output data sequence.\n\n### Purpose\n\nThe Runs Test is a statistical procedure used to determine whether the sequence of data extracted from the ML model\nbehaves randomly or not. Specifically, it analyzes runs, sequences of consecutive positives or negatives, in the\ndata to check if there are more or fewer runs than expected under the assumption of randomness. This can be an\nindication of some pattern, trend, or cycle in the model's output which may need attention.\n\n### Test Mechanism\n\nThe testing mechanism applies the Runs Test from the statsmodels module on each column of the training dataset. For\nevery feature in the dataset, a Runs Test is executed, whose output includes a Runs Statistic and P-value. A low\nP-value suggests that data arrangement in the feature is not likely to be random. The results are stored in a\ndictionary where the keys are the feature names, and the values are another dictionary storing the test statistic\nand the P-value for each feature.\n\n### Signs of High Risk\n\n- High risk is indicated when the P-value is close to zero.\n- If the P-value is less than a predefined significance level (like 0.05), it suggests that the runs (series of\npositive or negative values) in the model's output are not random and are longer or shorter than what is expected\nunder a random scenario.\n- This would mean there's a high risk of non-random distribution of errors or model outcomes, suggesting potential\nissues with the model.\n\n### Strengths\n\n- Straightforward and fast for detecting non-random patterns in data sequence.\n- Validates assumptions of randomness, which is valuable for checking error distributions in regression models,\ntrendless time series data, and ensuring a classifier doesn't favor one class over another.\n- Can be applied to both classification and regression tasks, making it versatile.\n\n### Limitations\n\n- Assumes that the data is independently and identically distributed (i.i.d.), which might not be the case for many\nreal-world datasets.\n- The conclusion drawn from the low P-value indicating non-randomness does not provide information about the type\nor the source of the detected pattern.\n- Sensitive to extreme values (outliers), and overly large or small run sequences can influence the results.\n- Does not provide model performance evaluation; it is used to detect patterns in the sequence of outputs only.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "statistical_test", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ScatterPlot": {
+        "description": "Assesses visual relationships, patterns, and outliers among features in a dataset through scatter plot matrices.\n\n### Purpose\n\nThe ScatterPlot test aims to visually analyze a given dataset by constructing a scatter plot matrix of its\nnumerical features. The primary goal is to uncover relationships, patterns, and outliers across different features\nto provide both quantitative and qualitative insights into multidimensional relationships within the dataset. This\nvisual assessment aids in understanding the efficacy of the chosen features for model training and their\nsuitability.\n\n### Test Mechanism\n\nUsing the Seaborn library, the ScatterPlot function creates the scatter plot matrix. The process involves\nretrieving all numerical columns from the dataset and generating a scatter matrix for these columns. The resulting\nscatter plot provides visual representations of feature relationships. The function also adjusts axis labels for\nreadability and returns the final plot as a Matplotlib Figure object for further analysis and visualization.\n\n### Signs of High Risk\n\n- The emergence of non-linear or random patterns across different feature pairs, suggesting complex relationships\nunsuitable for linear assumptions.\n- Lack of clear patterns or clusters, indicating weak or non-existent correlations among features, which could\nchallenge certain model types.\n- Presence of outliers, as visual outliers can adversely influence the model's performance.\n\n### Strengths\n\n- Provides insight into the multidimensional relationships among multiple features.\n- Assists in identifying trends, correlations, and outliers that could affect model performance.\n- Validates assumptions made during model creation, such as linearity.\n- Versatile for application in both regression and classification tasks.\n- Using Seaborn facilitates an intuitive and detailed visual exploration of data.\n\n### Limitations\n\n- Scatter plot matrices may become cluttered and hard to decipher as the number of features increases.\n- Primarily reveals pairwise relationships and may fail to illuminate complex interactions involving three or more\nfeatures.\n- Being a visual tool, precision in quantitative analysis might be compromised.\n- Outliers not clearly visible in plots can be missed, affecting model performance.\n- Assumes that the dataset can fit into the computer's memory, which might not be valid for extremely large\ndatasets.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.SeasonalDecompose": {
+        "description": "Assesses patterns and seasonality in a time series dataset by decomposing its features into foundational components.\n\n### Purpose\n\nThe Seasonal Decompose test aims to decompose the features of a time series dataset into their fundamental\ncomponents: observed, trend, seasonal, and residuals. By utilizing the Seasonal Decomposition of Time Series by\nLoess (STL) method, the test identifies underlying patterns, predominantly seasonality, in the dataset's features.\nThis aids in developing a more comprehensive understanding of the dataset, which in turn facilitates more effective\nmodel validation.\n\n### Test Mechanism\n\nThe testing process leverages the `seasonal_decompose` function from the `statsmodels.tsa.seasonal` library to\nevaluate each feature in the dataset. It isolates each feature into four components—observed, trend, seasonal, and\nresiduals—and generates six subplot graphs per feature for visual interpretation. Prior to decomposition, the test\nscrutinizes and removes any non-finite values, ensuring the reliability of the analysis.\n\n### Signs of High Risk\n\n- **Non-Finiteness**: Datasets with a high number of non-finite values may flag as high risk since these values are\nomitted before conducting the seasonal decomposition.\n- **Frequent Warnings**: Chronic failure to infer the frequency for a scrutinized feature indicates high risk.\n- **High Seasonality**: A significant seasonal component could potentially render forecasts unreliable due to\noverwhelming seasonal variation.\n\n### Strengths\n\n- **Seasonality Detection**: Accurately discerns hidden seasonality patterns in dataset features.\n- **Visualization**: Facilitates interpretation and comprehension through graphical representations.\n- **Unrestricted Usage**: Not confined to any specific regression model, promoting wide-ranging applicability.\n\n### Limitations\n\n- **Dependence on Assumptions**: Assumes that dataset features are periodically distributed. Features with no\ninferable frequency are excluded from the test.\n- **Handling Non-Finite Values**: Disregards non-finite values during analysis, potentially resulting in an\nincomplete understanding of the dataset.\n- **Unreliability with Noisy Datasets**: Produces unreliable results when used with datasets that contain heavy\nnoise.",
+        "required_inputs": ["dataset"],
+        "default_params": {"seasonal_model": "additive"},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "seasonality", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ShapiroWilk": {
+        "description": "Evaluates feature-wise normality of training data using the Shapiro-Wilk test.\n\n### Purpose\n\nThe Shapiro-Wilk test is utilized to investigate whether a particular dataset conforms to the standard normal\ndistribution. This analysis is crucial in machine learning modeling because the normality of the data can\nprofoundly impact the performance of the model. This metric is especially useful in evaluating various features of\nthe dataset in both classification and regression tasks.\n\n### Test Mechanism\n\nThe Shapiro-Wilk test is conducted on each feature column of the training dataset to determine if the data\ncontained fall within the normal distribution. The test presents a statistic and a p-value, with the p-value\nserving to validate or repudiate the null hypothesis, which is that the tested data is normally distributed.\n\n### Signs of High Risk\n\n- A p-value that falls below 0.05 signifies a high risk as it discards the null hypothesis, indicating that the\ndata does not adhere to the normal distribution.\n- For machine learning models built on the presumption of data normality, such an outcome could result in subpar\nperformance or incorrect predictions.\n\n### Strengths\n\n- The Shapiro-Wilk test is esteemed for its level of accuracy, thereby making it particularly well-suited to\ndatasets of small to moderate sizes.\n- It proves its versatility through its efficient functioning in both classification and regression tasks.\n- By separately testing each feature column, the Shapiro-Wilk test can raise an alarm if a specific feature does\nnot comply with the normality.\n\n### Limitations\n\n- The Shapiro-Wilk test's sensitivity can be a disadvantage as it often rejects the null hypothesis (i.e., data is\nnormally distributed), even for minor deviations, especially in large datasets. This may lead to unwarranted 'false\nalarms' of high risk by deeming the data as not normally distributed even if it approximates normal distribution.\n- Exceptional care must be taken in managing missing data or outliers prior to testing as these can greatly skew\nthe results.\n- Lastly, the Shapiro-Wilk test is not optimally suited for processing data with pronounced skewness or kurtosis.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_distribution", "statistical_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.Skewness": {
+        "description": "Evaluates the skewness of numerical data in a dataset to check against a defined threshold, aiming to ensure data\nquality and optimize model performance.\n\n### Purpose\n\nThe purpose of the Skewness test is to measure the asymmetry in the distribution of data within a predictive\nmachine learning model. Specifically, it evaluates the divergence of said distribution from a normal distribution.\nUnderstanding the level of skewness helps identify data quality issues, which are crucial for optimizing the\nperformance of traditional machine learning models in both classification and regression settings.\n\n### Test Mechanism\n\nThis test calculates the skewness of numerical columns in the dataset, focusing specifically on numerical data\ntypes. The calculated skewness value is then compared against a predetermined maximum threshold, which is set by\ndefault to 1. If the skewness value is less than this maximum threshold, the test passes; otherwise, it fails. The\ntest results, along with the skewness values and column names, are then recorded for further analysis.\n\n### Signs of High Risk\n\n- Substantial skewness levels that significantly exceed the maximum threshold.\n- Persistent skewness in the data, indicating potential issues with the foundational assumptions of the machine\nlearning model.\n- Subpar model performance, erroneous predictions, or biased inferences due to skewed data distributions.\n\n### Strengths\n\n- Fast and efficient identification of unequal data distributions within a machine learning model.\n- Adjustable maximum threshold parameter, allowing for customization based on user needs.\n- Provides a clear quantitative measure to mitigate model risks related to data skewness.\n\n### Limitations\n\n- Only evaluates numeric columns, potentially missing skewness or bias in non-numeric data.\n- Assumes that data should follow a normal distribution, which may not always be applicable to real-world data.\n- Subjective threshold for risk grading, requiring expert input and recurrent iterations for refinement.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_threshold": 1},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "data_quality"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.SpreadPlot": {
+        "description": "Assesses potential correlations between pairs of time series variables through visualization to enhance\nunderstanding of their relationships.\n\n### Purpose\n\nThe SpreadPlot test aims to graphically illustrate and analyze the relationships between pairs of time series\nvariables within a given dataset. This facilitated understanding helps in identifying and assessing potential time\nseries correlations, such as cointegration, between the variables.\n\n### Test Mechanism\n\nThe SpreadPlot test computes and represents the spread between each pair of time series variables in the dataset.\nSpecifically, the difference between two variables is calculated and presented as a line graph. This process is\niterated for each unique pair of variables in the dataset, allowing for comprehensive visualization of their\nrelationships.\n\n### Signs of High Risk\n\n- Large fluctuations in the spread over a given timespan.\n- Unexpected patterns or trends that may signal potential risks in the underlying correlations between the\nvariables.\n- Presence of significant missing data or extreme outlier values, which could potentially skew the spread and\nindicate high risk.\n\n### Strengths\n\n- Allows for thorough visual examination and interpretation of the correlations between time-series pairs.\n- Aids in revealing complex relationships like cointegration.\n- Enhances interpretability by visualizing the relationships, thereby helping in spotting outliers and trends.\n- Capable of handling numerous variable pairs from the dataset through a versatile and adaptable process.\n\n### Limitations\n\n- Primarily serves as a visualization tool and does not offer quantitative measurements or statistics to\nobjectively determine relationships.\n- Heavily relies on the quality and granularity of the data—missing data or outliers can notably disturb the\ninterpretation of relationships.\n- Can become inefficient or difficult to interpret with a high number of variables due to the profuse number of\nplots.\n- Might not completely capture intricate non-linear relationships between the variables.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TabularCategoricalBarPlots": {
+        "description": "Generates and visualizes bar plots for each category in categorical features to evaluate the dataset's composition.\n\n### Purpose\n\nThe purpose of this metric is to visually analyze categorical data using bar plots. It is intended to evaluate the\ndataset's composition by displaying the counts of each category in each categorical feature.\n\n### Test Mechanism\n\nThe provided dataset is first checked to determine if it contains any categorical variables. If no categorical\ncolumns are found, the tool raises a ValueError. For each categorical variable in the dataset, a separate bar plot\nis generated. The number of occurrences for each category is calculated and displayed on the plot. If a dataset\ncontains multiple categorical columns, multiple bar plots are produced.\n\n### Signs of High Risk\n\n- High risk could occur if the categorical variables exhibit an extreme imbalance, with categories having very few\ninstances possibly being underrepresented in the model, which could affect the model's performance and its ability\nto generalize.\n- Another sign of risk is if there are too many categories in a single variable, which could lead to overfitting\nand make the model complex.\n\n### Strengths\n\n- Provides a visual and intuitively understandable representation of categorical data.\n- Aids in the analysis of variable distributions.\n- Helps in easily identifying imbalances or rare categories that could affect the model's performance.\n\n### Limitations\n\n- This method only works with categorical data and won't apply to numerical variables.\n- It does not provide informative value when there are too many categories, as the bar chart could become cluttered\nand hard to interpret.\n- Offers no insights into the model's performance or precision, but rather provides a descriptive analysis of the\ninput.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TabularDateTimeHistograms": {
+        "description": "Generates histograms to provide graphical insight into the distribution of time intervals in a model's datetime\ndata.\n\n### Purpose\n\nThe `TabularDateTimeHistograms` metric is designed to provide graphical insight into the distribution of time\nintervals in a machine learning model's datetime data. By plotting histograms of differences between consecutive\ndate entries in all datetime variables, it enables an examination of the underlying pattern of time series data and\nidentification of anomalies.\n\n### Test Mechanism\n\nThis test operates by first identifying all datetime columns and extracting them from the dataset. For each\ndatetime column, it next computes the differences (in days) between consecutive dates, excluding zero values, and\nvisualizes these differences in a histogram. The Plotly library's histogram function is used to generate\nhistograms, which are labeled appropriately and provide a graphical representation of the frequency of different\nday intervals in the dataset.\n\n### Signs of High Risk\n\n- If no datetime columns are detected in the dataset, this would lead to a ValueError. Hence, the absence of\ndatetime columns signifies a high risk.\n- A severely skewed or irregular distribution depicted in the histogram may indicate possible complications with\nthe data, such as faulty timestamps or abnormalities.\n\n### Strengths\n\n- The metric offers a visual overview of time interval frequencies within the dataset, supporting the recognition\nof inherent patterns.\n- Histogram plots can aid in the detection of potential outliers and data anomalies, contributing to an assessment\nof data quality.\n- The metric is versatile, compatible with a range of task types, including classification and regression, and can\nwork with multiple datetime variables if present.\n\n### Limitations\n\n- A major weakness of this metric is its dependence on the visual examination of data, as it does not provide a\nmeasurable evaluation of the model.\n- The metric might overlook complex or multi-dimensional trends in the data.\n- The test is only applicable to datasets containing datetime columns and will fail if such columns are unavailable.\n- The interpretation of the histograms relies heavily on the domain expertise and experience of the reviewer.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["classification", "regression"],
+        "tags": ["time_series_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TabularDescriptionTables": {
+        "description": "Summarizes key descriptive statistics for numerical, categorical, and datetime variables in a dataset.\n\n### Purpose\n\nThe main purpose of this metric is to gather and present the descriptive statistics of numerical, categorical, and\ndatetime variables present in a dataset. The attributes it measures include the count, mean, minimum and maximum\nvalues, percentage of missing values, data types of fields, and unique values for categorical fields, among others.\n\n### Test Mechanism\n\nThe test first segregates the variables in the dataset according to their data types (numerical, categorical, or\ndatetime). Then, it compiles summary statistics for each type of variable. The specifics of these statistics vary\ndepending on the type of variable:\n\n- For numerical variables, the metric extracts descriptors like count, mean, minimum and maximum values, count of\nmissing values, and data types.\n- For categorical variables, it counts the number of unique values, displays unique values, counts missing values,\nand identifies data types.\n- For datetime variables, it counts the number of unique values, identifies the earliest and latest dates, counts\nmissing values, and identifies data types.\n\n### Signs of High Risk\n\n- Masses of missing values in the descriptive statistics results could hint at high risk or failure, indicating\npotential data collection, integrity, and quality issues.\n- Detection of inappropriate distributions for numerical variables, like having negative values for variables that\nare always supposed to be positive.\n- Identifying inappropriate data types, like a continuous variable being encoded as a categorical type.\n\n### Strengths\n\n- Provides a comprehensive overview of the dataset.\n- Gives a snapshot into the essence of the numerical, categorical, and datetime fields.\n- Identifies potential data quality issues such as missing values or inconsistencies crucial for building credible\nmachine learning models.\n- The metadata, including the data type and missing value information, are vital for anyone including data\nscientists dealing with the dataset before the modeling process.\n\n### Limitations\n\n- It does not perform any deeper statistical analysis or tests on the data.\n- It does not handle issues such as outliers, or relationships between variables.\n- It offers no insights into potential correlations or possible interactions between variables.\n- It does not investigate the potential impact of missing values on the performance of the machine learning models.\n- It does not explore potential transformation requirements that may be necessary to enhance the performance of the\nchosen algorithm.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TabularNumericalHistograms": {
+        "description": "Generates histograms for each numerical feature in a dataset to provide visual insights into data distribution and\ndetect potential issues.\n\n### Purpose\n\nThe purpose of this test is to provide visual analysis of numerical data through the generation of histograms for\neach numerical feature in the dataset. Histograms aid in the exploratory analysis of data, offering insight into\nthe distribution of the data, skewness, presence of outliers, and central tendencies. It helps in understanding if\nthe inputs to the model are normally distributed, which is a common assumption in many machine learning algorithms.\n\n### Test Mechanism\n\nThis test scans the provided dataset and extracts all the numerical columns. For each numerical column, it\nconstructs a histogram using plotly, with 50 bins. The deployment of histograms offers a robust visual aid,\nensuring unruffled identification and understanding of numerical data distribution patterns.\n\n### Signs of High Risk\n\n- A high degree of skewness\n- Unexpected data distributions\n- Existence of extreme outliers in the histograms\n\nThese may indicate issues with the data that the model is receiving. If data for a numerical feature is expected to\nfollow a certain distribution (like a normal distribution) but does not, it could lead to sub-par performance by\nthe model. As such these instances should be treated as high-risk indicators.\n\n### Strengths\n\n- Provides a simple, easy-to-interpret visualization of how data for each numerical attribute is distributed.\n- Helps detect skewed values and outliers that could potentially harm the AI model's performance.\n- Can be applied to large datasets and multiple numerical variables conveniently.\n\n### Limitations\n\n- Only works with numerical data, thus ignoring non-numerical or categorical data.\n- Does not analyze relationships between different features, only the individual feature distributions.\n- Is a univariate analysis and may miss patterns or anomalies that only appear when considering multiple variables\ntogether.\n- Does not provide any insight into how these features affect the output of the model; it is purely an input\nanalysis tool.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["classification", "regression"],
+        "tags": ["tabular_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TargetRateBarPlots": {
+        "description": "Generates bar plots visualizing the default rates of categorical features for a classification machine learning\nmodel.\n\n### Purpose\n\nThis test, implemented as a metric, is designed to provide an intuitive, graphical summary of the decision-making\npatterns exhibited by a categorical classification machine learning model. The model's performance is evaluated\nusing bar plots depicting the ratio of target rates—meaning the proportion of positive classes—for different\ncategorical inputs. This allows for an easy, at-a-glance understanding of the model's accuracy.\n\n### Test Mechanism\n\nThe test involves creating a pair of bar plots for each categorical feature in the dataset. The first plot depicts\nthe frequency of each category in the dataset, with each category visually distinguished by its unique color. The\nsecond plot shows the mean target rate of each category (sourced from the \"default_column\"). Plotly, a Python\nlibrary, is used to generate these plots, with distinct plots created for each feature. If no specific columns are\nselected, the test will generate plots for each categorical column in the dataset.\n\n### Signs of High Risk\n\n- Inconsistent or non-binary values in the \"default_column\" could complicate or render impossible the calculation\nof average target rates.\n- Particularly low or high target rates for a specific category might suggest that the model is misclassifying\ninstances of that category.\n\n### Strengths\n\n- This test offers a visually interpretable breakdown of the model's decisions, providing an easy way to spot\nirregularities, inconsistencies, or patterns.\n- Its flexibility allows for the inspection of one or multiple columns, as needed.\n\n### Limitations\n\n- The test is less useful when dealing with numeric or continuous data, as it's designed specifically for\ncategorical features.\n- If the model in question is dealing with a multi-class problem rather than binary classification, the test's\nassumption of binary target values (0s and 1s) becomes a significant limitation.\n- The readability of the bar plots drops as the number of distinct categories increases in the dataset, which can\nmake them harder to understand and less useful.",
+        "required_inputs": ["dataset"],
+        "default_params": {"default_column": None, "columns": None},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "visualization", "categorical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesDescription": {
+        "description": "Generates a detailed analysis for the provided time series dataset, summarizing key statistics to identify trends,\npatterns, and data quality issues.\n\n### Purpose\n\nThe TimeSeriesDescription function aims to analyze an individual time series by providing a summary of key\nstatistics. This helps in understanding trends, patterns, and data quality issues within the time series.\n\n### Test Mechanism\n\nThe function extracts the time series data and provides a summary of key statistics. The dataset is expected to\nhave a datetime index. The function checks this and raises an error if the index is not in datetime format. For\neach variable (column) in the dataset, appropriate statistics including start date, end date, frequency, number of\nmissing values, count, min, and max values are calculated.\n\n### Signs of High Risk\n\n- If the index of the dataset is not in datetime format, it could lead to errors in time-series analysis.\n- Inconsistent or missing data within the dataset might affect the analysis of trends and patterns.\n\n### Strengths\n\n- Provides a comprehensive summary of key statistics for each variable, helping to identify data quality issues\nsuch as missing values.\n- Helps in understanding the distribution and range of the data by including min and max values.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with a .df attribute to access the pandas\nDataFrame.\n- Only analyzes datasets with a datetime index and will raise an error for other types of indices.\n- Does not handle large datasets efficiently; performance may degrade with very large datasets.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesDescriptiveStatistics": {
+        "description": "Evaluates the descriptive statistics of a time series dataset to identify trends, patterns, and data quality issues.\n\n### Purpose\n\nThe purpose of the TimeSeriesDescriptiveStatistics function is to analyze an individual time series by providing a\nsummary of key descriptive statistics. This analysis helps in understanding trends, patterns, and data quality\nissues within the time series dataset.\n\n### Test Mechanism\n\nThe function extracts the time series data and provides a summary of key descriptive statistics. The dataset is\nexpected to have a datetime index, and the function will check this and raise an error if the index is not in a\ndatetime format. For each variable (column) in the dataset, appropriate statistics, including start date, end date,\nmin, mean, max, skewness, kurtosis, and count, are calculated.\n\n### Signs of High Risk\n\n- If the index of the dataset is not in datetime format, it could lead to errors in time-series analysis.\n- Inconsistent or missing data within the dataset might affect the analysis of trends and patterns.\n\n### Strengths\n\n- Provides a comprehensive summary of key descriptive statistics for each variable.\n- Helps identify data quality issues and understand the distribution of the data.\n\n### Limitations\n\n- Assumes the dataset is provided as a DataFrameDataset object with a .df attribute to access the pandas DataFrame.\n- Only analyzes datasets with a datetime index and will raise an error for other types of indices.\n- Does not handle large datasets efficiently, and performance may degrade with very large datasets.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesFrequency": {
+        "description": "Evaluates consistency of time series data frequency and generates a frequency plot.\n\n### Purpose\n\nThe purpose of the TimeSeriesFrequency test is to evaluate the consistency in the frequency of data points in a\ntime-series dataset. This test inspects the intervals or duration between each data point to determine if a fixed\npattern (such as daily, weekly, or monthly) exists. The identification of such patterns is crucial to time-series\nanalysis as any irregularities could lead to erroneous results and hinder the model's capacity for identifying\ntrends and patterns.\n\n### Test Mechanism\n\nInitially, the test checks if the dataframe index is in datetime format. Subsequently, it utilizes pandas'\n`infer_freq` method to identify the frequency of each data series within the dataframe. The `infer_freq` method\nattempts to establish the frequency of a time series and returns both the frequency string and a dictionary\nrelating these strings to their respective labels. The test compares the frequencies of all datasets. If they share\na common frequency, the test passes, but it fails if they do not. Additionally, Plotly is used to create a\nfrequency plot, offering a visual depiction of the time differences between consecutive entries in the dataframe\nindex.\n\n### Signs of High Risk\n\n- The test fails, indicating multiple unique frequencies within the dataset. This failure could suggest irregular\nintervals between observations, potentially interrupting pattern recognition or trend analysis.\n- The presence of missing or null frequencies could be an indication of inconsistencies in data or gaps within the\ndata collection process.\n\n### Strengths\n\n- This test uses a systematic approach to checking the consistency of data frequency within a time-series dataset.\n- It increases the model's reliability by asserting the consistency of observations over time, an essential factor\nin time-series analysis.\n- The test generates a visual plot, providing an intuitive representation of the dataset's frequency distribution,\nwhich caters to visual learners and aids in interpretation and explanation.\n\n### Limitations\n\n- This test is only applicable to time-series datasets and hence not suitable for other types of datasets.\n- The `infer_freq` method might not always correctly infer frequency when faced with missing or irregular data\npoints.\n- Depending on context or the model under development, mixed frequencies might sometimes be acceptable, but this\ntest considers them a failing condition.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesHistogram": {
+        "description": "Visualizes distribution of time-series data using histograms and Kernel Density Estimation (KDE) lines.\n\n### Purpose\n\nThe TimeSeriesHistogram test aims to perform a histogram analysis on time-series data to assess the distribution of\nvalues within a dataset over time. This test is useful for regression tasks and can be applied to various types of\ndata, such as internet traffic, stock prices, and weather data, providing insights into the probability\ndistribution, skewness, and kurtosis of the dataset.\n\n### Test Mechanism\n\nThis test operates on a specific column within the dataset that must have a datetime type index. For each column in\nthe dataset, a histogram is created using Plotly's histplot function. If the dataset includes more than one\ntime-series, a distinct histogram is plotted for each series. Additionally, a Kernel Density Estimate (KDE) line is\ndrawn for each histogram, visualizing the data's underlying probability distribution. The x and y-axis labels are\nhidden to focus solely on the data distribution.\n\n### Signs of High Risk\n\n- The dataset lacks a column with a datetime type index.\n- The specified columns do not exist within the dataset.\n- High skewness or kurtosis in the data distribution, indicating potential bias.\n- Presence of significant outliers in the data distribution.\n\n### Strengths\n\n- Serves as a visual diagnostic tool for understanding data behavior and distribution trends.\n- Effective for analyzing both single and multiple time-series data.\n- KDE line provides a smooth estimate of the overall trend in data distribution.\n\n### Limitations\n\n- Provides a high-level view without specific numeric measures such as skewness or kurtosis.\n- The histogram loses some detail due to binning of data values.\n- Cannot handle non-numeric data columns.\n- Histogram shape may be sensitive to the number of bins used.",
+        "required_inputs": ["dataset"],
+        "default_params": {"nbins": 30},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["data_validation", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesLinePlot": {
+        "description": "Generates and analyses time-series data through line plots revealing trends, patterns, anomalies over time.\n\n### Purpose\n\nThe TimeSeriesLinePlot metric is designed to generate and analyze time series data through the creation of line\nplots. This assists in the initial inspection of the data by providing a visual representation of patterns, trends,\nseasonality, irregularity, and anomalies that may be present in the dataset over a period of time.\n\n### Test Mechanism\n\nThe mechanism for this Python class involves extracting the column names from the provided dataset and subsequently\ngenerating line plots for each column using the Plotly Python library. For every column in the dataset, a\ntime-series line plot is created where the values are plotted against the dataset's datetime index. It is important\nto note that indexes that are not of datetime type will result in a ValueError.\n\n### Signs of High Risk\n\n- Presence of time-series data that does not have datetime indices.\n- Provided columns do not exist in the provided dataset.\n- The detection of anomalous patterns or irregularities in the time-series plots, indicating potential high model\ninstability or probable predictive error.\n\n### Strengths\n\n- The visual representation of complex time series data, which simplifies understanding and helps in recognizing\ntemporal trends, patterns, and anomalies.\n- The adaptability of the metric, which allows it to effectively work with multiple time series within the same\ndataset.\n- Enables the identification of anomalies and irregular patterns through visual inspection, assisting in spotting\npotential data or model performance problems.\n\n### Limitations\n\n- The effectiveness of the metric is heavily reliant on the quality and patterns of the provided time series data.\n- Exclusively a visual tool, it lacks the capability to provide quantitative measurements, making it less effective\nfor comparing and ranking multiple models or when specific numerical diagnostics are needed.\n- The metric necessitates that the time-specific data has been transformed into a datetime index, with the data\nformatted correctly.\n- The metric has an inherent limitation in that it cannot extract deeper statistical insights from the time series\ndata, which can limit its efficacy with complex data structures and phenomena.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesMissingValues": {
+        "description": "Validates time-series data quality by confirming the count of missing values is below a certain threshold.\n\n### Purpose\n\nThis test is designed to validate the quality of a historical time-series dataset by verifying that the number of\nmissing values is below a specified threshold. As time-series models greatly depend on the continuity and\ntemporality of data points, missing values could compromise the model's performance. Consequently, this test aims\nto ensure data quality and readiness for the machine learning model, safeguarding its predictive capacity.\n\n### Test Mechanism\n\nThe test method commences by validating if the dataset has a datetime index; if not, an error is raised. It\nestablishes a lower limit threshold for missing values and performs a missing values check on each column of the\ndataset. An object for the test result is created stating whether the number of missing values is within the\nspecified threshold. Additionally, the test calculates the percentage of missing values alongside the raw count.\n\nTo aid in data visualization, the test generates two plots - a bar plot and a heatmap - to better illustrate the\ndistribution and quantity of missing values per variable. The test results, including a count of missing values,\nthe percentage of missing values, and a pass/fail status, are returned in a results table.\n\n### Signs of High Risk\n\n- The number of missing values in any column of the dataset surpasses the threshold, marking a failure and a\nhigh-risk scenario. The reasons could range from incomplete data collection, faulty sensors to data preprocessing\nerrors.\n- A continuous visual 'streak' in the heatmap may indicate a systematic error during data collection, pointing\ntowards another potential risk source.\n\n### Strengths\n\n- Effectively identifies missing values which could adversely affect the model’s performance.\n- Applicable and customizable through the threshold parameter across different data sets.\n- Goes beyond raw numbers by calculating the percentage of missing values, offering a more relative understanding\nof data scarcity.\n- Includes a robust visualization mechanism for easy and fast understanding of data quality.\n\n### Limitations\n\n- Although it identifies missing values, the test does not provide solutions to handle them.\n- The test demands that the dataset should have a datetime index, hence limiting its use only to time series\nanalysis.\n- The test's sensitivity to the 'min_threshold' parameter may raise false alarms if set too strictly or may\noverlook problematic data if set too loosely.\n- Solely focuses on the 'missingness' of the data and might fall short in addressing other aspects of data quality.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_threshold": 1},
+        "tasks": ["regression"],
+        "tags": ["time_series_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TimeSeriesOutliers": {
+        "description": "Identifies and visualizes outliers in time-series data using the z-score method.\n\n### Purpose\n\nThis test is designed to identify outliers in time-series data using the z-score method. It's vital for ensuring\ndata quality before modeling, as outliers can skew predictive models and significantly impact their overall\nperformance.\n\n### Test Mechanism\n\nThe test processes a given dataset which must have datetime indexing, checks if a 'zscore_threshold' parameter has\nbeen supplied, and identifies columns with numeric data types. After finding numeric columns, the implementer then\napplies the z-score method to each numeric column, identifying outliers based on the threshold provided. Each\noutlier is listed together with their variable name, z-score, timestamp, and relative threshold in a dictionary and\nconverted to a DataFrame for convenient output. Additionally, it produces visual plots for each time series\nillustrating outliers in the context of the broader dataset. The 'zscore_threshold' parameter sets the limit beyond\nwhich a data point will be labeled as an outlier. The default threshold is set at 3, indicating that any data point\nthat falls 3 standard deviations away from the mean will be marked as an outlier.\n\n### Signs of High Risk\n\n- Many or substantial outliers are present within the dataset, indicating significant anomalies.\n- Data points with z-scores higher than the set threshold.\n- Potential impact on the performance of machine learning models if outliers are not properly addressed.\n\n### Strengths\n\n- The z-score method is a popular and robust method for identifying outliers in a dataset.\n- Simplifies time series maintenance by requiring a datetime index.\n- Identifies outliers for each numeric feature individually.\n- Provides an elaborate report showing variables, dates, z-scores, and pass/fail tests.\n- Offers visual inspection for detected outliers through plots.\n\n### Limitations\n\n- The test only identifies outliers in numeric columns, not in categorical variables.\n- The utility and accuracy of z-scores can be limited if the data doesn't follow a normal distribution.\n- The method relies on a subjective z-score threshold for deciding what constitutes an outlier, which might not\nalways be suitable depending on the dataset and use case.\n- It does not address possible ways to handle identified outliers in the data.\n- The requirement for a datetime index could limit its application.",
+        "required_inputs": ["dataset"],
+        "default_params": {"zscore_threshold": 3},
+        "tasks": ["regression"],
+        "tags": ["time_series_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.TooManyZeroValues": {
+        "description": "Identifies numerical columns in a dataset that contain an excessive number of zero values, defined by a threshold\npercentage.\n\n### Purpose\n\nThe 'TooManyZeroValues' test is utilized to identify numerical columns in the dataset that may present a quantity\nof zero values considered excessive. The aim is to detect situations where these may implicate data sparsity or a\nlack of variation, limiting their effectiveness within a machine learning model. The definition of 'too many' is\nquantified as a percentage of total values, with a default set to 3%.\n\n### Test Mechanism\n\nThis test is conducted by looping through each column in the dataset and categorizing those that pertain to\nnumerical data. On identifying a numerical column, the function computes the total quantity of zero values and\ntheir ratio to the total row count. Should the proportion exceed a pre-set threshold parameter, set by default at\n0.03 or 3%, the column is considered to have failed the test. The results for each column are summarized and\nreported, indicating the count and percentage of zero values for each numerical column, alongside a status\nindicating whether the column has passed or failed the test.\n\n### Signs of High Risk\n\n- Numerical columns showing a high ratio of zero values when compared to the total count of rows (exceeding the\npredetermined threshold).\n- Columns characterized by zero values across the board suggest a complete lack of data variation, signifying high\nrisk.\n\n### Strengths\n\n- Assists in highlighting columns featuring an excess of zero values that could otherwise go unnoticed within a\nlarge dataset.\n- Provides the flexibility to alter the threshold that determines when the quantity of zero values becomes 'too\nmany', thus catering to specific needs of a particular analysis or model.\n- Offers feedback in the form of both counts and percentages of zero values, which allows a closer inspection of\nthe distribution and proportion of zeros within a column.\n- Targets specifically numerical data, thereby avoiding inappropriate application to non-numerical columns and\nmitigating the risk of false test failures.\n\n### Limitations\n\n- Is exclusively designed to check for zero values and doesn’t assess the potential impact of other values that\ncould affect the dataset, such as extremely high or low figures, missing values, or outliers.\n- Lacks the ability to detect a repetitive pattern of zeros, which could be significant in time-series or\nlongitudinal data.\n- Zero values can actually be meaningful in some contexts; therefore, tagging them as 'too many' could potentially\nmisinterpret the data to some extent.\n- This test does not take into consideration the context of the dataset, and fails to recognize that within certain\ncolumns, a high number of zero values could be quite normal and not necessarily an indicator of poor data quality.\n- Cannot evaluate non-numerical or categorical columns, which might bring with them different types of concerns or\nissues.",
+        "required_inputs": ["dataset"],
+        "default_params": {"max_percent_threshold": 0.03},
+        "tasks": ["regression", "classification"],
+        "tags": ["tabular_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.UniqueRows": {
+        "description": "Verifies the diversity of the dataset by ensuring that the count of unique rows exceeds a prescribed threshold.\n\n### Purpose\n\nThe UniqueRows test is designed to gauge the quality of the data supplied to the machine learning model by\nverifying that the count of distinct rows in the dataset exceeds a specific threshold, thereby ensuring a varied\ncollection of data. Diversity in data is essential for training an unbiased and robust model that excels when faced\nwith novel data.\n\n### Test Mechanism\n\nThe testing process starts with calculating the total number of rows in the dataset. Subsequently, the count of\nunique rows is determined for each column in the dataset. If the percentage of unique rows (calculated as the ratio\nof unique rows to the overall row count) is less than the prescribed minimum percentage threshold given as a\nfunction parameter, the test passes. The results are cached and a final pass or fail verdict is given based on\nwhether all columns have successfully passed the test.\n\n### Signs of High Risk\n\n- A lack of diversity in data columns, demonstrated by a count of unique rows that falls short of the preset\nminimum percentage threshold, is indicative of high risk.\n- This lack of variety in the data signals potential issues with data quality, possibly leading to overfitting in\nthe model and issues with generalization, thus posing a significant risk.\n\n### Strengths\n\n- The UniqueRows test is efficient in evaluating the data's diversity across each information column in the dataset.\n- This test provides a quick, systematic method to assess data quality based on uniqueness, which can be pivotal in\ndeveloping effective and unbiased machine learning models.\n\n### Limitations\n\n- A limitation of the UniqueRows test is its assumption that the data's quality is directly proportionate to its\nuniqueness, which may not always hold true. There might be contexts where certain non-unique rows are essential and\nshould not be overlooked.\n- The test does not consider the relative 'importance' of each column in predicting the output, treating all\ncolumns equally.\n- This test may not be suitable or useful for categorical variables, where the count of unique categories is\ninherently limited.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_percent_threshold": 1},
+        "tasks": ["regression", "classification"],
+        "tags": ["tabular_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.WOEBinPlots": {
+        "description": "Generates visualizations of Weight of Evidence (WoE) and Information Value (IV) for understanding predictive power\nof categorical variables in a data set.\n\n### Purpose\n\nThis test is designed to visualize the Weight of Evidence (WoE) and Information Value (IV) for categorical\nvariables in a provided dataset. By showcasing the data distribution across different categories of each feature,\nit aids in understanding each variable's predictive power in the context of a classification-based machine learning\nmodel. Commonly used in credit scoring models, WoE and IV are robust statistical methods for evaluating a\nvariable's predictive power.\n\n### Test Mechanism\n\nThe test implementation follows defined steps. Initially, it selects non-numeric columns from the dataset and\nchanges them to string type, paving the way for accurate binning. It then performs an automated WoE binning\noperation on these selected features, effectively categorizing the potential values of a variable into distinct\nbins. After the binning process, the function generates two separate visualizations (a scatter chart for WoE values\nand a bar chart for IV) for each variable. These visual presentations are formed according to the spread of each\nmetric across various categories of each feature.\n\n### Signs of High Risk\n\n- Errors occurring during the binning process.\n- Challenges in converting non-numeric columns into string data type.\n- Misbalance in the distribution of WoE and IV, with certain bins overtaking others conspicuously. This could\ndenote that the model is disproportionately dependent on certain variables or categories for predictions, an\nindication of potential risks to its robustness and generalizability.\n\n### Strengths\n\n- Provides a detailed visual representation of the relationship between feature categories and the target variable.\nThis grants an intuitive understanding of each feature's contribution to the model.\n- Allows for easy identification of features with high impact, facilitating feature selection and enhancing\ncomprehension of the model's decision logic.\n- WoE conversions are monotonic, upholding the rank ordering of the original data points, which simplifies analysis.\n\n### Limitations\n\n- The method is largely reliant on the binning process, and an inappropriate binning threshold or bin number choice\nmight result in a misrepresentation of the variable's distribution.\n- While excellent for categorical data, the encoding of continuous variables into categorical can sometimes lead to\ninformation loss.\n- Extreme or outlier values can dramatically affect the computation of WoE and IV, skewing results.\n- The method requires a sufficient number of events per bin to generate a reliable information value and weight of\nevidence.",
+        "required_inputs": ["dataset"],
+        "default_params": {"breaks_adj": None, "fig_height": 600, "fig_width": 500},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "visualization", "categorical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.WOEBinTable": {
+        "description": "Assesses the Weight of Evidence (WoE) and Information Value (IV) of each feature to evaluate its predictive power\nin a binary classification model.\n\n### Purpose\n\nThe Weight of Evidence (WoE) and Information Value (IV) test is designed to evaluate the predictive power of each\nfeature in a machine learning model. This test generates binned groups of values from each feature, computes the\nWoE and IV for each bin, and provides insights into the relationship between each feature and the target variable,\nillustrating their contribution to the model's predictive capabilities.\n\n### Test Mechanism\n\nThe test uses the `scorecardpy.woebin` method to perform automatic binning of the dataset based on WoE. The method\nadjusts the cut-off points for binning numeric variables based on the parameter `breaks_adj`. The bins are then\nused to calculate the WoE and IV values, effectively creating a dataframe that includes the bin boundaries, WoE,\nand IV values for each feature. A target variable is required in the dataset to perform this analysis.\n\n### Signs of High Risk\n\n- High IV values, indicating variables with excessive predictive power which might lead to overfitting.\n- Errors during the binning process, potentially due to inappropriate data types or poorly defined bins.\n\n### Strengths\n\n- Highly effective for feature selection in binary classification problems, as it quantifies the predictive\ninformation within each feature concerning the binary outcome.\n- The WoE transformation creates a monotonic relationship between the target and independent variables.\n\n### Limitations\n\n- Primarily designed for binary classification tasks, making it less applicable or reliable for multi-class\nclassification or regression tasks.\n- Potential difficulties if the dataset has many features, non-binnable features, or non-numeric features.\n- The metric does not help in distinguishing whether the observed predictive factor is due to data randomness or a\ntrue phenomenon.",
+        "required_inputs": ["dataset"],
+        "default_params": {"breaks_adj": None},
+        "tasks": ["classification"],
+        "tags": ["tabular_data", "categorical_data"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.ZivotAndrewsArch": {
+        "description": "Evaluates the order of integration and stationarity of time series data using the Zivot-Andrews unit root test.\n\n### Purpose\n\nThe Zivot-Andrews Arch metric is used to evaluate the order of integration for time series data in a machine\nlearning model. It's designed to test for stationarity, a crucial aspect of time series analysis, where data points\nare independent of time. Stationarity means that the statistical properties such as mean, variance, and\nautocorrelation are constant over time.\n\n### Test Mechanism\n\nThe Zivot-Andrews unit root test is performed on each feature in the dataset using the `ZivotAndrews` function from\nthe `arch.unitroot` module. This function returns several metrics for each feature, including the statistical\nvalue, p-value (probability value), the number of lags used, and the number of observations. The p-value is used to\ndecide on the null hypothesis (the time series has a unit root and is non-stationary) based on a chosen level of\nsignificance.\n\n### Signs of High Risk\n\n- A high p-value suggests high risk, indicating insufficient evidence to reject the null hypothesis, implying that\nthe time series has a unit root and is non-stationary.\n- Non-stationary time series data can lead to misleading statistics and unreliable machine learning models.\n\n### Strengths\n\n- Dynamically tests for stationarity against structural breaks in time series data, offering robust evaluation of\nstationarity in features.\n- Especially beneficial with financial, economic, or other time-series data where data observations lack a\nconsistent pattern and structural breaks may occur.\n\n### Limitations\n\n- Assumes data is derived from a single-equation, autoregressive model, making it less appropriate for multivariate\ntime series data or data not aligning with this model.\n- May not account for unexpected shocks or changes in the series trend, both of which can significantly impact data\nstationarity.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "stationarity", "unit_root_test"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.CommonWords": {
+        "description": "Assesses the most frequent non-stopwords in a text column for identifying prevalent language patterns.\n\n### Purpose\n\nThe CommonWords metric is used to identify and visualize the most prevalent words within a specified text column of\na dataset. This provides insights into the prevalent language patterns and vocabulary, especially useful in Natural\nLanguage Processing (NLP) tasks such as text classification and text summarization.\n\n### Test Mechanism\n\nThe test methodology involves splitting the specified text column's entries into words, collating them into a\ncorpus, and then counting the frequency of each word using the Counter. The forty most frequently occurring\nnon-stopwords are then visualized in a bar chart, where the x-axis represents the words, and the y-axis indicates\ntheir frequency of occurrence.\n\n### Signs of High Risk\n\n- A lack of distinct words within the list, or the most common words being stopwords.\n- Frequent occurrence of irrelevant or inappropriate words could point out a poorly curated or noisy dataset.\n- An error returned due to the absence of a valid Dataset object, indicating high risk as the metric cannot be\neffectively implemented without it.\n\n### Strengths\n\n- The metric provides clear insights into the language features – specifically word frequency – of unstructured\ntext data.\n- It can reveal prominent vocabulary and language patterns, which prove vital for feature extraction in NLP tasks.\n- The visualization helps in quickly capturing the patterns and understanding the data intuitively.\n\n### Limitations\n\n- The test disregards semantic or context-related information as it solely focuses on word frequency.\n- It intentionally ignores stopwords, which might carry necessary significance in certain scenarios.\n- The applicability is limited to English-language text data as English stopwords are used for filtering, hence\ncannot account for data in other languages.\n- The metric requires a valid Dataset object, indicating a dependency condition that limits its broader\napplicability.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization", "frequency_analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.Hashtags": {
+        "description": "Assesses hashtag frequency in a text column, highlighting usage trends and potential dataset bias or spam.\n\n### Purpose\n\nThe Hashtags test is designed to measure the frequency of hashtags used within a given text column in a dataset. It\nis particularly useful for natural language processing tasks such as text classification and text summarization.\nThe goal is to identify common trends and patterns in the use of hashtags, which can serve as critical indicators\nor features within a machine learning model.\n\n### Test Mechanism\n\nThe test implements a regular expression (regex) to extract all hashtags from the specified text column. For each\nhashtag found, it makes a tally of its occurrences. It then outputs a list of the top N hashtags (default is 25,\nbut customizable), sorted by their counts in descending order. The results are also visualized in a bar plot, with\nfrequency counts on the y-axis and the corresponding hashtags on the x-axis.\n\n### Signs of High Risk\n\n- A low diversity in the usage of hashtags, as indicated by a few hashtags being used disproportionately more than\nothers.\n- Repeated usage of one or few hashtags can be indicative of spam or a biased dataset.\n- If there are no or extremely few hashtags found in the dataset, it perhaps signifies that the text data does not\ncontain structured social media data.\n\n### Strengths\n\n- Provides a concise visual representation of the frequency of hashtags, which can be critical for understanding\ntrends about a particular topic in text data.\n- Instrumental in tasks specifically related to social media text analytics, such as opinion analysis and trend\ndiscovery.\n- Adaptable, allowing the flexibility to determine the number of top hashtags to be analyzed.\n\n### Limitations\n\n- Assumes the presence of hashtags and therefore may not be applicable for text datasets that do not contain\nhashtags (e.g., formal documents, scientific literature).\n- Language-specific limitations of hashtag formulations are not taken into account.\n- Does not account for typographical errors, variations, or synonyms in hashtags.\n- Does not provide context or sentiment associated with the hashtags, so the information provided may have limited\nutility on its own.",
+        "required_inputs": ["dataset"],
+        "default_params": {"top_hashtags": 25},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization", "frequency_analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.LanguageDetection": {
+        "description": 'Assesses the diversity of languages in a textual dataset by detecting and visualizing the distribution of languages.\n\n### Purpose\n\nThe Language Detection test aims to identify and visualize the distribution of languages present within a textual\ndataset. This test helps in understanding the diversity of languages in the data, which is crucial for developing\nand validating multilingual models.\n\n### Test Mechanism\n\nThis test operates by:\n\n- Checking if the dataset has a specified text column.\n- Using a language detection library to determine the language of each text entry in the dataset.\n- Generating a histogram plot of the language distribution, with language codes on the x-axis and their frequencies\non the y-axis.\n\nIf the text column is not specified, a ValueError is raised to ensure proper dataset configuration.\n\n### Signs of High Risk\n\n- A high proportion of entries returning "Unknown" language codes.\n- Detection of unexpectedly diverse or incorrect language codes, indicating potential data quality issues.\n- Significant imbalance in language distribution, which might indicate potential biases in the dataset.\n\n### Strengths\n\n- Provides a visual representation of language diversity within the dataset.\n- Helps identify data quality issues related to incorrect or unknown language detection.\n- Useful for ensuring that multilingual models have adequate and appropriate representation from various languages.\n\n### Limitations\n\n- Dependency on the accuracy of the language detection library, which may not be perfect.\n- Languages with similar structures or limited text length may be incorrectly classified.\n- The test returns "Unknown" for entries where language detection fails, which might mask underlying issues with\ncertain languages or text formats.',
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.Mentions": {
+        "description": "Calculates and visualizes frequencies of '@' prefixed mentions in a text-based dataset for NLP model analysis.\n\n### Purpose\n\nThe \"Mentions\" test is designed to gauge the quality of data in a Natural Language Processing (NLP) or text-focused\nMachine Learning model. The primary objective is to identify and calculate the frequency of 'mentions' within a\nchosen text column of a dataset. A 'mention' in this context refers to individual text elements that are prefixed\nby '@'. The output of this test reveals the most frequently mentioned entities or usernames, which can be integral\nfor applications such as social media analyses or customer sentiment analyses.\n\n### Test Mechanism\n\nThe test first verifies the existence of a text column in the provided dataset. It then employs a regular\nexpression pattern to extract mentions from the text. Subsequently, the frequency of each unique mention is\ncalculated. The test selects the most frequent mentions based on default or user-defined parameters, the default\nbeing the top 25, for representation. This process of thresholding forms the core of the test. A treemap plot\nvisualizes the test results, where the size of each rectangle corresponds to the frequency of a particular mention.\n\n### Signs of High Risk\n\n- The lack of a valid text column in the dataset, which would result in the failure of the test execution.\n- The absence of any mentions within the text data, indicating that there might not be any text associated with\n'@'. This situation could point toward sparse or poor-quality data, thereby hampering the model's generalization or\nlearning capabilities.\n\n### Strengths\n\n- The test is specifically optimized for text-based datasets which gives it distinct power in the context of NLP.\n- It enables quick identification and visually appealing representation of the predominant elements or mentions.\n- It can provide crucial insights about the most frequently mentioned entities or usernames.\n\n### Limitations\n\n- The test only recognizes mentions that are prefixed by '@', hence useful textual aspects not preceded by '@'\nmight be ignored.\n- This test isn't suited for datasets devoid of textual data.\n- It does not provide insights on less frequently occurring data or outliers, which means potentially significant\npatterns could be overlooked.",
+        "required_inputs": ["dataset"],
+        "default_params": {"top_mentions": 25},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization", "frequency_analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.PolarityAndSubjectivity": {
+        "description": "Analyzes the polarity and subjectivity of text data within a given dataset to visualize the sentiment distribution.\n\n### Purpose\n\nThe Polarity and Subjectivity test is designed to evaluate the sentiment expressed in textual data. By analyzing\nthese aspects, it helps to identify the emotional tone and subjectivity of the dataset, which could be crucial in\nunderstanding customer feedback, social media sentiments, or other text-related data.\n\n### Test Mechanism\n\nThis test uses TextBlob to compute the polarity and subjectivity scores of textual data in a given dataset. The\nmechanism includes:\n\n- Iterating through each text entry in the specified column of the dataset.\n- Applying the TextBlob library to compute the polarity (ranging from -1 for negative sentiment to +1 for positive\nsentiment) and subjectivity (ranging from 0 for objective to 1 for subjective) for each entry.\n- Creating a scatter plot using Plotly to visualize the relationship between polarity and subjectivity.\n\n### Signs of High Risk\n\n- High concentration of negative polarity values indicating prevalent negative sentiments.\n- High subjectivity scores suggesting the text data is largely opinion-based rather than factual.\n- Disproportionate clusters of extreme scores (e.g., many points near -1 or +1 polarity).\n\n### Strengths\n\n- Quantifies sentiment and subjectivity which can provide actionable insights.\n- Visualizes sentiment distribution, aiding in easy interpretation.\n- Utilizes well-established TextBlob library for sentiment analysis.\n\n### Limitations\n\n- Polarity and subjectivity calculations may oversimplify nuanced text sentiments.\n- Reliance on TextBlob which may not be accurate for all domains or contexts.\n- Visualization could become cluttered with very large datasets, making interpretation difficult.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["nlp"],
+        "tags": ["nlp", "text_data", "data_validation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.Punctuations": {
+        "description": 'Analyzes and visualizes the frequency distribution of punctuation usage in a given text dataset.\n\n### Purpose\n\nThe Punctuations Metric\'s primary purpose is to analyze the frequency of punctuation usage within a given text\ndataset. This is often used in Natural Language Processing tasks, such as text classification and text\nsummarization.\n\n### Test Mechanism\n\nThe test begins by verifying that the input "dataset" is of the type VMDataset. Following that, a corpus is created\nfrom the dataset by splitting its text on spaces. Each unique punctuation character in the text corpus is then\ntallied. The frequency distribution of each punctuation symbol is visualized as a bar graph, with these results\nbeing stored as Figures and associated with the main Punctuations object.\n\n### Signs of High Risk\n\n- Excessive or unusual frequency of specific punctuation marks, potentially denoting dubious quality, data\ncorruption, or skewed data.\n\n### Strengths\n\n- Provides valuable insights into the distribution of punctuation usage in a text dataset.\n- Important in validating the quality, consistency, and nature of the data.\n- Can provide hints about the style or tonality of the text corpus, such as informal and emotional context\nindicated by frequent exclamation marks.\n\n### Limitations\n\n- Focuses solely on punctuation usage, potentially missing other important textual characteristics.\n- General cultural or tonality assumptions based on punctuation distribution can be misguiding, as these vary\nacross different languages and contexts.\n- Less effective with languages that use non-standard or different punctuation.\n- Visualization may lack interpretability when there are many unique punctuation marks in the dataset.',
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization", "frequency_analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.Sentiment": {
+        "description": "Analyzes the sentiment of text data within a dataset using the VADER sentiment analysis tool.\n\n### Purpose\n\nThe Sentiment test evaluates the overall sentiment of text data within a dataset. By analyzing sentiment scores, it\naims to ensure that the model is interpreting text data accurately and is not biased towards a particular sentiment.\n\n### Test Mechanism\n\nThis test uses the VADER (Valence Aware Dictionary and sEntiment Reasoner) SentimentIntensityAnalyzer. It processes\neach text entry in a specified column of the dataset to calculate the compound sentiment score, which represents\nthe overall sentiment polarity. The distribution of these sentiment scores is then visualized using a KDE (Kernel\nDensity Estimation) plot, highlighting any skewness or concentration in sentiment.\n\n### Signs of High Risk\n\n- Extreme polarity in sentiment scores, indicating potential bias.\n- Unusual concentration of sentiment scores in a specific range.\n- Significant deviation from expected sentiment distribution for the given text data.\n\n### Strengths\n\n- Provides a clear visual representation of sentiment distribution.\n- Uses a well-established sentiment analysis tool (VADER).\n- Can handle a wide range of text data, making it flexible for various applications.\n\n### Limitations\n\n- May not capture nuanced or context-specific sentiments.\n- Relies heavily on the accuracy of the VADER sentiment analysis tool.\n- Visualization alone may not provide comprehensive insights into underlying causes of sentiment distribution.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["nlp"],
+        "tags": ["nlp", "text_data", "data_validation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.StopWords": {
+        "description": "Evaluates and visualizes the frequency of English stop words in a text dataset against a defined threshold.\n\n### Purpose\n\nThe StopWords threshold test is a tool designed for assessing the quality of text data in an ML model. It focuses\non the identification and analysis of \"stop words\" in a given dataset. Stop words are frequent, common, yet\nsemantically insignificant words (for example: \"the\", \"and\", \"is\") in a language. This test evaluates the\nproportion of stop words to the total word count in the dataset, in essence, scrutinizing the frequency of stop\nword usage. The core objective is to highlight the prevalent stop words based on their usage frequency, which can\nbe instrumental in cleaning the data from noise and improving ML model performance.\n\n### Test Mechanism\n\nThe StopWords test initiates on receiving an input of a 'VMDataset' object. Absence of such an object will trigger\nan error. The methodology involves inspection of the text column of the VMDataset to create a 'corpus' (a\ncollection of written texts). Leveraging the Natural Language Toolkit's (NLTK) stop word repository, the test\nscreens the corpus for any stop words and documents their frequency. It further calculates the percentage usage of\neach stop word compared to the total word count in the corpus. This percentage is evaluated against a predefined\n'min_percent_threshold'. If this threshold is breached, the test returns a failed output. Top prevailing stop words\nalong with their usage percentages are returned, facilitated by a bar chart visualization of these stop words and\ntheir frequency.\n\n### Signs of High Risk\n\n- A percentage of any stop words exceeding the predefined 'min_percent_threshold'.\n- High frequency of stop words in the dataset which may adversely affect the application's analytical performance\ndue to noise creation.\n\n### Strengths\n\n- The ability to scrutinize and quantify the usage of stop words.\n- Provides insights into potential noise in the text data due to stop words.\n- Directly aids in enhancing model training efficiency.\n- Includes a bar chart visualization feature to easily interpret and action upon the stop words frequency\ninformation.\n\n### Limitations\n\n- The test only supports English stop words, making it less effective with datasets of other languages.\n- The 'min_percent_threshold' parameter may require fine-tuning for different datasets, impacting the overall\neffectiveness of the test.\n- Contextual use of the stop words within the dataset is not considered, potentially overlooking their significance\nin certain contexts.\n- The test focuses specifically on the frequency of stop words, not providing direct measures of model performance\nor predictive accuracy.",
+        "required_inputs": ["dataset"],
+        "default_params": {"min_percent_threshold": 0.5, "num_words": 25},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization", "frequency_analysis"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.TextDescription": {
+        "description": "Conducts comprehensive textual analysis on a dataset using NLTK to evaluate various parameters and generate\nvisualizations.\n\n### Purpose\n\nThe TextDescription test aims to conduct a thorough textual analysis of a dataset using the NLTK (Natural Language\nToolkit) library. It evaluates various metrics such as total words, total sentences, average sentence length, total\nparagraphs, total unique words, most common words, total punctuations, and lexical diversity. The goal is to\nunderstand the nature of the text and anticipate challenges machine learning models might face in text processing,\nlanguage understanding, or summarization tasks.\n\n### Test Mechanism\n\nThe test works by:\n\n- Parsing the dataset and tokenizing the text into words, sentences, and paragraphs using NLTK.\n- Removing stopwords and unwanted tokens.\n- Calculating parameters like total words, total sentences, average sentence length, total paragraphs, total unique\nwords, total punctuations, and lexical diversity.\n- Generating scatter plots to visualize correlations between various metrics (e.g., Total Words vs Total Sentences).\n\n### Signs of High Risk\n\n- Anomalies or increased complexity in lexical diversity.\n- Longer sentences and paragraphs.\n- High uniqueness of words.\n- Large number of unwanted tokens.\n- Missing or erroneous visualizations.\n\n### Strengths\n\n- Essential for pre-processing text data in machine learning models.\n- Provides a comprehensive breakdown of text data, aiding in understanding its complexity.\n- Generates visualizations to help comprehend text structure and complexity.\n\n### Limitations\n\n- Highly dependent on the NLTK library, limiting the test to supported languages.\n- Limited customization for removing undesirable tokens and stop words.\n- Does not consider semantic or grammatical complexities.\n- Assumes well-structured documents, which may result in inaccuracies with poorly formatted text.",
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "unwanted_tokens": {
+                "mr",
+                "dollar",
+                "ms",
+                "dr",
+                "'s",
+                "''",
+                " ",
+                "mrs",
+                "``",
+                "us",
+                "s",
+                "s'",
+            },
+            "num_top_words": 3,
+            "lang": "english",
+        },
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.data_validation.nlp.Toxicity": {
+        "description": "Assesses the toxicity of text data within a dataset to visualize the distribution of toxicity scores.\n\n### Purpose\n\nThe Toxicity test aims to evaluate the level of toxic content present in a text dataset by leveraging a pre-trained\ntoxicity model. It helps in identifying potentially harmful or offensive language that may negatively impact users\nor stakeholders.\n\n### Test Mechanism\n\nThis test uses a pre-trained toxicity evaluation model and applies it to each text entry in the specified column of\na dataset’s dataframe. The procedure involves:\n\n- Loading a pre-trained toxicity model.\n- Extracting the text from the specified column in the dataset.\n- Computing toxicity scores for each text entry.\n- Generating a KDE (Kernel Density Estimate) plot to visualize the distribution of these toxicity scores.\n\n### Signs of High Risk\n\n- High concentration of high toxicity scores in the KDE plot.\n- A significant proportion of text entries with toxicity scores above a predefined threshold.\n- Wide distribution of toxicity scores, indicating inconsistency in content quality.\n\n### Strengths\n\n- Provides a visual representation of toxicity distribution, making it easier to identify outliers.\n- Uses a robust pre-trained model for toxicity evaluation.\n- Can process large text datasets efficiently.\n\n### Limitations\n\n- Depends on the accuracy and bias of the pre-trained toxicity model.\n- Does not provide context-specific insights, which may be necessary for nuanced understanding.\n- May not capture all forms of subtle or indirect toxic language.",
+        "required_inputs": ["dataset"],
+        "default_params": {},
+        "tasks": ["nlp"],
+        "tags": ["nlp", "text_data", "data_validation"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.BertScore": {
+        "description": "Assesses the quality of machine-generated text using BERTScore metrics and visualizes results through histograms\nand bar charts, alongside compiling a comprehensive table of descriptive statistics.\n\n### Purpose\n\nThis function is designed to assess the quality of text generated by machine learning models using BERTScore\nmetrics. BERTScore evaluates text generation models' performance by calculating precision, recall, and F1 score\nbased on BERT contextual embeddings.\n\n### Test Mechanism\n\nThe function starts by extracting the true and predicted values from the provided dataset and model. It then\ninitializes the BERTScore evaluator. For each pair of true and predicted texts, the function calculates the\nBERTScore metrics and compiles them into a dataframe. Histograms and bar charts are generated for each BERTScore\nmetric (Precision, Recall, and F1 Score) to visualize their distribution. Additionally, a table of descriptive\nstatistics (mean, median, standard deviation, minimum, and maximum) is compiled for each metric, providing a\ncomprehensive summary of the model's performance.\n\n### Signs of High Risk\n\n- Consistently low scores across BERTScore metrics could indicate poor quality in the generated text, suggesting\nthat the model fails to capture the essential content of the reference texts.\n- Low precision scores might suggest that the generated text contains a lot of redundant or irrelevant information.\n- Low recall scores may indicate that important information from the reference text is being omitted.\n- An imbalanced performance between precision and recall, reflected by a low F1 Score, could signal issues in the\nmodel's ability to balance informativeness and conciseness.\n\n### Strengths\n\n- Provides a multifaceted evaluation of text quality through different BERTScore metrics, offering a detailed view\nof model performance.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of the\nscores.\n- Descriptive statistics offer a concise summary of the model's strengths and weaknesses in generating text.\n\n### Limitations\n\n- BERTScore relies on the contextual embeddings from BERT models, which may not fully capture all nuances of text\nsimilarity.\n- The evaluation relies on the availability of high-quality reference texts, which may not always be obtainable.\n- While useful for comparison, BERTScore metrics alone do not provide a complete assessment of a model's\nperformance and should be supplemented with other metrics and qualitative analysis.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.BleuScore": {
+        "description": "Evaluates the quality of machine-generated text using BLEU metrics and visualizes the results through histograms\nand bar charts, alongside compiling a comprehensive table of descriptive statistics for BLEU scores.\n\n### Purpose\n\nThis function is designed to assess the quality of text generated by machine learning models using the BLEU metric.\nBLEU, which stands for Bilingual Evaluation Understudy, is a metric used to evaluate the overlap of n-grams between\nthe machine-generated text and reference texts. This evaluation is crucial for tasks such as text summarization,\nmachine translation, and text generation, where the goal is to produce text that accurately reflects the content\nand meaning of human-crafted references.\n\n### Test Mechanism\n\nThe function starts by extracting the true and predicted values from the provided dataset and model. It then\ninitializes the BLEU evaluator. For each pair of true and predicted texts, the function calculates the BLEU scores\nand compiles them into a dataframe. Histograms and bar charts are generated for the BLEU scores to visualize their\ndistribution. Additionally, a table of descriptive statistics (mean, median, standard deviation, minimum, and\nmaximum) is compiled for the BLEU scores, providing a comprehensive summary of the model's performance.\n\n### Signs of High Risk\n\n- Consistently low BLEU scores could indicate poor quality in the generated text, suggesting that the model fails\nto capture the essential content of the reference texts.\n- Low precision scores might suggest that the generated text contains a lot of redundant or irrelevant information.\n- Low recall scores may indicate that important information from the reference text is being omitted.\n- An imbalanced performance between precision and recall, reflected by a low BLEU score, could signal issues in the\nmodel's ability to balance informativeness and conciseness.\n\n### Strengths\n\n- Provides a straightforward and widely-used evaluation of text quality through BLEU scores.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of the\nscores.\n- Descriptive statistics offer a concise summary of the model's strengths and weaknesses in generating text.\n\n### Limitations\n\n- BLEU metrics primarily focus on n-gram overlap and may not fully capture semantic coherence, fluency, or\ngrammatical quality of the text.\n- The evaluation relies on the availability of high-quality reference texts, which may not always be obtainable.\n- While useful for comparison, BLEU scores alone do not provide a complete assessment of a model's performance and\nshould be supplemented with other metrics and qualitative analysis.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ClusterSizeDistribution": {
+        "description": "Assesses the performance of clustering models by comparing the distribution of cluster sizes in model predictions\nwith the actual data.\n\n### Purpose\n\nThe Cluster Size Distribution test aims to assess the performance of clustering models by comparing the\ndistribution of cluster sizes in the model's predictions with the actual data. This comparison helps determine if\nthe clustering model's output aligns well with the true cluster distribution, providing insights into the model's\naccuracy and performance.\n\n### Test Mechanism\n\nThe test mechanism involves the following steps:\n- Run the clustering model on the provided dataset to obtain predictions.\n- Convert both the actual and predicted outputs into pandas dataframes.\n- Use pandas built-in functions to derive the cluster size distributions from these dataframes.\n- Construct two histograms: one for the actual cluster size distribution and one for the predicted distribution.\n- Plot the histograms side-by-side for visual comparison.\n\n### Signs of High Risk\n\n- Discrepancies between the actual cluster size distribution and the predicted cluster size distribution.\n- Irregular distribution of data across clusters in the predicted outcomes.\n- High number of outlier clusters suggesting the model struggles to correctly group data.\n\n### Strengths\n\n- Provides a visual and intuitive way to compare the clustering model's performance against actual data.\n- Effectively reveals where the model may be over- or underestimating cluster sizes.\n- Versatile as it works well with any clustering model.\n\n### Limitations\n\n- Assumes that the actual cluster distribution is optimal, which may not always be the case.\n- Relies heavily on visual comparison, which could be subjective and may not offer a precise numerical measure of\nperformance.\n- May not fully capture other important aspects of clustering, such as cluster density, distances between clusters,\nand the shape of clusters.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ContextualRecall": {
+        "description": "Evaluates a Natural Language Generation model's ability to generate contextually relevant and factually correct\ntext, visualizing the results through histograms and bar charts, alongside compiling a comprehensive table of\ndescriptive statistics for contextual recall scores.\n\n### Purpose\n\nThe Contextual Recall metric is used to evaluate the ability of a natural language generation (NLG) model to\ngenerate text that appropriately reflects the given context or prompt. It measures the model's capability to\nremember and reproduce the main context in its resulting output. This metric is critical in natural language\nprocessing tasks, as the coherency and contextuality of the generated text are essential.\n\n### Test Mechanism\n\nThe function starts by extracting the true and predicted values from the provided dataset and model. It then\ntokenizes the reference and candidate texts into discernible words or tokens using NLTK. The token overlap between\nthe reference and candidate texts is identified, and the Contextual Recall score is computed by dividing the number\nof overlapping tokens by the total number of tokens in the reference text. Scores are calculated for each test\ndataset instance, resulting in an array of scores. These scores are visualized using a histogram and a bar chart to\nshow score variations across different rows. Additionally, a table of descriptive statistics (mean, median,\nstandard deviation, minimum, and maximum) is compiled for the contextual recall scores, providing a comprehensive\nsummary of the model's performance.\n\n### Signs of High Risk\n\n- Low contextual recall scores could indicate that the model is not effectively reflecting the original context in\nits output, leading to incoherent or contextually misaligned text.\n- A consistent trend of low recall scores could suggest underperformance of the model.\n\n### Strengths\n\n- Provides a quantifiable measure of a model's adherence to the context and factual elements of the generated\nnarrative.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of\ncontextual recall scores.\n- Descriptive statistics offer a concise summary of the model's performance in generating contextually relevant\ntexts.\n\n### Limitations\n\n- The focus on word overlap could result in high scores for texts that use many common words, even when these texts\nlack coherence or meaningful context.\n- This metric does not consider the order of words, which could lead to overestimated scores for scrambled outputs.\n- Models that effectively use infrequent words might be undervalued, as these words might not overlap as often.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.FeaturesAUC": {
+        "description": "Evaluates the discriminatory power of each individual feature within a binary classification model by calculating\nthe Area Under the Curve (AUC) for each feature separately.\n\n### Purpose\n\nThe central objective of this metric is to quantify how well each feature on its own can differentiate between the\ntwo classes in a binary classification problem. It serves as a univariate analysis tool that can help in\npre-modeling feature selection or post-modeling interpretation.\n\n### Test Mechanism\n\nFor each feature, the metric treats the feature values as raw scores to compute the AUC against the actual binary\noutcomes. It provides an AUC value for each feature, offering a simple yet powerful indication of each feature's\nunivariate classification strength.\n\n### Signs of High Risk\n\n- A feature with a low AUC score may not be contributing significantly to the differentiation between the two\nclasses, which could be a concern if it is expected to be predictive.\n- Conversely, a surprisingly high AUC for a feature not believed to be informative may suggest data leakage or\nother issues with the data.\n\n### Strengths\n\n- By isolating each feature, it highlights the individual contribution of features to the classification task\nwithout the influence of other variables.\n- Useful for both initial feature evaluation and for providing insights into the model's reliance on individual\nfeatures after model training.\n\n### Limitations\n\n- Does not reflect the combined effects of features or any interaction between them, which can be critical in\ncertain models.\n- The AUC values are calculated without considering the model's use of the features, which could lead to different\ninterpretations of feature importance when considering the model holistically.\n- This metric is applicable only to binary classification tasks and cannot be directly extended to multiclass\nclassification or regression without modifications.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"fontsize": 12, "figure_height": 500},
+        "tasks": ["classification"],
+        "tags": ["feature_importance", "AUC", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.MeteorScore": {
+        "description": "Assesses the quality of machine-generated translations by comparing them to human-produced references using the\nMETEOR score, which evaluates precision, recall, and word order.\n\n### Purpose\n\nThe METEOR (Metric for Evaluation of Translation with Explicit ORdering) score is designed to evaluate the quality\nof machine translations by comparing them against reference translations. It emphasizes both the accuracy and\nfluency of translations, incorporating precision, recall, and word order into its assessment.\n\n### Test Mechanism\n\nThe function starts by extracting the true and predicted values from the provided dataset and model. The METEOR\nscore is computed for each pair of machine-generated translation (prediction) and its corresponding human-produced\nreference. This is done by considering unigram matches between the translations, including matches based on surface\nforms, stemmed forms, and synonyms. The score is a combination of unigram precision and recall, adjusted for word\norder through a fragmentation penalty. Scores are compiled into a dataframe, and histograms and bar charts are\ngenerated to visualize the distribution of METEOR scores. Additionally, a table of descriptive statistics (mean,\nmedian, standard deviation, minimum, and maximum) is compiled for the METEOR scores, providing a comprehensive\nsummary of the model's performance.\n\n### Signs of High Risk\n\n- Lower METEOR scores can indicate a lack of alignment between the machine-generated translations and their\nhuman-produced references, highlighting potential deficiencies in both the accuracy and fluency of translations.\n- Significant discrepancies in word order or an excessive fragmentation penalty could signal issues with how the\ntranslation model processes and reconstructs sentence structures, potentially compromising the natural flow of\ntranslated text.\n- Persistent underperformance across a variety of text types or linguistic contexts might suggest a broader\ninability of the model to adapt to the nuances of different languages or dialects, pointing towards gaps in its\ntraining or inherent limitations.\n\n### Strengths\n\n- Incorporates a balanced consideration of precision and recall, weighted towards recall to reflect the importance\nof content coverage in translations.\n- Directly accounts for word order, offering a nuanced evaluation of translation fluency beyond simple lexical\nmatching.\n- Adapts to various forms of lexical similarity, including synonyms and stemmed forms, allowing for flexible\nmatching.\n\n### Limitations\n\n- While comprehensive, the complexity of METEOR's calculation can make it computationally intensive, especially for\nlarge datasets.\n- The use of external resources for synonym and stemming matching may introduce variability based on the resources'\nquality and relevance to the specific translation task.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ModelMetadata": {
+        "description": "Compare metadata of different models and generate a summary table with the results.\n\n**Purpose**: The purpose of this function is to compare the metadata of different models, including information about their architecture, framework, framework version, and programming language.\n\n**Test Mechanism**: The function retrieves the metadata for each model using `get_model_info`, renames columns according to a predefined set of labels, and compiles this information into a summary table.\n\n**Signs of High Risk**:\n- Inconsistent or missing metadata across models can indicate potential issues in model documentation or management.\n- Significant differences in framework versions or programming languages might pose challenges in model integration and deployment.\n\n**Strengths**:\n- Provides a clear comparison of essential model metadata.\n- Standardizes metadata labels for easier interpretation and comparison.\n- Helps identify potential compatibility or consistency issues across models.\n\n**Limitations**:\n- Assumes that the `get_model_info` function returns all necessary metadata fields.\n- Relies on the correctness and completeness of the metadata provided by each model.\n- Does not include detailed parameter information, focusing instead on high-level metadata.",
+        "required_inputs": ["model"],
+        "default_params": {},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_training", "metadata"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ModelPredictionResiduals": {
+        "description": "Assesses normality and behavior of residuals in regression models through visualization and statistical tests.\n\n### Purpose\n\nThe Model Prediction Residuals test aims to visualize the residuals of model predictions and assess their normality\nusing the Kolmogorov-Smirnov (KS) test. It helps to identify potential issues related to model assumptions and\neffectiveness.\n\n### Test Mechanism\n\nThe function calculates residuals and generates\ntwo figures: one for the time series of residuals and one for the histogram of residuals.\nIt also calculates the KS test for normality and summarizes the results in a table.\n\n### Signs of High Risk\n\n- Residuals are not normally distributed, indicating potential issues with model assumptions.\n- High skewness or kurtosis in the residuals, which may suggest model misspecification.\n\n### Strengths\n\n- Provides clear visualizations of residuals over time and their distribution.\n- Includes statistical tests to assess the normality of residuals.\n- Helps in identifying potential model misspecifications and assumption violations.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with a .df attribute to access the pandas\nDataFrame.\n- Only generates plots for datasets with a datetime index, resulting in errors for other types of indices.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {
+            "nbins": 100,
+            "p_value_threshold": 0.05,
+            "start_date": None,
+            "end_date": None,
+        },
+        "tasks": ["residual_analysis", "visualization"],
+        "tags": ["regression"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.RegardScore": {
+        "description": "Assesses the sentiment and potential biases in text generated by NLP models by computing and visualizing regard\nscores.\n\n### Purpose\n\nThe `RegardScore` test aims to evaluate the levels of regard (positive, negative, neutral, or other) in texts\ngenerated by NLP models. It helps in understanding the sentiment and bias present in the generated content.\n\n### Test Mechanism\n\nThis test extracts the true and predicted values from the provided dataset and model. It then computes the regard\nscores for each text instance using a preloaded `regard` evaluation tool. The scores are compiled into dataframes,\nand visualizations such as histograms and bar charts are generated to display the distribution of regard scores.\nAdditionally, descriptive statistics (mean, median, standard deviation, minimum, and maximum) are calculated for\nthe regard scores, providing a comprehensive overview of the model's performance.\n\n### Signs of High Risk\n\n- Noticeable skewness in the histogram, especially when comparing the predicted regard scores with the target\nregard scores, can indicate biases or inconsistencies in the model.\n- Lack of neutral scores in the model's predictions, despite a balanced distribution in the target data, might\nsignal an issue.\n\n### Strengths\n\n- Provides a clear evaluation of regard levels in generated texts, aiding in ensuring content appropriateness.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of\nregard scores.\n- Descriptive statistics offer a concise summary of the model's performance in generating texts with balanced\nsentiments.\n\n### Limitations\n\n- The accuracy of the regard scores is contingent upon the underlying `regard` tool.\n- The scores provide a broad overview but do not specify which portions or tokens of the text are responsible for\nhigh regard.\n- Supplementary, in-depth analysis might be needed for granular insights.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.RegressionResidualsPlot": {
+        "description": 'Evaluates regression model performance using residual distribution and actual vs. predicted plots.\n\n### Purpose\n\nThe `RegressionResidualsPlot` metric aims to evaluate the performance of regression models. By generating and\nanalyzing two plots – a distribution of residuals and a scatter plot of actual versus predicted values – this tool\nhelps to visually appraise how well the model predicts and the nature of errors it makes.\n\n### Test Mechanism\n\nThe process begins by extracting the true output values (`y_true`) and the model\'s predicted values (`y_pred`).\nResiduals are computed by subtracting predicted from true values. These residuals are then visualized using a\nhistogram to display their distribution. Additionally, a scatter plot is derived to compare true values against\npredicted values, together with a "Perfect Fit" line, which represents an ideal match (predicted values equal\nactual values), facilitating the assessment of the model\'s predictive accuracy.\n\n### Signs of High Risk\n\n- Residuals showing a non-normal distribution, especially those with frequent extreme values.\n- Significant deviations of predicted values from actual values in the scatter plot.\n- Sparse density of data points near the "Perfect Fit" line in the scatter plot, indicating poor prediction\naccuracy.\n- Visible patterns or trends in the residuals plot, suggesting the model\'s failure to capture the underlying data\nstructure adequately.\n\n### Strengths\n\n- Provides a direct, visually intuitive assessment of a regression model’s accuracy and handling of data.\n- Visual plots can highlight issues of underfitting or overfitting.\n- Can reveal systematic deviations or trends that purely numerical metrics might miss.\n- Applicable across various regression model types.\n\n### Limitations\n\n- Relies on visual interpretation, which can be subjective and less precise than numerical evaluations.\n- May be difficult to interpret in cases with multi-dimensional outputs due to the plots’ two-dimensional nature.\n- Overlapping data points in the residuals plot can complicate interpretation efforts.\n- Does not summarize model performance into a single quantifiable metric, which might be needed for comparative or\nsummary analyses.',
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"bin_size": 0.1},
+        "tasks": ["regression"],
+        "tags": ["model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.RougeScore": {
+        "description": "Assesses the quality of machine-generated text using ROUGE metrics and visualizes the results to provide\ncomprehensive performance insights.\n\n### Purpose\n\nThe ROUGE Score test is designed to evaluate the quality of text generated by machine learning models using various\nROUGE metrics. ROUGE, which stands for Recall-Oriented Understudy for Gisting Evaluation, measures the overlap of\nn-grams, word sequences, and word pairs between machine-generated text and reference texts. This evaluation is\ncrucial for tasks like text summarization, machine translation, and text generation, where the goal is to produce\ntext that accurately reflects the content and meaning of human-crafted references.\n\n### Test Mechanism\n\nThe test extracts the true and predicted values from the provided dataset and model. It initializes the ROUGE\nevaluator with the specified metric (e.g., ROUGE-1). For each pair of true and predicted texts, it calculates the\nROUGE scores and compiles them into a dataframe. Histograms and bar charts are generated for each ROUGE metric\n(Precision, Recall, and F1 Score) to visualize their distribution. Additionally, a table of descriptive statistics\n(mean, median, standard deviation, minimum, and maximum) is compiled for each metric, providing a comprehensive\nsummary of the model's performance.\n\n### Signs of High Risk\n\n- Consistently low scores across ROUGE metrics could indicate poor quality in the generated text, suggesting that\nthe model fails to capture the essential content of the reference texts.\n- Low precision scores might suggest that the generated text contains a lot of redundant or irrelevant information.\n- Low recall scores may indicate that important information from the reference text is being omitted.\n- An imbalanced performance between precision and recall, reflected by a low F1 Score, could signal issues in the\nmodel's ability to balance informativeness and conciseness.\n\n### Strengths\n\n- Provides a multifaceted evaluation of text quality through different ROUGE metrics, offering a detailed view of\nmodel performance.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of the\nscores.\n- Descriptive statistics offer a concise summary of the model's strengths and weaknesses in generating text.\n\n### Limitations\n\n- ROUGE metrics primarily focus on n-gram overlap and may not fully capture semantic coherence, fluency, or\ngrammatical quality of the text.\n- The evaluation relies on the availability of high-quality reference texts, which may not always be obtainable.\n- While useful for comparison, ROUGE scores alone do not provide a complete assessment of a model's performance and\nshould be supplemented with other metrics and qualitative analysis.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"metric": "rouge-1"},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.TimeSeriesPredictionWithCI": {
+        "description": "Assesses predictive accuracy and uncertainty in time series models, highlighting breaches beyond confidence\nintervals.\n\n### Purpose\n\nThe purpose of the Time Series Prediction with Confidence Intervals (CI) test is to visualize the actual versus\npredicted values for time series data, including confidence intervals, and to compute and report the number of\nbreaches beyond these intervals. This helps in evaluating the reliability and accuracy of the model's predictions.\n\n### Test Mechanism\n\nThe function performs the following steps:\n\n- Calculates the standard deviation of prediction errors.\n- Determines the confidence intervals using a specified confidence level, typically 95%.\n- Counts the number of actual values that fall outside the confidence intervals, referred to as breaches.\n- Generates a plot visualizing the actual values, predicted values, and confidence intervals.\n- Returns a DataFrame summarizing the breach information, including the total breaches, upper breaches, and lower\nbreaches.\n\n### Signs of High Risk\n\n- A high number of breaches indicates that the model's predictions are not reliable within the specified confidence\nlevel.\n- Significant deviations between actual and predicted values may highlight model inadequacies or issues with data\nquality.\n\n### Strengths\n\n- Provides a visual representation of prediction accuracy and the uncertainty around predictions.\n- Includes a statistical measure of prediction reliability through confidence intervals.\n- Computes and reports breaches, offering a quantitative assessment of prediction performance.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with a datetime index.\n- Requires that `dataset.y_pred(model)` returns the predicted values for the model.\n- The calculation of confidence intervals assumes normally distributed errors, which may not hold for all datasets.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"confidence": 0.95},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_predictions", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.TimeSeriesPredictionsPlot": {
+        "description": "Plot actual vs predicted values for time series data and generate a visual comparison for the model.\n\n### Purpose\n\nThe purpose of this function is to visualize the actual versus predicted values for time\nseries data for a single model.\n\n### Test Mechanism\n\nThe function plots the actual values from the dataset and overlays the predicted\nvalues from the model using Plotly for interactive visualization.\n\n- Large discrepancies between actual and predicted values indicate poor model performance.\n- Systematic deviations in predicted values can highlight model bias or issues with data patterns.\n\n### Strengths\n\n- Provides a clear visual comparison of model predictions against actual values.\n- Uses Plotly for interactive and visually appealing plots.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with a datetime index.\n- Requires that `dataset.y_pred(model)` returns the predicted values for the model.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_predictions", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.TimeSeriesR2SquareBySegments": {
+        "description": "Evaluates the R-Squared values of regression models over specified time segments in time series data to assess\nsegment-wise model performance.\n\n### Purpose\n\nThe TimeSeriesR2SquareBySegments test aims to evaluate the R-Squared values for several regression models across\ndifferent segments of time series data. This helps in determining how well the models explain the variability in\nthe data within each specific time segment.\n\n### Test Mechanism\n- Provides a visual representation of model performance across different time segments.\n- Allows for identification of segments where the model performs poorly.\n- Calculating the R-Squared values for each segment.\n- Generating a bar chart to visually represent the R-Squared values across different models and segments.\n\n### Signs of High Risk\n\n- Significantly low R-Squared values for certain time segments, indicating poor model performance in those periods.\n- Large variability in R-Squared values across different segments for the same model, suggesting inconsistent\nperformance.\n\n### Strengths\n\n- Provides a visual representation of how well models perform over different time periods.\n- Helps identify time segments where models may need improvement or retraining.\n- Facilitates comparison between multiple models in a straightforward manner.\n\n### Limitations\n\n- Assumes datasets are provided as DataFrameDataset objects with the attributes `y`, `y_pred`, and\n`feature_columns`.\n- Requires that `dataset.y_pred(model)` returns predicted values for the model.\n- Assumes that both `y_true` and `y_pred` are pandas Series with datetime indices, which may not always be the case.\n- May not account for more nuanced temporal dependencies within the segments.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"segments": None},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_performance", "sklearn"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.TokenDisparity": {
+        "description": "Evaluates the token disparity between reference and generated texts, visualizing the results through histograms and\nbar charts, alongside compiling a comprehensive table of descriptive statistics for token counts.\n\n### Purpose\n\nThe Token Disparity test aims to assess the difference in the number of tokens between reference texts and texts\ngenerated by the model. Understanding token disparity is essential for evaluating how well the generated content\nmatches the expected length and richness of the reference texts.\n\n### Test Mechanism\n\nThe test extracts true and predicted values from the dataset and model. It computes the number of tokens in each\nreference and generated text. The results are visualized using histograms and bar charts to display the\ndistribution of token counts. Additionally, a table of descriptive statistics, including the mean, median, standard\ndeviation, minimum, and maximum token counts, is compiled to provide a detailed summary of token usage.\n\n### Signs of High Risk\n\n- Significant disparity in token counts between reference and generated texts could indicate issues with text\ngeneration quality, such as verbosity or lack of detail.\n- Consistently low token counts in generated texts compared to references might suggest that the model is producing\nincomplete or overly concise outputs.\n\n### Strengths\n\n- Provides a simple yet effective evaluation of text length and token usage.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of\ntoken counts.\n- Descriptive statistics offer a concise summary of the model's performance in generating texts of appropriate\nlength.\n\n### Limitations\n\n- Token counts alone do not provide a complete assessment of text quality and should be supplemented with other\nmetrics and qualitative analysis.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ToxicityScore": {
+        "description": "Assesses the toxicity levels of texts generated by NLP models to identify and mitigate harmful or offensive content.\n\n### Purpose\n\nThe ToxicityScore metric is designed to evaluate the toxicity levels of texts generated by models. This is crucial\nfor identifying and mitigating harmful or offensive content in machine-generated texts.\n\n### Test Mechanism\n\nThe function starts by extracting the input, true, and predicted values from the provided dataset and model. The\ntoxicity score is computed for each text using a preloaded `toxicity` evaluation tool. The scores are compiled into\ndataframes, and histograms and bar charts are generated to visualize the distribution of toxicity scores.\nAdditionally, a table of descriptive statistics (mean, median, standard deviation, minimum, and maximum) is\ncompiled for the toxicity scores, providing a comprehensive summary of the model's performance.\n\n### Signs of High Risk\n\n- Drastic spikes in toxicity scores indicate potentially toxic content within the associated text segment.\n- Persistent high toxicity scores across multiple texts may suggest systemic issues in the model's text generation\nprocess.\n\n### Strengths\n\n- Provides a clear evaluation of toxicity levels in generated texts, helping to ensure content safety and\nappropriateness.\n- Visual representations (histograms and bar charts) make it easier to interpret the distribution and trends of\ntoxicity scores.\n- Descriptive statistics offer a concise summary of the model's performance in generating non-toxic texts.\n\n### Limitations\n\n- The accuracy of the toxicity scores is contingent upon the underlying `toxicity` tool.\n- The scores provide a broad overview but do not specify which portions or tokens of the text are responsible for\nhigh toxicity.\n- Supplementary, in-depth analysis might be needed for granular insights.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["nlp", "text_data", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.ClusterDistribution": {
+        "description": "Assesses the distribution of text embeddings across clusters produced by a model using KMeans clustering.\n\n### Purpose\n\nThe purpose of this metric is to analyze the distribution of the clusters produced by a text embedding model. By\ndividing the text embeddings into different clusters, we can understand how the model is grouping or categorizing\nthe text data. This aids in visualizing the organization and segregation of the data, thereby giving an\nunderstanding of how the model is processing the data.\n\n### Test Mechanism\n\nThe metric applies the KMeans clustering algorithm on the predictions made by the model on the testing dataset and\ndivides the text embeddings into a pre-defined number of clusters. By default, this number is set to 5 but can be\ncustomized as per requirements. The output of this test is a histogram plot that shows the distribution of\nembeddings across these clusters.\n\n### Signs of High Risk\n\n- If the embeddings are skewed towards one or two clusters, it indicates that the model is not effectively\ndifferentiating the various categories in the text data.\n- Uniform distribution of the embeddings across the clusters might show a lack of proper categorization.\n\n### Strengths\n\n- Great tool to visualize the text data categorization by the model.\n- Provides a way to assess if the model is distinguishing the categories effectively or not.\n- Flexible with the number of clusters, so it can be used on various types of data regardless of the number of\ncategories.\n\n### Limitations\n\n- Success or failure of this test is based on visual interpretation, which might not be enough for making solid\nconclusions or determining the exact points of failure.\n- Assumes that the division of text embeddings across clusters should ideally be homogeneous, which might not\nalways be the case depending on the nature of the text data.\n- Only applies to text embedding models, reducing its utility across various ML models.\n- Uses the KMeans clustering algorithm, which assumes that clusters are convex and isotropic, and may not work as\nintended if the true clusters in the data are not of this shape.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"num_clusters": 5},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.CosineSimilarityComparison": {
+        "description": "Assesses the similarity between embeddings generated by different models using Cosine Similarity, providing both\nstatistical and visual insights.\n\n### Purpose\n\nThe Cosine Similarity Comparison test aims to analyze and compare the embeddings produced by different models using\nCosine Similarity. Cosine Similarity is a measure that calculates the cosine of the angle between two vectors,\nwidely used to determine the alignment or similarity between high-dimensional vectors, such as text embeddings.\nThis analysis helps understand how similar or different the models' predictions are in terms of embedding\ngeneration.\n\n### Test Mechanism\n\nThe function starts by computing the embeddings for each model using the provided dataset. It then calculates the\ncosine similarity for every possible pair of models, generating a similarity matrix wherein each element represents\nthe cosine similarity between two model embeddings. This matrix is flattened to create a bar chart for each model\npair, visualizing their similarity distribution. Additionally, a table with descriptive statistics (mean, median,\nstandard deviation, minimum, and maximum) for the similarities of each pair is compiled, referencing the compared\nmodels.\n\n### Signs of High Risk\n\n- A high concentration of cosine similarity values close to 1 could suggest that the models are producing very\nsimilar embeddings, indicating redundancy or lack of diversity in model training or design.\n- Very low similarity values near -1 highlight strong dissimilarity, suggesting models that are too divergent and\npossibly focusing on very different features of the data.\n\n### Strengths\n\n- Enables detailed comparisons between multiple models' embedding strategies through visual and statistical means.\n- Identifies models producing similar or dissimilar embeddings, useful for tasks requiring model diversity.\n- Provides quantitative and visual feedback on the degree of similarity, enhancing interpretability of model\nbehavior in embedding spaces.\n\n### Limitations\n\n- The analysis is confined to the comparison of embeddings and does not assess the overall performance of the\nmodels in terms of their primary tasks (e.g., classification, regression).\n- Assumes that the models are suitable for generating comparable embeddings, which might not always be the case,\nespecially across different types of models.\n- Interpretation of results is heavily dependent on the understanding of Cosine Similarity and the nature of\nhigh-dimensional embedding spaces.",
+        "required_inputs": ["dataset", "models"],
+        "default_params": {},
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.CosineSimilarityDistribution": {
+        "description": "Assesses the similarity between predicted text embeddings from a model using a Cosine Similarity distribution\nhistogram.\n\n### Purpose\n\nThis metric is used to assess the degree of similarity between the embeddings produced by a text embedding model\nusing Cosine Similarity. Cosine Similarity is a measure that calculates the cosine of the angle between two\nvectors. This metric is predominantly used in text analysis — in this case, to determine how closely the predicted\ntext embeddings align with one another.\n\n### Test Mechanism\n\nThe implementation starts by computing the cosine similarity between the predicted values of the model's test\ndataset. These cosine similarity scores are then plotted on a histogram with 100 bins to visualize the distribution\nof the scores. The x-axis of the histogram represents the computed Cosine Similarity.\n\n### Signs of High Risk\n\n- If the cosine similarity scores cluster close to 1 or -1, it may indicate overfitting, as the model's predictions\nare almost perfectly aligned. This could suggest that the model is not generalizable.\n- A broad spread of cosine similarity scores across the histogram may indicate a potential issue with the model's\nability to generate consistent embeddings.\n\n### Strengths\n\n- Provides a visual representation of the model's performance which is easily interpretable.\n- Can help identify patterns, trends, and outliers in the model's alignment of predicted text embeddings.\n- Useful in measuring the similarity between vectors in multi-dimensional space, important in the case of text\nembeddings.\n\n### Limitations\n\n- Only evaluates the similarity between outputs. It does not provide insight into the model's ability to correctly\nclassify or predict.\n- Cosine similarity only considers the angle between vectors and does not consider their magnitude. This can lead\nto high similarity scores for vectors with vastly different magnitudes but a similar direction.\n- The output is sensitive to the choice of bin number for the histogram. Different bin numbers could give a\nslightly altered perspective on the distribution of cosine similarity.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.CosineSimilarityHeatmap": {
+        "description": "Generates an interactive heatmap to visualize the cosine similarities among embeddings derived from a given model.\n\n### Purpose\n\nThis function is designed to visually analyze the cosine similarities of embeddings from a specific model. Cosine\nsimilarity, a measure of the cosine of the angle between two vectors, aids in understanding the orientation and\nsimilarity of vectors in multi-dimensional space. This is particularly valuable for exploring text embeddings and\ntheir relative similarities among documents, words, or phrases.\n\n### Test Mechanism\n\nThe function operates through a sequence of steps to visualize cosine similarities. Initially, embeddings are\nextracted for each dataset entry using the designated model. Following this, the function computes the pairwise\ncosine similarities among these embeddings. The computed similarities are then displayed in an interactive heatmap.\n\n### Signs of High Risk\n\n- High similarity values (close to 1) across the heatmap might not always be indicative of a risk; however, in\ncontexts where diverse perspectives or features are desired, this could suggest a lack of diversity in the model's\nlearning process or potential redundancy.\n- Similarly, low similarity values (close to -1) indicate strong dissimilarity, which could be beneficial in\nscenarios demanding diverse outputs. However, in cases where consistency is needed, these low values might\nhighlight that the model is unable to capture a coherent set of features from the data, potentially leading to poor\nperformance on related tasks.\n\n### Strengths\n\n- Provides an interactive and intuitive visual representation of embedding similarities, facilitating easy\nexploration and analysis.\n- Allows customization of visual elements such as title, axis labels, and color scale to suit specific analytical\nneeds and preferences.\n\n### Limitations\n\n- As the number of embeddings increases, the effectiveness of the heatmap might diminish due to overcrowding,\nmaking it hard to discern detailed similarities.\n- The interpretation of the heatmap heavily relies on the appropriate setting of the color scale, as incorrect\nsettings can lead to misleading visual interpretations.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {
+            "title": "Cosine Similarity Matrix",
+            "color": "Cosine Similarity",
+            "xaxis_title": "Index",
+            "yaxis_title": "Index",
+            "color_scale": "Blues",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.DescriptiveAnalytics": {
+        "description": "Evaluates statistical properties of text embeddings in an ML model via mean, median, and standard deviation\nhistograms.\n\n### Purpose\n\nThis metric, Descriptive Analytics for Text Embeddings Models, is employed to comprehend the fundamental properties\nand statistical characteristics of the embeddings in a Machine Learning model. It measures the dimensionality as\nwell as the statistical distributions of embedding values including the mean, median, and standard deviation.\n\n### Test Mechanism\n\nThe test mechanism involves using the 'DescriptiveAnalytics' class provided in the code which includes the 'run'\nfunction. This function computes three statistical measures - mean, median, and standard deviation of the test\npredictions from the model. It generates and caches three separate histograms showing the distribution of these\nmeasures. Each histogram visualizes the measure's distribution across the embedding values. Therefore, the method\ndoes not utilize a grading scale or threshold; it is fundamentally a visual exploration and data exploration tool.\n\n### Signs of High Risk\n\n- Abnormal patterns or values in the distributions of the statistical measures. This may include skewed\ndistributions or a significant amount of outliers.\n- Very high standard deviation values which indicate a high degree of variability in the data.\n- The mean and median values are vastly different, suggesting skewed data.\n\n### Strengths\n\n- Provides a visual and quantifiable understanding of the embeddings' statistical characteristics, allowing for a\ncomprehensive evaluation.\n- Facilitates the identification of irregular patterns and anomalous values that might indicate issues with the\nmachine learning model.\n- It considers three key statistical measures (mean, median, and standard deviation), offering a more well-rounded\nunderstanding of the data.\n\n### Limitations\n\n- The method does not offer an explicit measure of model performance or accuracy, as it mainly focuses on\nunderstanding data properties.\n- It relies heavily on the visual interpretation of histograms. This could be subjective, and important patterns\ncould be overlooked if not carefully reviewed.\n- While it displays valuable information about the central tendency and spread of data, it does not provide\ninformation about correlations between different embedding dimensions.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.EmbeddingsVisualization2D": {
+        "description": "Visualizes 2D representation of text embeddings generated by a model using t-SNE technique.\n\n### Purpose\n\nThe objective of this metric is to provide a visual 2D representation of the embeddings created by a text embedding\nmachine learning model. By doing so, it aids in analyzing the embedding space created by the model and helps in\nunderstanding how the learned embeddings are distributed and how they relate to each other.\n\n### Test Mechanism\n\nThis metric uses the t-Distributed Stochastic Neighbor Embedding (t-SNE) technique, which is a tool for visualizing\nhigh-dimensional data by reducing the dimensionality to 2. The perplexity parameter for t-SNE is set to the value\nprovided by the user. If the input perplexity value is greater than the number of samples, the perplexity is\nadjusted to be one less than the number of samples. Following the reduction of dimensionality, a scatter plot is\nproduced depicting each embedding as a data point in the visualized 2D plane.\n\n### Signs of High Risk\n\n- If the embeddings are highly concentrated in a specific region of the plane, it might indicate that the model is\nnot learning diverse representations of the text.\n- Wide gaps or partitions in the visualization could suggest that the model is over-segmenting in the embedding\nspace and may lead to poor generalization.\n\n### Strengths\n\n- Offers a powerful visual tool that can assist in understanding and interpreting high-dimensional embeddings,\nwhich could otherwise be difficult to visualize.\n- It is model-agnostic and can be used with any machine learning model that produces text embeddings.\n- t-SNE visualization helps in focusing on local structures and preserves the proximity of points that are close\ntogether in the original high-dimensional space.\n\n### Limitations\n\n- The reduction of high-dimensional data to 2D can result in loss of some information, which may lead to\nmisinterpretation.\n- Due to its stochastic nature, t-SNE can produce different results when run multiple times with the same\nparameters, leading to potential inconsistency in interpretation.\n- It is designed for visual exploration and not for downstream tasks; that is, the 2D embeddings generated should\nnot be directly used for further training or analysis.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"cluster_column": None, "perplexity": 30},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.EuclideanDistanceComparison": {
+        "description": "Assesses and visualizes the dissimilarity between model embeddings using Euclidean distance, providing insights\ninto model behavior and potential redundancy or diversity.\n\n### Purpose\n\nThe Euclidean Distance Comparison test aims to analyze and compare the embeddings produced by different models. By\nmeasuring the Euclidean distance between vectors in Euclidean space, it provides a metric to assess the magnitude\nof dissimilarity between embeddings created by different models. This is crucial for tasks that require models to\nproduce distinct responses or feature separations.\n\n### Test Mechanism\n\nThe test computes the embeddings for each model using the provided dataset and calculates the Euclidean distance\nfor every possible pair of models. It generates a distance matrix where each element represents the Euclidean\ndistance between two model embeddings. This matrix is then visualized through bar charts, showing the distance\ndistribution for each model pair. Additionally, it compiles a table with descriptive statistics such as mean,\nmedian, standard deviation, minimum, and maximum distances for each model pair, including references to the\ncompared models.\n\n### Signs of High Risk\n\n- Very high distance values could suggest that models are focusing on entirely different features or aspects of the\ndata, which might be undesirable for ensemble methods or when a consensus is required.\n- Extremely low distances across different models might indicate redundancy, suggesting that models are not\nproviding diverse enough perspectives on the data.\n\n### Strengths\n\n- Provides a clear and quantifiable measure of how different the embeddings from various models are.\n- Useful for identifying outlier models or those that behave significantly differently from others in a group.\n\n### Limitations\n\n- Euclidean distance can be sensitive to the scale of the data, meaning that preprocessing steps like normalization\nmight be necessary to ensure meaningful comparisons.\n- Does not consider the orientation or angle between vectors, focusing purely on magnitude differences.",
+        "required_inputs": ["dataset", "models"],
+        "default_params": {},
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.EuclideanDistanceHeatmap": {
+        "description": "Generates an interactive heatmap to visualize the Euclidean distances among embeddings derived from a given model.\n\n### Purpose\n\nThis function visualizes the Euclidean distances between embeddings generated by a model, offering insights into\nthe absolute differences between data points. Euclidean distance, a fundamental metric in data analysis, measures\nthe straight-line distance between two points in Euclidean space. It is particularly useful for understanding\nspatial relationships and clustering tendencies in high-dimensional data.\n\n### Test Mechanism\n\nThe function operates through a streamlined process: firstly, embeddings are extracted for each dataset entry using\nthe specified model. Subsequently, it computes the pairwise Euclidean distances among these embeddings. The results\nare then visualized in an interactive heatmap format, where each cell's color intensity correlates with the\ndistance magnitude between pairs of embeddings, providing a visual assessment of these distances.\n\n### Signs of High Risk\n\n- Uniformly low distances across the heatmap might suggest a lack of variability in the data or model overfitting,\nwhere the model fails to distinguish between distinct data points effectively.\n- Excessive variability in distances could indicate inconsistent data representation, potentially leading to\nunreliable model predictions.\n\n### Strengths\n\n- Provides a direct, intuitive visual representation of distances between embeddings, aiding in the detection of\npatterns or anomalies.\n- Allows customization of visual aspects such as the heatmap's title, axis labels, and color scale, adapting to\nvarious analytical needs.\n\n### Limitations\n\n- The interpretation of distances can be sensitive to the scale of data; normalization might be necessary for\nmeaningful analysis.\n- Large datasets may lead to dense, cluttered heatmaps, making it difficult to discern individual distances,\npotentially requiring techniques like data sampling or dimensionality reduction for clearer visualization.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {
+            "title": "Euclidean Distance Matrix",
+            "color": "Euclidean Distance",
+            "xaxis_title": "Index",
+            "yaxis_title": "Index",
+            "color_scale": "Blues",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.PCAComponentsPairwisePlots": {
+        "description": "Generates scatter plots for pairwise combinations of principal component analysis (PCA) components of model\nembeddings.\n\n### Purpose\n\nThis function visualizes the principal components of embeddings derived from a specified model. Principal Component\nAnalysis (PCA) is a statistical technique that emphasizes variation and uncovers strong patterns in a dataset. It\ntransforms the original variables into new, uncorrelated variables (principal components) that maximize variance.\n\n### Test Mechanism\n\nThe function follows a sequential process to visualize PCA components effectively. It starts by extracting\nembeddings from the dataset, utilizing the model specified by the user. These embeddings are then standardized to\nensure zero mean and unit variance, which is crucial to prevent any single feature from dominating due to\nscale—this standardization is a critical preprocessing step for PCA. Following this, the function calculates the\nspecified number of principal components. The core of the visualization process involves creating scatter plots for\neach pairwise combination of these principal components.\n\n### Signs of High Risk\n\n- If the principal components do not account for a significant portion of the variance, it may suggest that PCA is\nnot capturing the essential structures of the data.\n- Similarity in scatter plots across different pairs of components could indicate redundancy in the components,\nsuggesting that fewer dimensions might be sufficient to represent the data.\n\n### Strengths\n\n- Enables a simplified visualization of multivariate data, helping to identify patterns across many variables\neffectively.\n- Provides a clear depiction of the directions of maximum variance in the data, which is valuable for feature\nselection and dimensionality reduction.\n\n### Limitations\n\n- PCA's effectiveness hinges on the scaling of the variables; improper standardization can lead to misleading\ninterpretations.\n- The interpretation of principal components can be challenging, especially if they capture less significant\nvariances or are difficult to relate back to the original features.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"n_components": 3},
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.StabilityAnalysis": {
+        "description": "Assesses the stability of embeddings generated by a model when faced with perturbed input data to ensure robustness\nand consistency.\n\n### Purpose\n\nThe Embedding Stability test evaluates the robustness of the embeddings generated by a model when the input text is\nperturbed. By comparing the cosine similarities between the original and perturbed embeddings, it gauges the\nmodel's ability to maintain consistent semantic representations under slight variations in the input data.\n\n### Test Mechanism\n\nThis test works by:\n\n- Perturbing the original text data.\n- Generating embeddings for both the original and perturbed datasets using the model.\n- Calculating the cosine similarities between the original and perturbed embeddings.\n- Analyzing the distribution of these similarities (mean, min, max, median, and standard deviation).\n- Determining the test result based on whether the mean similarity exceeds a predefined threshold (default is 0.7).\n\n### Signs of High Risk\n\n- Mean cosine similarity below the threshold (default is 0.7).\n- Large standard deviation of cosine similarities, indicating inconsistency.\n- Minimum similarity score significantly lower than expected.\n- Failure to pass the threshold test based on the mean similarity.\n\n### Strengths\n\n- Provides a quantitative measure of embedding stability.\n- Helps in identifying weaknesses in the model's ability to handle minor input variations.\n- Visualization of similarity distributions aids in comprehensive analysis.\n- Easy to interpret results with clear pass/fail criteria.\n\n### Limitations\n\n- Relies on the chosen perturbation method, which may not cover all possible variations in real-world data.\n- Thresholds for similarity might need adjustment based on specific application requirements.\n- Cosine similarity, while useful, may not capture all aspects of semantic stability.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"mean_similarity_threshold": 0.7},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.StabilityAnalysisKeyword": {
+        "description": "Evaluates robustness of embedding models to keyword swaps in the test dataset.\n\n### Purpose\n\nThis test metric is used to evaluate the robustness of text embedding machine learning models to keyword swaps. A\nkeyword swap is a scenario where instances of certain specified keywords in the dataset are replaced with other\nspecified words (usually synonyms). The purpose of this metric is to ensure that these models maintain performance\nstability even when the input data slightly deviates, imitating real-world variability.\n\n### Test Mechanism\n\nThe test mechanism involves a perturbation of the dataset used in testing the model. Each instance of a specific\nword found in the dataset is replaced with the corresponding word as specified in a 'keyword_dict' mapping. The\nmodel is then re-run with the perturbed dataset and the results are compared with the non-perturbed dataset. This\ncomparison quantifies the extent to which keyword swaps impact the model's performance.\n\n### Signs of High Risk\n\n- A significant drop in model performance after keyword swaps indicates a high risk of model failure in real-world\nscenarios.\n- The model results being heavily reliant on specific word choices instead of capturing the context properly.\n\n### Strengths\n\n- This test provides a way to measure model robustness to small changes in input data, which reinforces its\napplicability and reliability in real-world scenarios.\n- This test encourages a model to understand the context of a sentence rather than memorizing specific words.\n- It helps to detect overfitting - a situation where a model performs well on training data but poorly on new or\nslightly altered data.\n\n### Limitations\n\n- It may not fully address semantic differences that can be introduced through keyword swaps. That is, the\nreplacement words might not preserve the exact semantic meaning of the original words.\n- It only tests for changes in keywords (word-level alterations) and might not expose model limitations related to\nstructural data changes.\n- It assumes that the provided 'keyword_dict' is an accurate representation of possible real-world variations,\nwhich might not always be the case.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"keyword_dict": None, "mean_similarity_threshold": 0.7},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.StabilityAnalysisRandomNoise": {
+        "description": "Assesses the robustness of text embeddings models to random noise introduced via text perturbations.\n\n### Purpose\n\nThe purpose of this test is to evaluate the robustness of a text embeddings model to random noise. It introduces\nperturbations such as swapping adjacent words, inserting typos, deleting words, or inserting random words within\nthe text to determine how well the model performs under such noisy conditions.\n\n### Test Mechanism\n\nThe test applies a series of pre-defined random perturbations to the text data. These perturbations include:\n\n- Swapping two adjacent words using the `random_swap` function.\n- Introducing a typo in a word using the `introduce_typo` function.\n- Deleting a word using the `random_deletion` function.\n- Inserting a random word at a random position using the `random_insertion` function.\n\nA probability parameter dictates the likelihood of each perturbation being applied to the words in the text. The\ntext is initially tokenized into words, and selected perturbations are applied based on this probability.\n\n### Signs of High Risk\n\n- High error rates in model predictions or classifications after the introduction of random noise.\n- Greater sensitivity to specific types of noise, such as typographical errors or word deletions.\n- Significant change in loss function or accuracy metrics.\n- Inconsistent model outputs for slightly perturbed inputs.\n\n### Strengths\n\n- Measures model robustness against noise, reflecting real-world scenarios where data may contain errors or\ninconsistencies.\n- Easy to implement with adjustable perturbation severity through a probability parameter.\n- Identifies model sensitivity to specific types of noise, offering insights for model improvement.\n- Useful for testing models designed to handle text data.\n\n### Limitations\n\n- May be ineffective for models that are inherently resistant to noise or designed to handle such perturbations.\n- Pseudo-randomness may not accurately represent the real-world distribution of noise or typographical errors.\n- Highly dependent on the probability parameter, requiring fine-tuning to achieve an optimal balance.\n- Only assesses performance against noise in input data, not the ability to capture complex language structures or\nsemantics.\n- Does not guarantee model performance on new, unseen, real-world data beyond the generated noisy test data.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"mean_similarity_threshold": 0.7, "probability": 0.02},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.StabilityAnalysisSynonyms": {
+        "description": "Evaluates the stability of text embeddings models when words in test data are replaced by their synonyms randomly.\n\n### Purpose\n\nThe Stability Analysis Synonyms test is designed to gauge the robustness and stability of an embeddings model on\ntext-based data. The test does so by introducing random word changes through replacing words in the test dataset\nwith their synonyms.\n\n### Test Mechanism\n\nThis test utilizes WordNet to find synonyms for a given word present in the test data, replacing the original word\nwith this synonym based on a given probability. The probability is defined as a parameter and determines the\nlikelihood of swapping a word with its synonym. By default, this is set at 0.02 but can be adjusted based on\nspecific test requirements. This methodology enables an evaluation of how such replacements can affect the model's\nperformance.\n\n### Signs of High Risk\n\n- The model's performance or predictions change significantly after swapping words with their synonyms.\n- The model shows high sensitivity to small perturbations, like modifying the data with synonyms.\n- The embeddings model fails to identify similar meanings between the original words and their synonyms, indicating\nit lacks semantic understanding.\n\n### Strengths\n\n- The test is flexible in its application. The 'probability' parameter can be adjusted based on the degree of\nsynonym swapping required.\n- Efficient in gauging a model's sensitivity or robustness with respect to small changes in input data.\n- Provides insights into the semantic understanding of the model as it monitors the impact of swapping words with\nsynonyms.\n\n### Limitations\n\n- The ability to perturb data is reliant on the availability of synonyms, limiting its efficiency.\n- It assumes that the synonyms provided by WordNet are accurate and interchangeable in all contexts, which may not\nalways be the case given the intricacies of language and context-specific meanings.\n- It does not consider the influence of multi-word expressions or phrases, as synonyms are considered at the word\nlevel only.\n- Relies solely on the WordNet corpus for synonyms, limiting its effectiveness for specialized or domain-specific\njargon not included in that corpus.\n- Does not consider the semantic role of the words in the sentence, meaning the swapped synonym could potentially\nalter the overall meaning of the sentence, leading to a false perception of the model's stability.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"probability": 0.02, "mean_similarity_threshold": 0.7},
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.StabilityAnalysisTranslation": {
+        "description": "Evaluates robustness of text embeddings models to noise introduced by translating the original text to another\nlanguage and back.\n\n### Purpose\n\nThe purpose of this test is to assess the robustness of text embeddings models under the influence of noise. The\nnoise in this scenario is introduced by translating the original text into another language and then translating it\nback to the original language. Any significant changes in the model's output between the original and\ntranslated-then-retranslated texts can be indicators of the model's lack of robustness to noise.\n\n### Test Mechanism\n\nThe test mechanism involves several steps:\n\n1. Initialize the Marian tokenizer and model for both source and target languages.\n2. Translate the data from the source language to the target language.\n3. Translate the translated data back into the source language.\n4. Compare the original data with the data that has been translated and back-translated to observe any significant\nchanges.\n\nThe threshold of this test output would then be determined by the tolerance level of the model to these potentially\nnoisy instances.\n\n### Signs of High Risk\n\n- Large discrepancies between the original and double-translated text, indicating a high level of risk and a lack\nof robustness to noise.\n- Translations that do not closely maintain the meaning and context of the original language, suggesting inadequate\nrobustness against this type of noise.\n\n### Strengths\n\n- An effective way to assess the model’s sensitivity and robustness to language translation noise.\n- Provides a realistic scenario which the model might encounter in real-world applications by using translation to\nintroduce noise.\n- Tests the model’s capacity to maintain semantic meaning under translational perturbations, extending beyond\nsimple lexical changes.\n\n### Limitations\n\n- Relies solely on translation-related noise, potentially overlooking other types of noise such as typographical\nerrors, grammatical mistakes, or random word substitutions.\n- Inaccuracies or discrepancies in the translation process itself might influence the resultant robustness score\nrather than reflect an inherent failing of the model.\n- Predominantly language-dependent, thus might not fully capture robustness for languages with fewer resources or\nthose highly dissimilar to the source language.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {
+            "source_lang": "en",
+            "target_lang": "fr",
+            "mean_similarity_threshold": 0.7,
+        },
+        "tasks": ["feature_extraction"],
+        "tags": ["llm", "text_data", "embeddings", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.embeddings.TSNEComponentsPairwisePlots": {
+        "description": "Creates scatter plots for pairwise combinations of t-SNE components to visualize embeddings and highlight potential\nclustering structures.\n\n### Purpose\n\nThis function creates scatter plots for each pairwise combination of t-SNE components derived from model\nembeddings. t-SNE (t-Distributed Stochastic Neighbor Embedding) is a machine learning algorithm for dimensionality\nreduction that is particularly well-suited for the visualization of high-dimensional datasets.\n\n### Test Mechanism\n\nThe function begins by extracting embeddings from the provided dataset using the specified model. These embeddings\nare then standardized to ensure that each dimension contributes equally to the distance computation. Following\nthis, the t-SNE algorithm is applied to reduce the dimensionality of the data, with the number of components\nspecified by the user. The results are plotted using Plotly, creating scatter plots for each unique pair of\ncomponents if more than one component is specified.\n\n### Signs of High Risk\n\n- If the scatter plots show overlapping clusters or indistinct groupings, it might suggest that the t-SNE\nparameters (such as perplexity) are not optimally set for the given data, or the data itself does not exhibit\nclear, separable clusters.\n- Similar plots across different pairs of components could indicate redundancy in the components generated by\nt-SNE, suggesting that fewer dimensions might be sufficient to represent the data's structure.\n\n### Strengths\n\n- Provides a visual exploration tool for high-dimensional data, simplifying the detection of patterns and clusters\nwhich are not apparent in higher dimensions.\n- Interactive plots generated by Plotly enhance user engagement and allow for a deeper dive into specific areas of\nthe plot, aiding in detailed data analysis.\n\n### Limitations\n\n- The effectiveness of t-SNE is highly dependent on the choice of parameters like perplexity and the number of\ncomponents, which might require tuning and experimentation for optimal results.\n- t-SNE visualizations can be misleading if interpreted without considering the stochastic nature of the algorithm;\ntwo runs with the same parameters might yield different visual outputs, necessitating multiple runs for a\nconsistent interpretation.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"n_components": 2, "perplexity": 30, "title": "t-SNE"},
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["visualization", "dimensionality_reduction", "embeddings"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.ragas.AnswerCorrectness": {
+        "description": 'Evaluates the correctness of answers in a dataset with respect to the provided ground\ntruths and visualizes the results in a histogram.\n\nThe assessment of Answer Correctness involves gauging the accuracy of the generated\nanswer when compared to the ground truth. This evaluation relies on the `ground truth`\nand the `answer`, with scores ranging from 0 to 1. A higher score indicates a closer\nalignment between the generated answer and the ground truth, signifying better\ncorrectness.\n\nAnswer correctness encompasses two critical aspects: semantic similarity between the\ngenerated answer and the ground truth, as well as factual similarity. These aspects\nare combined using a weighted scheme to formulate the answer correctness score. Users\nalso have the option to employ a `threshold` value to round the resulting score to\na binary value (0 or 1) based on the threshold.\n\nFactual correctness quantifies the factual overlap between the generated answer and\nthe ground truth answer. This is done using the concepts of:\n\n- TP (True Positive): Facts or statements that are present in both the ground truth\n  and the generated answer.\n- FP (False Positive): Facts or statements that are present in the generated answer\n  but not in the ground truth.\n- FN (False Negative): Facts or statements that are present in the ground truth but\n  not in the generated answer.\n\n### Configuring Columns\n\nThis metric requires specific columns to be present in the dataset:\n\n- `question` (str): The text prompt or query that was input into the model.\n- `answer` (str): The text response generated by the model.\n- `ground_truth` (str): The ground truth answer that the generated answer is compared\nagainst.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `question_column`, `answer_column`, and\n`ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\nparams = {\n    "question_column": "input_text",\n    "answer_column": "output_text",\n    "ground_truth_column": "human_answer",\n}\n```\n\nIf answer and contexts are stored as a dictionary in another column, specify the\ncolumn and key like this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": f"{pred_col}.generated_answer",\n    "ground_truth_column": f"{pred_col}.contexts",\n}\n```\n\nFor more complex data structures, you can use a function to extract the answers:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": lambda row: "\\n\\n".join(row[pred_col]["messages"]),\n    "ground_truth_column": lambda row: [row[pred_col]["context_message"]],\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "answer_column": "answer",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.AnswerRelevance": {
+        "description": 'Assesses how pertinent the generated answer is to the given prompt.\n\nThe evaluation metric, Answer Relevancy, focuses on assessing how pertinent the\ngenerated answer is to the given prompt. A lower score is assigned to answers that\nare incomplete or contain redundant information and higher scores indicate better\nrelevancy. This metric is computed using the `question`, the `contexts` and the\n`answer`.\n\nThe Answer Relevancy is defined as the mean cosine similartiy of the original\n`question` to a number of artifical questions, which are generated (reverse-engineered)\nbased on the `answer`:\n\n$$\n\\text{answer relevancy} = \\frac{1}{N} \\sum_{i=1}^{N} cos(E_{g_i}, E_o)\n$$\n$$\n\\text{answer relevancy} = \\frac{1}{N} \\sum_{i=1}^{N} \\frac{E_{g_i} \\cdot E_o}{\\|E_{g_i}\\|\\|E_o\\|}\n$$\n\nWhere:\n- $E_{g_i}$ is the embedding of the generated question $i$.\n- $E_o$ is the embedding of the original question.\n- $N$ is the number of generated questions - 3 by default.\n\n**Note**: *This is a reference-free metric, meaning that it does not require a\n`ground_truth` answer to compare against. A similar metric that does evaluate the\ncorrectness of a generated answser with respect to a `ground_truth` answer is\n`validmind.model_validation.ragas.AnswerCorrectness`.*\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `question` (str): The text query that was input into the model.\n- `contexts` (List[str]): Any contextual information retrieved by the model before\ngenerating an answer.\n- `answer` (str): The response generated by the model.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `question_column`, `answer_column`, and\n`contexts_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\nparams = {\n    "question_column": "input_text",\n    "answer_column": "output_text",\n    "contexts_column": "context_info"\n}\n```\n\nIf answer and contexts are stored as a dictionary in another column, specify the\ncolumn and key like this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": f"{pred_col}.generated_answer",\n    "contexts_column": f"{pred_col}.contexts",\n}\n```\n\nFor more complex data structures, you can use a function to extract the answers:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": lambda row: "\\n\\n".join(row[pred_col]["messages"]),\n    "contexts_column": lambda row: [row[pred_col]["context_message"]],\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "contexts_column": "contexts",
+            "answer_column": "answer",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm", "rag_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.AnswerSimilarity": {
+        "description": 'Calculates the semantic similarity between generated answers and ground truths\n\nThe concept of Answer Semantic Similarity pertains to the assessment of the semantic\nresemblance between the generated answer and the ground truth. This evaluation is\nbased on the `ground_truth` and the `answer`, with values falling within the range\nof 0 to 1. A higher score signifies a better alignment between the generated answer\nand the ground truth.\n\nMeasuring the semantic similarity between answers can offer valuable insights into\nthe quality of the generated response. This evaluation utilizes a cross-encoder\nmodel to calculate the semantic similarity score.\n\nSee this paper for more details: https://arxiv.org/pdf/2108.06130.pdf\n\nThe following steps are involved in computing the answer similarity score:\n1. Vectorize the ground truth answer using the specified embedding model.\n2. Vectorize the generated answer using the same embedding model.\n3. Compute the cosine similarity between the two vectors.\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `answer` (str): The text response generated by the model.\n- `ground_truth` (str): The ground truth answer that the generated answer is compared\nagainst.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `answer_column`, and `ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "answer_column": "llm_output_col",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nIf answer is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": f"{pred_col}.generated_answer",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "answer_column": lambda row: "\\n\\n".join(row[pred_col]["messages"]),\n    "ground_truth_column": "my_ground_truth_col",\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "answer_column": "answer",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.AspectCritique": {
+        "description": 'Evaluates generations against the following aspects: harmfulness, maliciousness,\ncoherence, correctness, and conciseness.\n\n### Overview:\n\nThis is designed to assess submissions against predefined and user-defined "aspects".\nFor each aspect, a judge LLM is prompted to critique a piece of generated text based\non a description of the aspect. The output of this evaluation is a binary (0/1 = yes/no)\nscore that indicates whether the submission aligns with the defined aspect or not.\n\n### Inputs and Outputs:\n\nThe input to this metric is a dataset containing the input `question` (prompt to the LLM)\nand the `answer` (text generated by the LLM). Any retrieved `contexts` can also be\nincluded to enhance the evaluation.\n\nThe `question_column`, `answer_column`, and `contexts_column` parameters can be used to\nspecify the names or sources for the data that this metric will evaluate if the dataset\ndoes not contain the required columns `question`, `answer`, and `contexts`.\n\nBy default, the aspects evaluated are harmfulness, maliciousness, coherence,\ncorrectness, and conciseness. To change the aspects evaluated, the `aspects` parameter\ncan be set to a list containing any of these aspects.\n\nTo add custom aspects, the `additional_aspects` parameter can be passed as a list\nof tuples where each tuple contains the aspect name and a description of the aspect\nthat the judge LLM will use to critique the submission.\n\nThe output of this metric is a table of scores for each aspect where the aspect score\nis the number of "yes" scores divided by the total number of submissions:\n$$\n\\text{aspect score} = \\frac{\\text{number of "yes" scores}}{\\text{total number of submissions}}\n$$\n\n### Examples:\n\n- **Mapping to Required Columns:** If the dataset does not contain the columns required\nto run this metric (i.e., `question`, `answer`, and `contexts`), the\n\n```python\npred_col = my_vm_dataset.prediction_column(my_vm_model)\nrun_test(\n    "validmind.model_validation.ragas.AspectCritique",\n    inputs={"dataset": my_vm_dataset},\n    params={\n        "question_column": "input_prompt",\n        "answer_column": f"{pred_col}.llm_output",\n        "contexts_column": lambda row: [row[pred_col]["context_message"]],\n    },\n)\n```\n\n- **Custom Aspects:** To evaluate custom aspects, the `additional_aspects` parameter can\nbe set to a list of tuples where each tuple contains the aspect name and a description\nof the aspect that the judge LLM will use to critique the submission. For example, to\nevaluate whether the LLM-generated text has a "professional tone", the `additional_aspects`\nparameter can be set like this:\n\n```python\nrun_test(\n    "validmind.model_validation.ragas.AspectCritique",\n    inputs={"dataset": my_vm_dataset},\n    params={\n        "additional_aspects": [\n            ("professionalism", "Does the text have a professional tone?"),\n        ],\n    },\n)\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "answer_column": "answer",
+            "contexts_column": "contexts",
+            "aspects": [
+                "coherence",
+                "conciseness",
+                "correctness",
+                "harmfulness",
+                "maliciousness",
+            ],
+            "additional_aspects": None,
+        },
+        "tasks": ["text_summarization", "text_generation", "text_qa"],
+        "tags": ["ragas", "llm", "qualitative"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.ContextEntityRecall": {
+        "description": 'Evaluates the context entity recall for dataset entries and visualizes the results.\n\n### Overview\n\nThis metric gives the measure of recall of the retrieved context, based on the\nnumber of entities present in both `ground_truths` and `contexts` relative to the\nnumber of entities present in the `ground_truths` alone. Simply put, it is a measure\nof what fraction of entities are recalled from `ground_truths`. This metric is\nuseful in fact-based use cases like tourism help desk, historical QA, etc. This\nmetric can help evaluate the retrieval mechanism for entities, based on comparison\nwith entities present in `ground_truths`, because in cases where entities matter,\nwe need the `contexts` which cover them.\n\n### Formula\n\nTo compute this metric, we use two sets, $GE$ and $CE$, representing the set of\nentities present in `ground_truths` and set of entities present in `contexts`\nrespectively. We then take the number of elements in intersection of these sets and\ndivide it by the number of elements present in the $GE$, given by the formula:\n\n$$\n\\text{context entity recall} = \\frac{| CE \\cap GE |}{| GE |}\n$$\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `contexts` (List[str]): A list of text contexts which will be evaluated to make\nsure if they contain the entities present in the ground truth.\n- `ground_truth` (str): The ground truth text from which the entities will be\nextracted and compared with the entities in the `contexts`.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `contexts_column`, and `ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "contexts_column": "context_info"\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda row: [row[pred_col]["context_message"]],\n    "ground_truth_column": "my_ground_truth_col",\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "contexts_column": "contexts",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm", "retrieval_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.ContextPrecision": {
+        "description": 'Context Precision is a metric that evaluates whether all of the ground-truth\nrelevant items present in the contexts are ranked higher or not. Ideally all the\nrelevant chunks must appear at the top ranks. This metric is computed using the\n`question`, `ground_truth` and the `contexts`, with values ranging between 0 and 1,\nwhere higher scores indicate better precision.\n\n$$\n\\text{Context Precision@K} = \\frac{\\sum_{k=1}^{K} \\left( \\text{Precision@k} \\times v_k \\right)}{\\text{Total number of relevant items in the top } K \\text{ results}}\n$$\n$$\n\\text{Precision@k} = {\\text{true positives@k} \\over  (\\text{true positives@k} + \\text{false positives@k})}\n$$\n\nWhere $K$ is the total number of chunks in contexts and $v_k \\in \\{0, 1\\}$ is the\nrelevance indicator at rank $k$.\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `question` (str): The text query that was input into the model.\n- `contexts` (List[str]): A list of text contexts which are retrieved and which\nwill be evaluated to make sure they contain relevant info in the correct order.\n- `ground_truth` (str): The ground truth text to compare with the retrieved contexts.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `question_column`, `contexts_column`\nand `ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "question_column": "question",\n    "contexts_column": "context_info"\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda x: [x[pred_col]["context_message"]],\n    "ground_truth_column": "my_ground_truth_col",\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "contexts_column": "contexts",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": [
+            "text_qa",
+            "text_generation",
+            "text_summarization",
+            "text_classification",
+        ],
+        "tags": ["ragas", "llm", "retrieval_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.ContextRecall": {
+        "description": 'Context recall measures the extent to which the retrieved context aligns with the\nannotated answer, treated as the ground truth. It is computed based on the `ground\ntruth` and the `retrieved context`, and the values range between 0 and 1, with higher\nvalues indicating better performance.\n\nTo estimate context recall from the ground truth answer, each sentence in the ground\ntruth answer is analyzed to determine whether it can be attributed to the retrieved\ncontext or not. In an ideal scenario, all sentences in the ground truth answer\nshould be attributable to the retrieved context.\n\n\nThe formula for calculating context recall is as follows:\n$$\n\\text{context recall} = {|\\text{GT sentences that can be attributed to context}| \\over |\\text{Number of sentences in GT}|}\n$$\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `question` (str): The text query that was input into the model.\n- `contexts` (List[str]): A list of text contexts which are retrieved and which\nwill be evaluated to make sure they contain all items in the ground truth.\n- `ground_truth` (str): The ground truth text to compare with the retrieved contexts.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `question_column`, `contexts_column`\nand `ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "question_column": "question",\n    "contexts_column": "context_info"\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda x: [x[pred_col]["context_message"]],\n    "ground_truth_column": "my_ground_truth_col",\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "contexts_column": "contexts",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": [
+            "text_qa",
+            "text_generation",
+            "text_summarization",
+            "text_classification",
+        ],
+        "tags": ["ragas", "llm", "retrieval_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.ContextUtilization": {
+        "description": 'Assesses how effectively relevant context chunks are utilized in generating answers by evaluating their ranking\nwithin the provided contexts.\n\n### Purpose\n\nThe Context Utilization test evaluates whether all of the answer-relevant items present in the contexts are ranked\nhigher within the provided retrieval results. This metric is essential for assessing the performance of models,\nespecially those involved in tasks such as text QA, text generation, text summarization, and text classification.\n\n### Test Mechanism\n\nThe test calculates Context Utilization using the formula:\n\n$$\n\\text{Context Utilization@K} = \\frac{\\sum_{k=1}^{K} \\left( \\text{Precision@k} \\times v_k \\right)}{\\text{Total number of relevant items in the top } K \\text{ results}}\n$$\n$$\n\\text{Precision@k} = {\\text{true positives@k} \\over  (\\text{true positives@k} + \\text{false positives@k})}\n$$\n\nWhere $K$ is the total number of chunks in `contexts` and $v_k \\in \\{0, 1\\}$ is the relevance indicator at rank $k$.\n\n\nThis test uses columns for questions, contexts, and answers from the dataset and computes context utilization\nscores, generating a histogram and box plot for visualization.\n\n#### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `question` (str): The text query that was input into the model.\n- `contexts` (List[str]): A list of text contexts which are retrieved and which will be evaluated to\n   make sure they contain relevant info in the correct order.\n- `answer` (str): The llm-generated response for the input `question`.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `question_column`, `contexts_column`\nand `ground_truth_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "question_column": "question",\n    "contexts_column": "context_info"\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda x: [x[pred_col]["context_message"]],\n    "ground_truth_column": "my_ground_truth_col",\n}\n```\n\n### Signs of High Risk\n\n- Very low mean or median context utilization scores, indicating poor usage of retrieved contexts.\n- High standard deviation, suggesting inconsistent model performance.\n- Low or minimal max scores, pointing to the model\'s failure to rank relevant contexts at top positions.\n\n### Strengths\n\n- Quantifies the rank of relevant context chunks in generating responses.\n- Provides clear visualizations through histograms and box plots for ease of interpretation.\n- Adapts to different dataset schema by allowing configurable column names.\n\n### Limitations\n\n- Assumes the relevance of context chunks is binary and may not capture nuances of partial relevance.\n- Requires proper context retrieval to be effective; irrelevant context chunks can skew the results.\n- Dependent on large sample sizes to provide stable and reliable estimates of utilization performance.',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "question_column": "question",
+            "contexts_column": "contexts",
+            "answer_column": "answer",
+        },
+        "tasks": [
+            "text_qa",
+            "text_generation",
+            "text_summarization",
+            "text_classification",
+        ],
+        "tags": ["ragas", "llm", "retrieval_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.Faithfulness": {
+        "description": 'Evaluates the faithfulness of the generated answers with respect to retrieved contexts.\n\nThis metric uses a judge LLM to measure the factual consistency of the generated answer\nagainst the given context(s). It is calculated using the generated text `answer` from\nthe LLM and the retrieved `contexts` which come from some RAG process. The score is\na value between 0 and 1, where a higher score indicates that the generated answer is\nmore faithful to the given context(s).\n\nThe generated answer is regarded as faithful if all the claims that are made in the\nanswer can be inferred from the given context. To calculate this a set of claims from\nthe generated answer is first identified. Then each one of these claims are cross checked\nwith given context to determine if it can be inferred from given context or not. The\nfaithfulness score formula is as follows:\n\n$$\n\\text{Faithfulness score} = {|\\text{Number of claims in the generated answer that can be inferred from given context}| \\over |\\text{Total number of claims in the generated answer}|}\n$$\n\n### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `contexts` (List[str]): A list of text contexts which are retrieved to generate\nthe answer.\n- `answer` (str): The response generated by the model which will be evaluated for\nfaithfulness against the given contexts.\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `contexts_column` and `answer_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "contexts_column": "context_info"\n    "answer_column": "my_answer_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "answer_column": f"{pred_col}.answer",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda row: [row[pred_col]["context_message"]],\n    "answer_column": lambda row: "\\n\\n".join(row[pred_col]["messages"]),\n}\n```',
+        "required_inputs": ["dataset"],
+        "default_params": {"answer_column": "answer", "contexts_column": "contexts"},
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm", "rag_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.ragas.NoiseSensitivity": {
+        "description": 'Assesses the sensitivity of a Large Language Model (LLM) to noise in retrieved context by measuring how often it\ngenerates incorrect responses.\n\n### Purpose\n\nThe Noise Sensitivity test aims to measure how sensitive an LLM is to irrelevant or noisy information within the\ncontextual data used to generate its responses. A lower noise sensitivity score suggests better model robustness in\ngenerating accurate answers from given contexts.\n\n### Test Mechanism\n\nThis test evaluates the model\'s answers by comparing the claims made in the generated response against the ground\ntruth and the retrieved context. The noise sensitivity score is calculated as:\n\n$$\n\\text{noise sensitivity} = {|\\text{Number of incorrect claims in answer}| \\over |\\text{Number of total claims in answer}|}\n$$\n\nThe formula computes the fraction of incorrect claims to the total claims in the answer, using a dataset where\n\'answer\', \'context\', and \'ground_truth\' columns are specified.\n\n#### Configuring Columns\n\nThis metric requires the following columns in your dataset:\n\n- `contexts` (List[str]): A list of text contexts which are retrieved to generate\nthe answer.\n- `answer` (str): The response generated by the model\n- `ground_truth` (str): The "correct" answer to the question\n\nIf the above data is not in the appropriate column, you can specify different column\nnames for these fields using the parameters `contexts_column` and `answer_column`.\n\nFor example, if your dataset has this data stored in different columns, you can\npass the following parameters:\n```python\n{\n    "contexts_column": "context_info"\n    "answer_column": "my_answer_col",\n}\n```\n\nIf the data is stored as a dictionary in another column, specify the column and key\nlike this:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": f"{pred_col}.contexts",\n    "answer_column": f"{pred_col}.answer",\n}\n```\n\nFor more complex situations, you can use a function to extract the data:\n```python\npred_col = dataset.prediction_column(model)\nparams = {\n    "contexts_column": lambda row: [row[pred_col]["context_message"]],\n    "answer_column": lambda row: "\\n\\n".join(row[pred_col]["messages"]),\n}\n\n### Signs of High Risk\n\n- High noise sensitivity scores across multiple samples.\n- Significant deviation between mean and median noise sensitivity scores.\n- High standard deviation indicating inconsistency in the model\'s performance.\n\n### Strengths\n\n- Provides a quantitative measure of how well the LLM handles noisy or irrelevant context.\n- Easy integration and configuration using column parameters.\n- Utilizes both histogram and box plot visualizations to analyze score distribution.\n\n### Limitations\n\n- Requires accurate ground truth that aligns with the generated answers.\n- Assumes the context provided is sufficiently granular to assess noise sensitivity.\n- Primarily applicable to tasks like text QA, text generation, and text summarization where contextual relevance is\ncritical.',
+        "required_inputs": ["dataset"],
+        "default_params": {
+            "answer_column": "answer",
+            "contexts_column": "contexts",
+            "ground_truth_column": "ground_truth",
+        },
+        "tasks": ["text_qa", "text_generation", "text_summarization"],
+        "tags": ["ragas", "llm", "rag_performance"],
+        "required_dependencies": ["ragas"],
+        "extra": "llm",
+    },
+    "validmind.model_validation.sklearn.AdjustedMutualInformation": {
+        "description": "Evaluates clustering model performance by measuring mutual information between true and predicted labels, adjusting\nfor chance.\n\n### Purpose\n\nThe purpose of this metric (Adjusted Mutual Information) is to evaluate the performance of a machine learning\nmodel, more specifically, a clustering model. It measures the mutual information between the true labels and the\nones predicted by the model, adjusting for chance.\n\n### Test Mechanism\n\nThe Adjusted Mutual Information (AMI) uses sklearn's `adjusted_mutual_info_score` function. This function\ncalculates the mutual information between the true labels and the ones predicted while correcting for the chance\ncorrelation expected due to random label assignments. This test requires the model, the training dataset, and the\ntest dataset as inputs.\n\n### Signs of High Risk\n\n- Low Adjusted Mutual Information Score: This score ranges between 0 and 1. A low score (closer to 0) can indicate\npoor model performance as the predicted labels do not align well with the true labels.\n- In case of high-dimensional data, if the algorithm shows high scores, this could also be a potential risk as AMI\nmay not perform reliably.\n\n### Strengths\n\n- The AMI metric takes into account the randomness of the predicted labels, which makes it more robust than the\nsimple Mutual Information.\n- The scale of AMI is not dependent on the sizes of the clustering, allowing for comparability between different\ndatasets or models.\n- Good for comparing the output of clustering algorithms where the number of clusters is not known a priori.\n\n### Limitations\n\n- Adjusted Mutual Information does not take into account the continuous nature of some data. As a result, it may\nnot be the best choice for regression or other continuous types of tasks.\n- AMI has the drawback of being biased towards clusterings with a higher number of clusters.\n- In comparison to other metrics, AMI can be slower to compute.\n- The interpretability of the score can be complex as it depends on the understanding of information theory\nconcepts.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.AdjustedRandIndex": {
+        "description": "Measures the similarity between two data clusters using the Adjusted Rand Index (ARI) metric in clustering machine\nlearning models.\n\n### Purpose\n\nThe Adjusted Rand Index (ARI) metric is intended to measure the similarity between two data clusters. This metric\nis specifically used for clustering machine learning models to quantify how well the model is clustering and\nproducing data groups. It involves comparing the model's produced clusters against the actual (true) clusters found\nin the dataset.\n\n### Test Mechanism\n\nThe Adjusted Rand Index (ARI) is calculated using the `adjusted_rand_score` method from the `sklearn.metrics`\nmodule in Python. The test requires inputs including the model itself and the model's training and test datasets.\nThe model's computed clusters and the true clusters are compared, and the similarities are measured to compute the\nARI.\n\n### Signs of High Risk\n\n- If the ARI is close to zero, it signifies that the model's cluster assignments are random and do not match the\nactual dataset clusters, indicating a high risk.\n- An ARI of less than zero indicates that the model's clustering performance is worse than random.\n\n### Strengths\n\n- ARI is normalized and provides a consistent metric between -1 and +1, irrespective of raw cluster sizes or\ndataset size variations.\n- It does not require a ground truth for computation, making it ideal for unsupervised learning model evaluations.\n- It penalizes for false positives and false negatives, providing a robust measure of clustering quality.\n\n### Limitations\n\n- In real-world situations, true clustering is often unknown, which can hinder the practical application of the ARI.\n- The ARI requires all individual data instances to be independent, which may not always hold true.\n- It may be difficult to interpret the implications of an ARI score without context or a benchmark, as it is\nheavily dependent on the characteristics of the dataset used.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ClassifierPerformance": {
+        "description": "Evaluates performance of binary or multiclass classification models using precision, recall, F1-Score, accuracy,\nand ROC AUC scores.\n\n### Purpose\n\nThe Classifier Performance test is designed to evaluate the performance of Machine Learning classification models.\nIt accomplishes this by computing precision, recall, F1-Score, and accuracy, as well as the ROC AUC (Receiver\noperating characteristic - Area under the curve) scores, thereby providing a comprehensive analytic view of the\nmodels' performance. The test is adaptable, handling binary and multiclass models equally effectively.\n\n### Test Mechanism\n\nThe test produces a report that includes precision, recall, F1-Score, and accuracy, by leveraging the\n`classification_report` from scikit-learn's metrics module. For multiclass models, macro and weighted averages for\nthese scores are also calculated. Additionally, the ROC AUC scores are calculated and included in the report using\nthe `multiclass_roc_auc_score` function. The outcome of the test (report format) differs based on whether the model\nis binary or multiclass.\n\n### Signs of High Risk\n\n- Low values for precision, recall, F1-Score, accuracy, and ROC AUC, indicating poor performance.\n- Imbalance in precision and recall scores.\n- A low ROC AUC score, especially scores close to 0.5 or lower, suggesting a failing model.\n\n### Strengths\n\n- Versatile, capable of assessing both binary and multiclass models.\n- Utilizes a variety of commonly employed performance metrics, offering a comprehensive view of model performance.\n- The use of ROC-AUC as a metric is beneficial for evaluating unbalanced datasets.\n\n### Limitations\n\n- Assumes correctly identified labels for binary classification models.\n- Specifically designed for classification models and not suitable for regression models.\n- May provide limited insights if the test dataset does not represent real-world scenarios adequately.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"average": "macro"},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ClusterCosineSimilarity": {
+        "description": "Measures the intra-cluster similarity of a clustering model using cosine similarity.\n\n### Purpose\n\nThe purpose of this metric is to measure how similar the data points within each cluster of a clustering model are.\nThis is done using cosine similarity, which compares the multi-dimensional direction (but not magnitude) of data\nvectors. From a Model Risk Management perspective, this metric is used to quantitatively validate that clusters\nformed by a model have high intra-cluster similarity.\n\n### Test Mechanism\n\nThis test works by first extracting the true and predicted clusters of the model's training data. Then, it computes\nthe centroid (average data point) of each cluster. Next, it calculates the cosine similarity between each data\npoint within a cluster and its respective centroid. Finally, it outputs the mean cosine similarity of each cluster,\nhighlighting how similar, on average, data points in a cluster are to the cluster's centroid.\n\n### Signs of High Risk\n\n- Low mean cosine similarity for one or more clusters: If the mean cosine similarity is low, the data points within\nthe respective cluster have high variance in their directions. This can be indicative of poor clustering,\nsuggesting that the model might not be suitably separating the data into distinct patterns.\n- High disparity between mean cosine similarity values across clusters: If there's a significant difference in mean\ncosine similarity across different clusters, this could indicate imbalance in how the model forms clusters.\n\n### Strengths\n\n- Cosine similarity operates in a multi-dimensional space, making it effective for measuring similarity in high\ndimensional datasets, typical for many machine learning problems.\n- It provides an agnostic view of the cluster performance by only considering the direction (and not the magnitude)\nof each vector.\n- This metric is not dependent on the scale of the variables, making it equally effective on different scales.\n\n### Limitations\n\n- Cosine similarity does not consider magnitudes (i.e. lengths) of vectors, only their direction. This means it may\noverlook instances where clusters have been adequately separated in terms of magnitude.\n- This method summarily assumes that centroids represent the average behavior of data points in each cluster. This\nmight not always be true, especially in clusters with high amounts of variance or non-spherical shapes.\n- It primarily works with continuous variables and is not suitable for binary or categorical variables.\n- Lastly, although rare, perfect perpendicular vectors (cosine similarity = 0) could be within the same cluster,\nwhich may give an inaccurate representation of a 'bad' cluster due to low cosine similarity score.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ClusterPerformance": {
+        "description": "Evaluates and compares a clustering model's performance on training and testing datasets using multiple defined\nmetrics.\n\n### Purpose\n\nThe Cluster Performance test evaluates the performance of a clustering model on both the training and testing\ndatasets. It assesses how well the model defines, forms, and distinguishes clusters of data.\n\n### Test Mechanism\n\nThe test mechanism involves predicting the clusters of the training and testing datasets using the clustering\nmodel. After prediction, performance metrics defined in the `metric_info()` method are calculated against the true\nlabels of the datasets. The results for each metric for both datasets are then collated and returned in a\nsummarized table form listing each metric along with its corresponding train and test values.\n\n### Signs of High Risk\n\n- High discrepancy between the performance metric values on the training and testing datasets.\n- Low performance metric values on both the training and testing datasets.\n- Consistent deterioration of performance across different metrics.\n\n### Strengths\n\n- Tests the model's performance on both training and testing datasets, helping to identify overfitting or\nunderfitting.\n- Allows for the use of a broad range of performance metrics, providing a comprehensive evaluation.\n- Returns a summarized table, making it easy to compare performance across different metrics and datasets.\n\n### Limitations\n\n- The `metric_info()` method needs to be properly overridden in a subclass and metrics must be manually defined.\n- The test may not capture the model's performance well if clusters are not well-separated or the model struggles\nwith certain clusters.\n- Does not consider the computational and time complexity of the model.\n- Binary comparison (train and test) might not capture performance changes under different circumstances or dataset\ncategories.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ClusterPerformanceMetrics": {
+        "description": "Evaluates the performance of clustering machine learning models using multiple established metrics.\n\n### Purpose\n\nThe `ClusterPerformanceMetrics` test is used to assess the performance and validity of clustering machine learning\nmodels. It evaluates homogeneity, completeness, V measure score, the Adjusted Rand Index, the Adjusted Mutual\nInformation, and the Fowlkes-Mallows score of the model. These metrics provide a holistic understanding of the\nmodel's ability to accurately form clusters of the given dataset.\n\n### Test Mechanism\n\nThe `ClusterPerformanceMetrics` test runs a clustering ML model over a given dataset and then calculates six\nmetrics using the Scikit-learn metrics computation functions: Homogeneity Score, Completeness Score, V Measure,\nAdjusted Rand Index (ARI), Adjusted Mutual Information (AMI), and Fowlkes-Mallows Score. It then returns the result\nas a summary, presenting the metric values for both training and testing datasets.\n\n### Signs of High Risk\n\n- Low Homogeneity Score: Indicates that the clusters formed contain a variety of classes, resulting in less pure\nclusters.\n- Low Completeness Score: Suggests that class instances are scattered across multiple clusters rather than being\ngathered in a single cluster.\n- Low V Measure: Reports a low overall clustering performance.\n- ARI close to 0 or Negative: Implies that clustering results are random or disagree with the true labels.\n- AMI close to 0: Means that clustering labels are random compared with the true labels.\n- Low Fowlkes-Mallows score: Signifies less precise and poor clustering performance in terms of precision and\nrecall.\n\n### Strengths\n\n- Provides a comprehensive view of clustering model performance by examining multiple clustering metrics.\n- Uses established and widely accepted metrics from scikit-learn, providing reliability in the results.\n- Able to provide performance metrics for both training and testing datasets.\n- Clearly defined and human-readable descriptions of each score make it easy to understand what each score\nrepresents.\n\n### Limitations\n\n- Only applies to clustering models; not suitable for other types of machine learning models.\n- Does not test for overfitting or underfitting in the clustering model.\n- All the scores rely on ground truth labels, the absence or inaccuracy of which can lead to misleading results.\n- Does not consider aspects like computational efficiency of the model or its capability to handle high dimensional\ndata.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.CompletenessScore": {
+        "description": "Evaluates a clustering model's capacity to categorize instances from a single class into the same cluster.\n\n### Purpose\n\nThe Completeness Score metric is used to assess the performance of clustering models. It measures the extent to\nwhich all the data points that are members of a given class are elements of the same cluster. The aim is to\ndetermine the capability of the model to categorize all instances from a single class into the same cluster.\n\n### Test Mechanism\n\nThis test takes three inputs, a model and its associated training and testing datasets. It invokes the\n`completeness_score` function from the sklearn library on the labels predicted by the model. High scores indicate\nthat data points from the same class generally appear in the same cluster, while low scores suggest the opposite.\n\n### Signs of High Risk\n\n- Low completeness score: This suggests that the model struggles to group instances from the same class into one\ncluster, indicating poor clustering performance.\n\n### Strengths\n\n- The Completeness Score provides an effective method for assessing the performance of a clustering model,\nspecifically its ability to group class instances together.\n- This test metric conveniently relies on the capabilities provided by the sklearn library, ensuring consistent and\nreliable test results.\n\n### Limitations\n\n- This metric only evaluates a specific aspect of clustering, meaning it may not provide a holistic or complete\nview of the model's performance.\n- It cannot assess the effectiveness of the model in differentiating between separate classes, as it is solely\nfocused on how well data points from the same class are grouped.\n- The Completeness Score only applies to clustering models; it cannot be used for other types of machine learning\nmodels.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ConfusionMatrix": {
+        "description": "Evaluates and visually represents the classification ML model's predictive performance using a Confusion Matrix\nheatmap.\n\n### Purpose\n\nThe Confusion Matrix tester is designed to assess the performance of a classification Machine Learning model. This\nperformance is evaluated based on how well the model is able to correctly classify True Positives, True Negatives,\nFalse Positives, and False Negatives - fundamental aspects of model accuracy.\n\n### Test Mechanism\n\nThe mechanism used involves taking the predicted results (`y_test_predict`) from the classification model and\ncomparing them against the actual values (`y_test_true`). A confusion matrix is built using the unique labels\nextracted from `y_test_true`, employing scikit-learn's metrics. The matrix is then visually rendered with the help\nof Plotly's `create_annotated_heatmap` function. A heatmap is created which provides a two-dimensional graphical\nrepresentation of the model's performance, showcasing distributions of True Positives (TP), True Negatives (TN),\nFalse Positives (FP), and False Negatives (FN).\n\n### Signs of High Risk\n\n- High numbers of False Positives (FP) and False Negatives (FN), depicting that the model is not effectively\nclassifying the values.\n- Low numbers of True Positives (TP) and True Negatives (TN), implying that the model is struggling with correctly\nidentifying class labels.\n\n### Strengths\n\n- It provides a simplified yet comprehensive visual snapshot of the classification model's predictive performance.\n- It distinctly brings out True Positives (TP), True Negatives (TN), False Positives (FP), and False Negatives\n(FN), thus making it easier to focus on potential areas of improvement.\n- The matrix is beneficial in dealing with multi-class classification problems as it can provide a simple view of\ncomplex model performances.\n- It aids in understanding the different types of errors that the model could potentially make, as it provides\nin-depth insights into Type-I and Type-II errors.\n\n### Limitations\n\n- In cases of unbalanced classes, the effectiveness of the confusion matrix might be lessened. It may wrongly\ninterpret the accuracy of a model that is essentially just predicting the majority class.\n- It does not provide a single unified statistic that could evaluate the overall performance of the model.\nDifferent aspects of the model's performance are evaluated separately instead.\n- It mainly serves as a descriptive tool and does not offer the capability for statistical hypothesis testing.\n- Risks of misinterpretation exist because the matrix doesn't directly provide precision, recall, or F1-score data.\nThese metrics have to be computed separately.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.FeatureImportance": {
+        "description": "Compute feature importance scores for a given model and generate a summary table\nwith the top important features.\n\n### Purpose\n\nThe Feature Importance Comparison test is designed to compare the feature importance scores for different models\nwhen applied to various datasets. By doing so, it aims to identify the most impactful features and assess the\nconsistency of feature importance across models.\n\n### Test Mechanism\n\nThis test works by iterating through each dataset-model pair and calculating permutation feature importance (PFI)\nscores. It then generates a summary table containing the top `num_features` important features for each model. The\nprocess involves:\n\n- Extracting features and target data from each dataset.\n- Computing PFI scores using `sklearn.inspection.permutation_importance`.\n- Sorting and selecting the top features based on their importance scores.\n- Compiling these features into a summary table for comparison.\n\n### Signs of High Risk\n\n- Key features expected to be important are ranked low, indicating potential issues with model training or data\nquality.\n- High variance in feature importance scores across different models, suggesting instability in feature selection.\n\n### Strengths\n\n- Provides a clear comparison of the most important features for each model.\n- Uses permutation importance, which is a model-agnostic method and can be applied to any estimator.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with `x_df` and `y_df` methods to access\nfeature and target data.\n- Requires that `model.model` is compatible with `sklearn.inspection.permutation_importance`.\n- The function's output is dependent on the number of features specified by `num_features`, which defaults to 3 but\ncan be adjusted.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"num_features": 3},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_explainability", "sklearn"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.FowlkesMallowsScore": {
+        "description": "Evaluates the similarity between predicted and actual cluster assignments in a model using the Fowlkes-Mallows\nscore.\n\n### Purpose\n\nThe FowlkesMallowsScore is a performance metric used to validate clustering algorithms within machine learning\nmodels. The score intends to evaluate the matching grade between two clusters. It measures the similarity between\nthe predicted and actual cluster assignments, thus gauging the accuracy of the model's clustering capability.\n\n### Test Mechanism\n\nThe FowlkesMallowsScore method applies the `fowlkes_mallows_score` function from the `sklearn` library to evaluate\nthe model's accuracy in clustering different types of data. The test fetches the datasets from the model's training\nand testing datasets as inputs then compares the resulting clusters against the previously known clusters to obtain\na score. A high score indicates a better clustering performance by the model.\n\n### Signs of High Risk\n\n- A low Fowlkes-Mallows score (near zero): This indicates that the model's clustering capability is poor and the\nalgorithm isn't properly grouping data.\n- Inconsistently low scores across different datasets: This may indicate that the model's clustering performance is\nnot robust and the model may fail when applied to unseen data.\n\n### Strengths\n\n- The Fowlkes-Mallows score is a simple and effective method for evaluating the performance of clustering\nalgorithms.\n- This metric takes into account both precision and recall in its calculation, therefore providing a balanced and\ncomprehensive measure of model performance.\n- The Fowlkes-Mallows score is non-biased meaning it treats False Positives and False Negatives equally.\n\n### Limitations\n\n- As a pairwise-based method, this score can be computationally intensive for large datasets and can become\nunfeasible as the size of the dataset increases.\n- The Fowlkes-Mallows score works best with balanced distribution of samples across clusters. If this condition is\nnot met, the score can be skewed.\n- It does not handle mismatching numbers of clusters between the true and predicted labels. As such, it may return\nmisleading results if the predicted labels suggest a different number of clusters than what is in the true labels.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.HomogeneityScore": {
+        "description": "Assesses clustering homogeneity by comparing true and predicted labels, scoring from 0 (heterogeneous) to 1\n(homogeneous).\n\n### Purpose\n\nThe Homogeneity Score encapsulated in this performance test is used to measure the homogeneity of the clusters\nformed by a machine learning model. In simple terms, a clustering result satisfies homogeneity if all of its\nclusters contain only points which are members of a single class.\n\n### Test Mechanism\n\nThis test uses the `homogeneity_score` function from the `sklearn.metrics` library to compare the ground truth\nclass labels of the training and testing sets with the labels predicted by the given model. The returned score is a\nmetric of the clustering accuracy, and ranges from 0.0 to 1.0, with 1.0 denoting the highest possible degree of\nhomogeneity.\n\n### Signs of High Risk\n\n- A score close to 0: This denotes that clusters are highly heterogenous and points within the same cluster might\nnot belong to the same class.\n- A significantly lower score for testing data compared to the score for training data: This can indicate\noverfitting, where the model has learned to perfectly match the training data but fails to perform well on unseen\ndata.\n\n### Strengths\n\n- It provides a simple quantitative measure of the degree to which clusters contain points from only one class.\n- Useful for validating clustering solutions where the ground truth — class membership of points — is known.\n- It's agnostic to the absolute labels, and cares only that the points within the same cluster have the same class\nlabel.\n\n### Limitations\n\n- The Homogeneity Score is not useful for clustering solutions where the ground truth labels are not known.\n- It doesn’t work well with differently sized clusters since it gives predominance to larger clusters.\n- The score does not address the actual number of clusters formed, or the evenness of cluster sizes. It only checks\nthe homogeneity within the given clusters created by the model.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.HyperParametersTuning": {
+        "description": 'Exerts exhaustive grid search to identify optimal hyperparameters for the model, improving performance.\n\n### Purpose:\n\nThe "HyperParametersTuning" metric aims to find the optimal set of hyperparameters for a given model. The test is\ndesigned to enhance the performance of the model by determining the best configuration of hyperparameters. The\nparameters that are being optimized are defined by the parameter grid provided to the metric.\n\n### Test Mechanism:\n\nThe HyperParametersTuning test employs a grid search mechanism using the GridSearchCV function from the\nscikit-learn library. The grid search algorithm systematically works through multiple combinations of parameter\nvalues, cross-validating to determine which combination gives the best model performance. The chosen model and the\nparameter grid passed for tuning are necessary inputs. Once the grid search is complete, the test caches and\nreturns details of the best model and its associated parameters.\n\n### Signs of High Risk:\n\n- The test raises a SkipTestError if the param_grid is not supplied, indicating a lack of specific parameters to\noptimize, which can be risky for certain model types reliant on parameter tuning.\n- Poorly chosen scoring metrics that do not align well with the specific model or problem at hand could reflect\npotential risks or failures in achieving optimal performance.\n\n### Strengths:\n\n- Provides a comprehensive exploration mechanism to identify the best set of hyperparameters for the supplied\nmodel, thereby enhancing its performance.\n- Implements GridSearchCV, simplifying and automating the time-consuming task of hyperparameter tuning.\n\n### Limitations:\n\n- The grid search algorithm can be computationally expensive, especially with large datasets or complex models, and\ncan be time-consuming as it tests all possible combinations within the specified parameter grid.\n- The effectiveness of the tuning is heavily dependent on the quality of data and only accepts datasets with\nnumerical or ordered categories.\n- Assumes that the same set of hyperparameters is optimal for all problem sets, which may not be true in every\nscenario.\n- There\'s a potential risk of overfitting the model if the training set is not representative of the data that the\nmodel will be applied to.',
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"param_grid": None, "scoring": None},
+        "tasks": ["classification", "clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.KMeansClustersOptimization": {
+        "description": "Optimizes the number of clusters in K-means models using Elbow and Silhouette methods.\n\n### Purpose\n\nThis metric is used to optimize the number of clusters used in K-means clustering models. It intends to measure and\nevaluate the optimal number of clusters by leveraging two methodologies, namely the Elbow method and the Silhouette\nmethod. This is crucial as an inappropriate number of clusters can either overly simplify or overcomplicate the\nstructure of the data, thereby undermining the effectiveness of the model.\n\n### Test Mechanism\n\nThe test mechanism involves iterating over a predefined range of cluster numbers and applying both the Elbow method\nand the Silhouette method. The Elbow method computes the sum of the minimum euclidean distances between data points\nand their respective cluster centers (distortion). This value decreases as the number of clusters increases; the\noptimal number is typically at the 'elbow' point where the decrease in distortion becomes less pronounced.\nMeanwhile, the Silhouette method calculates the average silhouette score for each data point in the dataset,\nproviding a measure of how similar each item is to its own cluster compared to other clusters. The optimal number\nof clusters under this method is the one that maximizes the average silhouette score. The results of both methods\nare plotted for visual inspection.\n\n### Signs of High Risk\n\n- A high distortion value or a low silhouette average score for the optimal number of clusters.\n- No clear 'elbow' point or plateau observed in the distortion plot, or a uniformly low silhouette average score\nacross different numbers of clusters, suggesting the data is not amenable to clustering.\n- An optimal cluster number that is unreasonably high or low, suggestive of overfitting or underfitting,\nrespectively.\n\n### Strengths\n\n- Provides both a visual and quantitative method to determine the optimal number of clusters.\n- Leverages two different methods (Elbow and Silhouette), thereby affording robustness and versatility in assessing\nthe data's clusterability.\n- Facilitates improved model performance by allowing for an informed selection of the number of clusters.\n\n### Limitations\n\n- Assumes that a suitable number of clusters exists in the data, which may not always be true, especially for\ncomplex or noisy data.\n- Both methods may fail to provide definitive answers when the data lacks clear cluster structures.\n- Might not be straightforward to determine the 'elbow' point or maximize the silhouette average score, especially\nin larger and complicated datasets.\n- Assumes spherical clusters (due to using the Euclidean distance in the Elbow method), which might not align with\nthe actual structure of the data.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"n_clusters": None},
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance", "kmeans"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.MinimumAccuracy": {
+        "description": "Checks if the model's prediction accuracy meets or surpasses a specified threshold.\n\n### Purpose\n\nThe Minimum Accuracy test’s objective is to verify whether the model's prediction accuracy on a specific dataset\nmeets or surpasses a predetermined minimum threshold. Accuracy, which is simply the ratio of correct predictions to\ntotal predictions, is a key metric for evaluating the model's performance. Considering binary as well as multiclass\nclassifications, accurate labeling becomes indispensable.\n\n### Test Mechanism\n\nThe test mechanism involves contrasting the model's accuracy score with a preset minimum threshold value, with the\ndefault being 0.7. The accuracy score is computed utilizing sklearn’s `accuracy_score` method, where the true\nlabels `y_true` and predicted labels `class_pred` are compared. If the accuracy score is above the threshold, the\ntest receives a passing mark. The test returns the result along with the accuracy score and threshold used for the\ntest.\n\n### Signs of High Risk\n\n- Model fails to achieve or surpass the predefined score threshold.\n- Persistent scores below the threshold, indicating a high risk of inaccurate predictions.\n\n### Strengths\n\n- Simplicity, presenting a straightforward measure of holistic model performance across all classes.\n- Particularly advantageous when classes are balanced.\n- Versatile, as it can be implemented on both binary and multiclass classification tasks.\n\n### Limitations\n\n- Misleading accuracy scores when classes in the dataset are highly imbalanced.\n- Favoritism towards the majority class, giving an inaccurate perception of model performance.\n- Inability to measure the model's precision, recall, or capacity to manage false positives or false negatives.\n- Focused on overall correctness and may not be sufficient for all types of model analytics.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"min_threshold": 0.7},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.MinimumF1Score": {
+        "description": "Assesses if the model's F1 score on the validation set meets a predefined minimum threshold, ensuring balanced\nperformance between precision and recall.\n\n### Purpose\n\nThe main objective of this test is to ensure that the F1 score, a balanced measure of precision and recall, of the\nmodel meets or surpasses a predefined threshold on the validation dataset. The F1 score is highly useful for\ngauging model performance in classification tasks, especially in cases where the distribution of positive and\nnegative classes is skewed.\n\n### Test Mechanism\n\nThe F1 score for the validation dataset is computed through scikit-learn's metrics in Python. The scoring mechanism\ndiffers based on the classification problem: for multi-class problems, macro averaging is used, and for binary\nclassification, the built-in `f1_score` calculation is used. The obtained F1 score is then assessed against the\npredefined minimum F1 score that is expected from the model.\n\n### Signs of High Risk\n\n- If a model returns an F1 score that is less than the established threshold, it is regarded as high risk.\n- A low F1 score might suggest that the model is not finding an optimal balance between precision and recall,\nfailing to effectively identify positive classes while minimizing false positives.\n\n### Strengths\n\n- Provides a balanced measure of a model's performance by accounting for both false positives and false negatives.\n- Particularly advantageous in scenarios with imbalanced class distribution, where accuracy can be misleading.\n- Flexibility in setting the threshold value allows tailored minimum acceptable performance standards.\n\n### Limitations\n\n- May not be suitable for all types of models and machine learning tasks.\n- The F1 score assumes an equal cost for false positives and false negatives, which may not be true in some\nreal-world scenarios.\n- Practitioners might need to rely on other metrics such as precision, recall, or the ROC-AUC score that align more\nclosely with specific requirements.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"min_threshold": 0.5},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.MinimumROCAUCScore": {
+        "description": "Validates model by checking if the ROC AUC score meets or surpasses a specified threshold.\n\n### Purpose\n\nThe Minimum ROC AUC Score test is used to determine the model's performance by ensuring that the Receiver Operating\nCharacteristic Area Under the Curve (ROC AUC) score on the validation dataset meets or exceeds a predefined\nthreshold. The ROC AUC score indicates how well the model can distinguish between different classes, making it a\ncrucial measure in binary and multiclass classification tasks.\n\n### Test Mechanism\n\nThis test implementation calculates the multiclass ROC AUC score on the true target values and the model's\npredictions. The test converts the multi-class target variables into binary format using `LabelBinarizer` before\ncomputing the score. If this ROC AUC score is higher than the predefined threshold (defaulted to 0.5), the test\npasses; otherwise, it fails. The results, including the ROC AUC score, the threshold, and whether the test passed\nor failed, are then stored in a `ThresholdTestResult` object.\n\n### Signs of High Risk\n\n- A high risk or failure in the model's performance as related to this metric would be represented by a low ROC AUC\nscore, specifically any score lower than the predefined minimum threshold. This suggests that the model is\nstruggling to distinguish between different classes effectively.\n\n### Strengths\n\n- The test considers both the true positive rate and false positive rate, providing a comprehensive performance\nmeasure.\n- ROC AUC score is threshold-independent meaning it measures the model's quality across various classification\nthresholds.\n- Works robustly with binary as well as multi-class classification problems.\n\n### Limitations\n\n- ROC AUC may not be useful if the class distribution is highly imbalanced; it could perform well in terms of AUC\nbut still fail to predict the minority class.\n- The test does not provide insight into what specific aspects of the model are causing poor performance if the ROC\nAUC score is unsatisfactory.\n- The use of macro average for multiclass ROC AUC score implies equal weightage to each class, which might not be\nappropriate if the classes are imbalanced.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"min_threshold": 0.5},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ModelsPerformanceComparison": {
+        "description": "Evaluates and compares the performance of multiple Machine Learning models using various metrics like accuracy,\nprecision, recall, and F1 score.\n\n### Purpose\n\nThe Models Performance Comparison test aims to evaluate and compare the performance of various Machine Learning\nmodels using test data. It employs multiple metrics such as accuracy, precision, recall, and the F1 score, among\nothers, to assess model performance and assist in selecting the most effective model for the designated task.\n\n### Test Mechanism\n\nThe test employs Scikit-learn’s performance metrics to evaluate each model's performance for both binary and\nmulticlass classification tasks. To compare performances, the test runs each model against the test dataset, then\nproduces a comprehensive classification report. This report includes metrics such as accuracy, precision, recall,\nand the F1 score. Based on whether the task at hand is binary or multiclass classification, it calculates metrics\nfor all the classes and their weighted averages, macro averages, and per-class metrics. The test will be skipped if\nno models are supplied.\n\n### Signs of High Risk\n\n- Low scores in accuracy, precision, recall, and F1 metrics indicate a potentially high risk.\n- A low area under the Receiver Operating Characteristic (ROC) curve (roc_auc score) is another possible indicator\nof high risk.\n- If the metrics scores are significantly lower than alternative models, this might suggest a high risk of failure.\n\n### Strengths\n\n- Provides a simple way to compare the performance of multiple models, accommodating both binary and multiclass\nclassification tasks.\n- Offers a holistic view of model performance through a comprehensive report of key performance metrics.\n- The inclusion of the ROC AUC score is advantageous, as this robust performance metric can effectively handle\nclass imbalance issues.\n\n### Limitations\n\n- May not be suitable for more complex performance evaluations that consider factors such as prediction speed,\ncomputational cost, or business-specific constraints.\n- The test's reliability depends on the provided test dataset; hence, the selected models' performance could vary\nwith unseen data or changes in the data distribution.\n- The ROC AUC score might not be as meaningful or easily interpretable for multilabel/multiclass tasks.",
+        "required_inputs": ["dataset", "models"],
+        "default_params": {"average": "macro"},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+            "model_comparison",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.OverfitDiagnosis": {
+        "description": "Assesses potential overfitting in a model's predictions, identifying regions where performance between training and\ntesting sets deviates significantly.\n\n### Purpose\n\nThe Overfit Diagnosis test aims to identify areas in a model's predictions where there is a significant difference\nin performance between the training and testing sets. This test helps to pinpoint specific regions or feature\nsegments where the model may be overfitting.\n\n### Test Mechanism\n\nThis test compares the model's performance on training versus test data, grouped by feature columns. It calculates\nthe difference between the training and test performance for each group and identifies regions where this\ndifference exceeds a specified threshold:\n\n- The test works for both classification and regression models.\n- It defaults to using the AUC metric for classification models and the MSE metric for regression models.\n- The threshold for identifying overfitting regions is set to 0.04 by default.\n- The test calculates the performance metrics for each feature segment and plots regions where the performance gap\nexceeds the threshold.\n\n### Signs of High Risk\n\n- Significant gaps between training and test performance metrics for specific feature segments.\n- Multiple regions with performance gaps exceeding the defined threshold.\n- Higher than expected differences in predicted versus actual values in the test set compared to the training set.\n\n### Strengths\n\n- Identifies specific areas where overfitting occurs.\n- Supports multiple performance metrics, providing flexibility.\n- Applicable to both classification and regression models.\n- Visualization of overfitting segments aids in better understanding and debugging.\n\n### Limitations\n\n- The default threshold may not be suitable for all use cases and requires tuning.\n- May not capture more subtle forms of overfitting that do not exceed the threshold.\n- Assumes that the binning of features adequately represents the data segments.",
+        "required_inputs": ["model", "datasets"],
+        "default_params": {"metric": None, "cut_off_threshold": 0.04},
+        "tasks": ["classification", "regression"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "linear_regression",
+            "model_diagnosis",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.PermutationFeatureImportance": {
+        "description": "Assesses the significance of each feature in a model by evaluating the impact on model performance when feature\nvalues are randomly rearranged.\n\n### Purpose\n\nThe Permutation Feature Importance (PFI) metric aims to assess the importance of each feature used by the Machine\nLearning model. The significance is measured by evaluating the decrease in the model's performance when the\nfeature's values are randomly arranged.\n\n### Test Mechanism\n\nPFI is calculated via the `permutation_importance` method from the `sklearn.inspection` module. This method\nshuffles the columns of the feature dataset and measures the impact on the model's performance. A significant\ndecrease in performance after permutating a feature's values deems the feature as important. On the other hand, if\nperformance remains the same, the feature is likely not important. The output of the PFI metric is a figure\nillustrating the importance of each feature.\n\n### Signs of High Risk\n\n- The model heavily relies on a feature with highly variable or easily permutable values, indicating instability.\n- A feature deemed unimportant by the model but expected to have a significant effect on the outcome based on\ndomain knowledge is not influencing the model's predictions.\n\n### Strengths\n\n- Provides insights into the importance of different features and may reveal underlying data structure.\n- Can indicate overfitting if a particular feature or set of features overly impacts the model's predictions.\n- Model-agnostic and can be used with any classifier that provides a measure of prediction accuracy before and\nafter feature permutation.\n\n### Limitations\n\n- Does not imply causality; it only presents the amount of information that a feature provides for the prediction\ntask.\n- Does not account for interactions between features. If features are correlated, the permutation importance may\nallocate importance to one and not the other.\n- Cannot interact with certain libraries like statsmodels, pytorch, catboost, etc., thus limiting its applicability.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"fontsize": None, "figure_height": 1000},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "feature_importance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.PopulationStabilityIndex": {
+        "description": "Assesses the Population Stability Index (PSI) to quantify the stability of an ML model's predictions across\ndifferent datasets.\n\n### Purpose\n\nThe Population Stability Index (PSI) serves as a quantitative assessment for evaluating the stability of a machine\nlearning model's output distributions when comparing two different datasets. Typically, these would be a\ndevelopment and a validation dataset or two datasets collected at different periods. The PSI provides a measurable\nindication of any significant shift in the model's performance over time or noticeable changes in the\ncharacteristics of the population the model is making predictions for.\n\n### Test Mechanism\n\nThe implementation of the PSI in this script involves calculating the PSI for each feature between the training and\ntest datasets. Data from both datasets is sorted and placed into either a predetermined number of bins or\nquantiles. The boundaries for these bins are initially determined based on the distribution of the training data.\nThe contents of each bin are calculated and their respective proportions determined. Subsequently, the PSI is\nderived for each bin through a logarithmic transformation of the ratio of the proportions of data for each feature\nin the training and test datasets. The PSI, along with the proportions of data in each bin for both datasets, are\ndisplayed in a summary table, a grouped bar chart, and a scatter plot.\n\n### Signs of High Risk\n\n- A high PSI value is a clear indicator of high risk. Such a value suggests a significant shift in the model\npredictions or severe changes in the characteristics of the underlying population.\n- This ultimately suggests that the model may not be performing as well as expected and that it may be less\nreliable for making future predictions.\n\n### Strengths\n\n- The PSI provides a quantitative measure of the stability of a model over time or across different samples, making\nit an invaluable tool for evaluating changes in a model's performance.\n- It allows for direct comparisons across different features based on the PSI value.\n- The calculation and interpretation of the PSI are straightforward, facilitating its use in model risk management.\n- The use of visual aids such as tables and charts further simplifies the comprehension and interpretation of the\nPSI.\n\n### Limitations\n\n- The PSI test does not account for the interdependence between features: features that are dependent on one\nanother may show similar shifts in their distributions, which in turn may result in similar PSI values.\n- The PSI test does not inherently provide insights into why there are differences in distributions or why the PSI\nvalues may have changed.\n- The test may not handle features with significant outliers adequately.\n- Additionally, the PSI test is performed on model predictions, not on the underlying data distributions which can\nlead to misinterpretations. Any changes in PSI could be due to shifts in the model (model drift), changes in the\nrelationships between features and the target variable (concept drift), or both. However, distinguishing between\nthese causes is non-trivial.",
+        "required_inputs": ["model", "datasets"],
+        "default_params": {"num_bins": 10, "mode": "fixed"},
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.PrecisionRecallCurve": {
+        "description": "Evaluates the precision-recall trade-off for binary classification models and visualizes the Precision-Recall curve.\n\n### Purpose\n\nThe Precision Recall Curve metric is intended to evaluate the trade-off between precision and recall in\nclassification models, particularly binary classification models. It assesses the model's capacity to produce\naccurate results (high precision), as well as its ability to capture a majority of all positive instances (high\nrecall).\n\n### Test Mechanism\n\nThe test extracts ground truth labels and prediction probabilities from the model's test dataset. It applies the\n`precision_recall_curve` method from the sklearn metrics module to these extracted labels and predictions, which\ncomputes a precision-recall pair for each possible threshold. This calculation results in an array of precision and\nrecall scores that can be plotted against each other to form the Precision-Recall Curve. This curve is then\nvisually represented by using Plotly's scatter plot.\n\n### Signs of High Risk\n\n- A lower area under the Precision-Recall Curve signifies high risk.\n- This corresponds to a model yielding a high amount of false positives (low precision) and/or false negatives (low\nrecall).\n- If the curve is closer to the bottom left of the plot, rather than being closer to the top right corner, it can\nbe a sign of high risk.\n\n### Strengths\n\n- This metric aptly represents the balance between precision (minimizing false positives) and recall (minimizing\nfalse negatives), which is especially critical in scenarios where both values are significant.\n- Through the graphic representation, it enables an intuitive understanding of the model's performance across\ndifferent threshold levels.\n\n### Limitations\n\n- This metric is only applicable to binary classification models - it raises errors for multiclass classification\nmodels or Foundation models.\n- It may not fully represent the overall accuracy of the model if the cost of false positives and false negatives\nare extremely different, or if the dataset is heavily imbalanced.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.ROCCurve": {
+        "description": "Evaluates binary classification model performance by generating and plotting the Receiver Operating Characteristic\n(ROC) curve and calculating the Area Under Curve (AUC) score.\n\n### Purpose\n\nThe Receiver Operating Characteristic (ROC) curve is designed to evaluate the performance of binary classification\nmodels. This curve illustrates the balance between the True Positive Rate (TPR) and False Positive Rate (FPR)\nacross various threshold levels. In combination with the Area Under the Curve (AUC), the ROC curve aims to measure\nthe model's discrimination ability between the two defined classes in a binary classification problem (e.g.,\ndefault vs non-default). Ideally, a higher AUC score signifies superior model performance in accurately\ndistinguishing between the positive and negative classes.\n\n### Test Mechanism\n\nFirst, this script selects the target model and datasets that require binary classification. It then calculates the\npredicted probabilities for the test set, and uses this data, along with the true outcomes, to generate and plot\nthe ROC curve. Additionally, it includes a line signifying randomness (AUC of 0.5). The AUC score for the model's\nROC curve is also computed, presenting a numerical estimation of the model's performance. If any Infinite values\nare detected in the ROC threshold, these are effectively eliminated. The resulting ROC curve, AUC score, and\nthresholds are consequently saved for future reference.\n\n### Signs of High Risk\n\n- A high risk is potentially linked to the model's performance if the AUC score drops below or nears 0.5.\n- Another warning sign would be the ROC curve lying closer to the line of randomness, indicating no discriminative\nability.\n- For the model to be deemed competent at its classification tasks, it is crucial that the AUC score is\nsignificantly above 0.5.\n\n### Strengths\n\n- The ROC Curve offers an inclusive visual depiction of a model's discriminative power throughout all conceivable\nclassification thresholds, unlike other metrics that solely disclose model performance at one fixed threshold.\n- Despite the proportions of the dataset, the AUC Score, which represents the entire ROC curve as a single data\npoint, continues to be consistent, proving to be the ideal choice for such situations.\n\n### Limitations\n\n- The primary limitation is that this test is exclusively structured for binary classification tasks, thus limiting\nits application towards other model types.\n- Furthermore, its performance might be subpar with models that output probabilities highly skewed towards 0 or 1.\n- At the extreme, the ROC curve could reflect high performance even when the majority of classifications are\nincorrect, provided that the model's ranking format is retained. This phenomenon is commonly termed the \"Class\nImbalance Problem\".",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RegressionErrors": {
+        "description": "Assesses the performance and error distribution of a regression model using various error metrics.\n\n### Purpose\n\nThe purpose of the Regression Errors test is to measure the performance of a regression model by calculating\nseveral error metrics. This evaluation helps determine the model's accuracy and potential issues like overfitting\nor bias by analyzing differences in error metrics between the training and testing datasets.\n\n### Test Mechanism\n\nThe test computes the following error metrics:\n- **Mean Absolute Error (MAE)**: Average of the absolute differences between true values and predicted values.\n- **Mean Squared Error (MSE)**: Average of the squared differences between true values and predicted values.\n- **Root Mean Squared Error (RMSE)**: Square root of the mean squared error.\n- **Mean Absolute Percentage Error (MAPE)**: Average of the absolute differences between true values and predicted\nvalues, divided by the true values, and expressed as a percentage.\n- **Mean Bias Deviation (MBD)**: Average bias between true values and predicted values.\n\nThese metrics are calculated separately for the training and testing datasets and compared to identify\ndiscrepancies.\n\n### Signs of High Risk\n\n- High values for MAE, MSE, RMSE, or MAPE indicating poor model performance.\n- Large differences in error metrics between the training and testing datasets, suggesting overfitting.\n- Significant deviation of MBD from zero, indicating systematic bias in model predictions.\n\n### Strengths\n\n- Provides a comprehensive overview of model performance through multiple error metrics.\n- Individual metrics offer specific insights, e.g., MAE for interpretability, MSE for emphasizing larger errors.\n- RMSE is useful for being in the same unit as the target variable.\n- MAPE allows the error to be expressed as a percentage.\n- MBD detects systematic bias in model predictions.\n\n### Limitations\n\n- MAE and MSE are sensitive to outliers.\n- RMSE heavily penalizes larger errors, which might not always be desirable.\n- MAPE can be misleading when actual values are near zero.\n- MBD may not be suitable if bias varies with the magnitude of actual values.\n- These metrics may not capture all nuances of model performance and should be interpreted with domain-specific\ncontext.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {},
+        "tasks": ["regression", "classification"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RegressionErrorsComparison": {
+        "description": "Assesses multiple regression error metrics to compare model performance across different datasets, emphasizing\nsystematic overestimation or underestimation and large percentage errors.\n\n### Purpose\n\nThe purpose of this test is to compare regression errors for different models applied to various datasets. It aims\nto examine model performance using multiple error metrics, thereby identifying areas where models may be\nunderperforming or exhibiting bias.\n\n### Test Mechanism\n\nThe function iterates through each dataset-model pair and calculates various error metrics, including Mean Absolute\nError (MAE), Mean Squared Error (MSE), Mean Absolute Percentage Error (MAPE), and Mean Bias Deviation (MBD). The\nresults are summarized in a table, which provides a comprehensive view of each model's performance on the datasets.\n\n### Signs of High Risk\n\n- High Mean Absolute Error (MAE) or Mean Squared Error (MSE), indicating poor model performance.\n- High Mean Absolute Percentage Error (MAPE), suggesting large percentage errors, especially problematic if the\ntrue values are small.\n- Mean Bias Deviation (MBD) significantly different from zero, indicating systematic overestimation or\nunderestimation by the model.\n\n### Strengths\n\n- Provides multiple error metrics to assess model performance from different perspectives.\n- Includes a check to avoid division by zero when calculating MAPE.\n\n### Limitations\n\n- Assumes that the dataset is provided as a DataFrameDataset object with `y`, `y_pred`, and `feature_columns`\nattributes.\n- Relies on the `logger` from `validmind.logging` to warn about zero values in `y_true`, which should be correctly\nimplemented and imported.\n- Requires that `dataset.y_pred(model)` returns the predicted values for the model.",
+        "required_inputs": ["datasets", "models"],
+        "default_params": {},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_performance", "sklearn"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RegressionPerformance": {
+        "description": "Compares and evaluates the performance of multiple regression models using five different metrics: MAE, MSE, RMSE,\nMAPE, and MBD.\n\n### Purpose\n\nThe Regression Models Performance Comparison metric is used to measure and compare the performance of regression\nmodels. It calculates multiple evaluation metrics, including Mean Absolute Error (MAE), Mean Squared Error (MSE),\nRoot Mean Squared Error (RMSE), Mean Absolute Percentage Error (MAPE), and Mean Bias Deviation (MBD), thereby\nenabling a comprehensive view of model performance.\n\n### Test Mechanism\n\nThe test starts by sourcing the true and predicted values from the models. It then computes the MAE, MSE, RMSE,\nMAPE, and MBD. These calculations encapsulate both the direction and the magnitude of error in predictions, thereby\nproviding a multi-faceted view of model accuracy. It captures these results in a dictionary and compares the\nperformance of all models using these metrics. The results are then appended to a table for presenting a\ncomparative summary.\n\n### Signs of High Risk\n\n- High values of MAE, MSE, RMSE, and MAPE, which indicate a high error rate and imply a larger departure of the\nmodel's predictions from the true values.\n- A large value of MBD, which shows a consistent bias in the model’s predictions.\n- If the test returns an error citing that no models were provided for comparison, it implies a risk in the\nevaluation process itself.\n\n### Strengths\n\n- The metric evaluates models on five different metrics offering a comprehensive analysis of model performance.\n- It compares multiple models simultaneously, aiding in the selection of the best-performing models.\n- It is designed to handle regression tasks and can be seamlessly integrated with libraries like sklearn.\n\n### Limitations\n\n- The metric only evaluates regression models and does not evaluate classification models.\n- The test assumes that the models have been trained and tested appropriately prior to evaluation. It does not\nhandle pre-processing, feature selection, or other stages in the model lifecycle.\n- It may fail to run if it doesn't receive valid models as inputs. The models are passed externally and the test\ndoesn't have an internal mechanism to verify their validity.\n- The test could exhibit performance limitations if a large number of models is input for comparison.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RegressionR2Square": {
+        "description": "Assesses the overall goodness-of-fit of a regression model by evaluating R-squared (R2) and Adjusted R-squared (Adj\nR2) scores to determine the model's explanatory power over the dependent variable.\n\n### Purpose\n\nThe purpose of the RegressionR2Square Metric test is to measure the overall goodness-of-fit of a regression model.\nSpecifically, this Python-based test evaluates the R-squared (R2) and Adjusted R-squared (Adj R2) scores, which are\nstatistical measures used to assess the strength of the relationship between the model's predictors and the\nresponse variable.\n\n### Test Mechanism\n\nThe test deploys the `r2_score` method from the Scikit-learn metrics module to measure the R2 score on both\ntraining and test sets. This score reflects the proportion of the variance in the dependent variable that is\npredictable from the independent variables. The test also calculates the Adjusted R2 score, which accounts for the\nnumber of predictors in the model to penalize model complexity and reduce overfitting. The Adjusted R2 score will\nbe smaller if unnecessary predictors are included in the model.\n\n### Signs of High Risk\n\n- Low R2 or Adjusted R2 scores, suggesting that the model does not explain much variation in the dependent variable.\n- Significant discrepancy between R2 scores on the training set and test set, indicating overfitting and poor\ngeneralization to unseen data.\n\n### Strengths\n\n- Widely-used measure in regression analysis, providing a sound general indication of model performance.\n- Easy to interpret and understand, as it represents the proportion of the dependent variable's variance explained\nby the independent variables.\n- Adjusted R2 score helps control overfitting by penalizing unnecessary predictors.\n\n### Limitations\n\n- Sensitive to the inclusion of unnecessary predictors even though Adjusted R2 penalizes complexity.\n- Less reliable in cases of non-linear relationships or when the underlying assumptions of linear regression are\nviolated.\n- Does not provide insight on whether the correct regression model was used or if key assumptions have been met.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RegressionR2SquareComparison": {
+        "description": "Compares R-Squared and Adjusted R-Squared values for different regression models across multiple datasets to assess\nmodel performance and relevance of features.\n\n### Purpose\n\nThe Regression R2 Square Comparison test aims to compare the R-Squared and Adjusted R-Squared values for different\nregression models across various datasets. It helps in assessing how well each model explains the variability in\nthe dataset, and whether the models include irrelevant features.\n\n### Test Mechanism\n\nThis test operates by:\n\n- Iterating through each dataset-model pair.\n- Calculating the R-Squared values to measure how much of the variability in the dataset is explained by the model.\n- Calculating the Adjusted R-Squared values, which adjust the R-Squared based on the number of predictors in the\nmodel, making it more reliable when comparing models with different numbers of features.\n- Generating a summary table containing these values for each combination of dataset and model.\n\n### Signs of High Risk\n\n- If the R-Squared values are significantly low, it indicates the model isn't explaining much of the variability in\nthe dataset.\n- A significant difference between R-Squared and Adjusted R-Squared values might indicate that the model includes\nirrelevant features.\n\n### Strengths\n\n- Provides a quantitative measure of model performance in terms of variance explained.\n- Adjusted R-Squared accounts for the number of predictors, making it a more reliable measure when comparing models\nwith different numbers of features.\n- Useful for time-series forecasting and regression tasks.\n\n### Limitations\n\n- Assumes the dataset is provided as a DataFrameDataset object with `y`, `y_pred`, and `feature_columns` attributes.\n- Relies on `adj_r2_score` from the `statsmodels.statsutils` module, which needs to be correctly implemented and\nimported.\n- Requires that `dataset.y_pred(model)` returns the predicted values for the model.",
+        "required_inputs": ["datasets", "models"],
+        "default_params": {},
+        "tasks": ["regression", "time_series_forecasting"],
+        "tags": ["model_performance", "sklearn"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.RobustnessDiagnosis": {
+        "description": "Assesses the robustness of a machine learning model by evaluating performance decay under noisy conditions.\n\n### Purpose\n\nThe Robustness Diagnosis test aims to evaluate the resilience of a machine learning model when subjected to\nperturbations or noise in its input data. This is essential for understanding the model's ability to handle\nreal-world scenarios where data may be imperfect or corrupted.\n\n### Test Mechanism\n\nThis test introduces Gaussian noise to the numeric input features of the datasets at varying scales of standard\ndeviation. The performance of the model is then measured using a specified metric. The process includes:\n\n- Adding Gaussian noise to numerical input features based on scaling factors.\n- Evaluating the model's performance on the perturbed data using metrics like AUC for classification tasks and MSE\nfor regression tasks.\n- Aggregating and plotting the results to visualize performance decay relative to perturbation size.\n\n### Signs of High Risk\n\n- A significant drop in performance metrics with minimal noise.\n- Performance decay values exceeding the specified threshold.\n- Consistent failure to meet performance standards across multiple perturbation scales.\n\n### Strengths\n\n- Provides insights into the model's robustness against noisy or corrupted data.\n- Utilizes a variety of performance metrics suitable for both classification and regression tasks.\n- Visualization helps in understanding the extent of performance degradation.\n\n### Limitations\n\n- Gaussian noise might not adequately represent all types of real-world data perturbations.\n- Performance thresholds are somewhat arbitrary and might need tuning.\n- The test may not account for more complex or unstructured noise patterns that could affect model robustness.",
+        "required_inputs": ["model", "datasets"],
+        "default_params": {
+            "metric": None,
+            "scaling_factor_std_dev_list": [0.1, 0.2, 0.3, 0.4, 0.5],
+            "performance_decay_threshold": 0.05,
+        },
+        "tasks": ["classification", "regression"],
+        "tags": ["sklearn", "model_diagnosis", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.SHAPGlobalImportance": {
+        "description": "Evaluates and visualizes global feature importance using SHAP values for model explanation and risk identification.\n\n### Purpose\n\nThe SHAP (SHapley Additive exPlanations) Global Importance metric aims to elucidate model outcomes by attributing\nthem to the contributing features. It assigns a quantifiable global importance to each feature via their respective\nabsolute Shapley values, thereby making it suitable for tasks like classification (both binary and multiclass).\nThis metric forms an essential part of model risk management.\n\n### Test Mechanism\n\nThe exam begins with the selection of a suitable explainer which aligns with the model's type. For tree-based\nmodels like XGBClassifier, RandomForestClassifier, CatBoostClassifier, TreeExplainer is used whereas for linear\nmodels like LogisticRegression, XGBRegressor, LinearRegression, it is the LinearExplainer. Once the explainer\ncalculates the Shapley values, these values are visualized using two specific graphical representations:\n\n1. Mean Importance Plot: This graph portrays the significance of individual features based on their absolute\nShapley values. It calculates the average of these absolute Shapley values across all instances to highlight the\nglobal importance of features.\n\n2. Summary Plot: This visual tool combines the feature importance with their effects. Every dot on this chart\nrepresents a Shapley value for a certain feature in a specific case. The vertical axis is denoted by the feature\nwhereas the horizontal one corresponds to the Shapley value. A color gradient indicates the value of the feature,\ngradually changing from low to high. Features are systematically organized in accordance with their importance.\nThese plots are generated by the function `_generate_shap_plot()`.\n\n### Signs of High Risk\n\n- Overemphasis on certain features in SHAP importance plots, thus hinting at the possibility of model overfitting\n- Anomalies such as unexpected or illogical features showing high importance, which might suggest that the model's\ndecisions are rooted in incorrect or undesirable reasoning\n- A SHAP summary plot filled with high variability or scattered data points, indicating a cause for concern\n\n### Strengths\n\n- SHAP does more than just illustrating global feature significance, it offers a detailed perspective on how\ndifferent features shape the model's decision-making logic for each instance.\n- It provides clear insights into model behavior.\n\n### Limitations\n\n- High-dimensional data can convolute interpretations.\n- Associating importance with tangible real-world impact still involves a certain degree of subjectivity.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {
+            "kernel_explainer_samples": 10,
+            "tree_or_linear_explainer_samples": 200,
+            "class_of_interest": None,
+        },
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "feature_importance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.SilhouettePlot": {
+        "description": "Calculates and visualizes Silhouette Score, assessing the degree of data point suitability to its cluster in ML\nmodels.\n\n### Purpose\n\nThis test calculates the Silhouette Score, which is a model performance metric used in clustering applications.\nPrimarily, the Silhouette Score evaluates how similar a data point is to its own cluster compared to other\nclusters. The metric ranges between -1 and 1, where a high value indicates that the object is well matched to its\nown cluster and poorly matched to neighboring clusters. Thus, the goal is to achieve a high Silhouette Score,\nimplying well-separated clusters.\n\n### Test Mechanism\n\nThe test first extracts the true and predicted labels from the model's training data. The test runs the Silhouette\nScore function, which takes as input the training dataset features and the predicted labels, subsequently\ncalculating the average score. This average Silhouette Score is printed for reference. The script then calculates\nthe silhouette coefficients for each data point, helping to form the Silhouette Plot. Each cluster is represented\nin this plot, with color distinguishing between different clusters. A red dashed line indicates the average\nSilhouette Score. The Silhouette Scores are also collected into a structured table, facilitating model performance\nanalysis and comparison.\n\n### Signs of High Risk\n\n- A low Silhouette Score, potentially indicating that the clusters are not well separated and that data points may\nnot be fitting well to their respective clusters.\n- A Silhouette Plot displaying overlapping clusters or the absence of clear distinctions between clusters visually\nalso suggests poor clustering performance.\n\n### Strengths\n\n- The Silhouette Score provides a clear and quantitative measure of how well data points have been grouped into\nclusters, offering insights into model performance.\n- The Silhouette Plot provides an intuitive, graphical representation of the clustering mechanism, aiding visual\nassessments of model performance.\n- It does not require ground truth labels, so it's useful when true cluster assignments are not known.\n\n### Limitations\n\n- The Silhouette Score may be susceptible to the influence of outliers, which could impact its accuracy and\nreliability.\n- It assumes the clusters are convex and isotropic, which might not be the case with complex datasets.\n- Due to the average nature of the Silhouette Score, the metric does not account for individual data point\nassignment nuances, so potentially relevant details may be omitted.\n- Computationally expensive for large datasets, as it requires pairwise distance computations.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.TrainingTestDegradation": {
+        "description": "Tests if model performance degradation between training and test datasets exceeds a predefined threshold.\n\n### Purpose\n\nThe `TrainingTestDegradation` class serves as a test to verify that the degradation in performance between the\ntraining and test datasets does not exceed a predefined threshold. This test measures the model's ability to\ngeneralize from its training data to unseen test data, assessing key classification metrics such as accuracy,\nprecision, recall, and f1 score to verify the model's robustness and reliability.\n\n### Test Mechanism\n\nThe code applies several predefined metrics, including accuracy, precision, recall, and f1 scores, to the model's\npredictions for both the training and test datasets. It calculates the degradation as the difference between the\ntraining score and test score divided by the training score. The test is considered successful if the degradation\nfor each metric is less than the preset maximum threshold of 10%. The results are summarized in a table showing\neach metric's train score, test score, degradation percentage, and pass/fail status.\n\n### Signs of High Risk\n\n- A degradation percentage that exceeds the maximum allowed threshold of 10% for any of the evaluated metrics.\n- A high difference or gap between the metric scores on the training and the test datasets.\n- The 'Pass/Fail' column displaying 'Fail' for any of the evaluated metrics.\n\n### Strengths\n\n- Provides a quantitative measure of the model's ability to generalize to unseen data, which is key for predicting\nits practical real-world performance.\n- By evaluating multiple metrics, it takes into account different facets of model performance and enables a more\nholistic evaluation.\n- The use of a variable predefined threshold allows the flexibility to adjust the acceptability criteria for\ndifferent scenarios.\n\n### Limitations\n\n- The test compares raw performance on training and test data but does not factor in the nature of the data. Areas\nwith less representation in the training set might still perform poorly on unseen data.\n- It requires good coverage and balance in the test and training datasets to produce reliable results, which may\nnot always be available.\n- The test is currently only designed for classification tasks.",
+        "required_inputs": ["model", "datasets"],
+        "default_params": {
+            "metrics": ["accuracy", "precision", "recall", "f1"],
+            "max_threshold": 0.1,
+        },
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_performance",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.VMeasure": {
+        "description": "Evaluates homogeneity and completeness of a clustering model using the V Measure Score.\n\n### Purpose\n\nThe purpose of this metric, V Measure Score (V Score), is to evaluate the performance of a clustering model. It\nmeasures the homogeneity and completeness of a set of cluster labels, where homogeneity refers to each cluster\ncontaining only members of a single class and completeness meaning all members of a given class are assigned to the\nsame cluster.\n\n### Test Mechanism\n\nClusterVMeasure is a class that inherits from another class, ClusterPerformance. It uses the `v_measure_score`\nfunction from the sklearn module's metrics package. The required inputs to perform this metric are the model, train\ndataset, and test dataset. The test is appropriate for models tasked with clustering.\n\n### Signs of High Risk\n\n- Low V Measure Score: A low V Measure Score indicates that the clustering model has poor homogeneity or\ncompleteness, or both. This might signal that the model is failing to correctly cluster the data.\n\n### Strengths\n\n- The V Measure Score is a harmonic mean between homogeneity and completeness. This ensures that both attributes\nare taken into account when evaluating the model, providing an overall measure of its cluster validity.\n- The metric does not require knowledge of the ground truth classes when measuring homogeneity and completeness,\nmaking it applicable in instances where such information is unavailable.\n\n### Limitations\n\n- The V Measure Score can be influenced by the number of clusters, which means that it might not always reflect the\nquality of the clustering. Partitioning the data into many small clusters could lead to high homogeneity but low\ncompleteness, leading to a low V Measure Score even if the clustering might be useful.\n- It assumes equal importance of homogeneity and completeness. In some applications, one may be more important than\nthe other. The V Measure Score does not provide flexibility in assigning different weights to homogeneity and\ncompleteness.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["clustering"],
+        "tags": ["sklearn", "model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.sklearn.WeakspotsDiagnosis": {
+        "description": "Identifies and visualizes weak spots in a machine learning model's performance across various sections of the\nfeature space.\n\n### Purpose\n\nThe weak spots test is applied to evaluate the performance of a machine learning model within specific regions of\nits feature space. This test slices the feature space into various sections, evaluating the model's outputs within\neach section against specific performance metrics (e.g., accuracy, precision, recall, and F1 scores). The ultimate\naim is to identify areas where the model's performance falls below the set thresholds, thereby exposing its\npossible weaknesses and limitations.\n\n### Test Mechanism\n\nThe test mechanism adopts an approach of dividing the feature space of the training dataset into numerous bins. The\nmodel's performance metrics (accuracy, precision, recall, F1 scores) are then computed for each bin on both the\ntraining and test datasets. A \"weak spot\" is identified if any of the performance metrics fall below a\npredetermined threshold for a particular bin on the test dataset. The test results are visually plotted as bar\ncharts for each performance metric, indicating the bins which fail to meet the established threshold.\n\n### Signs of High Risk\n\n- Any performance metric of the model dropping below the set thresholds.\n- Significant disparity in performance between the training and test datasets within a bin could be an indication\nof overfitting.\n- Regions or slices with consistently low performance metrics. Such instances could mean that the model struggles\nto handle specific types of input data adequately, resulting in potentially inaccurate predictions.\n\n### Strengths\n\n- The test helps pinpoint precise regions of the feature space where the model's performance is below par, allowing\nfor more targeted improvements to the model.\n- The graphical presentation of the performance metrics offers an intuitive way to understand the model's\nperformance across different feature areas.\n- The test exhibits flexibility, letting users set different thresholds for various performance metrics according\nto the specific requirements of the application.\n\n### Limitations\n\n- The binning system utilized for the feature space in the test could over-simplify the model's behavior within\neach bin. The granularity of this slicing depends on the chosen 'bins' parameter and can sometimes be arbitrary.\n- The effectiveness of this test largely hinges on the selection of thresholds for the performance metrics, which\nmay not hold universally applicable and could be subjected to the specifications of a particular model and\napplication.\n- The test is unable to handle datasets with a text column, limiting its application to numerical or categorical\ndata types only.\n- Despite its usefulness in highlighting problematic regions, the test does not offer direct suggestions for model\nimprovement.",
+        "required_inputs": ["model", "datasets"],
+        "default_params": {
+            "features_columns": None,
+            "thresholds": {
+                "accuracy": 0.75,
+                "precision": 0.5,
+                "recall": 0.5,
+                "f1": 0.7,
+            },
+        },
+        "tasks": ["classification", "text_classification"],
+        "tags": [
+            "sklearn",
+            "binary_classification",
+            "multiclass_classification",
+            "model_diagnosis",
+            "visualization",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.AutoARIMA": {
+        "description": "Evaluates ARIMA models for time-series forecasting, ranking them using Bayesian and Akaike Information Criteria.\n\n### Purpose\n\nThe AutoARIMA validation test is designed to evaluate and rank AutoRegressive Integrated Moving Average (ARIMA)\nmodels. These models are primarily used for forecasting time-series data. The validation test automatically fits\nmultiple ARIMA models, with varying parameters, to every variable within the given dataset. The models are then\nranked based on their Bayesian Information Criterion (BIC) and Akaike Information Criterion (AIC) values, which\nprovide a basis for the efficient model selection process.\n\n### Test Mechanism\n\nThis metric proceeds by generating an array of feasible combinations of ARIMA model parameters which are within a\nprescribed limit. These limits include `max_p`, `max_d`, `max_q`; they represent the autoregressive, differencing,\nand moving average components respectively. Upon applying these sets of parameters, the validation test fits each\nARIMA model to the time-series data provided. For each model, it subsequently proceeds to calculate and record both\nthe BIC and AIC values, which serve as performance indicators for the model fit. Prior to this parameter fitting\nprocess, the Augmented Dickey-Fuller test for data stationarity is conducted on the data series. If a series is\nfound to be non-stationary, a warning message is sent out, given that ARIMA models necessitate input series to be\nstationary.\n\n### Signs of High Risk\n\n- If the p-value of the Augmented Dickey-Fuller test for a variable exceeds 0.05, a warning is logged. This warning\nindicates that the series might not be stationary, leading to potentially inaccurate results.\n- Consistent failure in fitting ARIMA models (as made evident through logged errors) might disclose issues with\neither the data or model stability.\n\n### Strengths\n\n- The AutoARIMA validation test simplifies the often complex task of selecting the most suitable ARIMA model based\non BIC and AIC criteria.\n- The mechanism incorporates a check for non-stationarity within the data, which is a critical prerequisite for\nARIMA models.\n- The exhaustive search through all possible combinations of model parameters enhances the likelihood of\nidentifying the best-fit model.\n\n### Limitations\n\n- This validation test can be computationally costly as it involves creating and fitting multiple ARIMA models for\nevery variable.\n- Although the test checks for non-stationarity and logs warnings where present, it does not apply any\ntransformations to the data to establish stationarity.\n- The selection of models leans solely on BIC and AIC criteria, which may not yield the best predictive model in\nall scenarios.\n- The test is only applicable to regression tasks involving time-series data, and may not work effectively for\nother types of machine learning tasks.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "forecasting", "model_selection", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.CumulativePredictionProbabilities": {
+        "description": "Visualizes cumulative probabilities of positive and negative classes for both training and testing in logistic\nregression models.\n\n### Purpose\n\nThis metric is utilized to evaluate the distribution of predicted probabilities for positive and negative classes\nin a logistic regression model. It provides a visual assessment of the model's behavior by plotting the cumulative\nprobabilities for positive and negative classes across both the training and test datasets.\n\n### Test Mechanism\n\nThe logistic regression model is evaluated by first computing the predicted probabilities for each instance in both\nthe training and test datasets, which are then added as a new column in these sets. The cumulative probabilities\nfor positive and negative classes are subsequently calculated and sorted in ascending order. Cumulative\ndistributions of these probabilities are created for both positive and negative classes across both training and\ntest datasets. These cumulative probabilities are represented visually in a plot, containing two subplots - one for\nthe training data and the other for the test data, with lines representing cumulative distributions of positive and\nnegative classes.\n\n### Signs of High Risk\n\n- Imbalanced distribution of probabilities for either positive or negative classes.\n- Notable discrepancies or significant differences between the cumulative probability distributions for the\ntraining data versus the test data.\n- Marked discrepancies or large differences between the cumulative probability distributions for positive and\nnegative classes.\n\n### Strengths\n\n- Provides a visual illustration of data, which enhances the ease of understanding and interpreting the model's\nbehavior.\n- Allows for the comparison of model's behavior across training and testing datasets, providing insights about how\nwell the model is generalized.\n- Differentiates between positive and negative classes and their respective distribution patterns, aiding in\nproblem diagnosis.\n\n### Limitations\n\n- Exclusive to classification tasks and specifically to logistic regression models.\n- Graphical results necessitate human interpretation and may not be directly applicable for automated risk\ndetection.\n- The method does not give a solitary quantifiable measure of model risk, instead, it offers a visual\nrepresentation and broad distributional information.\n- If the training and test datasets are not representative of the overall data distribution, the metric could\nprovide misleading results.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"title": "Cumulative Probabilities"},
+        "tasks": ["classification"],
+        "tags": ["visualization", "credit_risk", "logistic_regression"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.DurbinWatsonTest": {
+        "description": "Assesses autocorrelation in time series data features using the Durbin-Watson statistic.\n\n### Purpose\n\nThe Durbin-Watson Test metric detects autocorrelation in time series data (where a set of data values influences\ntheir predecessors). Autocorrelation is a crucial factor for regression tasks as these often assume the\nindependence of residuals. A model with significant autocorrelation may give unreliable predictions.\n\n### Test Mechanism\n\nUtilizing the `durbin_watson` function in the `statsmodels` Python library, the Durbin-Watson (DW) Test metric\ngenerates a statistical value for each feature of the training dataset. The function is looped over all columns of\nthe dataset, calculating and caching the DW value for each column for further analysis. A DW metric value nearing 2\nindicates no autocorrelation. Conversely, values approaching 0 suggest positive autocorrelation, and those leaning\ntowards 4 imply negative autocorrelation.\n\n### Signs of High Risk\n\n- If a feature's DW value significantly deviates from 2, it could signal a high risk due to potential\nautocorrelation issues in the dataset.\n- A value closer to 0 could imply positive autocorrelation, while a value nearer to 4 could point to negative\nautocorrelation, both leading to potentially unreliable prediction models.\n\n### Strengths\n\n- The metric specializes in identifying autocorrelation in prediction model residuals.\n- Autocorrelation detection assists in diagnosing violation of various modeling technique assumptions, particularly\nin regression analysis and time-series data modeling.\n\n### Limitations\n\n- The Durbin-Watson Test mainly detects linear autocorrelation and could overlook other types of relationships.\n- The metric is highly sensitive to data points order. Shuffling the order could lead to notably different results.\n- The test only checks for first-order autocorrelation (between a variable and its immediate predecessor) and fails\nto detect higher-order autocorrelation.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"threshold": [1.5, 2.5]},
+        "tasks": ["regression"],
+        "tags": ["time_series_data", "forecasting", "statistical_test", "statsmodels"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.GINITable": {
+        "description": "Evaluates classification model performance using AUC, GINI, and KS metrics for training and test datasets.\n\n### Purpose\n\nThe 'GINITable' metric is designed to evaluate the performance of a classification model by emphasizing its\ndiscriminatory power. Specifically, it calculates and presents three important metrics - the Area under the ROC\nCurve (AUC), the GINI coefficient, and the Kolmogorov-Smirnov (KS) statistic - for both training and test datasets.\n\n### Test Mechanism\n\nUsing a dictionary for storing performance metrics for both the training and test datasets, the 'GINITable' metric\ncalculates each of these metrics sequentially. The Area under the ROC Curve (AUC) is calculated via the\n`roc_auc_score` function from the Scikit-Learn library. The GINI coefficient, a measure of statistical dispersion,\nis then computed by doubling the AUC and subtracting 1. Finally, the Kolmogorov-Smirnov (KS) statistic is\ncalculated via the `roc_curve` function from Scikit-Learn, with the False Positive Rate (FPR) subtracted from the\nTrue Positive Rate (TPR) and the maximum value taken from the resulting data. These metrics are then stored in a\npandas DataFrame for convenient visualization.\n\n### Signs of High Risk\n\n- Low values for performance metrics may suggest a reduction in model performance, particularly a low AUC which\nindicates poor classification performance, or a low GINI coefficient, which could suggest a decreased ability to\ndiscriminate different classes.\n- A high KS value may be an indicator of potential overfitting, as this generally signifies a substantial\ndivergence between positive and negative distributions.\n- Significant discrepancies between the performance on the training dataset and the test dataset may present\nanother signal of high risk.\n\n### Strengths\n\n- Offers three key performance metrics (AUC, GINI, and KS) in one test, providing a more comprehensive evaluation\nof the model.\n- Provides a direct comparison between the model's performance on training and testing datasets, which aids in\nidentifying potential underfitting or overfitting.\n- The applied metrics are class-distribution invariant, thereby remaining effective for evaluating model\nperformance even when dealing with imbalanced datasets.\n- Presents the metrics in a user-friendly table format for easy comprehension and analysis.\n\n### Limitations\n\n- The GINI coefficient and KS statistic are both dependent on the AUC value. Therefore, any errors in the\ncalculation of the latter will adversely impact the former metrics too.\n- Mainly suited for binary classification models and may require modifications for effective application in\nmulti-class scenarios.\n- The metrics used are threshold-dependent and may exhibit high variability based on the chosen cut-off points.\n- The test does not incorporate a method to efficiently handle missing or inefficiently processed data, which could\nlead to inaccuracies in the metrics if the data is not appropriately preprocessed.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {},
+        "tasks": ["classification"],
+        "tags": ["model_performance"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.KolmogorovSmirnov": {
+        "description": "Assesses whether each feature in the dataset aligns with a normal distribution using the Kolmogorov-Smirnov test.\n\n### Purpose\n\nThe Kolmogorov-Smirnov (KS) test evaluates the distribution of features in a dataset to determine their alignment\nwith a normal distribution. This is important because many statistical methods and machine learning models assume\nnormality in the data distribution.\n\n### Test Mechanism\n\nThis test calculates the KS statistic and corresponding p-value for each feature in the dataset. It does so by\ncomparing the cumulative distribution function of the feature with an ideal normal distribution. The KS statistic\nand p-value for each feature are then stored in a dictionary. The p-value threshold to reject the normal\ndistribution hypothesis is not preset, providing flexibility for different applications.\n\n### Signs of High Risk\n\n- Elevated KS statistic for a feature combined with a low p-value, indicating a significant divergence from a\nnormal distribution.\n- Features with notable deviations that could create problems if the model assumes normality in data distribution.\n\n### Strengths\n\n- The KS test is sensitive to differences in the location and shape of empirical cumulative distribution functions.\n- It is non-parametric and adaptable to various datasets, as it does not assume any specific data distribution.\n- Provides detailed insights into the distribution of individual features.\n\n### Limitations\n\n- The test's sensitivity to disparities in the tails of data distribution might cause false alarms about\nnon-normality.\n- Less effective for multivariate distributions, as it is designed for univariate distributions.\n- Does not identify specific types of non-normality, such as skewness or kurtosis, which could impact model fitting.",
+        "required_inputs": ["dataset"],
+        "default_params": {"dist": "norm"},
+        "tasks": ["classification", "regression"],
+        "tags": [
+            "tabular_data",
+            "data_distribution",
+            "statistical_test",
+            "statsmodels",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.Lilliefors": {
+        "description": "Assesses the normality of feature distributions in an ML model's training dataset using the Lilliefors test.\n\n### Purpose\n\nThe purpose of this metric is to utilize the Lilliefors test, named in honor of the Swedish statistician Hubert\nLilliefors, in order to assess whether the features of the machine learning model's training dataset conform to a\nnormal distribution. This is done because the assumption of normal distribution plays a vital role in numerous\nstatistical procedures as well as numerous machine learning models. Should the features fail to follow a normal\ndistribution, some model types may not operate at optimal efficiency. This can potentially lead to inaccurate\npredictions.\n\n### Test Mechanism\n\nThe application of this test happens across all feature columns within the training dataset. For each feature, the\nLilliefors test returns a test statistic and p-value. The test statistic quantifies how far the feature's\ndistribution is from an ideal normal distribution, whereas the p-value aids in determining the statistical\nrelevance of this deviation. The final results are stored within a dictionary, the keys of which correspond to the\nname of the feature column, and the values being another dictionary which houses the test statistic and p-value.\n\n### Signs of High Risk\n\n- If the p-value corresponding to a specific feature sinks below a pre-established significance level, generally\nset at 0.05, then it can be deduced that the distribution of that feature significantly deviates from a normal\ndistribution. This can present a high risk for models that assume normality, as these models may perform\ninaccurately or inefficiently in the presence of such a feature.\n\n### Strengths\n\n- One advantage of the Lilliefors test is its utility irrespective of whether the mean and variance of the normal\ndistribution are known in advance. This makes it a more robust option in real-world situations where these values\nmight not be known.\n- The test has the ability to screen every feature column, offering a holistic view of the dataset.\n\n### Limitations\n\n- Despite the practical applications of the Lilliefors test in validating normality, it does come with some\nlimitations.\n- It is only capable of testing unidimensional data, thus rendering it ineffective for datasets with interactions\nbetween features or multi-dimensional phenomena.\n- The test might not be as sensitive as some other tests (like the Anderson-Darling test) in detecting deviations\nfrom a normal distribution.\n- Like any other statistical test, Lilliefors test may also produce false positives or negatives. Hence, banking\nsolely on this test, without considering other characteristics of the data, may give rise to risks.",
+        "required_inputs": ["dataset"],
+        "default_params": None,
+        "tasks": ["classification", "regression"],
+        "tags": [
+            "tabular_data",
+            "data_distribution",
+            "statistical_test",
+            "statsmodels",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.PredictionProbabilitiesHistogram": {
+        "description": "Assesses the predictive probability distribution for binary classification to evaluate model performance and\npotential overfitting or bias.\n\n### Purpose\n\nThe Prediction Probabilities Histogram test is designed to generate histograms displaying the Probability of\nDefault (PD) predictions for both positive and negative classes in training and testing datasets. This helps in\nevaluating the performance of a logistic regression model, particularly for credit risk prediction.\n\n### Test Mechanism\n\nThe metric follows these steps to execute the test:\n- Extracts the target column from both the train and test datasets.\n- Uses the model's predict function to calculate probabilities.\n- Adds these probabilities as a new column to the training and testing dataframes.\n- Generates histograms for each class (0 or 1) within the training and testing datasets.\n- Sets different opacities for the histograms to enhance visualization.\n- Overlays the four histograms (two for training and two for testing) on two different subplot frames.\n- Returns a plotly graph object displaying the visualization.\n\n### Signs of High Risk\n\n- Significant discrepancies between the histograms of training and testing data.\n- Large disparities between the histograms for the positive and negative classes.\n- Potential overfitting or bias indicated by significant issues.\n- Unevenly distributed probabilities suggesting inaccurate model predictions.\n\n### Strengths\n\n- Offers a visual representation of the PD predictions made by the model, aiding in understanding its behavior.\n- Assesses both the training and testing datasets, adding depth to model validation.\n- Highlights disparities between classes, providing insights into class imbalance or data skewness.\n- Effectively visualizes risk spread, which is particularly beneficial for credit risk prediction.\n\n### Limitations\n\n- Specifically tailored for binary classification scenarios and not suited for multi-class classification tasks.\n- Mainly applicable to logistic regression models, and may not be effective for other model types.\n- Provides a robust visual representation but lacks a quantifiable measure to assess model performance.",
+        "required_inputs": ["dataset", "model"],
+        "default_params": {"title": "Histogram of Predictive Probabilities"},
+        "tasks": ["classification"],
+        "tags": ["visualization", "credit_risk", "logistic_regression"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionCoeffs": {
+        "description": "Assesses the significance and uncertainty of predictor variables in a regression model through visualization of\ncoefficients and their 95% confidence intervals.\n\n### Purpose\n\nThe `RegressionCoeffs` metric visualizes the estimated regression coefficients alongside their 95% confidence intervals,\nproviding insights into the impact and significance of predictor variables on the response variable. This visualization\nhelps to understand the variability and uncertainty in the model's estimates, aiding in the evaluation of the\nsignificance of each predictor.\n\n### Test Mechanism\n\nThe function operates by extracting the estimated coefficients and their standard errors from the regression model.\nUsing these, it calculates the confidence intervals at a 95% confidence level, which indicates the range within which\nthe true coefficient value is expected to fall 95% of the time. The confidence intervals are computed using the\nZ-value associated with the 95% confidence level. The coefficients and their confidence intervals are then visualized\nin a bar plot. The x-axis represents the predictor variables, the y-axis represents the estimated coefficients, and\nthe error bars depict the confidence intervals.\n\n### Signs of High Risk\n\n- The confidence interval for a coefficient contains the zero value, suggesting that the predictor may not significantly\ncontribute to the model.\n- Multiple coefficients with confidence intervals that include zero, potentially indicating issues with model reliability.\n- Very wide confidence intervals, which may suggest high uncertainty in the coefficient estimates and potential model\ninstability.\n\n### Strengths\n\n- Provides a clear visualization that allows for easy interpretation of the significance and impact of predictor\nvariables.\n- Includes confidence intervals, which provide additional information about the uncertainty surrounding each coefficient\nestimate.\n\n### Limitations\n\n- The method assumes normality of residuals and independence of observations, assumptions that may not always hold true\nin practice.\n- It does not address issues related to multi-collinearity among predictor variables, which can affect the interpretation\nof coefficients.\n- This metric is limited to regression tasks using tabular data and is not applicable to other types of machine learning\ntasks or data structures.",
+        "required_inputs": ["model"],
+        "default_params": {},
+        "tasks": ["regression"],
+        "tags": ["tabular_data", "visualization", "model_training"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionFeatureSignificance": {
+        "description": "Assesses and visualizes the statistical significance of features in a set of regression models.\n\n### Purpose\n\nThe Regression Feature Significance metric assesses the significance of each feature in a given set of regression\nmodels. It creates a visualization displaying p-values for every feature of each model, assisting model developers\nin understanding which features are most influential in their models.\n\n### Test Mechanism\n\nThe test mechanism involves going through each fitted regression model in a given list, extracting the model\ncoefficients and p-values for each feature, and then plotting these values. The x-axis on the plot contains the\np-values while the y-axis denotes the coefficients of each feature. A vertical red line is drawn at the threshold\nfor p-value significance, which is 0.05 by default. Any features with p-values to the left of this line are\nconsidered statistically significant at the chosen level.\n\n### Signs of High Risk\n\n- Any feature with a high p-value (greater than the threshold) is considered a potential high risk, as it suggests\nthe feature is not statistically significant and may not be reliably contributing to the model's predictions.\n- A high number of such features may indicate problems with the model validation, variable selection, and overall\nreliability of the model predictions.\n\n### Strengths\n\n- Helps identify the features that significantly contribute to a model's prediction, providing insights into the\nfeature importance.\n- Provides tangible, easy-to-understand visualizations to interpret the feature significance.\n- Facilitates comparison of feature importance across multiple models.\n\n### Limitations\n\n- This metric assumes model features are independent, which may not always be the case. Multicollinearity (high\ncorrelation amongst predictors) can cause high variance and unreliable statistical tests of significance.\n- The p-value strategy for feature selection doesn't take into account the magnitude of the effect, focusing solely\non whether the feature is likely non-zero.\n- This test is specific to regression models and wouldn't be suitable for other types of ML models.\n- P-value thresholds are somewhat arbitrary and do not always indicate practical significance, only statistical\nsignificance.",
+        "required_inputs": ["model"],
+        "default_params": {"fontsize": 10, "p_threshold": 0.05},
+        "tasks": ["regression"],
+        "tags": [
+            "statistical_test",
+            "model_interpretation",
+            "visualization",
+            "feature_importance",
+        ],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionModelForecastPlot": {
+        "description": 'Generates plots to visually compare the forecasted outcomes of one or more regression models against actual\nobserved values over a specified date range.\n\n### Purpose\n\nThe "regression_forecast_plot" is intended to visually depict the performance of one or more regression models by\ncomparing the model\'s forecasted outcomes against actual observed values within a specified date range. This metric\nis especially useful in time-series models or any model where the outcome changes over time, allowing direct\ncomparison of predicted vs actual values.\n\n### Test Mechanism\n\nThis test generates a plot for each fitted model in the list. The x-axis represents the date ranging from the\nspecified "start_date" to the "end_date", while the y-axis shows the value of the outcome variable. Two lines are\nplotted: one representing the forecasted values and the other representing the observed values. The "start_date"\nand "end_date" can be parameters of this test; if these parameters are not provided, they are set to the minimum\nand maximum date available in the dataset. The test verifies that the provided date range is within the limits of\nthe available data.\n\n### Signs of High Risk\n\n- High risk or failure signs could be deduced visually from the plots if the forecasted line significantly deviates\nfrom the observed line, indicating the model\'s predicted values are not matching actual outcomes.\n- A model that struggles to handle the edge conditions like maximum and minimum data points could also be\nconsidered a sign of risk.\n\n### Strengths\n\n- Visualization: The plot provides an intuitive and clear illustration of how well the forecast matches the actual\nvalues, making it straightforward even for non-technical stakeholders to interpret.\n- Flexibility: It allows comparison for multiple models and for specified time periods.\n- Model Evaluation: It can be useful in identifying overfitting or underfitting situations, as these will manifest\nas discrepancies between the forecasted and observed values.\n\n### Limitations\n\n- Interpretation Bias: Interpretation of the plot is subjective and can lead to different conclusions by different\nevaluators.\n- Lack of Precision: Visual representation might not provide precise values of the deviation.\n- Inapplicability: Limited to cases where the order of data points (time-series) matters, it might not be of much\nuse in problems that are not related to time series prediction.',
+        "required_inputs": ["models", "datasets"],
+        "default_params": {"start_date": None, "end_date": None},
+        "tasks": ["regression"],
+        "tags": ["forecasting", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionModelForecastPlotLevels": {
+        "description": 'Assesses the alignment between forecasted and observed values in regression models through visual plots, including\nhandling data transformations.\n\n### Purpose\n\nThe `RegressionModelForecastPlotLevels` test aims to visually assess the performance of a series of regression\nmodels by comparing their forecasted values against the actual observed values in both training and test datasets.\nThis test helps determine the accuracy of the models and can handle specific data transformations before making the\ncomparison, providing a comprehensive evaluation of model performance.\n\n### Test Mechanism\n\nThe test mechanism involves initializing the `RegressionModelForecastPlotLevels` class with an optional\n`transformation` parameter. The class then:\n\n- Checks for the presence of model objects and raises a `ValueError` if none are found.\n- Processes each model to generate predictive forecasts for both training and testing datasets.\n- Contrasts these forecasts with the actual observed values.\n- Produces plots to visually compare forecasted and observed values for both raw and transformed datasets.\n- Handles specified transformations (e.g., "integrate") by performing cumulative sums to create a new series before\nplotting.\n\n### Signs of High Risk\n\n- Significant deviation between forecasted and observed values in training or testing datasets.\n- Patterns suggesting overfitting or underfitting.\n- Large discrepancies in the plotted forecasts, indicating potential issues with model generalizability and\nprecision.\n\n### Strengths\n\n- **Visual Evaluations**: Provides an intuitive, visual way to assess multiple regression models, aiding in easier\ninterpretation and evaluation of forecast accuracy.\n- **Transformation Handling**: Can process specified data transformations such as "integrate," enhancing\nflexibility.\n- **Detailed Perspective**: Assesses performance on both training and testing datasets, offering a comprehensive\nview of model behavior.\n\n### Limitations\n\n- **Subjectivity**: Relies heavily on visual interpretation, which may vary between individuals.\n- **Limited Transformation Capability**: Supports only the "integrate" transformation; other complex\ntransformations might not be handled.\n- **Overhead**: Plotting can be computationally intensive for large datasets, increasing runtime.\n- **Numerical Measurement**: Does not provide a numerical metric to quantify forecast accuracy, relying solely on\nvisual assessment.',
+        "required_inputs": ["models", "datasets"],
+        "default_params": {"transformation": None},
+        "tasks": ["regression"],
+        "tags": ["forecasting", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionModelSensitivityPlot": {
+        "description": "Assesses the sensitivity of a regression model to changes in independent variables by applying shocks and\nvisualizing the impact.\n\n### Purpose\n\nThe Regression Sensitivity Plot test is designed to perform sensitivity analysis on regression models. This test\naims to measure the impact of slight changes (shocks) applied to individual variables on the system's outcome while\nkeeping all other variables constant. By doing so, it analyzes the effects of each independent variable on the\ndependent variable within the regression model, helping identify significant risk factors that could substantially\ninfluence the model's output.\n\n### Test Mechanism\n\nThis test operates by initially applying shocks of varying magnitudes, defined by specific parameters, to each of\nthe model's features, one at a time. With all other variables held constant, a new prediction is made for each\ndataset subjected to shocks. Any changes in the model's predictions are directly attributed to the shocks applied.\nIf the transformation parameter is set to \"integrate,\" initial predictions and target values undergo transformation\nvia an integration function before being plotted. Finally, a plot demonstrating observed values against predicted\nvalues for each model is generated, showcasing a distinct line graph illustrating predictions for each shock.\n\n### Signs of High Risk\n\n- Drastic alterations in model predictions due to minor shocks to an individual variable, indicating high\nsensitivity and potential over-dependence on that variable.\n- Unusually high or unpredictable shifts in response to shocks, suggesting potential model instability or\noverfitting.\n\n### Strengths\n\n- Helps identify variables that strongly influence model outcomes, aiding in understanding feature importance.\n- Generates visual plots, making results easily interpretable even to non-technical stakeholders.\n- Useful in identifying overfitting and detecting unstable models that react excessively to minor variable changes.\n\n### Limitations\n\n- Operates on the assumption that all other variables remain unchanged during the application of a shock, which may\nnot reflect real-world interdependencies.\n- Best compatible with linear models and may not effectively evaluate the sensitivity of non-linear models.\n- Provides a visual representation without a numerical risk measure, potentially introducing subjectivity in\ninterpretation.",
+        "required_inputs": ["models", "datasets"],
+        "default_params": {"transformation": None, "shocks": [0.1]},
+        "tasks": ["regression"],
+        "tags": ["senstivity_analysis", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionModelSummary": {
+        "description": "Evaluates regression model performance using metrics including R-Squared, Adjusted R-Squared, MSE, and RMSE.\n\n### Purpose\n\nThe Regression Model Summary test evaluates the performance of regression models by measuring their predictive\nability regarding dependent variables given changes in the independent variables. It uses conventional regression\nmetrics such as R-Squared, Adjusted R-Squared, Mean Squared Error (MSE), and Root Mean Squared Error (RMSE) to\nassess the model's accuracy and fit.\n\n### Test Mechanism\n\nThis test employs the 'train_ds' attribute of the model to gather and analyze the training data. Initially, it\nfetches the independent variables and uses the model to make predictions on these given features. Subsequently, it\ncalculates several standard regression performance metrics including R-Squared, Adjusted R-Squared, Mean Squared\nError (MSE), and Root Mean Squared Error (RMSE), which quantify the approximation of the predicted responses to the\nactual responses.\n\n### Signs of High Risk\n\n- Low R-Squared and Adjusted R-Squared values.\n- High MSE and RMSE values.\n\n### Strengths\n\n- Offers an extensive evaluation of regression models by combining four key measures of model accuracy and fit.\n- Provides a comprehensive view of the model's performance.\n- Both the R-Squared and Adjusted R-Squared measures are readily interpretable.\n\n### Limitations\n\n- Applicable exclusively to regression models.\n- RMSE and MSE might be sensitive to outliers.\n- A high R-Squared or Adjusted R-Squared may not necessarily indicate a good model, especially in cases of\noverfitting.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": None,
+        "tasks": ["regression"],
+        "tags": ["model_metadata", "model_comparison"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.RegressionPermutationFeatureImportance": {
+        "description": "Assesses the significance of each feature in a model by evaluating the impact on model performance when feature\nvalues are randomly rearranged.\n\n### Purpose\n\nThe primary purpose of this metric is to determine which features significantly impact the performance of a\nregression model developed using statsmodels. The metric measures how much the prediction accuracy deteriorates\nwhen each feature's values are permuted.\n\n### Test Mechanism\n\nThis metric shuffles the values of each feature one at a time in the dataset, computes the model's performance\nafter each permutation, and compares it to the baseline performance. A significant decrease in performance\nindicates the importance of the feature.\n\n### Signs of High Risk\n\n- Significant reliance on a feature that, when permuted, leads to a substantial decrease in performance, suggesting\noverfitting or high model dependency on that feature.\n- Features identified as unimportant despite known impacts from domain knowledge, suggesting potential issues in\nmodel training or data preprocessing.\n\n### Strengths\n\n- Directly assesses the impact of each feature on model performance, providing clear insights into model\ndependencies.\n- Model-agnostic within the scope of statsmodels, applicable to any regression model that outputs predictions.\n\n### Limitations\n\n- The metric is specific to statsmodels and cannot be used with other types of models without adaptation.\n- It does not capture interactions between features, which can lead to underestimating the importance of correlated\nfeatures.\n- Assumes independence of features when calculating importance, which might not always hold true.",
+        "required_inputs": ["model", "dataset"],
+        "default_params": {"fontsize": 12, "figure_height": 500},
+        "tasks": ["regression"],
+        "tags": ["statsmodels", "feature_importance", "visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.model_validation.statsmodels.ScorecardHistogram": {
+        "description": "The Scorecard Histogram test evaluates the distribution of credit scores between default and non-default instances,\nproviding critical insights into the performance and generalizability of credit-risk models.\n\n### Purpose\n\nThe Scorecard Histogram test metric provides a visual interpretation of the credit scores generated by a machine\nlearning model for credit-risk classification tasks. It aims to compare the alignment of the model's scoring\ndecisions with the actual outcomes of credit loan applications. It helps in identifying potential discrepancies\nbetween the model's predictions and real-world risk levels.\n\n### Test Mechanism\n\nThis metric uses logistic regression to generate a histogram of credit scores for both default (negative class) and\nnon-default (positive class) instances. Using both training and test datasets, the metric calculates the credit\nscore of each instance with a scorecard method, considering the impact of different features on the likelihood of\ndefault. It includes the default point to odds (PDO) scaling factor and predefined target score and odds settings.\nHistograms for training and test sets are computed and plotted separately to offer insights into the model's\ngeneralizability to unseen data.\n\n### Signs of High Risk\n\n- Discrepancies between the distributions of training and testing data, indicating a model's poor generalization\nability\n- Skewed distributions favoring specific scores or classes, representing potential bias\n\n### Strengths\n\n- Provides a visual interpretation of the model's credit scoring system, enhancing comprehension of model behavior\n- Enables a direct comparison between actual and predicted scores for both training and testing data\n- Its intuitive visualization helps understand the model's ability to differentiate between positive and negative\nclasses\n- Can unveil patterns or anomalies not easily discerned through numerical metrics alone\n\n### Limitations\n\n- Despite its value for visual interpretation, it doesn't quantify the performance of the model and therefore may\nlack precision for thorough model evaluation\n- The quality of input data can strongly influence the metric, as bias or noise in the data will affect both the\nscore calculation and resultant histogram\n- Its specificity to credit scoring models limits its applicability across a wider variety of machine learning\ntasks and models\n- The metric's effectiveness is somewhat tied to the subjective interpretation of the analyst, relying on their\njudgment of the characteristics and implications of the plot.",
+        "required_inputs": ["dataset"],
+        "default_params": {"title": "Histogram of Scores", "score_column": "score"},
+        "tasks": ["classification"],
+        "tags": ["visualization", "credit_risk", "logistic_regression"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.ongoing_monitoring.FeatureDrift": {
+        "description": "Evaluates changes in feature distribution over time to identify potential model drift.\n\n### Purpose\n\nThe Feature Drift test aims to evaluate how much the distribution of features has shifted over time between two\ndatasets, typically training and monitoring datasets. It uses the Population Stability Index (PSI) to quantify this\nchange, providing insights into the model’s robustness and the necessity for retraining or feature engineering.\n\n### Test Mechanism\n\nThis test calculates the PSI by:\n\n- Bucketing the distributions of each feature in both datasets.\n- Comparing the percentage of observations in each bucket between the two datasets.\n- Aggregating the differences across all buckets for each feature to produce the PSI score for that feature.\n\nThe PSI score is interpreted as:\n\n- PSI < 0.1: No significant population change.\n- PSI < 0.2: Moderate population change.\n- PSI >= 0.2: Significant population change.\n\n### Signs of High Risk\n\n- PSI >= 0.2 for any feature, indicating a significant distribution shift.\n- Consistently high PSI scores across multiple features.\n- Sudden spikes in PSI in recent monitoring data compared to historical data.\n\n### Strengths\n\n- Provides a quantitative measure of feature distribution changes.\n- Easily interpretable thresholds for decision-making.\n- Helps in early detection of data drift, prompting timely interventions.\n\n### Limitations\n\n- May not capture more intricate changes in data distribution nuances.\n- Assumes that bucket thresholds (quantiles) adequately represent distribution shifts.\n- PSI score interpretation can be overly simplistic for complex datasets.",
+        "required_inputs": ["datasets"],
+        "default_params": {
+            "bins": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
+            "feature_columns": None,
+        },
+        "tasks": ["monitoring"],
+        "tags": ["visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.ongoing_monitoring.PredictionAcrossEachFeature": {
+        "description": "Assesses differences in model predictions across individual features between reference and monitoring datasets\nthrough visual analysis.\n\n### Purpose\n\nThe Prediction Across Each Feature test aims to visually compare model predictions for each feature between\nreference (training) and monitoring (production) datasets. It helps identify significant differences in prediction\npatterns for further investigation and ensures the model's consistency and stability over time.\n\n### Test Mechanism\n\nThe test generates scatter plots for each feature, comparing prediction probabilities between the reference and\nmonitoring datasets. Each plot consists of two subplots: one for reference data and one for monitoring data,\nenabling visual comparison of the model's predictive behavior.\n\n### Signs of High Risk\n\n- Significant discrepancies between the reference and monitoring subplots for the same feature.\n- Unexpected patterns or trends in monitoring data that were absent in reference data.\n\n### Strengths\n\n- Provides a clear visual representation of model performance across different features.\n- Facilitates easy identification of features where the model's predictions have diverged.\n- Enables quick detection of potential model performance issues in production.\n\n### Limitations\n\n- Interpretation of scatter plots can be subjective and may require expertise.\n- Visualizations do not provide quantitative metrics for objective evaluation.\n- May not capture all types of distribution changes or issues with the model's predictions.",
+        "required_inputs": ["datasets", "model"],
+        "default_params": {},
+        "tasks": ["monitoring"],
+        "tags": ["visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.ongoing_monitoring.PredictionCorrelation": {
+        "description": "Assesses correlation changes between model predictions from reference and monitoring datasets to detect potential\ntarget drift.\n\n### Purpose\n\nTo evaluate the changes in correlation pairs between model predictions and features from reference and monitoring\ndatasets. This helps in identifying significant shifts that may indicate target drift, potentially affecting model\nperformance.\n\n### Test Mechanism\n\nThis test calculates the correlation of each feature with model predictions for both reference and monitoring\ndatasets. It then compares these correlations side-by-side using a bar plot and a correlation table. Significant\nchanges in correlation pairs are highlighted to signal possible model drift.\n\n### Signs of High Risk\n\n- Significant changes in correlation pairs between the reference and monitoring predictions.\n- Notable differences in correlation values, indicating a possible shift in the relationship between features and\nthe target variable.\n\n### Strengths\n\n- Provides visual identification of drift in feature relationships with model predictions.\n- Clear bar plot comparison aids in understanding model stability over time.\n- Enables early detection of target drift, facilitating timely interventions.\n\n### Limitations\n\n- Requires substantial reference and monitoring data for accurate comparison.\n- Correlation does not imply causation; other factors may influence changes.\n- Focuses solely on linear relationships, potentially missing non-linear interactions.",
+        "required_inputs": ["datasets", "model"],
+        "default_params": {},
+        "tasks": ["monitoring"],
+        "tags": ["visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.ongoing_monitoring.TargetPredictionDistributionPlot": {
+        "description": "Assesses differences in prediction distributions between a reference dataset and a monitoring dataset to identify\npotential data drift.\n\n### Purpose\n\nThe Target Prediction Distribution Plot test aims to evaluate potential changes in the prediction distributions\nbetween the reference and new monitoring datasets. It seeks to identify underlying shifts in data characteristics\nthat warrant further investigation.\n\n### Test Mechanism\n\nThis test generates Kernel Density Estimation (KDE) plots for prediction probabilities from both the reference and\nmonitoring datasets. By visually comparing the KDE plots, it assesses significant differences in the prediction\ndistributions between the two datasets.\n\n### Signs of High Risk\n\n- Significant divergence between the distribution curves of reference and monitoring predictions.\n- Unusual shifts or bimodal distribution in the monitoring predictions compared to the reference predictions.\n\n### Strengths\n\n- Visual representation makes it easy to spot differences in prediction distributions.\n- Useful for identifying potential data drift or changes in underlying data characteristics.\n- Simple and efficient to implement using standard plotting libraries.\n\n### Limitations\n\n- Subjective interpretation of the visual plots.\n- Might not pinpoint the exact cause of distribution changes.\n- Less effective if the differences in distributions are subtle and not easily visible.",
+        "required_inputs": ["datasets", "model"],
+        "default_params": {},
+        "tasks": ["monitoring"],
+        "tags": ["visualization"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Bias": {
+        "description": "Assesses potential bias in a Large Language Model by analyzing the distribution and order of exemplars in the\nprompt.\n\n### Purpose\n\nThe Bias Evaluation test calculates if and how the order and distribution of exemplars (examples) in a few-shot\nlearning prompt affect the output of a Large Language Model (LLM). The results of this evaluation can be used to\nfine-tune the model's performance and manage any unintended biases in its results.\n\n### Test Mechanism\n\nThis test uses two checks:\n\n1. **Distribution of Exemplars:** The number of positive vs. negative examples in a prompt is varied. The test then\nexamines the LLM's classification of a neutral or ambiguous statement under these circumstances.\n2. **Order of Exemplars:** The sequence in which positive and negative examples are presented to the model is\nmodified. Their resultant effect on the LLM's response is studied.\n\nFor each test case, the LLM grades the input prompt on a scale of 1 to 10. It evaluates whether the examples in the\nprompt could produce biased responses. The test only passes if the score meets or exceeds a predetermined minimum\nthreshold. This threshold is set at 7 by default but can be modified as per the requirements via the test\nparameters.\n\n### Signs of High Risk\n\n- A skewed result favoring either positive or negative responses may suggest potential bias in the model. This skew\ncould be caused by an unbalanced distribution of positive and negative exemplars.\n- If the score given by the model is less than the set minimum threshold, it might indicate a risk of high bias and\nhence poor performance.\n\n### Strengths\n\n- This test provides a quantitative measure of potential bias, offering clear guidelines for developers about\nwhether their Large Language Model (LLM) contains significant bias.\n- It is useful in evaluating the impartiality of the model based on the distribution and sequence of examples.\n- The flexibility to adjust the minimum required threshold allows tailoring this test to stricter or more lenient\nbias standards.\n\n### Limitations\n\n- The test may not pick up on more subtle forms of bias or biases that are not directly related to the distribution\nor order of exemplars.\n- The test's effectiveness will decrease if the quality or balance of positive and negative exemplars is not\nrepresentative of the problem space the model is intended to solve.\n- The use of a grading mechanism to gauge bias may not be entirely accurate in every case, particularly when the\ndifference between threshold and score is narrow.",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Clarity": {
+        "description": "Evaluates and scores the clarity of prompts in a Large Language Model based on specified guidelines.\n\n### Purpose\n\nThe Clarity evaluation metric is used to assess how clear the prompts of a Large Language Model (LLM) are. This\nassessment is particularly important because clear prompts assist the LLM in more accurately interpreting and\nresponding to instructions.\n\n### Test Mechanism\n\nThe evaluation uses an LLM to scrutinize the clarity of prompts, factoring in considerations such as the inclusion\nof relevant details, persona adoption, step-by-step instructions, usage of examples, and specification of desired\noutput length. Each prompt is rated on a clarity scale of 1 to 10, and any prompt scoring at or above the preset\nthreshold (default of 7) will be marked as clear. It is important to note that this threshold can be adjusted via\ntest parameters, providing flexibility in the evaluation process.\n\n### Signs of High Risk\n\n- Prompts that consistently score below the clarity threshold\n- Repeated failure of prompts to adhere to guidelines for clarity, including detail inclusion, persona adoption,\nexplicit step-by-step instructions, use of examples, and specification of output length\n\n### Strengths\n\n- Encourages the development of more effective prompts that aid the LLM in interpreting instructions accurately\n- Applies a quantifiable measure (a score from 1 to 10) to evaluate the clarity of prompts\n- Threshold for clarity is adjustable, allowing for flexible evaluation depending on the context\n\n### Limitations\n\n- Scoring system is subjective and relies on the AI’s interpretation of 'clarity'\n- The test assumes that all required factors (detail inclusion, persona adoption, step-by-step instructions, use of\nexamples, and specification of output length) contribute equally to clarity, which might not always be the case\n- The evaluation may not be as effective if used on non-textual models",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Conciseness": {
+        "description": "Analyzes and grades the conciseness of prompts provided to a Large Language Model.\n\n### Purpose\n\nThe Conciseness Assessment is designed to evaluate the brevity and succinctness of prompts provided to a Language\nLearning Model (LLM). A concise prompt strikes a balance between offering clear instructions and eliminating\nredundant or unnecessary information, ensuring that the LLM receives relevant input without being overwhelmed.\n\n### Test Mechanism\n\nUsing an LLM, this test conducts a conciseness analysis on input prompts. The analysis grades the prompt on a scale\nfrom 1 to 10, where the grade reflects how well the prompt delivers clear instructions without being verbose.\nPrompts that score equal to or above a predefined threshold (default set to 7) are deemed successfully concise.\nThis threshold can be adjusted to meet specific requirements.\n\n### Signs of High Risk\n\n- Prompts that consistently score below the predefined threshold.\n- Prompts that are overly wordy or contain unnecessary information.\n- Prompts that create confusion or ambiguity due to excess or unnecessary information.\n\n### Strengths\n\n- Ensures clarity and effectiveness of the prompts.\n- Promotes brevity and preciseness in prompts without sacrificing essential information.\n- Useful for models like LLMs, where input prompt length and clarity greatly influence model performance.\n- Provides a quantifiable measure of prompt conciseness.\n\n### Limitations\n\n- The conciseness score is based on an AI's assessment, which might not fully capture human interpretation of\nconciseness.\n- The predefined threshold for conciseness could be subjective and might need adjustment based on application.\n- The test is dependent on the LLM’s understanding of conciseness, which might vary from model to model.",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Delimitation": {
+        "description": "Evaluates the proper use of delimiters in prompts provided to Large Language Models.\n\n### Purpose\n\nThe Delimitation Test aims to assess whether prompts provided to the Language Learning Model (LLM) correctly use\ndelimiters to mark different sections of the input. Well-delimited prompts help simplify the interpretation process\nfor the LLM, ensuring that the responses are precise and accurate.\n\n### Test Mechanism\n\nThe test employs an LLM to examine prompts for appropriate use of delimiters such as triple quotation marks, XML\ntags, and section titles. Each prompt is assigned a score from 1 to 10 based on its delimitation integrity. Prompts\nwith scores equal to or above the preset threshold (which is 7 by default, although it can be adjusted as\nnecessary) pass the test.\n\n### Signs of High Risk\n\n- Prompts missing, improperly placed, or incorrectly used delimiters, leading to misinterpretation by the LLM.\n- High-risk scenarios with complex prompts involving multiple tasks or diverse data where correct delimitation is\ncrucial.\n- Scores below the threshold, indicating a high risk.\n\n### Strengths\n\n- Ensures clarity in demarcating different components of given prompts.\n- Reduces ambiguity in understanding prompts, especially for complex tasks.\n- Provides a quantified insight into the appropriateness of delimiter usage, aiding continuous improvement.\n\n### Limitations\n\n- Only checks for the presence and placement of delimiters, not whether the correct delimiter type is used for the\nspecific data or task.\n- May not fully reveal the impacts of poor delimitation on the LLM's final performance.\n- The preset score threshold may not be refined enough for complex tasks and prompts, requiring regular manual\nadjustment.",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.NegativeInstruction": {
+        "description": "Evaluates and grades the use of affirmative, proactive language over negative instructions in LLM prompts.\n\n### Purpose\n\nThe Negative Instruction test is utilized to scrutinize the prompts given to a Large Language Model (LLM). The\nobjective is to ensure these prompts are expressed using proactive, affirmative language. The focus is on\ninstructions indicating what needs to be done rather than what needs to be avoided, thereby guiding the LLM more\nefficiently towards the desired output.\n\n### Test Mechanism\n\nAn LLM is employed to evaluate each prompt. The prompt is graded based on its use of positive instructions with\nscores ranging between 1-10. This grade reflects how effectively the prompt leverages affirmative language while\nshying away from negative or restrictive instructions. A prompt that attains a grade equal to or above a\npredetermined threshold (7 by default) is regarded as adhering effectively to the best practices of positive\ninstruction. This threshold can be custom-tailored through the test parameters.\n\n### Signs of High Risk\n\n- Low score obtained from the LLM analysis, indicating heavy reliance on negative instructions in the prompts.\n- Failure to surpass the preset minimum threshold.\n- The LLM generates ambiguous or undesirable outputs as a consequence of the negative instructions used in the\nprompt.\n\n### Strengths\n\n- Encourages the usage of affirmative, proactive language in prompts, aiding in more accurate and advantageous\nmodel responses.\n- The test result provides a comprehensible score, helping to understand how well a prompt follows the positive\ninstruction best practices.\n\n### Limitations\n\n- Despite an adequate score, a prompt could still be misleading or could lead to undesired responses due to factors\nnot covered by this test.\n- The test necessitates an LLM for evaluation, which might not be available or feasible in certain scenarios.\n- A numeric scoring system, while straightforward, may oversimplify complex issues related to prompt designing and\ninstruction clarity.\n- The effectiveness of the test hinges significantly on the predetermined threshold level, which can be subjective\nand may need to be adjusted according to specific use-cases.",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Robustness": {
+        "description": "Assesses the robustness of prompts provided to a Large Language Model under varying conditions and contexts.\n\n### Purpose\n\nThe Robustness test is meant to evaluate the resilience and reliability of prompts provided to a Language Learning\nModel (LLM). The aim of this test is to guarantee that the prompts consistently generate accurate and expected\noutputs, even in diverse or challenging scenarios.\n\n### Test Mechanism\n\nThe Robustness test appraises prompts under various conditions, alterations, and contexts to ascertain their\nstability in producing consistent responses from the LLM. Factors evaluated include different phrasings, inclusion\nof potential distracting elements, and various input complexities. By default, the test generates 10 inputs for a\nprompt but can be adjusted according to test parameters.\n\n### Signs of High Risk\n\n- If the output from the tests diverges extensively from the expected results, this indicates high risk.\n- When the prompt doesn't give a consistent performance across various tests.\n- A high risk is indicated when the prompt is susceptible to breaking, especially when the output is expected to be\nof a specific type.\n\n### Strengths\n\n- The robustness test helps to ensure stable performance of the LLM prompts and lowers the chances of generating\nunexpected or off-target outputs.\n- This test is vital for applications where predictability and reliability of the LLM’s output are crucial.\n\n### Limitations\n\n- Currently, the test only supports single-variable prompts, which restricts its application to more complex models.\n- When there are too many target classes (over 10), the test is skipped, which can leave potential vulnerabilities\nunchecked in complex multi-class models.\n- The test may not account for all potential conditions or alterations that could show up in practical use\nscenarios.",
+        "required_inputs": ["model"],
+        "default_params": {"num_tests": 10},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+    "validmind.prompt_validation.Specificity": {
+        "description": "Evaluates and scores the specificity of prompts provided to a Large Language Model (LLM), based on clarity, detail,\nand relevance.\n\n### Purpose\n\nThe Specificity Test evaluates the clarity, precision, and effectiveness of the prompts provided to a Language\nModel (LLM). It aims to ensure that the instructions embedded in a prompt are indisputably clear and relevant,\nthereby helping to remove ambiguity and steer the LLM towards desired outputs. This level of specificity\nsignificantly affects the accuracy and relevance of LLM outputs.\n\n### Test Mechanism\n\nThe Specificity Test employs an LLM to grade each prompt based on clarity, detail, and relevance parameters within\na specificity scale that extends from 1 to 10. On this scale, prompts scoring equal to or more than a predefined\nthreshold (set to 7 by default) pass the evaluation, while those scoring below this threshold fail it. Users can\nadjust this threshold as per their requirements.\n\n### Signs of High Risk\n\n- Prompts scoring consistently below the established threshold\n- Vague or ambiguous prompts that do not provide clear direction to the LLM\n- Overly verbose prompts that may confuse the LLM instead of providing clear guidance\n\n### Strengths\n\n- Enables precise and clear communication with the LLM to achieve desired outputs\n- Serves as a crucial means to measure the effectiveness of prompts\n- Highly customizable, allowing users to set their threshold based on specific use cases\n\n### Limitations\n\n- This test doesn't consider the content comprehension capability of the LLM\n- High specificity score doesn't guarantee a high-quality response from the LLM, as the model's performance is also\ndependent on various other factors\n- Striking a balance between specificity and verbosity can be challenging, as overly detailed prompts might confuse\nor mislead the model",
+        "required_inputs": ["model.prompt"],
+        "default_params": {"min_threshold": 7},
+        "tasks": ["text_classification", "text_summarization"],
+        "tags": ["llm", "zero_shot", "few_shot"],
+        "required_dependencies": [],
+        "extra": None,
+    },
+}
@@ -4,6 +4,8 @@
 
 """Module for storing loaded tests and test providers"""
 
+from pathlib import Path
+
 
 def singleton(cls):
     """Decorator to make a class a singleton"""
@@ -57,12 +59,40 @@ class TestProviderStore:
 
 
 class TestStore:
-    """Singleton class for storing loaded tests"""
+    """Singleton class for storing loaded tests
+
+    The IDs of the built-in tests are discovered from the test directories the first
+    time they are needed instead of when the module is imported.
+    """
 
     def __init__(self):
-        self.tests = {}
+        self._tests = {}
+        self._discovered = False
         self.custom_tests = {}
 
+    @property
+    def tests(self) -> dict:
+        if not self._discovered:
+            self._discovered = True
+            self._discover_tests()
+
+        return self._tests
+
+    def _discover_tests(self):
+        tests_dir = Path(__file__).parent
+        directories = [p.name for p in tests_dir.iterdir() if p.is_dir()]
+
+        for d in directories:
+            for path in tests_dir.joinpath(d).glob("**/**/*.py"):
+                if path.name.startswith("__") or not path.name[0].isupper():
+                    continue  # skip __init__.py and other special files as well as non Test files
+                test_id = (
+                    f"validmind.{d}.{path.parent.stem}.{path.stem}"
+                    if path.parent.parent.stem == d
+                    else f"validmind.{d}.{path.stem}"
+                )
+                self._tests.setdefault(test_id, None)
+
     def get_test(self, test_id: str):
         """Get a test by test ID
 
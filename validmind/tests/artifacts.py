@@ -0,0 +1,253 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""Artifacts derived from test inputs that are shared between tests
+
+Many tests compute the same intermediate results for the same dataset and model
+(e.g. a correlation matrix or a ROC curve). When a test is run as part of a test
+suite or through `run_test`, the functions in this module compute each artifact
+once per run and return the cached result to every other test that needs it.
+Outside of a run they simply compute the artifact.
+
+Artifacts are shared between tests so they must not be modified.
+
+The artifacts of polars datasets are computed by polars without building a pandas
+dataframe (see `validmind.vm_models.dataset.polars_ops`).
+"""
+
+import functools
+from typing import Callable, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn import metrics
+
+from ..vm_models.dataset import PolarsDataset, VMDataset
+from ..vm_models.dataset.profile import (
+    DatasetProfile,
+    pearson_correlation,
+    profile_dataframe,
+)
+from ..vm_models.dataset.utils import column_view
+from ..vm_models.model import VMModel
+from ..vm_models.test_context import ArtifactCache, get_current_context
+
+# percentiles included in the summary statistics of numerical columns
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75, 0.9, 0.95)
+
+
+def _freeze(value, cache: ArtifactCache, columns: List[str] = None):
+    """Turn an artifact argument into a hashable key
+
+    Datasets are keyed by the fingerprint of `columns` (all of `dataset.df` if not
+    given) so only the columns an artifact reads are hashed, once per run.
+    """
+    if isinstance(value, VMDataset):
+        # columns are also part of the key since they determine what `dataset.df`
+        # and `dataset.y` return for the same data
+        columns = value._df_columns() if columns is None else list(columns)
+        return (
+            "dataset",
+            cache.fingerprint(value, columns),
+            tuple(columns),
+            value.target_column,
+        )
+
+    if isinstance(value, VMModel):
+        return ("model", value.input_id, id(value))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v, cache, columns) for v in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v, cache, columns)) for k, v in value.items()))
+
+    return value
+
+
+def artifact(func: Callable = None, *, columns: Callable = None) -> Callable:
+    """Decorator for functions that derive an artifact from a dataset and/or model
+
+    The artifact is cached in the `TestContext` of the test being run, keyed by the
+    fingerprint of the dataset, the model and the other arguments. The columns that
+    datasets share with the user's dataframe are only hashed once per run so they
+    must not be modified while the tests are running.
+
+    Args:
+        columns (Callable, optional): Called with the artifact's arguments, returns
+            the dataset columns the artifact reads. Only these columns are hashed
+            for the key. Defaults to all the columns of `dataset.df`.
+    """
+    if func is None:
+        return functools.partial(artifact, columns=columns)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        context = get_current_context()
+        if context is None:
+            return func(*args, **kwargs)
+
+        read = None if columns is None else columns(*args, **kwargs)
+        cache = context.artifacts
+        key = (name, _freeze(args, cache, read), _freeze(kwargs, cache, read))
+
+        return cache.get(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _group_columns(dataset: VMDataset, by: Union[str, List[str]], column=None):
+    by = [by] if isinstance(by, str) else list(by)
+    return by if column is None else [*by, column]
+
+
+def _prediction_columns(dataset: VMDataset, model: VMModel) -> List[str]:
+    return [dataset.target_column, dataset.prediction_column(model)]
+
+
+def _probability_columns(dataset: VMDataset, model: VMModel) -> List[str]:
+    return [dataset.target_column, dataset.probability_column(model)]
+
+
+@artifact
+def correlation_matrix(dataset: VMDataset) -> pd.DataFrame:
+    """Pearson correlation matrix of the numerical columns in `dataset.df`"""
+    columns = dataset._df_columns()
+
+    if isinstance(dataset, PolarsDataset):
+        from ..vm_models.dataset import polars_ops
+
+        return polars_ops.pearson_correlation(
+            dataset.lazy(columns),
+            {column: dataset._dtypes[column] for column in columns},
+        )
+
+    return pearson_correlation(column_view(dataset._df, columns))
+
+
+@artifact
+def profile(dataset: VMDataset) -> DatasetProfile:
+    """Statistics of every column in `dataset.df` computed in a single pass
+
+    See `validmind.vm_models.dataset.profile` for the statistics included. The
+    statistics are exact unless approximate profiling has been enabled with
+    `configure_profiling` (or `VALIDMIND_PROFILE_APPROXIMATE`).
+    """
+    columns = dataset._df_columns()
+
+    if isinstance(dataset, PolarsDataset):
+        from ..vm_models.dataset import polars_ops
+
+        return polars_ops.profile_frame(
+            dataset.lazy(columns),
+            {column: dataset._dtypes[column] for column in columns},
+        )
+
+    return profile_dataframe(column_view(dataset._df, columns))
+
+
+@artifact
+def column_types(dataset: VMDataset) -> Dict[str, str]:
+    """Type of each column in `dataset.df` as inferred by ydata-profiling
+
+    e.g. "Numeric", "Categorical", "Boolean", "Text", "DateTime" or "Unsupported"
+    """
+    from ydata_profiling.config import Settings
+    from ydata_profiling.model.typeset import ProfilingTypeSet
+
+    typeset = ProfilingTypeSet(Settings())
+    columns = dataset._df_columns()
+
+    if isinstance(dataset, PolarsDataset):
+        from ..vm_models.dataset.polars_ops import to_pandas
+
+        # one column at a time so no pandas copy of the whole dataset is needed
+        return {
+            column: str(typeset.infer_type(to_pandas(dataset.lazy([column])))[column])
+            for column in columns
+        }
+
+    df = column_view(dataset._df, columns)
+
+    return {column: str(type_) for column, type_ in typeset.infer_type(df).items()}
+
+
+@artifact(columns=lambda dataset, column: [column])
+def value_counts(dataset: VMDataset, column: str) -> pd.Series:
+    """Counts of the unique (non-null) values of a column, most frequent first"""
+    if isinstance(dataset, PolarsDataset):
+        from ..vm_models.dataset import polars_ops
+
+        return polars_ops.value_counts(dataset.lazy(), column, dataset._dtypes[column])
+
+    return dataset._df[column].value_counts()
+
+
+@artifact(columns=_group_columns)
+def group_stats(
+    dataset: VMDataset, by: Union[str, List[str]], column: str = None
+) -> pd.DataFrame:
+    """Number of rows (`size`) and mean of `column` (`mean`) of each group of rows
+
+    Equivalent to `dataset.df.groupby(by)`: groups with missing keys are left out
+    and the groups are sorted by their keys, which make up the index.
+    """
+    if isinstance(dataset, PolarsDataset):
+        from ..vm_models.dataset import polars_ops
+
+        return polars_ops.group_stats(dataset.lazy(), by, column)
+
+    grouped = dataset._df.groupby(by)
+
+    stats = grouped.size().to_frame("size")
+    if column is not None:
+        stats["mean"] = grouped[column].mean()
+
+    return stats
+
+
+@artifact(columns=_prediction_columns)
+def confusion_matrix(dataset: VMDataset, model: VMModel) -> Tuple[np.ndarray, list]:
+    """Confusion matrix of a classifier's predictions and the sorted class labels"""
+    y_pred = dataset.y_pred(model)
+    y_true = dataset.y.astype(y_pred.dtype)
+    labels = np.sort(np.unique(dataset.y)).T.tolist()
+
+    return (
+        _readonly(metrics.confusion_matrix(y_true, y_pred, labels=labels)),
+        labels,
+    )
+
+
+@artifact(columns=_probability_columns)
+def roc_curve(
+    dataset: VMDataset, model: VMModel
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ROC curve of a binary classifier's probabilities as `(fpr, tpr, thresholds)`
+
+    Includes all thresholds (`drop_intermediate=False`).
+    """
+    y_prob = dataset.y_prob(model)
+    y_true = dataset.y.astype(y_prob.dtype).flatten()
+
+    return tuple(
+        _readonly(values)
+        for values in metrics.roc_curve(y_true, y_prob, drop_intermediate=False)
+    )
+
+
+@artifact(columns=_probability_columns)
+def roc_auc(dataset: VMDataset, model: VMModel) -> float:
+    """ROC AUC score of a binary classifier's probabilities"""
+    y_prob = dataset.y_prob(model)
+    y_true = dataset.y.astype(y_prob.dtype).flatten()
+
+    return metrics.roc_auc_score(y_true, y_prob)
@@ -4,7 +4,6 @@
 
 import pandas as pd
 import plotly.graph_objects as go
-from statsmodels.tsa.stattools import acf, pacf
 
 from validmind.vm_models import Figure, Metric
 
@@ -61,6 +60,8 @@ class ACFandPACFPlot(Metric):
     ]
 
     def run(self):
+        from statsmodels.tsa.stattools import acf, pacf
+
         # Check if index is datetime
         if not pd.api.types.is_datetime64_any_dtype(self.inputs.dataset.df.index):
             raise ValueError("Index must be a datetime type")
@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller
 
 from validmind.logging import get_logger
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
@@ -92,6 +91,8 @@ class ADF(Metric):
         """
         Calculates ADF metric for each of the dataset features
         """
+        from statsmodels.tsa.stattools import adfuller
+
         dataset = self.inputs.dataset.df
 
         # Check if the dataset is a time series
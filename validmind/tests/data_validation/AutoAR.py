@@ -3,8 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.tsa.ar_model import AutoReg
-from statsmodels.tsa.stattools import adfuller
 
 from validmind.logging import get_logger
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
@@ -65,6 +63,9 @@ class AutoAR(Metric):
     tags = ["time_series_data", "statsmodels", "forecasting", "statistical_test"]
 
     def run(self):
+        from statsmodels.tsa.ar_model import AutoReg
+        from statsmodels.tsa.stattools import adfuller
+
         if "max_ar_order" not in self.params:
             raise ValueError("max_ar_order must be provided in params")
 
@@ -4,7 +4,6 @@
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 from validmind.logging import get_logger
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
@@ -73,6 +72,8 @@ class AutoSeasonality(Metric):
     ]
 
     def evaluate_seasonal_periods(self, series, min_period, max_period):
+        from statsmodels.tsa.seasonal import seasonal_decompose
+
         seasonal_periods = []
         residual_errors = []
 
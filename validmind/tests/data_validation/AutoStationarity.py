@@ -4,7 +4,6 @@
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.stattools import adfuller
 
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
@@ -69,6 +68,8 @@ class AutoStationarity(Metric):
     ]
 
     def run(self):
+        from statsmodels.tsa.stattools import adfuller
+
         if "max_order" not in self.params:
             raise ValueError("max_order must be provided in params")
         max_order = self.params["max_order"]
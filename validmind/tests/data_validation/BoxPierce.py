@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.stats.diagnostic import acorr_ljungbox
 
 from validmind import tags, tasks
 
@@ -53,6 +52,7 @@ def BoxPierce(dataset):
     - In the presence of trends or seasonal patterns, the Box-Pierce test may yield misleading results.
     - Applicability is limited to time-series data, which limits its overall utility.
     """
+    from statsmodels.stats.diagnostic import acorr_ljungbox
 
     df = dataset.df
 
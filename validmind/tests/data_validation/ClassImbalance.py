@@ -12,6 +12,7 @@ import pandas as pd
 import plotly.graph_objs as go
 
 from validmind.errors import SkipTestError
+from validmind.tests.artifacts import value_counts
 from validmind.vm_models import (
     Figure,
     ResultSummary,
@@ -101,9 +102,8 @@ class ClassImbalance(ThresholdTest):
             return
 
         target_column = self.inputs.dataset.target_column
-        imbalance_percentages = self.inputs.dataset.df[target_column].value_counts(
-            normalize=True
-        )
+        counts = value_counts(self.inputs.dataset, target_column)
+        imbalance_percentages = counts / counts.sum()
         if len(imbalance_percentages) > 10:
             raise SkipTestError(
                 f"Skipping {self.__class__.__name__} test as"
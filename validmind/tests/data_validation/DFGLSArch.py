@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-from arch.unitroot import DFGLS
 from numpy.linalg import LinAlgError
 
 from validmind.logging import get_logger
@@ -66,6 +65,8 @@ class DFGLSArch(Metric):
         """
         Calculates Dickey-Fuller GLS metric for each of the dataset features
         """
+        from arch.unitroot import DFGLS
+
         dataset = self.inputs.dataset.df
 
         # Check if the dataset is a time series
@@ -6,12 +6,9 @@ import re
 from collections import Counter
 from dataclasses import dataclass
 
-import numpy as np
-from ydata_profiling.config import Settings
-from ydata_profiling.model.typeset import ProfilingTypeSet
-
 from validmind.errors import UnsupportedColumnTypeError
 from validmind.logging import get_logger
+from validmind.tests.artifacts import DESCRIBE_PERCENTILES, column_types, profile
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
 DEFAULT_HISTOGRAM_BINS = 10
@@ -109,6 +106,13 @@ class DatasetDescription(Metric):
                 }
             )
 
+        # error bounds are only reported when distinct values were estimated
+        if any("distinct_error" in field["statistics"] for field in metric_value):
+            for row, field in zip(results_table, metric_value):
+                row["Distinct Error (±%)"] = (
+                    field["statistics"].get("distinct_error", 0) * 100
+                )
+
         return ResultSummary(
             results=[
                 ResultTable(
@@ -120,75 +124,75 @@ class DatasetDescription(Metric):
 
     def run(self):
         results = []
-        for ds_field in self.infer_datatype(self.inputs.dataset.df):
-            self.describe_dataset_field(self.inputs.dataset.df, ds_field)
+        for ds_field in self.infer_datatype(self.inputs.dataset):
+            self.describe_dataset_field(self.inputs.dataset, ds_field)
             results.append(ds_field)
         return self.cache_results(results)
 
-    def infer_datatype(self, df):
+    def infer_datatype(self, dataset):
         vm_dataset_variables = {}
-        typeset = ProfilingTypeSet(Settings())
-        variable_types = typeset.infer_type(df)
+        dataset_profile = profile(dataset)
 
-        for column, type in variable_types.items():
-            if str(type) == "Unsupported":
-                if df[column].isnull().all():
+        for column, type in column_types(dataset).items():
+            if type == "Unsupported":
+                if dataset_profile[column].count == 0:
                     vm_dataset_variables[column] = {"id": column, "type": "Null"}
                 else:
                     raise UnsupportedColumnTypeError(
                         f"Unsupported type for column {column}. Please review all values in this dataset column."
                     )
             else:
-                vm_dataset_variables[column] = {"id": column, "type": str(type)}
+                vm_dataset_variables[column] = {"id": column, "type": type}
 
         return list(vm_dataset_variables.values())
 
-    def describe_dataset_field(self, df, field):
+    def describe_dataset_field(self, dataset, field):
         """
-        Gets descriptive statistics for a single field in a Pandas DataFrame.
+        Gets descriptive statistics for a single field in a VMDataset.
         """
+        column = profile(dataset)[field["id"]]
         field_type = field["type"]
 
-        # - When we call describe on one field at a time, Pandas will
-        #   know better if it needs to report on numerical or categorical statistics
+        # - Numerical fields are reported with numerical statistics and
+        #   everything else with categorical statistics
         # - Boolean (binary) fields should be reported as categorical
         #       (force to categorical when nunique == 2)
-        if field_type == ["Boolean"] or df[field["id"]].nunique() == 2:
-            top_value = df[field["id"]].value_counts().nlargest(1)
+        if field_type == ["Boolean"] or column.n_distinct == 2:
+            top_value = column.value_counts.nlargest(1)
 
             field["statistics"] = {
-                "count": df[field["id"]].count(),
-                "unique": df[field["id"]].nunique(),
+                "count": column.count,
+                "unique": column.n_distinct,
                 "top": top_value.index[0],
                 "freq": top_value.values[0],
             }
         elif field_type == "Numeric":
-            field["statistics"] = (
-                df[field["id"]]
-                .describe(percentiles=[0.25, 0.5, 0.75, 0.9, 0.95])
-                .to_dict()
-            )
+            field["statistics"] = column.describe(DESCRIBE_PERCENTILES).to_dict()
         elif field_type == "Categorical" or field_type == "Text":
-            field["statistics"] = (
-                df[field["id"]].astype("category").describe().to_dict()
-            )
+            top, freq = column.top
+            field["statistics"] = {
+                "count": column.count,
+                "unique": column.n_distinct,
+                "top": top,
+                "freq": freq,
+            }
 
         # Initialize statistics object for non-numeric or categorical fields
         if "statistics" not in field:
             field["statistics"] = {}
 
-        field["statistics"]["n_missing"] = df[field["id"]].isna().sum()
-        field["statistics"]["missing"] = field["statistics"]["n_missing"] / len(
-            df[field["id"]]
-        )
-        field["statistics"]["n_distinct"] = df[field["id"]].nunique()
-        field["statistics"]["distinct"] = field["statistics"]["n_distinct"] / len(
-            df[field["id"]]
-        )
+        field["statistics"]["n_missing"] = column.n_missing
+        field["statistics"]["missing"] = column.p_missing
+        field["statistics"]["n_distinct"] = column.n_distinct
+        field["statistics"]["distinct"] = column.p_distinct
+        if column.approximate:
+            field["statistics"]["distinct_error"] = column.distinct_error
 
-        field["histograms"] = self.get_field_histograms(df, field["id"], field_type)
+        field["histograms"] = self.get_field_histograms(
+            dataset, field["id"], field_type
+        )
 
-    def get_field_histograms(self, df, field, type_):
+    def get_field_histograms(self, dataset, field, type_):
         """
         Returns a collection of histograms for a numerical or categorical field.
         We store different combinations of bin sizes to allow analyzing the data better
@@ -197,18 +201,18 @@ class DatasetDescription(Metric):
         """
         # Set the minimum number of bins to nunique if it's less than the default
         if type_ == "Numeric":
-            return self.get_numerical_histograms(df, field)
+            return self.get_numerical_histograms(dataset, field)
         elif type_ == "Categorical" or type_ == "Boolean":
-            value_counts = df[field].value_counts()
+            counts = profile(dataset)[field].value_counts
             return {
                 "default": {
-                    "bin_size": len(value_counts),
-                    "histogram": value_counts.to_dict(),
+                    "bin_size": len(counts),
+                    "histogram": counts.to_dict(),
                 }
             }
         elif type_ == "Text":
             # Combine all the text in the specified field
-            text_data = " ".join(df[field].astype(str))
+            text_data = " ".join(dataset._df[field].astype(str))
             # Split the text into words (tokens) using a regular expression
             words = re.findall(r"\w+", text_data)
             # Use Counter to count the frequency of each word
@@ -227,20 +231,19 @@ class DatasetDescription(Metric):
                 f"Unsupported field type found when computing its histogram: {type_}"
             )
 
-    def get_numerical_histograms(self, df, field):
+    def get_numerical_histograms(self, dataset, field):
         """
         Returns a collection of histograms for a numerical field, each one
         with a different bin size
         """
-        values = df[field].to_numpy()
-        values_cleaned = values[~np.isnan(values)]
+        column = profile(dataset)[field]
 
         # bins='sturges'. Cannot use 'auto' until we review and fix its performance
         #  on datasets with too many unique values
         #
         # 'sturges': R’s default method, only accounts for data size. Only optimal
         # for gaussian data and underestimates number of bins for large non-gaussian datasets.
-        default_hist = np.histogram(values_cleaned, bins="sturges")
+        default_hist = column.histogram(bins="sturges")
 
         histograms = {
             "default": {
@@ -253,7 +256,7 @@ class DatasetDescription(Metric):
         }
 
         for bin_size in DEFAULT_HISTOGRAM_BIN_SIZES:
-            hist = np.histogram(values_cleaned, bins=bin_size)
+            hist = column.histogram(bins=bin_size)
             histograms[f"bins_{bin_size}"] = {
                 "bin_size": bin_size,
                 "histogram": {
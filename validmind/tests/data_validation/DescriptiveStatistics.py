@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 import pandas as pd
 
+from validmind.tests.artifacts import DESCRIBE_PERCENTILES, profile
 from validmind.utils import format_records
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
@@ -63,33 +64,59 @@ class DescriptiveStatistics(Metric):
     tasks = ["classification", "regression"]
     tags = ["tabular_data", "time_series_data"]
 
-    def get_summary_statistics_numerical(self, df, numerical_fields):
-        percentiles = [0.25, 0.5, 0.75, 0.90, 0.95]
+    def get_summary_statistics_numerical(self, dataset, numerical_fields):
+        if len(numerical_fields) == 0:
+            return []
 
-        summary_stats = df[numerical_fields].describe(percentiles=percentiles).T
+        dataset_profile = profile(dataset)
+        summary_stats = pd.DataFrame(
+            {
+                column: dataset_profile[column].describe(DESCRIBE_PERCENTILES)
+                for column in numerical_fields
+            }
+        ).T
         summary_stats = summary_stats[
             ["count", "mean", "std", "min", "25%", "50%", "75%", "90%", "95%", "max"]
         ]
         summary_stats.columns = summary_stats.columns.str.title()
+
+        # error bounds are only reported when percentiles were estimated
+        if any(dataset_profile[column].approximate for column in numerical_fields):
+            summary_stats["Percentile Rank Error (±%)"] = [
+                dataset_profile[column].rank_error * 100 for column in numerical_fields
+            ]
         summary_stats.reset_index(inplace=True)
         summary_stats.rename(columns={"index": "Name"}, inplace=True)
 
         return format_records(summary_stats)
 
-    def get_summary_statistics_categorical(self, df, categorical_fields):
+    def get_summary_statistics_categorical(self, dataset, categorical_fields):
+        dataset_profile = profile(dataset)
         summary_stats = pd.DataFrame()
 
-        for column in df[categorical_fields].columns:
-            top_value = df[column].value_counts().idxmax()
-            top_freq = df[column].value_counts().max()
-            summary_stats.loc[column, "Count"] = df[column].count()
-            summary_stats.loc[column, "Number of Unique Values"] = df[column].nunique()
+        approximate = any(
+            dataset_profile[column].approximate for column in categorical_fields
+        )
+
+        for column in categorical_fields:
+            column_profile = dataset_profile[column]
+            top_value, top_freq = column_profile.top
+            summary_stats.loc[column, "Count"] = column_profile.count
+            summary_stats.loc[
+                column, "Number of Unique Values"
+            ] = column_profile.n_distinct
             summary_stats.loc[column, "Top Value"] = top_value
             summary_stats.loc[column, "Top Value Frequency"] = top_freq
             summary_stats.loc[column, "Top Value Frequency %"] = (
-                top_freq / df[column].count()
+                top_freq / column_profile.count
             ) * 100
 
+            # error bounds are only reported when unique values were estimated
+            if approximate:
+                summary_stats.loc[column, "Unique Values Error (±%)"] = (
+                    column_profile.distinct_error * 100
+                )
+
         summary_stats.reset_index(inplace=True)
         summary_stats.rename(columns={"index": "Name"}, inplace=True)
 
@@ -120,17 +147,14 @@ class DescriptiveStatistics(Metric):
         return ResultSummary(results=results)
 
     def run(self):
-        feature_columns = self.inputs.dataset.feature_columns
         numerical_feature_columns = self.inputs.dataset.feature_columns_numeric
         categorical_feature_columns = self.inputs.dataset.feature_columns_categorical
 
-        df = self.inputs.dataset.df[feature_columns]
-
         summary_stats_numerical = self.get_summary_statistics_numerical(
-            df, numerical_feature_columns
+            self.inputs.dataset, numerical_feature_columns
         )
         summary_stats_categorical = self.get_summary_statistics_categorical(
-            df, categorical_feature_columns
+            self.inputs.dataset, categorical_feature_columns
         )
         return self.cache_results(
             {
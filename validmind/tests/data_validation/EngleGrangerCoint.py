@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.tsa.stattools import coint
 
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
@@ -57,6 +56,8 @@ class EngleGrangerCoint(Metric):
     tags = ["time_series_data", "statistical_test", "forecasting"]
 
     def run(self):
+        from statsmodels.tsa.stattools import coint
+
         threshold = self.params["threshold"]
         df = self.inputs.dataset.df.dropna()
 
@@ -7,6 +7,7 @@ import numpy as np
 import plotly.graph_objects as go
 
 from validmind import tags, tasks
+from validmind.tests.artifacts import correlation_matrix
 
 
 @tags("tabular_data", "visualization", "correlation")
@@ -53,20 +54,19 @@ def FeatureTargetCorrelationPlot(dataset, fig_height=600):
     may not accurately reflect their importance.
     """
 
-    # Filter DataFrame based on features and target_column
-    df = dataset.df[dataset.feature_columns + [dataset.target_column]]
+    # Correlations of the (numerical) features with the target variable
+    corr = correlation_matrix(dataset)
+    features = [column for column in corr.index if column in dataset.feature_columns]
+    correlations = corr.loc[features, [dataset.target_column]]
 
-    fig = _visualize_feature_target_correlation(df, dataset.target_column, fig_height)
+    fig = _visualize_feature_target_correlation(
+        correlations, dataset.target_column, fig_height
+    )
 
     return fig
 
 
-def _visualize_feature_target_correlation(df, target_column, fig_height):
-    # Compute correlations with the target variable
-    correlations = (
-        df.corr(numeric_only=True)[target_column].drop(target_column).to_frame()
-    )
-    correlations = correlations.loc[:, ~correlations.columns.duplicated()]
+def _visualize_feature_target_correlation(correlations, target_column, fig_height):
 
     correlations = correlations.sort_values(by=target_column, ascending=True)
 
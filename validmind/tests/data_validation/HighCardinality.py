@@ -5,9 +5,7 @@
 from dataclasses import dataclass
 from typing import List
 
-from ydata_profiling.config import Settings
-from ydata_profiling.model.typeset import ProfilingTypeSet
-
+from validmind.tests.artifacts import column_types, profile
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -81,6 +79,13 @@ class HighCardinality(ThresholdTest):
             }
             for result in results
         ]
+
+        # error bounds are only reported when distinct values were estimated
+        if any("n_distinct_error" in result.values for result in results):
+            for row, result in zip(results_table, results):
+                row["Distinct Values Error (±%)"] = (
+                    result.values.get("n_distinct_error", 0) * 100
+                )
         return ResultSummary(
             results=[
                 ResultTable(
@@ -93,34 +98,38 @@ class HighCardinality(ThresholdTest):
         )
 
     def run(self):
-        typeset = ProfilingTypeSet(Settings())
-        dataset_types = typeset.infer_type(self.inputs.dataset.df)
+        dataset_profile = profile(self.inputs.dataset)
+        dataset_types = column_types(self.inputs.dataset)
 
         results = []
-        rows = self.inputs.dataset.df.shape[0]
+        rows = dataset_profile.n_rows
 
         num_threshold = self.params["num_threshold"]
         if self.params["threshold_type"] == "percent":
             num_threshold = int(self.params["percent_threshold"] * rows)
 
-        for col in self.inputs.dataset.df.columns:
+        for col, column in dataset_profile.columns.items():
             # Only calculate high cardinality for categorical columns
-            if str(dataset_types[col]) != "Categorical":
+            if dataset_types[col] != "Categorical":
                 continue
 
-            n_distinct = self.inputs.dataset.df[col].nunique()
+            n_distinct = column.n_distinct
             p_distinct = n_distinct / rows
 
             passed = n_distinct < num_threshold
 
+            values = {
+                "n_distinct": n_distinct,
+                "p_distinct": p_distinct,
+            }
+            if column.approximate:
+                values["n_distinct_error"] = column.distinct_error
+
             results.append(
                 ThresholdTestResult(
                     column=col,
                     passed=passed,
-                    values={
-                        "n_distinct": n_distinct,
-                        "p_distinct": p_distinct,
-                    },
+                    values=values,
                 )
             )
 
@@ -8,6 +8,7 @@ from typing import List
 import numpy as np
 import pandas as pd
 
+from validmind.tests.artifacts import correlation_matrix
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -101,7 +102,7 @@ class HighPearsonCorrelation(ThresholdTest):
         )
 
     def run(self):
-        corr = self.inputs.dataset.df.corr(numeric_only=True)
+        corr = correlation_matrix(self.inputs.dataset)
 
         # Create a table of correlation coefficients and column pairs
         corr_table = corr.unstack().sort_values(
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.stats.stattools import jarque_bera
 
 from validmind import tags, tasks
 
@@ -50,6 +49,7 @@ def JarqueBera(dataset):
     - Highly sensitive to large sample sizes, often rejecting the null hypothesis (that data is normally distributed)
     even for minor deviations in larger datasets.
     """
+    from statsmodels.stats.stattools import jarque_bera
 
     df = dataset.df[dataset.feature_columns_numeric]
 
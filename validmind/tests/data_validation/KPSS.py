@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-from statsmodels.tsa.stattools import kpss
 
 from validmind.logging import get_logger
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
@@ -69,6 +68,8 @@ class KPSS(Metric):
         """
         Calculates KPSS for each of the dataset features
         """
+        from statsmodels.tsa.stattools import kpss
+
         dataset = self.inputs.dataset.df
 
         # Check if the dataset is a time series
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.stats.diagnostic import acorr_ljungbox
 
 from validmind import tags, tasks
 
@@ -48,6 +47,7 @@ def LJungBox(dataset):
     - Designed more for traditional statistical models and may not be fully compatible with certain types of complex
       machine learning models.
     """
+    from statsmodels.stats.diagnostic import acorr_ljungbox
 
     df = dataset.df
 
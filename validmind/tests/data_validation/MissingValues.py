@@ -5,6 +5,7 @@
 from dataclasses import dataclass
 from typing import List
 
+from validmind.tests.artifacts import profile
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -86,16 +87,15 @@ class MissingValues(ThresholdTest):
         )
 
     def run(self):
-        rows = self.inputs.dataset.df.shape[0]
+        dataset_profile = profile(self.inputs.dataset)
 
-        missing = self.inputs.dataset.df.isna().sum()
         results = [
             ThresholdTestResult(
                 column=col,
-                passed=missing[col] < self.params["min_threshold"],
-                values={"n_missing": missing[col], "p_missing": missing[col] / rows},
+                passed=column.n_missing < self.params["min_threshold"],
+                values={"n_missing": column.n_missing, "p_missing": column.p_missing},
             )
-            for col in missing.index
+            for col, column in dataset_profile.columns.items()
         ]
 
         return self.cache_results(results, passed=all([r.passed for r in results]))
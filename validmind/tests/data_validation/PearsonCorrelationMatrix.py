@@ -6,6 +6,7 @@
 import plotly.graph_objects as go
 
 from validmind import tags, tasks
+from validmind.tests.artifacts import correlation_matrix
 
 
 @tags("tabular_data", "numerical_data", "correlation")
@@ -51,7 +52,7 @@ def PearsonCorrelationMatrix(dataset):
     - The 0.7 correlation threshold is arbitrary and might exclude valid dependencies with lower coefficients.
     """
 
-    corr_matrix = dataset.df.corr(numeric_only=True)
+    corr_matrix = correlation_matrix(dataset)
     heatmap = go.Heatmap(
         z=corr_matrix.values,
         x=list(corr_matrix.columns),
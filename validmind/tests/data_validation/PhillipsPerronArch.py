@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-from arch.unitroot import PhillipsPerron
 from numpy.linalg import LinAlgError
 
 from validmind.logging import get_logger
@@ -70,6 +69,8 @@ class PhillipsPerronArch(Metric):
         """
         Calculates PP metric for each of the dataset features
         """
+        from arch.unitroot import PhillipsPerron
+
         dataset = self.inputs.dataset.df
 
         # Check if the dataset is a time series
@@ -8,6 +8,7 @@ import plotly.graph_objects as go
 
 from validmind import tags, tasks
 from validmind.logging import get_logger
+from validmind.tests.artifacts import group_stats
 
 logger = get_logger(__name__)
 
@@ -68,12 +69,13 @@ def ProtectedClassesDescription(dataset, protected_classes=None):
     figures = []
     all_stats = []
 
-    df = dataset._df
     target = dataset.target_column
 
     for protected_class in protected_classes:
         # Create the stacked bar chart
-        counts = df.groupby([protected_class, target]).size().unstack(fill_value=0)
+        counts = group_stats(dataset, [protected_class, target])["size"].unstack(
+            fill_value=0
+        )
         fig = go.Figure()
         for col in counts.columns:
             fig.add_trace(
@@ -97,23 +99,21 @@ def ProtectedClassesDescription(dataset, protected_classes=None):
 
         figures.append(fig)
 
-        # Get unique values in the target column
-        target_labels = df[target].unique()
+        # the statistics of each category are derived from the counts above
+        category_counts = counts.sum(axis=1)
 
-        for category in df[protected_class].unique():
-            category_data = df[df[protected_class] == category]
+        for category, count in category_counts.items():
             stats = {
                 "Protected Class": protected_class,
                 "Category": category,
-                "Count": len(category_data),
-                "Percentage": len(category_data) / len(df) * 100,
+                "Count": count,
+                "Percentage": count / category_counts.sum() * 100,
             }
 
             # Add mean for each target label
-            for label in target_labels:
-                label_data = category_data[category_data[target] == label]
+            for label in counts.columns:
                 stats[f"Rate {target}: {label}"] = (
-                    len(label_data) / len(category_data) * 100
+                    counts.at[category, label] / count * 100
                 )
 
             all_stats.append(stats)
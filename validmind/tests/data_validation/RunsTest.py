@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.sandbox.stats.runs import runstest_1samp
 
 from validmind import tags, tasks
 
@@ -54,6 +53,7 @@ def RunsTest(dataset):
     - Sensitive to extreme values (outliers), and overly large or small run sequences can influence the results.
     - Does not provide model performance evaluation; it is used to detect patterns in the sequence of outputs only.
     """
+    from statsmodels.sandbox.stats.runs import runstest_1samp
 
     df = dataset.df[dataset.feature_columns_numeric]
 
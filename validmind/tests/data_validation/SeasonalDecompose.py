@@ -9,7 +9,6 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from scipy import stats
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 from validmind.logging import get_logger
 from validmind.vm_models import Figure, Metric
@@ -116,6 +115,8 @@ class SeasonalDecompose(Metric):
         return merged_df.to_dict("records")
 
     def run(self):
+        from statsmodels.tsa.seasonal import seasonal_decompose
+
         # Parse input parameters
         if "seasonal_model" not in self.params:
             raise ValueError("seasonal_model must be provided in params")
@@ -5,9 +5,7 @@
 from dataclasses import dataclass
 from typing import List
 
-from ydata_profiling.config import Settings
-from ydata_profiling.model.typeset import ProfilingTypeSet
-
+from validmind.tests.artifacts import column_types, profile
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -86,20 +84,18 @@ class Skewness(ThresholdTest):
         )
 
     def run(self):
-        typeset = ProfilingTypeSet(Settings())
-        dataset_types = typeset.infer_type(self.inputs.dataset.df)
-
-        skewness = self.inputs.dataset.df.skew(numeric_only=True)
+        dataset_profile = profile(self.inputs.dataset)
+        dataset_types = column_types(self.inputs.dataset)
 
         results = []
         passed = []
 
-        for col in skewness.index:
+        for col, column in dataset_profile.columns.items():
             # Only calculate skewness for numerical columns
-            if str(dataset_types[col]) != "Numeric":
+            if not column.is_numeric or dataset_types[col] != "Numeric":
                 continue
 
-            col_skewness = skewness[col]
+            col_skewness = column.skewness
             col_pass = abs(col_skewness) < self.params["max_threshold"]
             passed.append(col_pass)
             results.append(
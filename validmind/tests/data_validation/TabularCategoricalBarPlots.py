@@ -5,6 +5,7 @@
 import pandas as pd
 import plotly.graph_objs as go
 
+from validmind.tests.artifacts import value_counts
 from validmind.vm_models import Figure, Metric
 
 
@@ -79,7 +80,7 @@ class TabularCategoricalBarPlots(Metric):
 
         figures = []
         for col in categorical_columns:
-            counts = df[col].value_counts()
+            counts = value_counts(self.inputs.dataset, col)
 
             fig = go.Figure()
             fig.add_trace(
@@ -5,6 +5,7 @@
 import pandas as pd
 
 from validmind import tags, tasks
+from validmind.tests.artifacts import DESCRIBE_PERCENTILES, profile
 
 
 @tags("tabular_data")
@@ -104,11 +105,19 @@ def TabularDescriptionTables(dataset):
 
 
 def get_summary_statistics_numerical(dataset, numerical_fields):
-    summary_stats = dataset.df[numerical_fields].describe().T
-    summary_stats["Missing Values (%)"] = (
-        dataset.df[numerical_fields].isnull().mean() * 100
+    dataset_profile = profile(dataset)
+    summary_stats = pd.DataFrame(
+        {
+            column: dataset_profile[column].describe(DESCRIBE_PERCENTILES)
+            for column in numerical_fields
+        }
+    ).T
+    summary_stats["Missing Values (%)"] = pd.Series(
+        {column: dataset_profile[column].p_missing * 100 for column in numerical_fields}
+    )
+    summary_stats["Data Type"] = pd.Series(
+        {column: str(dataset_profile[column].dtype) for column in numerical_fields}
     )
-    summary_stats["Data Type"] = dataset.df[numerical_fields].dtypes.astype(str)
     summary_stats = summary_stats[
         ["count", "mean", "min", "max", "Missing Values (%)", "Data Type"]
     ]
@@ -128,20 +137,22 @@ def get_summary_statistics_numerical(dataset, numerical_fields):
 
 
 def get_summary_statistics_categorical(dataset, categorical_fields):
+    dataset_profile = profile(dataset)
     summary_stats = pd.DataFrame()
     if categorical_fields:  # check if the list is not empty
-        for column in dataset.df[categorical_fields].columns:
-            summary_stats.loc[column, "Num of Obs"] = int(dataset.df[column].count())
-            summary_stats.loc[column, "Num of Unique Values"] = dataset.df[
-                column
-            ].nunique()
-            summary_stats.loc[column, "Unique Values"] = str(
-                dataset.df[column].unique()
-            )
+        for column in categorical_fields:
+            column_profile = dataset_profile[column]
+            summary_stats.loc[column, "Num of Obs"] = int(column_profile.count)
+            summary_stats.loc[
+                column, "Num of Unique Values"
+            ] = column_profile.n_distinct
+            summary_stats.loc[column, "Unique Values"] = str(column_profile.unique)
             summary_stats.loc[column, "Missing Values (%)"] = (
-                dataset.df[column].isnull().mean() * 100
+                column_profile.p_missing * 100
             )
-            summary_stats.loc[column, "Data Type"] = str(dataset.df[column].dtype)
+            summary_stats.loc[column, "Data Type"] = str(column_profile.dtype)
+
+        _add_distinct_error(summary_stats, dataset_profile, categorical_fields)
 
         summary_stats = summary_stats.sort_values(
             by="Missing Values (%)", ascending=False
@@ -152,16 +163,18 @@ def get_summary_statistics_categorical(dataset, categorical_fields):
 
 
 def get_summary_statistics_datetime(dataset, datetime_fields):
+    dataset_profile = profile(dataset)
     summary_stats = pd.DataFrame()
-    for column in dataset.df[datetime_fields].columns:
-        summary_stats.loc[column, "Num of Obs"] = int(dataset.df[column].count())
-        summary_stats.loc[column, "Num of Unique Values"] = dataset.df[column].nunique()
-        summary_stats.loc[column, "Earliest Date"] = dataset.df[column].min()
-        summary_stats.loc[column, "Latest Date"] = dataset.df[column].max()
-        summary_stats.loc[column, "Missing Values (%)"] = (
-            dataset.df[column].isnull().mean() * 100
-        )
-        summary_stats.loc[column, "Data Type"] = str(dataset.df[column].dtype)
+    for column in datetime_fields:
+        column_profile = dataset_profile[column]
+        summary_stats.loc[column, "Num of Obs"] = int(column_profile.count)
+        summary_stats.loc[column, "Num of Unique Values"] = column_profile.n_distinct
+        summary_stats.loc[column, "Earliest Date"] = column_profile.min
+        summary_stats.loc[column, "Latest Date"] = column_profile.max
+        summary_stats.loc[column, "Missing Values (%)"] = column_profile.p_missing * 100
+        summary_stats.loc[column, "Data Type"] = str(column_profile.dtype)
+
+    _add_distinct_error(summary_stats, dataset_profile, datetime_fields)
 
     if not summary_stats.empty:
         summary_stats = summary_stats.sort_values(
@@ -172,20 +185,39 @@ def get_summary_statistics_datetime(dataset, datetime_fields):
     return summary_stats
 
 
+def _add_distinct_error(summary_stats, dataset_profile, fields):
+    # error bounds are only reported when unique values were estimated
+    if any(dataset_profile[column].approximate for column in fields):
+        summary_stats["Unique Values Error (±%)"] = pd.Series(
+            {column: dataset_profile[column].distinct_error * 100 for column in fields}
+        )
+
+
+def _dtypes_df(dataset):
+    # only the dtypes are needed to select columns so leave the data out
+    return dataset._schema_df()[dataset._df_columns()]
+
+
 def get_categorical_columns(dataset):
-    categorical_columns = dataset.df.select_dtypes(
-        include=["object", "category"]
-    ).columns.tolist()
+    categorical_columns = (
+        _dtypes_df(dataset)
+        .select_dtypes(include=["object", "category"])
+        .columns.tolist()
+    )
     return categorical_columns
 
 
 def get_numerical_columns(dataset):
-    numerical_columns = dataset.df.select_dtypes(
-        include=["int", "float", "uint8"]
-    ).columns.tolist()
+    numerical_columns = (
+        _dtypes_df(dataset)
+        .select_dtypes(include=["int", "float", "uint8"])
+        .columns.tolist()
+    )
     return numerical_columns
 
 
 def get_datetime_columns(dataset):
-    datetime_columns = dataset.df.select_dtypes(include=["datetime"]).columns.tolist()
+    datetime_columns = (
+        _dtypes_df(dataset).select_dtypes(include=["datetime"]).columns.tolist()
+    )
     return datetime_columns
@@ -5,6 +5,7 @@
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
+from validmind.tests.artifacts import group_stats, value_counts
 from validmind.vm_models import Figure, Metric
 
 
@@ -58,8 +59,6 @@ class TargetRateBarPlots(Metric):
     tags = ["tabular_data", "visualization", "categorical_data"]
 
     def plot_loan_default_ratio(self, default_column, columns=None):
-        df = self.inputs.dataset.df
-
         # Use all categorical features if columns is not specified, else use selected columns
         if columns is None:
             features = self.inputs.dataset.feature_columns_categorical
@@ -74,8 +73,10 @@ class TargetRateBarPlots(Metric):
             )
 
             # Calculate counts and default rate for each category
-            counts = df[feature].value_counts()
-            default_rate = df.groupby(feature)[default_column].mean()
+            counts = value_counts(self.inputs.dataset, feature)
+            default_rate = group_stats(self.inputs.dataset, feature, default_column)[
+                "mean"
+            ]
 
             # Left plot: Counts
             fig.add_trace(
@@ -125,7 +126,7 @@ class TargetRateBarPlots(Metric):
         if default_column is None:
             raise ValueError("The default_column parameter needs to be specified.")
 
-        unique_values = self.inputs.dataset.df[default_column].unique()
+        unique_values = value_counts(self.inputs.dataset, default_column).index.tolist()
         binary_values = [0, 1]
 
         if sorted(unique_values) != binary_values:
@@ -5,9 +5,7 @@
 from dataclasses import dataclass
 from typing import List
 
-from ydata_profiling.config import Settings
-from ydata_profiling.model.typeset import ProfilingTypeSet
-
+from validmind.tests.artifacts import column_types, profile
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -102,22 +100,21 @@ class TooManyZeroValues(ThresholdTest):
         )
 
     def run(self):
-        rows = self.inputs.dataset.df.shape[0]
-        typeset = ProfilingTypeSet(Settings())
-        dataset_types = typeset.infer_type(self.inputs.dataset.df)
+        dataset_profile = profile(self.inputs.dataset)
+
+        rows = dataset_profile.n_rows
+        dataset_types = column_types(self.inputs.dataset)
         results = []
 
-        for col in self.inputs.dataset.df.columns:
+        for col, column in dataset_profile.columns.items():
             # Only calculate zeros for numerical columns
-            if str(dataset_types[col]) != "Numeric":
+            if dataset_types[col] != "Numeric":
                 continue
 
-            value_counts = self.inputs.dataset.df[col].value_counts()
-
-            if 0 not in value_counts.index:
+            if column.n_zeros == 0:
                 continue
 
-            n_zeros = value_counts[0]
+            n_zeros = column.n_zeros
             p_zeros = n_zeros / rows
 
             results.append(
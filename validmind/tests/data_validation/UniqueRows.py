@@ -5,6 +5,7 @@
 from dataclasses import dataclass
 from typing import List
 
+from validmind.tests.artifacts import profile
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -79,6 +80,13 @@ class UniqueRows(ThresholdTest):
             }
             for result in results
         ]
+
+        # error bounds are only reported when unique values were estimated
+        if any("n_unique_error" in result.values for result in results):
+            for row, result in zip(results_table, results):
+                row["Unique Values Error (±%)"] = (
+                    result.values.get("n_unique_error", 0) * 100
+                )
         return ResultSummary(
             results=[
                 ResultTable(
@@ -91,19 +99,23 @@ class UniqueRows(ThresholdTest):
         )
 
     def run(self):
-        rows = self.inputs.dataset.df.shape[0]
-
-        unique_rows = self.inputs.dataset.df.nunique()
-        results = [
-            ThresholdTestResult(
-                column=col,
-                passed=(unique_rows[col] / rows) < self.params["min_percent_threshold"],
-                values={
-                    "n_unique": unique_rows[col],
-                    "p_unique": unique_rows[col] / rows,
-                },
+        dataset_profile = profile(self.inputs.dataset)
+
+        results = []
+        for col, column in dataset_profile.columns.items():
+            values = {
+                "n_unique": column.n_distinct,
+                "p_unique": column.p_distinct,
+            }
+            if column.approximate:
+                values["n_unique_error"] = column.distinct_error
+
+            results.append(
+                ThresholdTestResult(
+                    column=col,
+                    passed=column.p_distinct < self.params["min_percent_threshold"],
+                    values=values,
+                )
             )
-            for col in unique_rows.index
-        ]
 
         return self.cache_results(results, passed=all([r.passed for r in results]))
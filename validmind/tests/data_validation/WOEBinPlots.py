@@ -8,7 +8,6 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import scorecardpy as sc
 from plotly.subplots import make_subplots
 
 from validmind.vm_models import Figure, Metric
@@ -86,6 +85,7 @@ class WOEBinPlots(Metric):
         df: A pandas dataframe
         y: The target variable in quotes, e.g. 'target'
         """
+        import scorecardpy as sc
 
         non_numeric_cols = df.select_dtypes(exclude=["int64", "float64"]).columns
         df[non_numeric_cols] = df[non_numeric_cols].astype(str)
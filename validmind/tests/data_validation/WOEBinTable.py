@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-import scorecardpy as sc
 
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
@@ -78,6 +77,8 @@ class WOEBinTable(Metric):
         df: A pandas dataframe
         y: The target variable in quotes, e.g. 'target'
         """
+        import scorecardpy as sc
+
         non_numeric_cols = df.select_dtypes(exclude=["int64", "float64"]).columns
         df[non_numeric_cols] = df[non_numeric_cols].astype(str)
 
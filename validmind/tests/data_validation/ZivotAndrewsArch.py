@@ -5,7 +5,6 @@
 from dataclasses import dataclass
 
 import pandas as pd
-from arch.unitroot import ZivotAndrews
 from numpy.linalg import LinAlgError
 
 from validmind.logging import get_logger
@@ -64,6 +63,8 @@ class ZivotAndrewsArch(Metric):
         """
         Calculates Zivot-Andrews metric for each of the dataset features
         """
+        from arch.unitroot import ZivotAndrews
+
         dataset = self.inputs.dataset.df
 
         # Check if the dataset is a time series
@@ -10,8 +10,6 @@ from collections import Counter
 from dataclasses import dataclass
 
 import matplotlib.pyplot as plt
-import nltk
-from nltk.corpus import stopwords
 
 from ....vm_models import Figure, Metric, VMDataset
 
@@ -64,6 +62,9 @@ class CommonWords(Metric):
     tags = ["nlp", "text_data", "visualization", "frequency_analysis"]
 
     def run(self):
+        import nltk
+        from nltk.corpus import stopwords
+
         # Can only run this test if we have a Dataset object
         if not isinstance(self.inputs.dataset, VMDataset):
             raise ValueError("CommonWords requires a validmind Dataset object")
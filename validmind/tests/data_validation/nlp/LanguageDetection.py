@@ -8,7 +8,6 @@ Metrics functions for any Pandas-compatible datasets
 
 
 import plotly.express as px
-from langdetect import LangDetectException, detect
 
 from validmind import tags, tasks
 
@@ -55,6 +54,8 @@ def LanguageDetection(dataset):
     - The test returns "Unknown" for entries where language detection fails, which might mask underlying issues with
     certain languages or text formats.
     """
+    from langdetect import LangDetectException, detect
+
     # check text column
     if not dataset.text_column:
         raise ValueError("Please set text_column name in the Validmind Dataset object")
@@ -5,7 +5,6 @@
 
 import pandas as pd
 import plotly.express as px
-from textblob import TextBlob
 
 from validmind import tags, tasks
 
@@ -50,6 +49,7 @@ def PolarityAndSubjectivity(dataset):
     - Reliance on TextBlob which may not be accurate for all domains or contexts.
     - Visualization could become cluttered with very large datasets, making interpretation difficult.
     """
+    from textblob import TextBlob
 
     # Function to calculate sentiment and subjectivity
     def analyze_sentiment(text):
@@ -4,9 +4,7 @@
 
 
 import matplotlib.pyplot as plt
-import nltk
 import seaborn as sns
-from nltk.sentiment import SentimentIntensityAnalyzer
 
 from validmind import tags, tasks
 
@@ -47,6 +45,9 @@ def Sentiment(dataset):
     - Relies heavily on the accuracy of the VADER sentiment analysis tool.
     - Visualization alone may not provide comprehensive insights into underlying causes of sentiment distribution.
     """
+    import nltk
+    from nltk.sentiment import SentimentIntensityAnalyzer
+
     nltk.download("vader_lexicon", quiet=True)
     # Initialize VADER
     sia = SentimentIntensityAnalyzer()
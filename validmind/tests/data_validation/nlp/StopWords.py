@@ -11,9 +11,7 @@ from dataclasses import dataclass
 from typing import List
 
 import matplotlib.pyplot as plt
-import nltk
 import pandas as pd
-from nltk.corpus import stopwords
 
 from validmind.vm_models import (
     Figure,
@@ -97,6 +95,9 @@ class StopWords(ThresholdTest):
         )
 
     def run(self):
+        import nltk
+        from nltk.corpus import stopwords
+
         text_column = self.inputs.dataset.text_column
 
         def create_corpus(df, text_column):
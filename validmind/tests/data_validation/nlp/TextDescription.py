@@ -6,10 +6,8 @@ import string
 from dataclasses import dataclass
 
 import matplotlib.pyplot as plt
-import nltk
 import pandas as pd
 import plotly.express as px
-from nltk.corpus import stopwords
 
 from ....vm_models import Figure, Metric, VMDataset
 
@@ -84,6 +82,8 @@ class TextDescription(Metric):
     tags = ["nlp", "text_data", "visualization"]
 
     def general_text_metrics(self, df, text_column):
+        import nltk
+
         results = []
 
         for text in df[text_column]:
@@ -121,6 +121,9 @@ class TextDescription(Metric):
     def vocabulary_structure_metrics(
         self, df, text_column, unwanted_tokens, num_top_words, lang
     ):
+        import nltk
+        from nltk.corpus import stopwords
+
         stop_words = set(word.lower() for word in stopwords.words(lang))
         unwanted_tokens = set(token.lower() for token in unwanted_tokens)
 
@@ -174,6 +177,8 @@ class TextDescription(Metric):
         if not isinstance(self.inputs.dataset, VMDataset):
             raise ValueError("TextDescription requires a validmind Dataset object")
 
+        import nltk
+
         # download nltk data
         nltk.download("punkt_tab", quiet=True)
 
@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import evaluate
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -49,6 +48,8 @@ def Toxicity(dataset):
     - Does not provide context-specific insights, which may be necessary for nuanced understanding.
     - May not capture all forms of subtle or indirect toxic language.
     """
+    import evaluate
+
     toxicity = evaluate.load("toxicity")
     input_text = dataset.df[dataset.text_column]
     toxicity_scores = toxicity.compute(predictions=list(input_text.values))["toxicity"]
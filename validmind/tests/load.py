@@ -4,17 +4,19 @@
 
 """Module for listing and loading tests."""
 
+import functools
 import importlib
+import importlib.util
 import inspect
 import json
 import sys
-from pathlib import Path
+import warnings
 from pprint import pformat
 from uuid import uuid4
 
 import pandas as pd
-from ipywidgets import HTML, Accordion
 
+from ..__version__ import __version__
 from ..errors import LoadTestError, MissingDependencyError
 from ..html_templates.content_blocks import test_content_block_html
 from ..logging import get_logger
@@ -24,7 +26,9 @@ from ..utils import (
     display,
     format_dataframe,
     fuzzy_match,
+    lazy_import,
     md_to_html,
+    setup_plot_defaults,
     test_id_to_name,
 )
 from .__types__ import TestID
@@ -32,25 +36,95 @@ from ._store import test_provider_store, test_store
 from .decorator import test as test_decorator
 from .utils import test_description
 
+ipywidgets = lazy_import("ipywidgets")
+
 logger = get_logger(__name__)
 
 
-def __init__():
-    directories = [p.name for p in Path(__file__).parent.iterdir() if p.is_dir()]
+@functools.lru_cache(maxsize=None)
+def _setup():
+    """Runs once before the first test is loaded
 
-    for d in directories:
-        for path in Path(__file__).parent.joinpath(d).glob("**/**/*.py"):
-            if path.name.startswith("__") or not path.name[0].isupper():
-                continue  # skip __init__.py and other special files as well as non Test files
-            test_id = (
-                f"validmind.{d}.{path.parent.stem}.{path.stem}"
-                if path.parent.parent.stem == d
-                else f"validmind.{d}.{path.stem}"
-            )
-            test_store.register_test(test_id)
+    Deferred from import time since matplotlib, seaborn and numba are slow to import.
+    """
+    # Ignore Numba warnings. We are not requiring this package directly
+    from numba.core.errors import (
+        NumbaDeprecationWarning,
+        NumbaPendingDeprecationWarning,
+    )
+
+    warnings.simplefilter("ignore", category=NumbaDeprecationWarning)
+    warnings.simplefilter("ignore", category=NumbaPendingDeprecationWarning)
+
+    setup_plot_defaults()
 
 
-__init__()
+def _get_catalog() -> dict:
+    """Get the metadata of the built-in tests from the prebuilt catalog
+
+    The catalog is generated by running `make generate-test-catalog` and is ignored
+    if it was generated for a different version of the framework.
+    """
+    from . import __catalog__
+
+    if __catalog__.VERSION != __version__:
+        logger.debug(
+            f"Test catalog was generated for version {__catalog__.VERSION}, "
+            f"loading tests to get their metadata"
+        )
+        return {}
+
+    return __catalog__.TESTS
+
+
+def _get_test_metadata(test) -> dict:
+    return {
+        "description": inspect.getdoc(test).strip(),
+        "required_inputs": test.required_inputs,
+        "default_params": test.default_params,
+        "tasks": test.tasks,
+        "tags": test.tags,
+    }
+
+
+def _check_dependencies(metadata):
+    """Raise a `MissingDependencyError` if a cataloged test can't be imported"""
+    missing = [
+        dependency
+        for dependency in metadata["required_dependencies"]
+        if importlib.util.find_spec(dependency) is None
+    ]
+
+    if missing:
+        raise MissingDependencyError(
+            f"Missing required packages: {missing}",
+            required_dependencies=metadata["required_dependencies"],
+            extra=metadata["extra"],
+        )
+
+
+def _log_missing_dependencies(test_id, e: MissingDependencyError):
+    logger.debug(str(e))
+
+    if e.extra:
+        logger.info(
+            f"Skipping `{test_id}` as it requires extra dependencies: {e.required_dependencies}."
+            f" Please run `pip install validmind[{e.extra}]` to view and run this test."
+        )
+    else:
+        logger.info(
+            f"Skipping `{test_id}` as it requires missing dependencies: {e.required_dependencies}."
+            " Please install the missing dependencies to view and run this test."
+        )
+
+
+def _load_test_metadata(test_id: str, catalog: dict) -> dict:
+    """Get the metadata of a test from the catalog or by loading the test"""
+    if test_id in catalog and test_store.get_test(test_id) is None:
+        _check_dependencies(catalog[test_id])
+        return catalog[test_id]
+
+    return _get_test_metadata(load_test(test_id, reload=True))
 
 
 def _pretty_list_tests(tests, truncate=True):
@@ -58,9 +132,9 @@ def _pretty_list_tests(tests, truncate=True):
         {
             "ID": test_id,
             "Name": test_id_to_name(test_id),
-            "Description": test_description(test, truncate),
-            "Required Inputs": test.required_inputs,
-            "Params": test.default_params or {},
+            "Description": test_description(test["description"], truncate),
+            "Required Inputs": test["required_inputs"],
+            "Params": test["default_params"] or {},
         }
         for test_id, test in tests.items()
     ]
@@ -68,6 +142,24 @@ def _pretty_list_tests(tests, truncate=True):
     return format_dataframe(pd.DataFrame(table))
 
 
+def _list_test_metadata() -> dict:
+    """Get the metadata of all registered tests, skipping tests with missing dependencies
+
+    Metadata for the built-in tests comes from the prebuilt catalog so their modules
+    don't need to be imported. Other tests are loaded to get their metadata.
+    """
+    catalog = _get_catalog()
+
+    tests = {}
+    for test_id in test_store.get_test_ids():
+        try:
+            tests[test_id] = _load_test_metadata(test_id, catalog)
+        except MissingDependencyError as e:
+            _log_missing_dependencies(test_id, e)
+
+    return tests
+
+
 def list_tests(
     filter=None, task=None, tags=None, pretty=True, truncate=True, __as_class=False
 ):
@@ -88,30 +180,7 @@ def list_tests(
     Returns:
         list or pandas.DataFrame: A list of all tests or a formatted table.
     """
-    # tests = {
-    #     test_id: load_test(test_id, reload=True)
-    #     for test_id in test_store.get_test_ids()
-    # }
-    tests = {}
-    for test_id in test_store.get_test_ids():
-        try:
-            tests[test_id] = load_test(test_id, reload=True)
-        except MissingDependencyError as e:
-            # skip tests that have missing dependencies
-            logger.debug(str(e))
-
-            if e.extra:
-                logger.info(
-                    f"Skipping `{test_id}` as it requires extra dependencies: {e.required_dependencies}."
-                    f" Please run `pip install validmind[{e.extra}]` to view and run this test."
-                )
-            else:
-                logger.info(
-                    f"Skipping `{test_id}` as it requires missing dependencies: {e.required_dependencies}."
-                    " Please install the missing dependencies to view and run this test."
-                )
-
-            continue
+    tests = _list_test_metadata()
 
     # first search by the filter string since it's the most general search
     if filter is not None:
@@ -119,23 +188,25 @@ def list_tests(
             test_id: test
             for test_id, test in tests.items()
             if filter.lower() in test_id.lower()
-            or any(filter.lower() in task.lower() for task in test.tasks)
-            or any(fuzzy_match(tag, filter.lower()) for tag in test.tags)
+            or any(filter.lower() in task.lower() for task in test["tasks"])
+            or any(fuzzy_match(tag, filter.lower()) for tag in test["tags"])
         }
 
     # then filter by task type and tags since they are more specific
     if task is not None:
-        tests = {test_id: test for test_id, test in tests.items() if task in test.tasks}
+        tests = {
+            test_id: test for test_id, test in tests.items() if task in test["tasks"]
+        }
 
     if tags is not None:
         tests = {
             test_id: test
             for test_id, test in tests.items()
-            if all(tag in test.tags for tag in tags)
+            if all(tag in test["tags"] for tag in tags)
         }
 
     if __as_class:
-        return list(tests.values())
+        return [load_test(test_id) for test_id in tests]
 
     if not pretty:
         # only return test ids
@@ -181,6 +252,8 @@ def load_test(test_id: str, reload=False):
         test_id (str): The test ID in the format `namespace.path_to_module.TestName[:result_id]`
         reload (bool, optional): Whether to reload the test module. Defaults to False.
     """
+    _setup()
+
     # TODO: we should use a dedicated class for test IDs to handle this consistently
     test_id, result_id = test_id.split(":", 1) if ":" in test_id else (test_id, None)
 
@@ -239,14 +312,14 @@ def describe_test(test_id: TestID = None, raw: bool = False, show: bool = True):
         raw (bool, optional): If True, returns a dictionary with the test details.
             Defaults to False.
     """
-    test = load_test(test_id, reload=True)
+    test = _load_test_metadata(test_id, _get_catalog())
 
     details = {
         "ID": test_id,
         "Name": test_id_to_name(test_id),
-        "Required Inputs": test.required_inputs or [],
-        "Params": test.default_params or {},
-        "Description": inspect.getdoc(test).strip() or "",
+        "Required Inputs": test["required_inputs"] or [],
+        "Params": test["default_params"] or {},
+        "Description": test["description"] or "",
     }
 
     if raw:
@@ -277,8 +350,8 @@ def describe_test(test_id: TestID = None, raw: bool = False, show: bool = True):
         return html
 
     display(
-        Accordion(
-            children=[HTML(html)],
+        ipywidgets.Accordion(
+            children=[ipywidgets.HTML(html)],
             titles=[f"Test Description: {details['Name']} ('{test_id}')"],
         )
     )
@@ -6,7 +6,7 @@ import pandas as pd
 
 from validmind.utils import format_dataframe
 
-from .load import list_tests
+from .load import _list_test_metadata
 
 
 def list_tags():
@@ -16,8 +16,8 @@ def list_tags():
 
     unique_tags = set()
 
-    for test in list_tests(__as_class=True):
-        unique_tags.update(test.tags)
+    for test in _list_test_metadata().values():
+        unique_tags.update(test["tags"])
 
     return list(unique_tags)
 
@@ -32,9 +32,9 @@ def list_tasks_and_tags():
     """
     task_tags_dict = {}
 
-    for test in list_tests(__as_class=True):
-        for task in test.tasks:
-            task_tags_dict.setdefault(task, set()).update(test.tags)
+    for test in _list_test_metadata().values():
+        for task in test["tasks"]:
+            task_tags_dict.setdefault(task, set()).update(test["tags"])
 
     return format_dataframe(
         pd.DataFrame(
@@ -53,7 +53,7 @@ def list_tasks():
 
     unique_tasks = set()
 
-    for test in list_tests(__as_class=True):
-        unique_tasks.update(test.tasks)
+    for test in _list_test_metadata().values():
+        unique_tasks.update(test["tasks"])
 
     return list(unique_tasks)
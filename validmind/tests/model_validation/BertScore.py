@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import evaluate
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -56,6 +55,7 @@ def BertScore(dataset, model):
     - While useful for comparison, BERTScore metrics alone do not provide a complete assessment of a model's
     performance and should be supplemented with other metrics and qualitative analysis.
     """
+    import evaluate
 
     # Extract true and predicted values
     y_true = dataset.y
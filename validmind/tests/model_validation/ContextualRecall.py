@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import nltk
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -57,6 +56,7 @@ def ContextualRecall(dataset, model):
     - This metric does not consider the order of words, which could lead to overestimated scores for scrambled outputs.
     - Models that effectively use infrequent words might be undervalued, as these words might not overlap as often.
     """
+    import nltk
 
     # download nltk data
     nltk.download("punkt_tab", quiet=True)
@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import evaluate
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -60,6 +59,7 @@ def MeteorScore(dataset, model):
     - The use of external resources for synonym and stemming matching may introduce variability based on the resources'
     quality and relevance to the specific translation task.
     """
+    import evaluate
 
     # Extract true and predicted values
     y_true = dataset.y
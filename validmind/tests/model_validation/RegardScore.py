@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import evaluate
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -51,6 +50,7 @@ def RegardScore(dataset, model):
     high regard.
     - Supplementary, in-depth analysis might be needed for granular insights.
     """
+    import evaluate
 
     # Extract true and predicted values
     y_true = dataset.y
@@ -4,7 +4,6 @@
 
 import pandas as pd
 import plotly.graph_objects as go
-from rouge import Rouge
 
 from validmind import tags, tasks
 
@@ -58,6 +57,7 @@ def RougeScore(dataset, model, metric="rouge-1"):
     - While useful for comparison, ROUGE scores alone do not provide a complete assessment of a model's performance and
     should be supplemented with other metrics and qualitative analysis.
     """
+    from rouge import Rouge
 
     # Extract true and predicted values
     y_true = dataset.y
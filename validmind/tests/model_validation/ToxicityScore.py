@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import evaluate
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -49,6 +48,7 @@ def ToxicityScore(dataset, model):
     high toxicity.
     - Supplementary, in-depth analysis might be needed for granular insights.
     """
+    import evaluate
 
     # Extract true, predicted, and input values
     y_true = dataset.y
@@ -66,8 +66,8 @@ def CosineSimilarityComparison(dataset, models):
 
     # Generate all pairs of models for comparison
     for model_A, model_B in combinations(models, 2):
-        embeddings_A = np.stack(dataset.y_pred(model_A))
-        embeddings_B = np.stack(dataset.y_pred(model_B))
+        embeddings_A = dataset.y_pred(model_A)
+        embeddings_B = dataset.y_pred(model_B)
 
         # Calculate pairwise cosine similarity
         similarity_matrix = cosine_similarity(embeddings_A, embeddings_B)
@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import numpy as np
 import plotly.express as px
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -61,7 +60,7 @@ def CosineSimilarityHeatmap(
     settings can lead to misleading visual interpretations.
     """
 
-    embeddings = np.stack(dataset.y_pred(model))
+    embeddings = dataset.y_pred(model)
 
     # Calculate pairwise cosine similarity
     similarity_matrix = cosine_similarity(embeddings)
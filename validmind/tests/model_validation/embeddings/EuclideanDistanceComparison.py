@@ -59,8 +59,8 @@ def EuclideanDistanceComparison(dataset, models):
 
     # Generate all pairs of models for comparison
     for model_A, model_B in combinations(models, 2):
-        embeddings_A = np.stack(dataset.y_pred(model_A))
-        embeddings_B = np.stack(dataset.y_pred(model_B))
+        embeddings_A = dataset.y_pred(model_A)
+        embeddings_B = dataset.y_pred(model_B)
 
         # Calculate pairwise Euclidean distances
         distance_matrix = euclidean_distances(embeddings_A, embeddings_B)
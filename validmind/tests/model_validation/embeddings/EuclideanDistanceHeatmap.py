@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import numpy as np
 import plotly.express as px
 from sklearn.metrics.pairwise import euclidean_distances
 
@@ -59,7 +58,7 @@ def EuclideanDistanceHeatmap(
     potentially requiring techniques like data sampling or dimensionality reduction for clearer visualization.
     """
 
-    embeddings = np.stack(dataset.y_pred(model))
+    embeddings = dataset.y_pred(model)
 
     # Calculate pairwise Euclidean distance
     distance_matrix = euclidean_distances(embeddings)
@@ -4,7 +4,6 @@
 
 import itertools
 
-import numpy as np
 import pandas as pd
 import plotly.express as px
 from sklearn.decomposition import PCA
@@ -58,7 +57,7 @@ def PCAComponentsPairwisePlots(dataset, model, n_components=3):
     """
 
     # Get embeddings from the dataset using the model
-    embeddings = np.stack(dataset.y_pred(model))
+    embeddings = dataset.y_pred(model)
 
     # Standardize the embeddings
     scaler = StandardScaler()
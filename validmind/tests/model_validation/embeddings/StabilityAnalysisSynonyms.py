@@ -4,9 +4,6 @@
 
 import random
 
-import nltk
-from nltk.corpus import wordnet as wn
-
 from .StabilityAnalysis import StabilityAnalysis
 
 
@@ -63,6 +60,9 @@ class StabilityAnalysisSynonyms(StabilityAnalysis):
     }
 
     def perturb_data(self, data):
+        import nltk
+        from nltk.corpus import wordnet as wn
+
         if not isinstance(data, str):
             return data
 
@@ -2,7 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-from transformers import MarianMTModel, MarianTokenizer
 
 from validmind.logging import get_logger
 
@@ -69,6 +68,8 @@ class StabilityAnalysisTranslation(StabilityAnalysis):
     }
 
     def perturb_data(self, data: str):
+        from transformers import MarianMTModel, MarianTokenizer
+
         if len(data) > 512:
             logger.info(
                 "Data length exceeds 512 tokens. Truncating data to 512 tokens."
@@ -4,7 +4,6 @@
 
 import itertools
 
-import numpy as np
 import pandas as pd
 import plotly.express as px
 from sklearn.manifold import TSNE
@@ -64,7 +63,7 @@ def TSNEComponentsPairwisePlots(
     consistent interpretation.
     """
     # Get embeddings from the dataset using the model
-    embeddings = np.stack(dataset.y_pred(model))
+    embeddings = dataset.y_pred(model)
 
     # Standardize the embeddings
     scaler = StandardScaler()
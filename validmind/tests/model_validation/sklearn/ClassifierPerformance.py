@@ -8,6 +8,7 @@ import numpy as np
 from sklearn.metrics import classification_report, roc_auc_score
 from sklearn.preprocessing import LabelBinarizer
 
+from validmind.tests.artifacts import roc_auc
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
 
@@ -135,14 +136,11 @@ class ClassifierPerformance(Metric):
         if len(np.unique(y_true)) > 2:
             y_pred = self.inputs.dataset.y_pred(self.inputs.model)
             y_true = y_true.astype(y_pred.dtype)
-            roc_auc = multiclass_roc_auc_score(
+            report["roc_auc"] = multiclass_roc_auc_score(
                 y_true, y_pred, average=self.params["average"]
             )
         else:
-            y_prob = self.inputs.dataset.y_prob(self.inputs.model)
-            y_true = y_true.astype(y_prob.dtype).flatten()
-            roc_auc = roc_auc_score(y_true, y_prob, average=self.params["average"])
-
-        report["roc_auc"] = roc_auc
+            # `average` only applies to multiclass (binarized) labels
+            report["roc_auc"] = roc_auc(self.inputs.dataset, self.inputs.model)
 
         return self.cache_results(report)
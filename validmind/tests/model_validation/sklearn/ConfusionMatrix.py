@@ -4,10 +4,9 @@
 
 from dataclasses import dataclass
 
-import numpy as np
 import plotly.figure_factory as ff
-from sklearn import metrics
 
+from validmind.tests.artifacts import confusion_matrix
 from validmind.vm_models import Figure, Metric
 
 
@@ -72,15 +71,7 @@ class ConfusionMatrix(Metric):
     ]
 
     def run(self):
-        y_true = self.inputs.dataset.y
-        labels = np.unique(y_true)
-        labels.sort()
-        labels = np.array(labels).T.tolist()
-
-        y_pred = self.inputs.dataset.y_pred(self.inputs.model)
-        y_true = y_true.astype(y_pred.dtype)
-
-        cm = metrics.confusion_matrix(y_true, y_pred, labels=labels)
+        cm, labels = confusion_matrix(self.inputs.dataset, self.inputs.model)
 
         text = None
         if len(labels) == 2:
@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 from sklearn import metrics, preprocessing
 
+from validmind.tests.artifacts import roc_auc
 from validmind.vm_models import (
     ResultSummary,
     ResultTable,
@@ -109,18 +110,16 @@ class MinimumROCAUCScore(ThresholdTest):
         if len(np.unique(y_true)) > 2:
             class_pred = self.inputs.dataset.y_pred(self.inputs.model)
             y_true = y_true.astype(class_pred.dtype)
-            roc_auc = self.multiclass_roc_auc_score(y_true, class_pred)
+            score = self.multiclass_roc_auc_score(y_true, class_pred)
         else:
-            y_prob = self.inputs.dataset.y_prob(self.inputs.model)
-            y_true = y_true.astype(y_prob.dtype).flatten()
-            roc_auc = metrics.roc_auc_score(y_true, y_prob)
+            score = roc_auc(self.inputs.dataset, self.inputs.model)
 
-        passed = roc_auc > self.params["min_threshold"]
+        passed = score > self.params["min_threshold"]
         results = [
             ThresholdTestResult(
                 passed=passed,
                 values={
-                    "score": roc_auc,
+                    "score": score,
                     "threshold": self.params["min_threshold"],
                 },
             )
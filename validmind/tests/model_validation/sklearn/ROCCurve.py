@@ -6,10 +6,10 @@ from dataclasses import dataclass
 
 import numpy as np
 import plotly.graph_objects as go
-from sklearn.metrics import roc_auc_score, roc_curve
 
 from validmind.errors import SkipTestError
 from validmind.models import FoundationModel
+from validmind.tests.artifacts import roc_auc, roc_curve
 from validmind.vm_models import Figure, Metric
 
 
@@ -86,15 +86,14 @@ class ROCCurve(Metric):
                 "ROC Curve is only supported for binary classification models"
             )
 
-        y_true = y_true.astype(y_prob.dtype).flatten()
         assert np.all((y_prob >= 0) & (y_prob <= 1)), "Invalid probabilities in y_prob."
 
-        fpr, tpr, roc_thresholds = roc_curve(y_true, y_prob, drop_intermediate=False)
+        fpr, tpr, roc_thresholds = roc_curve(self.inputs.dataset, self.inputs.model)
 
         # Remove Inf values from roc_thresholds
         valid_thresholds_mask = np.isfinite(roc_thresholds)
         roc_thresholds = roc_thresholds[valid_thresholds_mask]
-        auc = roc_auc_score(y_true, y_prob)
+        auc = roc_auc(self.inputs.dataset, self.inputs.model)
 
         trace0 = go.Scatter(
             x=fpr,
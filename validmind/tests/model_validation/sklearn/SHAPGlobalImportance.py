@@ -7,13 +7,15 @@ from dataclasses import dataclass
 
 import matplotlib.pyplot as plt
 import numpy as np
-import shap
 
 from validmind.errors import UnsupportedModelForSHAPError
 from validmind.logging import get_logger
 from validmind.models import CatBoostModel, SKlearnModel, StatsModelsModel
+from validmind.utils import lazy_import
 from validmind.vm_models import Figure, Metric
 
+shap = lazy_import("shap")
+
 logger = get_logger(__name__)
 
 
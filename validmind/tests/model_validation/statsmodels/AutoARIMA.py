@@ -2,8 +2,6 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.stattools import adfuller
 
 from validmind.logging import get_logger
 from validmind.vm_models import Metric
@@ -72,6 +70,9 @@ class AutoARIMA(Metric):
     max_q = 3
 
     def run(self):
+        from statsmodels.tsa.arima.model import ARIMA
+        from statsmodels.tsa.stattools import adfuller
+
         x_train = self.inputs.dataset.df
 
         results = []
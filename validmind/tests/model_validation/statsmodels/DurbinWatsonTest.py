@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import pandas as pd
-from statsmodels.stats.stattools import durbin_watson
 
 from validmind import tags, tasks
 
@@ -48,6 +47,7 @@ def DurbinWatsonTest(dataset, model, threshold=[1.5, 2.5]):
     - The test only checks for first-order autocorrelation (between a variable and its immediate predecessor) and fails
     to detect higher-order autocorrelation.
     """
+    from statsmodels.stats.stattools import durbin_watson
 
     # Validate threshold values
     if not (0 < threshold[0] < threshold[1] < 4):
@@ -2,11 +2,10 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-import numpy as np
 import pandas as pd
-from sklearn.metrics import roc_auc_score, roc_curve
 
 from validmind import tags, tasks
+from validmind.tests.artifacts import roc_auc, roc_curve
 
 
 @tags("model_performance")
@@ -64,17 +63,10 @@ def GINITable(dataset, model):
 
     metrics_dict = {"AUC": [], "GINI": [], "KS": []}
 
-    # Retrieve y_true and y_pred for the current dataset
-    y_true = np.ravel(dataset.y)  # Flatten y_true to make it one-dimensional
-    y_prob = dataset.y_prob(model)
-
     # Compute metrics
-    y_true = np.array(y_true, dtype=float)
-    y_prob = np.array(y_prob, dtype=float)
-
-    fpr, tpr, _ = roc_curve(y_true, y_prob)
+    fpr, tpr, _ = roc_curve(dataset, model)
     ks = max(tpr - fpr)
-    auc = roc_auc_score(y_true, y_prob)
+    auc = roc_auc(dataset, model)
     gini = 2 * auc - 1
 
     # Add the metrics to the dictionary
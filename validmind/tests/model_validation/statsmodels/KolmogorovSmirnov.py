@@ -4,8 +4,6 @@
 
 from dataclasses import dataclass
 
-from statsmodels.stats.diagnostic import kstest_normal
-
 from validmind.errors import InvalidTestParametersError
 from validmind.vm_models import Metric, ResultSummary, ResultTable, ResultTableMetadata
 
@@ -80,6 +78,8 @@ class KolmogorovSmirnov(Metric):
         """
         Calculates KS for each of the dataset features
         """
+        from statsmodels.stats.diagnostic import kstest_normal
+
         data_distribution = self.params["dist"]
         if data_distribution not in ["norm" or "exp"]:
             InvalidTestParametersError("Dist parameter must be either 'norm' or 'exp'")
@@ -4,8 +4,6 @@
 
 from dataclasses import dataclass
 
-from statsmodels.stats.diagnostic import lilliefors
-
 from validmind.vm_models import Metric
 
 
@@ -71,6 +69,8 @@ class Lilliefors(Metric):
         """
         Calculates Lilliefors test for each of the dataset features
         """
+        from statsmodels.stats.diagnostic import lilliefors
+
         x_train = self.inputs.dataset.df[self.inputs.dataset.feature_columns_numeric]
 
         lilliefors_values = {}
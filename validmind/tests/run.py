@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 from typing import Any, Dict, List, Union
 from uuid import uuid4
@@ -31,6 +32,7 @@ from validmind.vm_models.test.result_wrapper import (
 
 from .__types__ import TestID
 from .load import load_test
+from .utils import uses_pyplot
 
 logger = get_logger(__name__)
 
@@ -58,19 +60,23 @@ def _combine_summaries(summaries: List[Dict[str, Any]]):
         return None
 
     def combine_tables(table_index):
-        combined_df = pd.DataFrame()
+        summary_dfs = []
 
         for summary_obj in summaries:
             serialized = summary_obj["summary"].results[table_index].serialize()
             summary_df = pd.DataFrame(serialized["data"])
-            summary_df = pd.concat(
-                [
-                    pd.DataFrame(summary_obj["inputs"], index=summary_df.index),
-                    summary_df,
-                ],
-                axis=1,
+            summary_dfs.append(
+                pd.concat(
+                    [
+                        pd.DataFrame(summary_obj["inputs"], index=summary_df.index),
+                        summary_df,
+                    ],
+                    axis=1,
+                )
             )
-            combined_df = pd.concat([combined_df, summary_df], ignore_index=True)
+
+        # concatenate once at the end since concatenating in the loop is quadratic
+        combined_df = pd.concat(summary_dfs, ignore_index=True)
 
         return ResultTable(
             data=combined_df.to_dict(orient="records"),
@@ -169,19 +175,8 @@ def _combine_unit_metrics(results: List[MetricResultWrapper]):
             result.metric.summary.results.append(table)
 
 
-def metric_comparison(
-    results: List[MetricResultWrapper],
-    test_id: TestID,
-    input_params_groups: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
-    output_template: str = None,
-    generate_description: bool = True,
-):
-    """Build a comparison result for multiple metric results"""
-    ref_id = str(uuid4())
-
-    # Treat param_groups and input_groups as empty lists if they are None or empty
-    input_params_groups = input_params_groups or [{}]
-
+def _get_input_group_strings(input_params_groups: List[Dict[str, Any]]):
+    """Get the params and input ids for each group to label the combined results"""
     input_group_strings = []
 
     for input_params in input_params_groups:
@@ -202,6 +197,24 @@ def metric_comparison(
                 raise ValueError(f"Unsupported type for value: {metric_v}")
         input_group_strings.append(new_group)
 
+    return input_group_strings
+
+
+def metric_comparison(
+    results: List[MetricResultWrapper],
+    test_id: TestID,
+    input_params_groups: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+    output_template: str = None,
+    generate_description: bool = True,
+):
+    """Build a comparison result for multiple metric results"""
+    ref_id = str(uuid4())
+
+    # Treat param_groups and input_groups as empty lists if they are None or empty
+    input_params_groups = input_params_groups or [{}]
+
+    input_group_strings = _get_input_group_strings(input_params_groups)
+
     # handle unit metrics (scalar values) by adding it to the summary
     _combine_unit_metrics(results)
 
@@ -261,20 +274,7 @@ def threshold_test_comparison(
     """Build a comparison result for multiple threshold test results"""
     ref_id = str(uuid4())
 
-    input_group_strings = []
-
-    for group in input_groups:
-        new_group = {}
-        for k, v in group.items():
-            if isinstance(v, str):
-                new_group[k] = v
-            elif hasattr(v, "input_id"):
-                new_group[k] = v.input_id
-            elif isinstance(v, list) and all(hasattr(item, "input_id") for item in v):
-                new_group[k] = ", ".join([item.input_id for item in v])
-            else:
-                raise ValueError(f"Unsupported type for value: {v}")
-        input_group_strings.append(new_group)
+    input_group_strings = _get_input_group_strings(input_groups)
 
     merged_summary = _combine_summaries(
         [
@@ -308,7 +308,7 @@ def threshold_test_comparison(
         inputs=[
             input if isinstance(input, str) else input.input_id
             for group in input_groups
-            for input in group.values()
+            for input in group["inputs"].values()
         ],
         output_template=output_template,
         test_results=ThresholdTestResults(
@@ -324,6 +324,57 @@ def threshold_test_comparison(
     )
 
 
+def _run_grid(
+    test_id: TestID,
+    inputs_params_product: List[Dict[str, Any]],
+    name: str = None,
+    unit_metrics: List[TestID] = None,
+    max_workers: int = None,
+):
+    """Run a test once for each set of inputs and params, keeping their order"""
+    if test_id.startswith("validmind.unit_metrics"):
+
+        def run(inputs_params):
+            return run_metric(
+                test_id,
+                inputs=inputs_params["inputs"],
+                params=inputs_params["params"],
+                show=False,
+            )
+
+        run_sequentially = False
+
+    else:
+        # load the test once instead of (re)loading it for every run
+        TestClass = load_test_class(test_id, unit_metrics, name)
+        # runs share a context so artifacts are only computed once across the grid
+        context = TestContext()
+
+        def run(inputs_params):
+            return _run_test_class(
+                TestClass,
+                test_id,
+                inputs=inputs_params["inputs"],
+                params=inputs_params["params"],
+                generate_description=False,
+                context=context,
+            )
+
+        run_sequentially = uses_pyplot(TestClass)
+
+    if not max_workers or max_workers < 2 or len(inputs_params_product) < 2:
+        return [run(inputs_params) for inputs_params in inputs_params_product]
+
+    if run_sequentially:
+        logger.info(f"Running {test_id} sequentially since it uses matplotlib")
+        return [run(inputs_params) for inputs_params in inputs_params_product]
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="validmind-test"
+    ) as executor:
+        return list(executor.map(run, inputs_params_product))
+
+
 def run_comparison_test(
     test_id: TestID,
     input_grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]] = None,
@@ -335,15 +386,22 @@ def run_comparison_test(
     show: bool = True,
     output_template: str = None,
     generate_description: bool = True,
+    max_workers: int = None,
 ):
-    """Run a comparison test"""
+    """Run a comparison test
+
+    The test is run once for each combination of inputs and params. When
+    `max_workers` is greater than 1, the runs are spread over a thread pool of that
+    size. Tests that use matplotlib are still run one at a time since pyplot's global
+    state isn't thread-safe.
+    """
     if input_grid:
         if isinstance(input_grid, dict):
             input_groups = _cartesian_product(input_grid)
         else:
             input_groups = input_grid
     else:
-        input_groups = list(inputs) if inputs else []
+        input_groups = [inputs] if inputs else []
 
     if param_grid:
         if isinstance(param_grid, dict):
@@ -351,7 +409,7 @@ def run_comparison_test(
         else:
             param_groups = param_grid
     else:
-        param_groups = list(params) if inputs else []
+        param_groups = [params] if params else []
 
     input_groups = input_groups or [{}]
     param_groups = param_groups or [{}]
@@ -363,18 +421,7 @@ def run_comparison_test(
         }  # Merge dictionaries from input_groups and param_groups
         for item1, item2 in itertools.product(input_groups, param_groups)
     ]
-    results = [
-        run_test(
-            test_id,
-            name=name,
-            unit_metrics=unit_metrics,
-            inputs=inputs_params["inputs"],
-            show=False,
-            params=inputs_params["params"],
-            __generate_description=False,
-        )
-        for inputs_params in (inputs_params_product or [{}])
-    ]
+    results = _run_grid(test_id, inputs_params_product, name, unit_metrics, max_workers)
     if isinstance(results[0], MetricResultWrapper):
         func = metric_comparison
     else:
@@ -400,6 +447,7 @@ def run_test(
     unit_metrics: List[TestID] = None,
     output_template: str = None,
     show: bool = True,
+    max_workers: int = None,
     __generate_description: bool = True,
     **kwargs,
 ) -> Union[MetricResultWrapper, ThresholdTestResultWrapper]:
@@ -436,6 +484,9 @@ def run_test(
     output_template (str, optional): A jinja2 html template to customize the output
         of the test. Defaults to None.
     show (bool, optional): Whether to display the results. Defaults to True.
+    max_workers (int, optional): The number of threads to use to run the test for
+        the different inputs and params of a comparison test (`input_grid` or
+        `param_grid`). Defaults to None (run one after the other).
     **kwargs: Keyword inputs to pass into the test (same as `inputs` but as keyword
         args instead of a dictionary):
         - dataset: A validmind Dataset object or a Pandas DataFrame
@@ -465,6 +516,7 @@ def run_test(
             output_template,
             show,
             __generate_description,
+            max_workers,
         )
 
     # Run unit metric tests
@@ -477,20 +529,43 @@ def run_test(
     # Load the appropriate test class
     TestClass = load_test_class(test_id, unit_metrics, name)
 
-    # Create and run the test
+    result = _run_test_class(
+        TestClass,
+        test_id,
+        inputs={**kwargs, **(inputs or {})},
+        params=params,
+        output_template=output_template,
+        generate_description=__generate_description,
+    )
+
+    if show:
+        result.show()
+
+    return result
+
+
+def _run_test_class(
+    TestClass,
+    test_id: TestID,
+    inputs: Dict[str, Any] = None,
+    params: Dict[str, Any] = None,
+    output_template: str = None,
+    generate_description: bool = True,
+    context: TestContext = None,
+):
+    """Create and run a test from its class and return the result"""
+    context = context or TestContext()
     test = TestClass(
         test_id=test_id,
-        context=TestContext(),
-        inputs=TestInput({**kwargs, **(inputs or {})}),
+        context=context,
+        inputs=TestInput(inputs or {}),
         output_template=output_template,
         params=params,
-        generate_description=__generate_description,
+        generate_description=generate_description,
     )
 
-    test.run()
-
-    if show:
-        test.result.show()
+    with context.activate():
+        test.run()
 
     return test.result
 
@@ -532,6 +607,7 @@ def run_comparison_test_with_grids(
     output_template,
     show,
     generate_description,
+    max_workers=None,
 ):
     """Run a comparison test based on the presence of input and param grids."""
     if input_grid and param_grid:
@@ -544,6 +620,7 @@ def run_comparison_test_with_grids(
             output_template=output_template,
             show=show,
             generate_description=generate_description,
+            max_workers=max_workers,
         )
     if input_grid:
         return run_comparison_test(
@@ -555,6 +632,7 @@ def run_comparison_test_with_grids(
             output_template=output_template,
             show=show,
             generate_description=generate_description,
+            max_workers=max_workers,
         )
     if param_grid:
         return run_comparison_test(
@@ -566,6 +644,7 @@ def run_comparison_test_with_grids(
             output_template=output_template,
             show=show,
             generate_description=generate_description,
+            max_workers=max_workers,
         )
 
 
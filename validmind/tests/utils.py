@@ -5,12 +5,84 @@
 """Test Module Utils"""
 
 import inspect
+import sys
+from types import ModuleType
 
+# matplotlib's pyplot (and libraries built on top of it) keep global figure state
+# that is not thread-safe, so tests using it never run concurrently with each other
+_PYPLOT_MODULES = ("matplotlib", "seaborn", "shap", "scorecardpy")
 
-def test_description(test_class, truncate=True):
-    description = inspect.getdoc(test_class).strip()
 
+def test_description(description, truncate=True):
     if truncate and len(description.split("\n")) > 5:
         return description.strip().split("\n")[0] + "..."
 
     return description
+
+
+def _is_pyplot_object(value) -> bool:
+    if isinstance(value, ModuleType):
+        return value.__name__.startswith(_PYPLOT_MODULES)
+
+    module = getattr(value, "__module__", None)
+
+    # e.g. `from matplotlib.pyplot import subplots`
+    return isinstance(module, str) and module.startswith(_PYPLOT_MODULES)
+
+
+def _referenced_modules(value):
+    """Get the validmind modules a module global points to (helpers used by a test)"""
+    if isinstance(value, ModuleType):
+        name = value.__name__
+    elif inspect.isfunction(value) or inspect.isclass(value):
+        name = getattr(value, "__module__", None)
+    else:
+        return []
+
+    if not isinstance(name, str) or not name.startswith("validmind."):
+        return []
+
+    module = sys.modules.get(name)
+
+    return [module] if module is not None else []
+
+
+def uses_pyplot(test_class) -> bool:
+    """Check if a test uses pyplot or a library using it
+
+    Looks at the globals of the module the test is defined in as well as those of
+    the validmind modules it uses (e.g. plotting helpers), recursively.
+    """
+    run = getattr(test_class, "run", None)
+    if not inspect.isfunction(run):
+        return False
+
+    # function tests are wrapped by the `metric` decorator so we also look at the
+    # module globals of the functions captured by the `run` closure
+    functions = [run] + [
+        cell.cell_contents
+        for cell in run.__closure__ or []
+        if inspect.isfunction(cell.cell_contents)
+    ]
+
+    pending = [function.__globals__ for function in functions]
+    seen = set()
+
+    while pending:
+        module_globals = pending.pop()
+        if id(module_globals) in seen:
+            continue
+
+        seen.add(id(module_globals))
+
+        for value in list(module_globals.values()):
+            if _is_pyplot_object(value):
+                return True
+
+            pending.extend(
+                vars(module)
+                for module in _referenced_modules(value)
+                if id(vars(module)) not in seen
+            )
+
+    return False
@@ -2,44 +2,98 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
+import functools
 import glob
 import hashlib
 import json
 import os
+import pickle
 from importlib import import_module
+from importlib.util import find_spec
 from textwrap import dedent
 
-from IPython.display import Markdown, display
-
+from validmind.__version__ import __version__
 from validmind.input_registry import input_registry
 from validmind.tests.decorator import _build_result, _inspect_signature
 from validmind.utils import test_id_to_name
 
-unit_metric_results_cache = {}
+from .cache import DEFAULT_MAX_SIZE, LRUCache, SQLiteStore
+
+_cache_path = os.getenv("VALIDMIND_UNIT_METRIC_CACHE_PATH")
+unit_metric_results_cache = LRUCache(
+    store=SQLiteStore(_cache_path) if _cache_path else None
+)
+
 
+def configure_cache(max_size=DEFAULT_MAX_SIZE, path=None, max_stored=None):
+    """Configure the cache used to store unit metric results
 
-def _serialize_dataset(dataset, model=None, sample_size=1000):
+    Results are kept in memory with least-recently-used eviction. When a `path`
+    is provided, results are also persisted to a sqlite database at that path so
+    that later runs over unchanged data don't need to recompute them. The cache
+    path can also be set with the `VALIDMIND_UNIT_METRIC_CACHE_PATH` environment
+    variable. Persisted results are keyed by the validmind version, the metric's
+    source code and a fingerprint of the model, so results of models that can't be
+    pickled are only kept in memory.
+
+    Args:
+        max_size (int, optional): The maximum number of results to keep in memory. Defaults to 1000.
+        path (str, optional): Path to a sqlite database to persist results to. Defaults to None.
+        max_stored (int, optional): The maximum number of results to persist. Defaults to None (no limit).
+    """
+    global unit_metric_results_cache
+
+    unit_metric_results_cache = LRUCache(
+        max_size=max_size,
+        store=SQLiteStore(path, max_size=max_stored) if path else None,
+    )
+
+
+def _serialize_dataset(dataset, model=None):
     columns = [*dataset.feature_columns, dataset.target_column]
     if model:
         columns.append(dataset.prediction_column(model))
 
-    df = dataset._df[columns]
+    return dataset.fingerprint([column for column in columns if column])
+
 
-    return hashlib.md5(
-        df.sample(n=min(sample_size, df.shape[0]), random_state=42)
-        .to_string(header=True, index=True)
-        .encode()
-    ).hexdigest()
+def _serialize_model(model):
+    """Fingerprint of the underlying model object or None if it can't be pickled"""
+    if model.model is None:
+        return None
 
+    try:
+        return hashlib.md5(pickle.dumps(model.model)).hexdigest()
+    except Exception:
+        return None
 
-def _get_metric_cache_key(metric_id, inputs, params):
+
+@functools.lru_cache(maxsize=None)
+def _serialize_metric_source(metric_id):
+    """Hash of the source file of a metric, so results are recomputed when it changes
+
+    Computed once per process since the metric's module is only imported once.
+    """
+    spec = find_spec(metric_id)
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return ""
+
+    with open(spec.origin, "rb") as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def _get_metric_cache_key(metric_id, inputs, params, model_fingerprint=None):
     cache_elements = [
+        __version__,
         metric_id,
+        _serialize_metric_source(metric_id),
         hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest(),
     ]
 
     if "model" in inputs:
         cache_elements.append(inputs["model"].input_id)
+        if model_fingerprint:
+            cache_elements.append(model_fingerprint)
 
     if "dataset" in inputs:
         cache_elements.append(inputs["dataset"].input_id)
@@ -82,6 +136,8 @@ def describe_metric(metric_id, raw=False):
 
     **Parameters**: {params}
     """
+    from IPython.display import Markdown, display
+
     display(Markdown(dedent(description_md)))
 
 
@@ -130,9 +186,19 @@ def run_metric(metric_id, inputs=None, params=None, show=True, value_only=False)
     }
     params = params or {}
 
-    cache_key = _get_metric_cache_key(metric_id, inputs, params)
+    # persisted results must not be reused for a different model with the same
+    # input_id so they are only stored for models that can be fingerprinted
+    persist = unit_metric_results_cache.store is not None
+    model_fingerprint = None
+    if persist and "model" in inputs:
+        model_fingerprint = _serialize_model(inputs["model"])
+        persist = model_fingerprint is not None
+
+    cache_key = _get_metric_cache_key(metric_id, inputs, params, model_fingerprint)
 
-    if cache_key not in unit_metric_results_cache:
+    cached_result = unit_metric_results_cache.get(cache_key)
+
+    if cached_result is None:
         metric = load_metric(metric_id)
         _inputs, _params = _inspect_signature(metric)
 
@@ -144,15 +210,14 @@ def run_metric(metric_id, inputs=None, params=None, show=True, value_only=False)
                 if k in _params.keys() or "kwargs" in _params.keys()
             },
         )
-        unit_metric_results_cache[cache_key] = (
+        cached_result = (
             result,
             # store the input ids that were used to calculate the result
             [v.input_id for v in inputs.values()],
             # store the params that were used to calculate the result
             params,
         )
-
-    cached_result = unit_metric_results_cache[cache_key]
+        unit_metric_results_cache.set(cache_key, cached_result, persist=persist)
 
     if value_only:
         return cached_result[0]
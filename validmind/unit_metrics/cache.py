@@ -0,0 +1,167 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Caches for unit metric results
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from validmind.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_SIZE = int(os.getenv("VALIDMIND_UNIT_METRIC_CACHE_SIZE", 1000))
+
+
+class SQLiteStore:
+    """Persistent store for unit metric results backed by a sqlite database
+
+    Results are pickled so they survive across processes (e.g. repeat monitoring
+    runs over unchanged data). When `max_size` is set, the least recently used
+    results are evicted once the store grows past it.
+
+    Args:
+        path (str): Path to the sqlite database file. Created if it doesn't exist.
+        max_size (int, optional): The maximum number of results to keep. Defaults to None (no limit).
+    """
+
+    def __init__(self, path, max_size=None):
+        self.path = path
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB, accessed REAL)"
+            )
+
+    def get(self, key):
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        try:
+            value = pickle.dumps(value)
+        except Exception as e:
+            logger.debug(
+                f"Not persisting unit metric result that can't be pickled: {e}"
+            )
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, accessed) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            if self.max_size:
+                self._conn.execute(
+                    "DELETE FROM results WHERE key NOT IN "
+                    "(SELECT key FROM results ORDER BY accessed DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+class LRUCache:
+    """In-memory cache for unit metric results with least-recently-used eviction
+
+    Optionally backed by a persistent `store` (see `SQLiteStore`) that is used to
+    look up results that aren't in memory and that every new result is written to.
+
+    Args:
+        max_size (int, optional): The maximum number of results to keep in memory.
+            Defaults to 1000 or the `VALIDMIND_UNIT_METRIC_CACHE_SIZE` environment variable.
+        store (SQLiteStore, optional): A persistent store. Defaults to None.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, store=None):
+        self.max_size = max_size
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        value = self.store.get(key) if self.store is not None else None
+        if value is None:
+            return default
+
+        self._set(key, value)
+
+        return value
+
+    def _set(self, key, value):
+        with self._lock:
+            self._results[key] = value
+            self._results.move_to_end(key)
+
+            while self.max_size and len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def set(self, key, value, persist=True):
+        """Add a result to the cache
+
+        Args:
+            key (str): The cache key
+            value: The result
+            persist (bool, optional): Whether to also write the result to the
+                store. Defaults to True.
+        """
+        self._set(key, value)
+
+        if persist and self.store is not None:
+            self.store.set(key, value)
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __len__(self):
+        return len(self._results)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+        if self.store is not None:
+            self.store.clear()
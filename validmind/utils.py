@@ -4,51 +4,89 @@
 
 import asyncio
 import difflib
+import functools
+import importlib
 import inspect
 import json
 import math
+import random
 import re
 import sys
+import threading
+import types
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from platform import python_version
 from typing import Any
 
-import matplotlib.pylab as pylab
-import mistune
 import nest_asyncio
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from IPython.core import getipython
-from IPython.display import HTML
-from IPython.display import display as ipy_display
-from latex2mathml.converter import convert
-from matplotlib.axes._axes import _log as matplotlib_axes_logger
 from numpy import ndarray
-from tabulate import tabulate
 
 from .html_templates.content_blocks import math_jax_snippet, python_syntax_highlighting
 from .logging import get_logger
 
+# plotting, notebook and markdown libraries are slow to import so they are imported
+# where they are used instead of here to keep `import validmind` fast
+
 DEFAULT_BIG_NUMBER_DECIMALS = 2
 DEFAULT_SMALL_NUMBER_DECIMALS = 4
 
+# max number of rows used to compute the summary statistics logged for datasets
+DATASET_INFO_SAMPLE_SIZE = 1_000_000
+
+
+class _LazyModule(types.ModuleType):
+    """Stand-in for a module that imports it on first attribute access"""
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import a module the first time one of its attributes is accessed
+
+    Used for modules that are slow to import (ipywidgets, IPython etc.) and that
+    are only needed for displaying results so that `import validmind` stays fast.
+
+    Args:
+        name (str): The full name of the module (e.g. `ipywidgets`)
 
-# SETUP SOME DEFAULTS FOR PLOTS #
-# Silence this warning: *c* argument looks like a single numeric RGB or
-# RGBA sequence, which should be avoided
-matplotlib_axes_logger.setLevel("ERROR")
+    Returns:
+        types.ModuleType: The module if already imported, otherwise a lazy stand-in
+    """
+    return sys.modules.get(name) or _LazyModule(name)
 
-sns.set(rc={"figure.figsize": (20, 10)})
 
-params = {
-    "legend.fontsize": "x-large",
-    "axes.labelsize": "x-large",
-    "axes.titlesize": "x-large",
-    "xtick.labelsize": "x-large",
-    "ytick.labelsize": "x-large",
-}
-pylab.rcParams.update(params)
-#################################
+@functools.lru_cache(maxsize=None)
+def setup_plot_defaults():
+    """Set up the default styles for plots
+
+    Runs once before the first test is loaded instead of when validmind is imported
+    since importing matplotlib and seaborn is slow.
+    """
+    import matplotlib.pylab as pylab
+    import seaborn as sns
+    from matplotlib.axes._axes import _log as matplotlib_axes_logger
+
+    # Silence this warning: *c* argument looks like a single numeric RGB or
+    # RGBA sequence, which should be avoided
+    matplotlib_axes_logger.setLevel("ERROR")
+
+    sns.set(rc={"figure.figsize": (20, 10)})
+
+    params = {
+        "legend.fontsize": "x-large",
+        "axes.labelsize": "x-large",
+        "axes.titlesize": "x-large",
+        "xtick.labelsize": "x-large",
+        "ytick.labelsize": "x-large",
+    }
+    pylab.rcParams.update(params)
+
 
 logger = get_logger(__name__)
 
@@ -59,13 +97,15 @@ def is_notebook() -> bool:
 
     https://stackoverflow.com/questions/15411967/how-can-i-check-if-code-is-executed-in-the-ipython-notebook
     """
-    try:
-        if getipython.get_ipython() is not None:
-            return True
-    except NameError:
-        return False  # Probably standard Python interpreter
+    return _get_ipython() is not None
+
 
-    return False
+def _get_ipython():
+    # IPython is always already imported when running in a notebook or IPython
+    # shell so we don't need to pay for importing it just to check
+    ipython = sys.modules.get("IPython")
+
+    return ipython.get_ipython() if ipython is not None else None
 
 
 # hacky way to make async code run "synchronously" in colab
@@ -73,7 +113,7 @@ __loop: asyncio.AbstractEventLoop = None
 try:
     from google.colab._shell import Shell  # type: ignore
 
-    if isinstance(getipython.get_ipython(), Shell):
+    if isinstance(_get_ipython(), Shell):
         __loop = asyncio.new_event_loop()
         nest_asyncio.apply(__loop)
 except ModuleNotFoundError:
@@ -82,6 +122,16 @@ except ModuleNotFoundError:
         nest_asyncio.apply(__loop)
 
 
+# backoff of retries of rate limited calls (see `get_rate_limit_delay`)
+_RATE_LIMIT_BACKOFF_BASE = 1
+_RATE_LIMIT_BACKOFF_MAX = 60
+
+# single worker thread for background tasks (see `run_in_background`)
+__background_executor: ThreadPoolExecutor = None
+__background_futures = set()
+__background_lock = threading.Lock()
+
+
 def nan_to_none(obj):
     if isinstance(obj, dict):
         return {k: nan_to_none(v) for k, v in obj.items()}
@@ -111,8 +161,23 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
     def encode(self, obj):
-        obj = nan_to_none(obj)
-        return super().encode(obj)
+        # Most objects have no NaN or Inf values so we first try to encode them as-is
+        # which lets the (C) encoder do the work in bulk. Only if that fails do we
+        # walk the object in python to replace NaN and Inf values with None.
+        strict_encoder = json.JSONEncoder(
+            skipkeys=self.skipkeys,
+            ensure_ascii=self.ensure_ascii,
+            check_circular=self.check_circular,
+            allow_nan=False,
+            sort_keys=self.sort_keys,
+            indent=self.indent,
+            separators=(self.item_separator, self.key_separator),
+            default=self.default,
+        )
+        try:
+            return strict_encoder.encode(obj)
+        except ValueError:
+            return "".join(super().iterencode(nan_to_none(obj), _one_shot=True))
 
     def iterencode(self, obj, _one_shot: bool = ...):
         obj = nan_to_none(obj)
@@ -246,6 +311,8 @@ def summarize_data_quality_results(results):
             ]
         )
 
+    from tabulate import tabulate
+
     return tabulate(
         test_results,
         headers=["Test", "Passed", "# Passed", "# Errors", "% Passed"],
@@ -319,6 +386,96 @@ def run_async_check(func, *args, **kwargs):
         pass
 
 
+def _init_background_thread():
+    # give the background thread its own event loop so `run_async` works there
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+def _run_background_task(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        # the error is kept on the task's future for whoever depends on its result
+        logger.error(f"Error in background task: {e}")
+        raise
+
+
+def run_in_background(func, *args, **kwargs) -> Future:
+    """Run a (blocking) function on a background thread
+
+    Used to take work that the user doesn't need to wait for (e.g. logging input
+    metadata) off the caller's thread. Tasks run one at a time in the order they
+    were submitted. Errors are logged when they happen and raised by the returned
+    future's `result()` so only the code depending on the task sees them.
+
+    Args:
+        func (function): The function to run
+        *args: The arguments to pass to the function
+        **kwargs: The keyword arguments to pass to the function
+
+    Returns:
+        concurrent.futures.Future: A future for the result of the function
+    """
+    global __background_executor
+
+    with __background_lock:
+        if __background_executor is None:
+            __background_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="validmind-background",
+                initializer=_init_background_thread,
+            )
+
+        future = __background_executor.submit(
+            _run_background_task, func, *args, **kwargs
+        )
+        __background_futures.add(future)
+
+    future.add_done_callback(__background_futures.discard)
+
+    return future
+
+
+def wait_for_background_tasks(timeout: float = None):
+    """Wait for tasks submitted with `run_in_background()` to complete
+
+    Errors of failed tasks aren't raised here, they're raised by the futures
+    returned by `run_in_background()` (see `InputRegistry.wait_until_logged()`).
+
+    Args:
+        timeout (float, optional): The maximum number of seconds to wait. Defaults
+            to None, which waits for all tasks to complete.
+    """
+    wait(list(__background_futures), timeout=timeout)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check if an error raised by a model or LLM client is due to rate limiting (HTTP 429)"""
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return status == 429 or "RateLimit" in error.__class__.__name__
+
+
+def get_rate_limit_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying a rate limited call
+
+    Uses the `Retry-After` header if the error has one, otherwise exponential backoff
+    with jitter.
+
+    Args:
+        error (Exception): The rate limit error
+        attempt (int): The number of the attempt that failed, starting at 0
+
+    Returns:
+        float: The delay in seconds
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return min(float(headers.get("retry-after")), _RATE_LIMIT_BACKOFF_MAX)
+    except (TypeError, ValueError):
+        delay = min(_RATE_LIMIT_BACKOFF_BASE * 2**attempt, _RATE_LIMIT_BACKOFF_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
+
 def fuzzy_match(string: str, search_string: str, threshold=0.7):
     """Check if a string matches another string using fuzzy matching
 
@@ -382,13 +539,20 @@ def get_model_info(model):
     }
 
 
-def get_dataset_info(dataset):
-    """Attempts to extract all dataset info from a dataset object instance"""
-    num_rows, num_cols = dataset.df.shape
-    schema = dataset.df.dtypes.apply(lambda x: x.name).to_dict()
-    description = (
-        dataset.df.describe(include="all").reset_index().to_dict(orient="records")
-    )
+def get_dataset_info(dataset, sample_size: int = DATASET_INFO_SAMPLE_SIZE):
+    """Attempts to extract all dataset info from a dataset object instance
+
+    The summary statistics are computed over a random sample of `sample_size` rows
+    for datasets larger than that. Pass `sample_size=None` to use all rows.
+    """
+    df = dataset.df
+    num_rows, num_cols = df.shape
+    schema = {column: dtype.name for column, dtype in df.dtypes.items()}
+
+    if sample_size and num_rows > sample_size:
+        df = df.sample(n=sample_size, random_state=42)
+
+    description = df.describe(include="all").reset_index().to_dict(orient="records")
 
     return {
         "num_rows": num_rows,
@@ -417,11 +581,17 @@ def preview_test_config(config):
     <div id="collapsibleContent" style="display:none;"><pre>{formatted_json}</pre></div>
     """
 
+    from IPython.display import HTML
+    from IPython.display import display as ipy_display
+
     ipy_display(HTML(collapsible_html))
 
 
 def display(widget_or_html, syntax_highlighting=True, mathjax=True):
     """Display widgets with extra goodies (syntax highlighting, MathJax, etc.)"""
+    from IPython.display import HTML
+    from IPython.display import display as ipy_display
+
     if isinstance(widget_or_html, str):
         ipy_display(HTML(widget_or_html))
         # if html we can auto-detect if we actually need syntax highlighting or MathJax
@@ -439,6 +609,8 @@ def display(widget_or_html, syntax_highlighting=True, mathjax=True):
 
 def md_to_html(md: str, mathml=False) -> str:
     """Converts Markdown to HTML using mistune with plugins"""
+    import mistune
+
     # use mistune with math plugin to convert to html
     html = mistune.create_markdown(
         plugins=["math", "table", "strikethrough", "footnotes"]
@@ -448,6 +620,8 @@ def md_to_html(md: str, mathml=False) -> str:
         # return the html as is (with latex that will be rendered by MathJax)
         return html
 
+    from latex2mathml.converter import convert
+
     # convert the latex to MathML which CKeditor can render
     math_block_pattern = re.compile(r'<div class="math">\$\$([\s\S]*?)\$\$</div>')
     html = math_block_pattern.sub(
@@ -2,6 +2,18 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-from .dataset import DataFrameDataset, PolarsDataset, TorchDataset, VMDataset
+from .dataset import (
+    DataFrameDataset,
+    FileDataset,
+    PolarsDataset,
+    TorchDataset,
+    VMDataset,
+)
 
-__all__ = ["VMDataset", "DataFrameDataset", "PolarsDataset", "TorchDataset"]
+__all__ = [
+    "VMDataset",
+    "DataFrameDataset",
+    "FileDataset",
+    "PolarsDataset",
+    "TorchDataset",
+]
@@ -6,32 +6,64 @@
 Dataset class wrapper
 """
 
+import hashlib
+import os
+import pickle
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import cached_property
+from typing import TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
-import polars as pl
 
 from validmind.logging import get_logger
 from validmind.models import FunctionModel, PipelineModel
 from validmind.vm_models.input import VMInput
 from validmind.vm_models.model import VMModel
 
-from .utils import ExtraColumns, as_df, compute_predictions, convert_index_to_datetime
+if TYPE_CHECKING:
+    import polars as pl
+
+from .tensors import TensorArray, TensorDtype, tensor_values
+from .utils import (
+    ExtraColumns,
+    PredictionCheckpoint,
+    as_df,
+    column_view,
+    compute_predictions,
+    compute_predictions_chunked,
+    convert_index_to_datetime,
+    fingerprint_values,
+    pandas_copy_on_write,
+    readonly_view,
+)
 
 logger = get_logger(__name__)
 
 
+def _hash_kwargs(kwargs: dict):
+    """Hash of the values of keyword arguments passed to a model"""
+    try:
+        return hashlib.md5(pickle.dumps(sorted(kwargs.items()))).hexdigest()
+    except Exception:
+        # the arguments can't be compared so a checkpoint made with them never matches
+        return object()
+
+
 class VMDataset(VMInput):
     """Base class for VM datasets
 
     Child classes should be used to support new dataset types (tensor, polars etc)
-    by converting the user's dataset into a numpy array collecting metadata like
-    column names and then call this (parent) class `__init__` method.
+    by converting the user's dataset into a numpy array or a pandas dataframe,
+    collecting metadata like column names and then call this (parent) class
+    `__init__` method.
 
-    This way we can support multiple dataset types but under the hood we only
-    need to work with numpy arrays and pandas dataframes in this class.
+    Pandas dataframes are stored column by column as they are passed in: the
+    dataset keeps a shallow reference to the user's column buffers (no copy and
+    no dtype conversion) and the `x`, `y`, `df` and `x_df()` accessors are built
+    as projections over those columns. Numpy arrays are wrapped in a dataframe
+    which is zero-copy for homogeneous (e.g. all numeric) arrays.
 
     Attributes:
         raw_dataset (np.ndarray): The raw dataset as a NumPy array.
@@ -46,11 +78,13 @@ class VMDataset(VMInput):
         target_class_labels (Dict): The class labels for the target columns.
         df (pd.DataFrame): The dataset as a pandas DataFrame.
         extra_columns (Dict): Extra columns to include in the dataset.
+        copy_on_write (bool): Whether `df` returns read-only, zero-copy views of the
+            dataset columns instead of a full copy. Defaults to False.
     """
 
     def __init__(
         self,
-        raw_dataset: np.ndarray,
+        raw_dataset: Union[np.ndarray, pd.DataFrame],
         input_id: str = None,
         model: VMModel = None,
         index: np.ndarray = None,
@@ -67,7 +101,10 @@ class VMDataset(VMInput):
         Initializes a VMDataset instance.
 
         Args:
-            raw_dataset (np.ndarray): The raw dataset as a NumPy array.
+            raw_dataset (np.ndarray, pd.DataFrame): The raw dataset as a NumPy array
+                or a pandas DataFrame. The data is not copied: the dataset shares the
+                column buffers of the array or DataFrame, so modifying them in place
+                also modifies the dataset.
             input_id (str): Identifier for the dataset.
             model (VMModel): Model associated with the dataset.
             index (np.ndarray): The raw dataset index as a NumPy array.
@@ -83,16 +120,29 @@ class VMDataset(VMInput):
         self.input_id = input_id
 
         # initialize raw dataset
-        if not isinstance(raw_dataset, np.ndarray):
-            raise ValueError("Expected Numpy array for attribute raw_dataset")
-        self._raw_dataset = raw_dataset
+        if not isinstance(raw_dataset, (np.ndarray, pd.DataFrame)):
+            raise ValueError(
+                "Expected Numpy array or Pandas DataFrame for attribute raw_dataset"
+            )
 
         # initialize index and index name
         if index is not None and not isinstance(index, np.ndarray):
             raise ValueError("Expected Numpy array for attribute raw_dataset")
         self.index = index
 
-        self._df = pd.DataFrame(self._raw_dataset, columns=columns).infer_objects()
+        if isinstance(raw_dataset, pd.DataFrame):
+            # shallow copy: shares the column buffers with the user's dataframe but
+            # lets us add prediction and extra columns without touching the original
+            self._df = raw_dataset.copy(deep=False)
+            columns = columns or self._df.columns.to_list()
+        else:
+            self._df = pd.DataFrame(raw_dataset, columns=columns)
+            if raw_dataset.dtype == object:
+                # mixed-type arrays need their columns converted to proper dtypes
+                self._df = self._df.infer_objects()
+
+        self._n_raw_columns = self._df.shape[1]
+
         # set index to dataframe
         if index is not None:
             self._df.set_index(pd.Index(index), inplace=True)
@@ -101,17 +151,28 @@ class VMDataset(VMInput):
         if date_time_index:
             self._df = convert_index_to_datetime(self._df)
 
-        self.columns = columns or []
+        self.columns = list(columns or [])
         self.column_aliases = {}
         self.target_column = target_column
         self.text_column = text_column
         self.target_class_labels = target_class_labels
         self.extra_columns = ExtraColumns.from_dict(extra_columns)
+        self.copy_on_write = False
+        self._prediction_checkpoints = {}
+        self._fingerprints = {}
+        # columns whose data only the dataset holds (e.g. predictions) so their
+        # fingerprints can be cached
+        self._owned_columns = set()
         self._set_feature_columns(feature_columns)
 
         if model:
             self.assign_predictions(model)
 
+    @property
+    def _raw_dataset(self) -> np.ndarray:
+        """The original dataset columns as a NumPy array (materialized on access)"""
+        return self._df.iloc[:, : self._n_raw_columns].to_numpy()
+
     def _set_feature_columns(self, feature_columns=None):
         if feature_columns is not None and (
             not isinstance(feature_columns, list)
@@ -126,18 +187,29 @@ class VMDataset(VMInput):
             self.feature_columns = [col for col in self.columns if col not in excluded]
 
         self.feature_columns_numeric = (
-            self._df[self.feature_columns]
+            self._schema_df()[self.feature_columns]
             .select_dtypes(include=[np.number])
             .columns.tolist()
         )
         self.feature_columns_categorical = (
-            self._df[self.feature_columns]
-            .select_dtypes(include=[object, pd.Categorical])
+            self._schema_df()[self.feature_columns]
+            .select_dtypes(include=[object, "category", "string"])
             .columns.tolist()
         )
 
+    def _schema_df(self) -> pd.DataFrame:
+        """An empty dataframe with the columns and dtypes of the dataset
+
+        For selecting columns by dtype without touching the data.
+        """
+        return self._df.head(0)
+
     def _add_column(self, column_name, column_values):
-        column_values = np.array(column_values)
+        column_values = tensor_values(column_values)
+
+        # the column is new or its data is being replaced
+        self._fingerprints.pop(column_name, None)
+        self._owned_columns.add(column_name)
 
         if column_values.ndim == 1:
             if len(column_values) != len(self._df):
@@ -152,11 +224,69 @@ class VMDataset(VMInput):
                     "Number of rows in values doesn't match number of rows in the DataFrame."
                 )
             self.columns.append(column_name)
-            self._df[column_name] = column_values.tolist()
+            # rows of vectors are stored in a contiguous array (see `TensorArray`)
+            self._df[column_name] = TensorArray(column_values)
 
         else:
             raise ValueError("Only 1D and 2D arrays are supported for column_values.")
 
+    def fingerprint(self, columns: list = None, memo: dict = None) -> str:
+        """Compute an exact fingerprint of the dataset's data
+
+        Each column is hashed from its data buffer. The hashes of columns that can't
+        be modified from outside the dataset (columns added through
+        `add_extra_column`, `assign_predictions` etc., read-only columns, or any
+        column when pandas' copy-on-write mode is enabled) are cached until the
+        column is replaced. Columns shared with the user's dataframe are hashed on
+        every call since they can be modified in place, unless a `memo` is given.
+
+        Args:
+            columns (list, optional): The columns to include. Defaults to all columns.
+            memo (dict, optional): Keeps the hashes of the columns shared with the
+                user's dataframe, e.g. for the duration of a test run during which
+                they're assumed not to change. Defaults to None.
+
+        Returns:
+            str: A hex digest that only matches datasets with identical data.
+        """
+        columns = self.columns if columns is None else columns
+
+        if None not in self._fingerprints:
+            self._fingerprints[None] = fingerprint_values(None, self._df.index)
+        hashes = [self._fingerprints[None]]
+
+        for column in columns:
+            if column in self._fingerprints:
+                hashes.append(self._fingerprints[column])
+                continue
+
+            # the memo keeps a reference to the dataframe so its id isn't reused
+            key = (id(self._df), column)
+            if memo is not None and key in memo:
+                hashes.append(memo[key][1])
+                continue
+
+            values = self._df[column]
+            hashes.append(fingerprint_values(column, values))
+            if self._is_immutable(column, values):
+                self._fingerprints[column] = hashes[-1]
+            elif memo is not None:
+                memo[key] = (self._df, hashes[-1])
+
+        return hashlib.blake2b("_".join(hashes).encode(), digest_size=16).hexdigest()
+
+    def _is_immutable(self, column: str, values: pd.Series) -> bool:
+        """Whether the data of a column can only change through the dataset"""
+        if column in self._owned_columns or pandas_copy_on_write():
+            return True
+
+        # e.g. memory-mapped columns opened read-only
+        return (
+            isinstance(values.dtype, np.dtype)
+            and values.dtype != object
+            and not values.to_numpy().flags.writeable
+        )
+
     def _validate_assign_predictions(
         self,
         model: VMModel,
@@ -197,6 +327,24 @@ class VMDataset(VMInput):
                 "Cannot use precomputed probabilities without precomputed predictions"
             )
 
+    def _shallow_copy(self) -> "VMDataset":
+        """Create a copy of the dataset that shares the column data with `self`
+
+        The dataframe is copied shallowly (no data is copied) so that adding or
+        replacing columns on the new dataset doesn't affect the original one.
+        """
+        new = copy(self)
+        new._df = self._df.copy(deep=False)
+        new.columns = self.columns.copy()
+        new.column_aliases = self.column_aliases.copy()
+        new.extra_columns = deepcopy(self.extra_columns)
+        new.feature_columns = self.feature_columns.copy()
+        new._prediction_checkpoints = {}
+        new._fingerprints = self._fingerprints.copy()
+        new._owned_columns = self._owned_columns.copy()
+
+        return new
+
     def with_options(self, **kwargs) -> "VMDataset":
         """Support options provided when passing an input to run_test or run_test_suite
 
@@ -220,17 +368,25 @@ class VMDataset(VMInput):
         Args:
             **kwargs: Options:
                 - columns: Filter columns in the dataset
+                - copy_on_write: Return read-only views from `df` instead of copies
 
         Returns:
-            VMDataset: A new instance of the dataset with only the specified columns
+            VMDataset: A new instance of the dataset with the specified options. The
+                new instance shares the underlying column data with this dataset.
         """
+        if not kwargs:
+            return
+
+        new = self._shallow_copy()
+
+        if "copy_on_write" in kwargs:
+            new.copy_on_write = kwargs.pop("copy_on_write")
+
         if "columns" in kwargs:
             # filter columns (create a temp copy of self with only specified columns)
             # TODO: need a more robust mechanism for this as we expand on this feature
             columns = kwargs.pop("columns")
 
-            new = deepcopy(self)
-
             new._set_feature_columns(
                 [col for col in new.feature_columns if col in columns]
             )
@@ -240,13 +396,13 @@ class VMDataset(VMInput):
             )
             new.extra_columns.extras = new.extra_columns.extras.intersection(columns)
 
-            return new
-
         if kwargs:
             raise NotImplementedError(
                 f"Options {kwargs} are not supported for this input"
             )
 
+        return new
+
     def assign_predictions(
         self,
         model: VMModel,
@@ -255,6 +411,7 @@ class VMDataset(VMInput):
         probability_column: str = None,
         probability_values: list = None,
         prediction_probabilities: list = None,  # DEPRECATED: use probability_values
+        chunk_size: int = None,
         **kwargs,
     ):
         """Assign predictions and probabilities to the dataset.
@@ -266,6 +423,10 @@ class VMDataset(VMInput):
             probability_column (str, optional): The name of the column containing the probabilities. Defaults to None.
             probability_values (list, optional): The values of the probabilities. Defaults to None.
             prediction_probabilities (list, optional): DEPRECATED: The values of the probabilities. Defaults to None.
+            chunk_size (int, optional): Stream the dataset through the model in chunks of this many rows
+                instead of all at once. Progress is logged after each chunk and if the call is interrupted,
+                calling it again with the same model and `chunk_size` resumes from the last completed chunk.
+                Defaults to None (no chunking).
             kwargs: Additional keyword arguments that will get passed through to the model's `predict` method.
         """
         if prediction_probabilities is not None:
@@ -296,7 +457,11 @@ class VMDataset(VMInput):
             if probability_column:
                 probability_values = self._df[probability_column].values
 
-        if prediction_values is None:
+        if prediction_values is None and chunk_size:
+            probability_values, prediction_values = self._compute_predictions_chunked(
+                model, chunk_size, **kwargs
+            )
+        elif prediction_values is None:
             X = self.df if isinstance(model, (FunctionModel, PipelineModel)) else self.x
             probability_values, prediction_values = compute_predictions(
                 model, X, **kwargs
@@ -316,6 +481,46 @@ class VMDataset(VMInput):
                 "Not adding probability column to the dataset."
             )
 
+    def _compute_predictions_chunked(self, model: VMModel, chunk_size: int, **kwargs):
+        if isinstance(model, (FunctionModel, PipelineModel)):
+            columns = self._df_columns()
+
+            def get_chunk(start, stop):
+                return column_view(self._df, columns).iloc[start:stop].copy()
+
+        else:
+            columns = self.feature_columns.copy()
+
+            def get_chunk(start, stop):
+                return column_view(self._df, columns).iloc[start:stop].to_numpy()
+
+        # an interrupted call is only resumed for the same model object, data and
+        # keyword argument values
+        key = (
+            chunk_size,
+            tuple(columns),
+            self.fingerprint(columns),
+            id(model),
+            id(model.model),
+            _hash_kwargs(kwargs),
+        )
+        checkpoint = self._prediction_checkpoints.get(model.input_id)
+
+        if checkpoint and checkpoint.key == key and checkpoint.n_rows == len(self._df):
+            logger.info(
+                f"Resuming predictions for model {model.input_id} from row {checkpoint.rows_done}"
+            )
+        else:
+            checkpoint = PredictionCheckpoint(key=key, n_rows=len(self._df))
+            self._prediction_checkpoints[model.input_id] = checkpoint
+
+        result = compute_predictions_chunked(
+            model, get_chunk, checkpoint, chunk_size, **kwargs
+        )
+        del self._prediction_checkpoints[model.input_id]
+
+        return result
+
     def prediction_column(self, model: VMModel, column_name: str = None) -> str:
         """Get or set the prediction column for a model."""
         if column_name and column_name not in self.columns:
@@ -370,14 +575,7 @@ class VMDataset(VMInput):
             f"Extra column {column_name} with {len(column_values)} values added to the dataset"
         )
 
-    @property
-    def df(self) -> pd.DataFrame:
-        """
-        Returns the dataset as a pandas DataFrame.
-
-        Returns:
-            pd.DataFrame: The dataset as a pandas DataFrame.
-        """
+    def _df_columns(self) -> list:
         # only include feature, text and target columns
         # don't include internal pred and prob columns
         columns = self.feature_columns.copy()
@@ -395,8 +593,33 @@ class VMDataset(VMInput):
             assert self.target_column not in columns
             columns.append(self.target_column)
 
+        return columns
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        Returns the dataset as a pandas DataFrame.
+
+        By default this is a full copy of the dataset columns to prevent accidental
+        modification of the dataset. When pandas' copy-on-write mode is enabled
+        (`pd.options.mode.copy_on_write = True`) a zero-copy view is returned and
+        pandas takes care of copying on modification. When the dataset is in
+        `copy_on_write` mode, a read-only zero-copy view is returned instead
+        (see `readonly_view`).
+
+        Returns:
+            pd.DataFrame: The dataset as a pandas DataFrame.
+        """
+        columns = self._df_columns()
+
+        if pandas_copy_on_write():
+            return column_view(self._df, columns)
+
+        if self.copy_on_write:
+            return readonly_view(self._df, columns)
+
         # return a copy to prevent accidental modification
-        return as_df(self._df[columns]).copy()
+        return column_view(self._df, columns).copy()
 
     @property
     def x(self) -> np.ndarray:
@@ -406,7 +629,7 @@ class VMDataset(VMInput):
         Returns:
             np.ndarray: The input features.
         """
-        return self._df[self.feature_columns].to_numpy()
+        return column_view(self._df, self.feature_columns).to_numpy()
 
     @property
     def y(self) -> np.ndarray:
@@ -421,8 +644,9 @@ class VMDataset(VMInput):
     def y_pred(self, model) -> np.ndarray:
         """Returns the predictions for a given model.
 
-        Attempts to stack complex prediction types (e.g., embeddings) into a single,
-        multi-dimensional array.
+        Vector predictions (e.g., embeddings) are returned as a read-only 2D view of
+        the column without copying it. Other complex prediction types are stacked
+        into a single, multi-dimensional array.
 
         Args:
             model (VMModel): The model whose predictions are sought.
@@ -430,22 +654,33 @@ class VMDataset(VMInput):
         Returns:
             np.ndarray: The predictions for the model
         """
-        return np.stack(self._df[self.prediction_column(model)].values)
+        series = self._df[self.prediction_column(model)]
+        if isinstance(series.array, TensorArray):
+            return series.array.to_tensor()
+
+        return np.stack(series.values)
 
     def y_prob(self, model) -> np.ndarray:
         """Returns the probabilities for a given model.
 
+        Multi-class probabilities are returned as a read-only 2D view of the column
+        without copying it.
+
         Args:
             model (str): The ID of the model whose predictions are sought.
 
         Returns:
             np.ndarray: The probability variables.
         """
-        return self._df[self.probability_column(model)].values
+        series = self._df[self.probability_column(model)]
+        if isinstance(series.array, TensorArray):
+            return series.array.to_tensor()
+
+        return series.values
 
     def x_df(self):
         """Returns a dataframe containing only the feature columns"""
-        return as_df(self._df[self.feature_columns])
+        return column_view(self._df, self.feature_columns)
 
     def y_df(self) -> pd.DataFrame:
         """Returns a dataframe containing the target column"""
@@ -511,16 +746,13 @@ class DataFrameDataset(VMDataset):
             target_class_labels (dict, optional): The class labels for the target columns. Defaults to None.
             date_time_index (bool, optional): Whether to use date-time index. Defaults to False.
         """
-        index = None
-        if isinstance(raw_dataset.index, pd.Index):
-            index = raw_dataset.index.values
-
+        # the dataframe (and its index) is passed through as-is so that the
+        # columns keep their original dtypes and buffers
         super().__init__(
-            raw_dataset=raw_dataset.values,
+            raw_dataset=raw_dataset,
             input_id=input_id,
             model=model,
             index_name=raw_dataset.index.name,
-            index=index,
             columns=raw_dataset.columns.to_list(),
             target_column=target_column,
             extra_columns=extra_columns,
@@ -533,12 +765,23 @@ class DataFrameDataset(VMDataset):
 
 class PolarsDataset(VMDataset):
     """
-    VM dataset implementation for Polars DataFrame.
+    VM dataset implementation for Polars DataFrames and LazyFrames.
+
+    The polars frame is kept as is and the statistics that tests share (profiles,
+    value counts, group-by aggregations and correlations, see
+    `validmind.tests.artifacts`) are computed by polars (see
+    `validmind.vm_models.dataset.polars_ops`). `x`, `y` and `y_pred` are also read
+    straight from the polars frame. The pandas dataframe behind `df` and the other
+    accessors is only built when a test first needs it.
+
+    LazyFrames are not collected up front: every query runs the frame's plan so
+    datasets scanned from files only read the columns each query needs. Collect
+    (or `cache`) plans that are expensive to run.
     """
 
     def __init__(
         self,
-        raw_dataset: pl.DataFrame,
+        raw_dataset: Union["pl.DataFrame", "pl.LazyFrame"],
         input_id: str = None,
         model: VMModel = None,
         target_column: str = None,
@@ -552,7 +795,7 @@ class PolarsDataset(VMDataset):
         Initializes a PolarsDataset instance.
 
         Args:
-            raw_dataset (pl.DataFrame): The raw dataset as a Polars DataFrame.
+            raw_dataset (pl.DataFrame, pl.LazyFrame): The raw dataset as a Polars DataFrame or LazyFrame.
             input_id (str, optional): Identifier for the dataset. Defaults to None.
             model (VMModel, optional): Model associated with the dataset. Defaults to None.
             target_column (str, optional): The target column of the dataset. Defaults to None.
@@ -562,20 +805,168 @@ class PolarsDataset(VMDataset):
             target_class_labels (dict, optional): The class labels for the target columns. Defaults to None.
             date_time_index (bool, optional): Whether to use date-time index. Defaults to False.
         """
+        from .polars_ops import pandas_dtypes
+
+        # a DataFrame's lazy frame shares its data
+        self._frame = raw_dataset.lazy()
+        self._dtypes = pandas_dtypes(self._frame)
+        self._date_time_index = date_time_index
+
+        # the base class only gets an empty dataframe with the columns and dtypes
+        self._pandas = None
         super().__init__(
-            raw_dataset=raw_dataset.to_numpy(),
+            raw_dataset=self._schema_df(),
             input_id=input_id,
-            model=model,
-            index_name=None,
-            index=None,
-            columns=raw_dataset.columns,
+            columns=list(self._dtypes),
             target_column=target_column,
             extra_columns=extra_columns,
             feature_columns=feature_columns,
             text_column=text_column,
             target_class_labels=target_class_labels,
-            date_time_index=date_time_index,
         )
+        self._pandas = None
+
+        if model:
+            self.assign_predictions(model)
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        """The dataset as a pandas dataframe, converted from polars on first access"""
+        if self._pandas is None:
+            from .polars_ops import to_pandas
+
+            logger.debug(f"Converting dataset {self.input_id} to pandas")
+            self._pandas = to_pandas(self._frame)
+            if self._date_time_index:
+                self._pandas = convert_index_to_datetime(self._pandas)
+
+        return self._pandas
+
+    @_df.setter
+    def _df(self, df: pd.DataFrame):
+        self._pandas = df
+
+    @cached_property
+    def _n_rows(self) -> int:
+        import polars as pl
+
+        return self._frame.select(pl.len()).collect().item()
+
+    def _schema_df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in self._dtypes.items()}
+        )
+
+    def lazy(self, columns: list = None) -> "pl.LazyFrame":
+        """Returns the dataset as a polars LazyFrame
+
+        Includes the columns added to the dataset (e.g. predictions).
+
+        Args:
+            columns (list, optional): The columns to select. Defaults to all columns.
+
+        Returns:
+            pl.LazyFrame: The dataset as a LazyFrame.
+        """
+        return self._frame if columns is None else self._frame.select(columns)
+
+    def _add_column(self, column_name, column_values):
+        import polars as pl
+
+        from .polars_ops import pandas_dtypes
+
+        column_values = tensor_values(column_values)
+
+        if column_values.ndim not in (1, 2):
+            raise ValueError("Only 1D and 2D arrays are supported for column_values.")
+
+        if len(column_values) != self._n_rows:
+            raise ValueError(
+                "Number of rows in values doesn't match number of rows in the DataFrame."
+            )
+
+        self._fingerprints.pop(column_name, None)
+        self.columns.append(column_name)
+
+        self._frame = self._frame.with_columns(pl.Series(column_name, column_values))
+        self._dtypes[column_name] = pandas_dtypes(self._frame.select(column_name))[
+            column_name
+        ]
+
+        if self._pandas is not None:
+            # 2D values are stored as a `TensorArray` like polars arrays are converted
+            self._pandas[column_name] = (
+                column_values if column_values.ndim == 1 else TensorArray(column_values)
+            )
+
+    def _shallow_copy(self) -> "PolarsDataset":
+        # polars frames are immutable so the copy shares the frame, and the pandas
+        # dataframe is only copied if it has been built
+        new = copy(self)
+        new._pandas = None if self._pandas is None else self._pandas.copy(deep=False)
+        new._dtypes = self._dtypes.copy()
+        new.columns = self.columns.copy()
+        new.column_aliases = self.column_aliases.copy()
+        new.extra_columns = deepcopy(self.extra_columns)
+        new.feature_columns = self.feature_columns.copy()
+        new._prediction_checkpoints = {}
+        new._fingerprints = self._fingerprints.copy()
+        new._owned_columns = self._owned_columns.copy()
+
+        return new
+
+    def fingerprint(self, columns: list = None, memo: dict = None) -> str:
+        from .polars_ops import fingerprint_columns
+
+        columns = self.columns if columns is None else columns
+
+        missing = [
+            column
+            for column in dict.fromkeys(columns)
+            if column not in self._fingerprints
+        ]
+        if missing:
+            self._fingerprints.update(fingerprint_columns(self._frame, missing))
+
+        if None not in self._fingerprints:
+            # the pandas dataframe gets a default index
+            self._fingerprints[None] = fingerprint_values(
+                None, pd.RangeIndex(self._n_rows)
+            )
+
+        return super().fingerprint(columns, memo)
+
+    def _column_values(self, column: str) -> np.ndarray:
+        return self._frame.select(column).collect().to_series().to_numpy()
+
+    @property
+    def x(self) -> np.ndarray:
+        kinds = {self._dtypes[column].kind for column in self.feature_columns}
+        if not (kinds <= set("iuf") or kinds == {"b"}):
+            # pandas returns objects for mixed types and converts them differently
+            return super().x
+
+        return self._frame.select(self.feature_columns).collect().to_numpy()
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._column_values(self.target_column)
+
+    def y_pred(self, model) -> np.ndarray:
+        column = self.prediction_column(model)
+        if isinstance(self._dtypes[column], TensorDtype):
+            # polars returns a read-only 2D view of fixed-size arrays
+            return self._column_values(column)
+
+        return np.stack(self._column_values(column))
+
+    def y_prob(self, model) -> np.ndarray:
+        column = self.probability_column(model)
+        if self._dtypes[column] == object:
+            # rows of arrays with nulls are returned as arrays like for pandas
+            return super().y_prob(model)
+
+        return self._column_values(column)
 
 
 class TorchDataset(VMDataset):
@@ -654,3 +1045,71 @@ class TorchDataset(VMDataset):
             extra_columns=extra_columns,
             target_class_labels=target_class_labels,
         )
+
+
+class FileDataset(VMDataset):
+    """
+    VM dataset implementation for Parquet and Arrow IPC files.
+
+    The dataset columns are memory-mapped (see `validmind.vm_models.dataset.files`)
+    so only the columns and row ranges that tests read are loaded into memory.
+    `df` returns read-only views of the columns by default (see `copy_on_write`).
+
+    The columns are first converted to a cache directory that takes about as much
+    disk space as the columns take in memory (`VALIDMIND_DATASET_CACHE_DIR`,
+    defaults to a directory in the system's temporary directory). The copy of a
+    previous version of the files is deleted when they change and the whole cache
+    can be deleted with `validmind.vm_models.dataset.files.clear_dataset_cache()`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        input_id: str = None,
+        model: VMModel = None,
+        columns: list = None,
+        target_column: str = None,
+        extra_columns: dict = None,
+        feature_columns: list = None,
+        text_column: str = None,
+        target_class_labels: dict = None,
+        date_time_index: bool = False,
+    ):
+        """
+        Initializes a FileDataset instance.
+
+        Args:
+            path (str, os.PathLike): A Parquet file, an Arrow IPC (Feather v2) file or a
+                directory of them (e.g. a partitioned dataset).
+            input_id (str, optional): Identifier for the dataset. Defaults to None.
+            model (VMModel, optional): Model associated with the dataset. Defaults to None.
+            columns (list, optional): The columns to read from the files. Defaults to all columns.
+            target_column (str, optional): The target column of the dataset. Defaults to None.
+            extra_columns (dict, optional): Extra columns to include in the dataset. Defaults to None.
+            feature_columns (list, optional): The feature columns of the dataset. Defaults to None.
+            text_column (str, optional): The text column name of the dataset for NLP tasks. Defaults to None.
+            target_class_labels (dict, optional): The class labels for the target columns. Defaults to None.
+            date_time_index (bool, optional): Whether to use date-time index. Defaults to False.
+        """
+        from .files import read_dataset_files
+
+        self.path = os.fspath(path)
+        raw_dataset = read_dataset_files(self.path, columns=columns)
+
+        super().__init__(
+            raw_dataset=raw_dataset,
+            input_id=input_id,
+            model=model,
+            columns=raw_dataset.columns.to_list(),
+            target_column=target_column,
+            extra_columns=extra_columns,
+            feature_columns=feature_columns,
+            text_column=text_column,
+            target_class_labels=target_class_labels,
+            date_time_index=date_time_index,
+        )
+
+        # copying the memory-mapped columns would load the whole dataset
+        self.copy_on_write = True
+        # the columns are read from the cache files and aren't shared with the user
+        self._owned_columns.update(self.columns)
@@ -0,0 +1,357 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Memory-mapped dataframes read from Parquet and Arrow IPC (Feather v2) files
+
+Parquet files are compressed and encoded so they can't be used in place, and the
+columns of Arrow IPC files are split across record batches (and possibly
+compressed). The first time a file (or a directory of files) is opened, the
+requested columns are streamed through in batches of rows and written to a cache
+directory, one file per column:
+
+- Numeric, boolean, timestamp and duration columns are written as `.npy` files
+  that are memory-mapped when the dataset is opened. The dataframe columns are
+  zero-copy views of those files, so only the pages of the columns (and ranges of
+  rows) that are actually read are loaded into memory, and the operating system
+  can evict them again when memory is needed.
+- Other columns (strings, dictionaries, dates, nested types...) are written as
+  Arrow IPC files and converted to pandas when the dataset is opened, the same
+  way `pd.read_parquet` does.
+
+Columns get the same dtypes as with `pd.read_parquet` (e.g. integer columns with
+nulls become float columns with NaNs) except for boolean columns with nulls,
+which use pandas' nullable "boolean" dtype instead of objects so they can be
+memory-mapped too. Converted columns are reused until the source files change.
+
+The cache takes about as much disk space as the requested columns take in memory.
+When the source files change (a new size or modification time), the columns are
+converted again and the copies of the previous versions of the same files are
+deleted. `clear_dataset_cache()` deletes the whole cache. The cache directory can
+be set with the `VALIDMIND_DATASET_CACHE_DIR` environment variable. Files are
+written under names unique to the writer and then atomically renamed, so
+processes opening the same files at the same time don't corrupt the cache (at
+worst they convert the same columns twice).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pa_ds
+import pyarrow.ipc as ipc
+
+from validmind.logging import get_logger
+
+logger = get_logger(__name__)
+
+DATASET_CACHE_DIR = os.getenv(
+    "VALIDMIND_DATASET_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "validmind-datasets"),
+)
+
+# number of rows read from the source files at once when converting columns
+_BATCH_ROWS = 65_536
+
+_CACHE_VERSION = 2
+
+_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+}
+
+
+def _file_format(path: str) -> str:
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                extension = os.path.splitext(name)[1].lower()
+                if extension in _FORMATS:
+                    return _FORMATS[extension]
+
+        raise ValueError(f"No Parquet or Arrow IPC files found in {path}")
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _FORMATS:
+        raise ValueError(
+            f"Unsupported file type for {path}. Expected a Parquet (.parquet, .pq) "
+            "or Arrow IPC (.arrow, .feather, .ipc) file or a directory of them"
+        )
+
+    return _FORMATS[extension]
+
+
+def _source_key(source: pa_ds.FileSystemDataset) -> Tuple[str, str]:
+    """Identify the source files and the version of their contents"""
+    paths = sorted(os.path.abspath(path) for path in source.files)
+    files_digest = hashlib.blake2b(repr(paths).encode(), digest_size=16)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(_CACHE_VERSION).encode())
+
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(repr((path, stat.st_size, stat.st_mtime_ns)).encode())
+
+    return files_digest.hexdigest(), digest.hexdigest()
+
+
+def _evict_stale_versions(source_dir: str, version: str):
+    """Delete the columns converted from previous versions of the source files"""
+    for name in os.listdir(source_dir):
+        if name != version:
+            logger.debug(f"Deleting stale dataset cache {name} in {source_dir}")
+            # memory-mapped files stay readable until they're closed (on POSIX)
+            shutil.rmtree(os.path.join(source_dir, name), ignore_errors=True)
+
+
+def clear_dataset_cache():
+    """Delete the columns converted from Parquet and Arrow IPC files
+
+    Frees the disk space used by the cache (see `DATASET_CACHE_DIR`). Columns are
+    converted again the next time their files are opened.
+    """
+    shutil.rmtree(DATASET_CACHE_DIR, ignore_errors=True)
+
+
+def _is_numpy_type(type_: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(type_)
+        or pa.types.is_floating(type_)
+        or pa.types.is_boolean(type_)
+        or pa.types.is_timestamp(type_)
+        or pa.types.is_duration(type_)
+    )
+
+
+def _numpy_dtype(type_: pa.DataType) -> np.dtype:
+    if pa.types.is_timestamp(type_):
+        return np.dtype("datetime64[ns]")
+    if pa.types.is_duration(type_):
+        return np.dtype("timedelta64[ns]")
+
+    return np.dtype(type_.to_pandas_dtype())
+
+
+def _temp_path(path: str) -> str:
+    """A path next to `path` that no other process or writer uses"""
+    return f"{path}.{os.getpid()}-{uuid.uuid4().hex}.tmp"
+
+
+class _ColumnWriter:
+    """Writes a column of the source to a memory-mapped `.npy` file"""
+
+    def __init__(self, path: str, field: pa.Field, n_rows: int):
+        self.path = path
+        self.tmp = _temp_path(path)
+        self.field = field
+        self.dtype = _numpy_dtype(field.type)
+
+        self.values = np.lib.format.open_memmap(
+            f"{self.tmp}.npy", mode="w+", dtype=self.dtype, shape=(n_rows,)
+        )
+        self.mask = None
+
+    def write(self, start: int, column: pa.ChunkedArray):
+        type_ = column.type
+        stop = start + len(column)
+
+        if pa.types.is_timestamp(type_) or pa.types.is_duration(type_):
+            # stored as nanoseconds (in UTC) like pandas does, nulls become NaT
+            if pa.types.is_timestamp(type_):
+                column = column.cast(pa.timestamp("ns", tz=type_.tz))
+            else:
+                column = column.cast(pa.duration("ns"))
+
+            values = column.cast(pa.int64()).fill_null(np.iinfo(np.int64).min)
+            self.values[start:stop] = values.to_numpy().view(self.dtype)
+            return
+
+        if column.null_count and not pa.types.is_floating(type_):
+            if self.mask is None:
+                self.mask = np.lib.format.open_memmap(
+                    f"{self.tmp}.mask.npy",
+                    mode="w+",
+                    dtype=bool,
+                    shape=self.values.shape,
+                )
+            self.mask[start:stop] = column.is_null().to_numpy(zero_copy_only=False)
+            column = column.fill_null(False if pa.types.is_boolean(type_) else 0)
+
+        # floats get NaN for nulls
+        self.values[start:stop] = column.to_numpy(zero_copy_only=False)
+
+    def close(self) -> dict:
+        self.values.flush()
+        meta = {"name": self.field.name, "kind": "numpy", "mask": False}
+
+        if pa.types.is_timestamp(self.field.type) and self.field.type.tz:
+            meta["tz"] = self.field.type.tz
+
+        if self.mask is not None and np.issubdtype(self.dtype, np.integer):
+            # integer columns with nulls are converted to floats like pandas does
+            values = np.lib.format.open_memmap(
+                f"{self.tmp}.float.npy",
+                mode="w+",
+                dtype=np.float64,
+                shape=self.values.shape,
+            )
+            for start in range(0, len(values), _BATCH_ROWS):
+                chunk = slice(start, start + _BATCH_ROWS)
+                values[chunk] = self.values[chunk]
+                values[chunk][self.mask[chunk]] = np.nan
+            values.flush()
+
+            del self.values
+            os.replace(f"{self.tmp}.float.npy", f"{self.tmp}.npy")
+        elif self.mask is not None:
+            self.mask.flush()
+            os.replace(f"{self.tmp}.mask.npy", f"{self.path}.mask.npy")
+            meta["mask"] = True
+
+        if self.mask is not None:
+            del self.mask
+            if os.path.exists(f"{self.tmp}.mask.npy"):
+                os.remove(f"{self.tmp}.mask.npy")
+
+        os.replace(f"{self.tmp}.npy", f"{self.path}.npy")
+
+        return meta
+
+
+class _ArrowColumnWriter:
+    """Writes a column of the source to an uncompressed Arrow IPC file"""
+
+    def __init__(self, path: str, field: pa.Field, n_rows: int):
+        self.path = path
+        self.tmp = _temp_path(path)
+        self.field = field
+        self.writer = ipc.new_file(f"{self.tmp}.arrow", pa.schema([field]))
+
+    def write(self, start: int, column: pa.ChunkedArray):
+        self.writer.write_table(pa.table([column], schema=pa.schema([self.field])))
+
+    def close(self) -> dict:
+        self.writer.close()
+        os.replace(f"{self.tmp}.arrow", f"{self.path}.arrow")
+
+        return {"name": self.field.name, "kind": "arrow"}
+
+
+def _convert_columns(
+    source: pa_ds.Dataset, fields: List[pa.Field], cache_dir: str
+) -> Dict[str, dict]:
+    n_rows = source.count_rows()
+    logger.info(f"Converting {len(fields)} columns of {n_rows} rows to {cache_dir}")
+
+    writers = []
+    for field in fields:
+        path = os.path.join(cache_dir, str(source.schema.get_field_index(field.name)))
+        writer_class = (
+            _ColumnWriter if _is_numpy_type(field.type) else _ArrowColumnWriter
+        )
+        writers.append(writer_class(path, field, n_rows))
+
+    start = 0
+    for batch in source.to_batches(
+        columns=[field.name for field in fields], batch_size=_BATCH_ROWS
+    ):
+        for writer, column in zip(writers, batch.columns):
+            writer.write(start, pa.chunked_array([column]))
+        start += batch.num_rows
+
+    return {writer.field.name: writer.close() for writer in writers}
+
+
+def _open_column(cache_dir: str, index: int, meta: dict) -> pd.Series:
+    path = os.path.join(cache_dir, str(index))
+
+    if meta["kind"] == "arrow":
+        with pa.memory_map(f"{path}.arrow") as source:
+            table = ipc.open_file(source).read_all()
+        return table.column(0).to_pandas().rename(meta["name"])
+
+    values = np.load(f"{path}.npy", mmap_mode="r")
+
+    if meta["mask"]:
+        values = pd.arrays.BooleanArray(
+            values, np.load(f"{path}.mask.npy", mmap_mode="r")
+        )
+    elif meta.get("tz"):
+        values = pd.arrays.DatetimeArray(
+            values, dtype=pd.DatetimeTZDtype(tz=meta["tz"])
+        )
+
+    return pd.Series(values, name=meta["name"], copy=False)
+
+
+def _read_meta(meta_path: str) -> dict:
+    if not os.path.exists(meta_path):
+        return {}
+
+    with open(meta_path) as f:
+        return json.load(f)
+
+
+def read_dataset_files(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Open Parquet or Arrow IPC files as a dataframe of memory-mapped columns
+
+    Args:
+        path (str): A Parquet file, an Arrow IPC (Feather v2) file or a directory
+            of them (e.g. a partitioned dataset).
+        columns (List[str], optional): The columns to read. Defaults to all columns.
+
+    Returns:
+        pd.DataFrame: A dataframe whose numeric, boolean and datetime columns are
+            read-only views of memory-mapped files.
+    """
+    path = os.fspath(path)
+    source = pa_ds.dataset(path, format=_file_format(path))
+
+    schema = source.schema
+    columns = schema.names if columns is None else list(columns)
+    missing = [column for column in columns if column not in schema.names]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {path}")
+
+    files_key, version = _source_key(source)
+    source_dir = os.path.join(DATASET_CACHE_DIR, files_key)
+    cache_dir = os.path.join(source_dir, version)
+    os.makedirs(cache_dir, exist_ok=True)
+    _evict_stale_versions(source_dir, version)
+
+    meta_path = os.path.join(cache_dir, "columns.json")
+    meta = _read_meta(meta_path)
+
+    # only the columns that haven't been converted yet are read from the source
+    fields = [schema.field(column) for column in columns if column not in meta]
+    if fields:
+        converted = _convert_columns(source, fields, cache_dir)
+
+        # keep the columns other processes converted in the meantime
+        meta = {**_read_meta(meta_path), **converted}
+        tmp_path = _temp_path(meta_path)
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    return pd.DataFrame(
+        {
+            column: _open_column(
+                cache_dir, schema.get_field_index(column), meta[column]
+            )
+            for column in columns
+        },
+        copy=False,
+    )
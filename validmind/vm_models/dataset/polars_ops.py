@@ -0,0 +1,402 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Dataset statistics computed natively on polars frames
+
+`PolarsDataset` keeps the user's polars DataFrame (or LazyFrame) and the artifacts
+that tests share (see `validmind.tests.artifacts`) are computed here with polars'
+multi-threaded query engine instead of on a pandas copy of the data:
+
+- Profiles get the distinct values of every numeric, boolean and string column
+  and their counts from group-bys that polars runs in parallel. The moments,
+  quantiles and histograms are derived from the (much smaller) distinct values
+  by the same code as for pandas datasets. Other column types are converted to
+  pandas one column at a time.
+- Correlation matrices are computed from float64 blocks of rows taken straight
+  from the polars frame.
+- Value counts and group-by aggregations are single polars queries.
+
+Results match what the pandas implementations return for `dataset.df`, e.g.
+NaNs are missing values and integer columns with nulls are reported as float
+columns, like in the pandas dataframe polars converts to.
+"""
+
+import hashlib
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from validmind.logging import get_logger
+
+from .profile import (
+    DEFAULT_CHUNK_CELLS,
+    ColumnProfile,
+    DatasetProfile,
+    DatasetProfiler,
+    _CorrelationAccumulator,
+    _VectorizedBlock,
+    profile_dataframe,
+)
+from .tensors import TensorArray, TensorDtype
+
+logger = get_logger(__name__)
+
+_COUNT = "__validmind_count__"
+
+
+def _is_vector(pl_dtype: pl.DataType) -> bool:
+    """Whether the column holds fixed-size arrays of numbers or booleans"""
+    return isinstance(pl_dtype, pl.Array) and (
+        pl_dtype.inner.is_numeric() or pl_dtype.inner == pl.Boolean
+    )
+
+
+def to_pandas(frame: Union[pl.DataFrame, pl.LazyFrame]) -> pd.DataFrame:
+    """Convert a polars frame to a pandas dataframe (collecting it if lazy)
+
+    Columns of fixed-size arrays are converted to `TensorArray` columns from their
+    contiguous values instead of to object columns of arrays.
+    """
+    if isinstance(frame, pl.LazyFrame):
+        frame = frame.collect()
+
+    vectors = [column for column, dtype in frame.schema.items() if _is_vector(dtype)]
+    df = frame.drop(vectors).to_pandas()
+
+    for column in vectors:
+        # integer arrays with nulls become float arrays with NaNs and boolean
+        # arrays with nulls stay arrays of objects
+        values = frame[column].to_numpy()
+        df.insert(
+            frame.get_column_index(column),
+            column,
+            (
+                TensorArray(values, mask=frame[column].is_null().to_numpy())
+                if values.dtype != object
+                else frame.select(column).to_pandas()[column]
+            ),
+        )
+
+    return df
+
+
+def pandas_dtypes(frame: pl.LazyFrame) -> Dict[str, object]:
+    """The dtypes the columns of `frame` get when converted to pandas
+
+    Only needs the null counts of integer, boolean and array columns: pandas
+    converts integer columns with nulls to floats and boolean columns with nulls
+    to objects, and the same goes for the elements of arrays (see `to_pandas`).
+    """
+    schema = frame.collect_schema()
+    dtypes = to_pandas(frame.head(0)).dtypes.to_dict()
+
+    nullable = [
+        column
+        for column, dtype in schema.items()
+        if dtype.is_integer() or dtype == pl.Boolean or _is_vector(dtype)
+    ]
+    if nullable:
+        null_counts = (
+            frame.select(
+                # counts the nulls of the elements and of the arrays themselves
+                (pl.col(c).explode() if _is_vector(schema[c]) else pl.col(c))
+                .null_count()
+                .alias(c)
+                for c in nullable
+            )
+            .collect()
+            .row(0)
+        )
+        for column, null_count in zip(nullable, null_counts):
+            dtype = schema[column]
+            if _is_vector(dtype):
+                if null_count and dtype.inner == pl.Boolean:
+                    continue
+                subtype = pl.Series(dtype=dtype.inner).to_numpy().dtype
+                if null_count and dtype.inner.is_integer():
+                    subtype = np.dtype(np.float64)
+                dtypes[column] = TensorDtype(subtype, dtype.shape)
+            elif null_count:
+                dtypes[column] = np.dtype(np.float64 if dtype.is_integer() else object)
+
+    return dtypes
+
+
+def _values(column: str, dtype: pl.DataType) -> pl.Expr:
+    # NaNs are missing values in pandas
+    return pl.col(column).fill_nan(None) if dtype.is_float() else pl.col(column)
+
+
+def _is_numeric(pl_dtype: pl.DataType, dtype) -> bool:
+    """Whether the column is a numpy bool, int or float column in pandas"""
+    return (
+        pl_dtype.is_integer()
+        or pl_dtype.is_float()
+        or (pl_dtype == pl.Boolean and dtype == bool)
+    )
+
+
+def _is_object(pl_dtype: pl.DataType, dtype) -> bool:
+    """Whether the column is an object column of strings or booleans in pandas"""
+    return pl_dtype == pl.String or (pl_dtype == pl.Boolean and dtype == object)
+
+
+def _is_sortable(pl_dtype: pl.DataType) -> bool:
+    """Whether polars sorts the values of the column the same way as pandas"""
+    return (
+        pl_dtype.is_numeric()
+        or pl_dtype.is_temporal()
+        or pl_dtype in (pl.Boolean, pl.String)
+    )
+
+
+def _group_counts(frame: pl.LazyFrame, column: str, dtype: pl.DataType):
+    """Query for the distinct values of a column (including null) and their counts
+    in order of first appearance"""
+    return (
+        frame.select(_values(column, dtype))
+        .group_by(column, maintain_order=True)
+        .agg(pl.len().alias(_COUNT))
+    )
+
+
+def _split_counts(counts: pl.DataFrame, column: str):
+    keys = counts[column]
+    n = counts[_COUNT].to_numpy().astype(np.int64)
+    null = keys.is_null().to_numpy()
+
+    return keys, n, null
+
+
+def _iter_slices(
+    frame: pl.LazyFrame, columns: List[str], chunk_size: int = None
+) -> Iterator[pl.DataFrame]:
+    if chunk_size is None:
+        chunk_size = max(1, DEFAULT_CHUNK_CELLS // max(1, len(columns)))
+
+    # selecting the columns of a DataFrame doesn't copy them and a scan only
+    # reads the selected columns
+    return frame.select(columns).collect().iter_slices(chunk_size)
+
+
+def fingerprint_columns(frame: pl.LazyFrame, columns: List[str]) -> Dict[str, str]:
+    """Compute a fingerprint of each column from polars' hashes of its values
+
+    See `fingerprint_values` for the fingerprints of pandas columns.
+    """
+    schema = frame.collect_schema()
+    hashes = frame.select(pl.col(column).hash(0) for column in columns).collect()
+
+    fingerprints = {}
+    for column in columns:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((column, str(schema[column]), len(hashes))).encode())
+        digest.update(hashes[column].to_numpy().view(np.uint8))
+        fingerprints[column] = digest.hexdigest()
+
+    return fingerprints
+
+
+def value_counts(
+    frame: pl.LazyFrame, column: str, dtype: Optional[object] = None
+) -> pd.Series:
+    """Counts of the unique (non-null) values of a column, most frequent first
+
+    Equivalent to `Series.value_counts` on the column converted to pandas.
+
+    Args:
+        frame (pl.LazyFrame): The polars frame.
+        column (str): The column.
+        dtype (optional): The pandas dtype of the column. Defaults to the dtype
+            from `pandas_dtypes`.
+    """
+    pl_dtype = frame.collect_schema()[column]
+    if dtype is None:
+        dtype = pandas_dtypes(frame.select(column))[column]
+
+    if not (_is_numeric(pl_dtype, dtype) or _is_object(pl_dtype, dtype)):
+        return to_pandas(frame.select(column))[column].value_counts()
+
+    keys, counts, null = _split_counts(
+        _group_counts(frame, column, pl_dtype).collect(), column
+    )
+    index = pd.Index(keys.to_numpy()[~null], name=column).astype(dtype)
+
+    return pd.Series(counts[~null], index=index, name="count").sort_values(
+        ascending=False, kind="stable"
+    )
+
+
+def group_stats(
+    frame: pl.LazyFrame, by: Union[str, List[str]], column: str = None
+) -> pd.DataFrame:
+    """Number of rows (`size`) and mean of `column` (`mean`) of each group
+
+    Equivalent to `df.groupby(by)` on the frame converted to pandas: groups with
+    missing keys are left out and the groups are sorted by their keys. Columns that
+    polars can't sort or average the way pandas does (e.g. object, list or
+    categorical columns) are grouped by pandas instead.
+    """
+    schema = frame.collect_schema()
+    keys = [by] if isinstance(by, str) else list(by)
+
+    if not all(_is_sortable(schema[key]) for key in keys) or (
+        column is not None
+        and not (schema[column].is_numeric() or schema[column] == pl.Boolean)
+    ):
+        columns = [*keys, column] if column is not None else keys
+        grouped = to_pandas(frame.select(list(dict.fromkeys(columns)))).groupby(by)
+
+        stats = grouped.size().to_frame("size")
+        if column is not None:
+            stats["mean"] = grouped[column].mean()
+
+        return stats
+
+    dtypes = pandas_dtypes(frame.select(keys))
+
+    key_values = []
+    for key in keys:
+        values = _values(key, schema[key])
+        if schema[key].is_integer() and dtypes[key] == np.float64:
+            # integer columns with nulls are float columns in pandas
+            values = values.cast(pl.Float64)
+        key_values.append(values)
+
+    aggregations = [pl.len().cast(pl.Int64).alias("size")]
+    if column is not None:
+        aggregations.append(_values(column, schema[column]).mean().alias("mean"))
+
+    stats = (
+        frame.group_by(key_values)
+        .agg(aggregations)
+        .drop_nulls(keys)
+        .sort(keys)
+        .collect()
+    )
+
+    return to_pandas(stats).set_index(by if isinstance(by, str) else keys)
+
+
+def profile_frame(
+    frame: pl.LazyFrame,
+    dtypes: Optional[Dict[str, object]] = None,
+    approximate: bool = None,
+) -> DatasetProfile:
+    """Profile every column of a polars frame
+
+    Equivalent to `profile_dataframe` on the frame converted to pandas. In
+    approximate mode (see `configure_profiling`) the rows are instead streamed
+    through the `DatasetProfiler` in chunks so the memory used stays bounded.
+
+    Args:
+        frame (pl.LazyFrame): The polars frame.
+        dtypes (Dict[str, object], optional): The pandas dtype of each column.
+            Defaults to the dtypes from `pandas_dtypes`.
+        approximate (bool, optional): Whether to profile approximately. Defaults
+            to the setting of `configure_profiling`.
+
+    Returns:
+        DatasetProfile: The profile of the frame.
+    """
+    schema = frame.collect_schema()
+    columns = schema.names()
+    if dtypes is None:
+        dtypes = pandas_dtypes(frame)
+
+    profiler = DatasetProfiler(approximate=approximate)
+    if profiler.max_tracked_values is not None:
+        for chunk in _iter_slices(frame, columns):
+            profiler.update(chunk.to_pandas())
+        return profiler.finalize()
+
+    numeric = [c for c in columns if _is_numeric(schema[c], dtypes[c])]
+    objects = [c for c in columns if _is_object(schema[c], dtypes[c])]
+    others = [c for c in columns if c not in numeric and c not in objects]
+
+    # polars runs the group-bys in parallel
+    n_rows, *results = pl.collect_all(
+        [
+            frame.select(pl.len()),
+            *(_group_counts(frame, c, schema[c]) for c in numeric + objects),
+        ]
+    )
+    n_rows = n_rows.item()
+    results = dict(zip(numeric + objects, results))
+
+    profiles = {}
+
+    blocks = {}
+    for column in numeric:
+        blocks.setdefault(np.dtype(dtypes[column]), []).append(column)
+
+    for dtype, block_columns in blocks.items():
+        values, counts = [], []
+        for column in block_columns:
+            keys, n, null = _split_counts(results[column], column)
+            values.append(keys.to_numpy()[~null])
+            counts.append(n[~null])
+
+        block = _VectorizedBlock(block_columns, dtype)
+        block.update_counts(values, counts)
+        profiles.update(block.finalize(n_rows))
+
+    for column in objects:
+        keys, n, null = _split_counts(results[column], column)
+        unique = np.array(keys.to_list(), dtype=object)
+
+        profiles[column] = ColumnProfile(
+            name=column,
+            dtype=dtypes[column],
+            n_rows=n_rows,
+            count=int(n[~null].sum()),
+            unique=unique,
+            _value_counts=pd.Series(
+                n[~null],
+                index=pd.Index(unique[~null], dtype=object, name=column),
+                name="count",
+            ).sort_values(ascending=False, kind="stable"),
+        )
+
+    if others:
+        logger.debug(f"Profiling columns {others} with pandas")
+        profiles.update(
+            profile_dataframe(
+                to_pandas(frame.select(others)), approximate=False
+            ).columns
+        )
+
+    return DatasetProfile(
+        n_rows=n_rows, columns={column: profiles[column] for column in columns}
+    )
+
+
+def pearson_correlation(
+    frame: pl.LazyFrame,
+    dtypes: Optional[Dict[str, object]] = None,
+    chunk_size: int = None,
+) -> pd.DataFrame:
+    """Pearson correlation matrix of the numeric columns of a polars frame
+
+    Equivalent to `pearson_correlation` on the frame converted to pandas.
+    """
+    if dtypes is None:
+        dtypes = pandas_dtypes(frame)
+
+    columns = [
+        column
+        for column, dtype in dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    ]
+
+    accumulator = _CorrelationAccumulator(columns)
+    for chunk in _iter_slices(frame, columns, chunk_size):
+        # nulls become NaNs
+        accumulator.update_values(chunk.select(pl.all().cast(pl.Float64)).to_numpy())
+
+    return accumulator.finalize()
@@ -0,0 +1,1080 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Single-pass profiling of every column in a dataset
+
+The profiler streams a dataframe through in chunks of rows and updates the
+statistics of all columns from each chunk: counts, missing values, zeros,
+distinct values, moments, quantiles, histograms and top values. Columns with
+numpy bool, int and float dtypes are processed together as 2-D arrays (one per
+dtype) so the work per chunk is a handful of vectorized operations instead of a
+scan per column and statistic. Nullable integer and float columns (`Int64`,
+`Float64`...) are processed as float64 columns with NaN for missing values. Other
+columns (strings, categoricals, dates...)
+fall back to pandas' `value_counts`.
+
+The statistics are exact: distinct values are kept along with their counts so
+memory grows with the number of distinct values rather than with the number of
+rows. Moments are merged across chunks with the pairwise update formulas, so
+results match pandas up to floating point rounding (exactly for float64 data that
+fits in a single chunk).
+
+For datasets with very many distinct values the profiler can instead run in an
+approximate mode (see `configure_profiling`) that bounds the memory used per
+column: only the most frequent values are tracked (a Misra-Gries summary) and
+columns with more distinct values than that get their distinct count from a
+HyperLogLog sketch and their quantiles and histograms from a KLL sketch. Counts,
+missing values, zeros, moments and min/max stay exact, and so does everything else
+for columns that never exceed the tracked values. The error bounds of the
+estimates are available on the `ColumnProfile`.
+"""
+
+import copy
+import os
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from validmind.logging import get_logger
+
+from .sketches import (
+    DEFAULT_HLL_PRECISION,
+    DEFAULT_KLL_K,
+    HyperLogLog,
+    KLLSketch,
+    hash_values,
+)
+
+logger = get_logger(__name__)
+
+# number of values (rows x columns) processed at once by default
+DEFAULT_CHUNK_CELLS = int(os.getenv("VALIDMIND_PROFILE_CHUNK_CELLS", 5_000_000))
+
+# number of most frequent values tracked per column in approximate mode
+DEFAULT_MAX_TRACKED_VALUES = 10_000
+
+_approximate = os.getenv("VALIDMIND_PROFILE_APPROXIMATE", "0") not in ["0", "false"]
+_max_tracked_values = DEFAULT_MAX_TRACKED_VALUES
+
+# distinct values of each chunk are merged once this many chunks have been seen
+_MAX_PENDING_CHUNKS = 32
+
+_VECTORIZED_KINDS = "biuf"
+
+
+def configure_profiling(
+    approximate: bool = False, max_tracked_values: int = DEFAULT_MAX_TRACKED_VALUES
+):
+    """Choose between exact and approximate dataset profiling
+
+    Exact profiling keeps every distinct value of every column along with its count
+    so memory grows with the number of distinct values. Approximate profiling only
+    tracks the `max_tracked_values` most frequent values of each column: columns
+    with more distinct values than that report an estimated number of distinct
+    values (HyperLogLog), estimated quantiles and histograms (KLL sketch) and
+    value counts that may be undercounted, with error bounds shown in the results
+    of the tests that use them. Approximate profiling can also be enabled with the
+    `VALIDMIND_PROFILE_APPROXIMATE` environment variable.
+
+    Args:
+        approximate (bool, optional): Whether to profile datasets approximately.
+            Defaults to False.
+        max_tracked_values (int, optional): The number of most frequent values
+            tracked per column in approximate mode. Defaults to 10,000.
+    """
+    global _approximate, _max_tracked_values
+
+    if max_tracked_values < 2:
+        raise ValueError("max_tracked_values must be at least 2")
+
+    _approximate = approximate
+    _max_tracked_values = max_tracked_values
+
+
+def _is_masked_numeric(dtype) -> bool:
+    """Whether the dtype is one of pandas' nullable integer or float dtypes"""
+    numpy_dtype = getattr(dtype, "numpy_dtype", None)
+
+    return (
+        isinstance(dtype, pd.api.extensions.ExtensionDtype)
+        and isinstance(numpy_dtype, np.dtype)
+        and numpy_dtype.kind in "iuf"
+    )
+
+
+def _vectorized_dtype(dtype) -> Optional[np.dtype]:
+    """The numpy dtype a column is processed as, None if it isn't vectorized
+
+    Nullable integer and float columns (`Int64`, `Float64`...) are processed as
+    float64 columns with NaN for missing values.
+    """
+    if isinstance(dtype, np.dtype) and dtype.kind in _VECTORIZED_KINDS:
+        return dtype
+
+    if _is_masked_numeric(dtype):
+        return np.dtype(np.float64)
+
+    return None
+
+
+def _zero_out_fperr(values: np.ndarray) -> np.ndarray:
+    # same as pandas: treat floating point error in the central moments as zero
+    return np.where(np.abs(values) < 1e-14, 0, values)
+
+
+def _merge_distinct(
+    values: List[np.ndarray], counts: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge sorted distinct values and their counts from several chunks"""
+    if len(values) == 1:
+        return values[0], counts[0]
+
+    values = np.concatenate(values)
+    if not len(values):
+        return values, np.concatenate(counts)
+
+    counts = np.concatenate(counts)
+
+    order = np.argsort(values, kind="stable")
+    values = values[order]
+    counts = counts[order]
+
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+
+    return values[starts], np.add.reduceat(counts, starts)
+
+
+def _merge_value_counts(value_counts: List[pd.Series]) -> pd.Series:
+    if len(value_counts) == 1:
+        return value_counts[0]
+
+    merged = pd.concat(value_counts).groupby(level=0, sort=False, observed=False).sum()
+
+    return merged.sort_values(ascending=False, kind="stable")
+
+
+def _truncate_counts(
+    values: np.ndarray, counts: np.ndarray, capacity: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Keep at most `capacity` values by subtracting the (capacity + 1)-th largest
+    count from every count (Misra-Gries), returning the amount subtracted"""
+    if len(counts) <= capacity:
+        return values, counts, 0
+
+    decrement = np.partition(counts, len(counts) - capacity - 1)[
+        len(counts) - capacity - 1
+    ]
+    counts = counts - decrement
+    keep = counts > 0
+
+    return values[keep], counts[keep], int(decrement)
+
+
+def _quantiles(values: np.ndarray, counts: np.ndarray, q: Sequence[float]):
+    """Linear interpolation quantiles (numpy's default method) of a sorted sample
+    given as its distinct values and their counts"""
+    n = counts.sum()
+    cumulative = np.cumsum(counts)
+
+    # same arithmetic as `Series.quantile` so the results are identical
+    q = np.true_divide(np.asarray(q, dtype=np.float64) * 100.0, 100)
+    virtual = (n - 1) * q
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+
+    previous = np.clip(previous.astype(np.int64), 0, n - 1)
+    next_ = np.clip(previous + 1, 0, n - 1)
+
+    a = values[np.searchsorted(cumulative, previous, side="right")]
+    b = values[np.searchsorted(cumulative, next_, side="right")]
+
+    diff_b_a = np.subtract(b, a)
+    result = np.add(a, diff_b_a * gamma)
+
+    return np.where(gamma >= 0.5, np.subtract(b, diff_b_a * (1 - gamma)), result)
+
+
+@dataclass
+class ColumnProfile:
+    """Statistics of a single column computed by the `DatasetProfiler`
+
+    Attributes:
+        name (str): The column name.
+        dtype: The column dtype.
+        n_rows (int): The number of rows in the dataset.
+        count (int): The number of non-null values.
+        n_zeros (int): The number of values equal to zero (numeric columns only).
+        mean (float): The mean of the values (numeric columns only).
+        std (float): The sample standard deviation (numeric columns only).
+        skewness (float): The sample skewness (numeric columns only).
+        unique (np.ndarray): The unique values (including nulls) in order of first
+            appearance. Only kept for columns that aren't numeric (and only the
+            first ones in approximate mode).
+    """
+
+    name: str
+    dtype: Union[np.dtype, pd.api.extensions.ExtensionDtype]
+    n_rows: int
+    count: int
+    n_zeros: int = 0
+    mean: float = np.nan
+    std: float = np.nan
+    skewness: float = np.nan
+    unique: Optional[np.ndarray] = None
+
+    # sorted distinct values and their counts (numeric columns)
+    _values: Optional[np.ndarray] = field(default=None, repr=False)
+    _counts: Optional[np.ndarray] = field(default=None, repr=False)
+    # value counts, most frequent first (other columns)
+    _value_counts: Optional[pd.Series] = field(default=None, repr=False)
+
+    # exact min and max when not all values are kept (approximate mode)
+    _min: object = field(default=None, repr=False)
+    _max: object = field(default=None, repr=False)
+    # sketches of columns with more distinct values than are tracked, whose value
+    # counts are undercounted by at most `_count_error` (approximate mode)
+    _distinct_sketch: Optional[HyperLogLog] = field(default=None, repr=False)
+    _quantile_sketch: Optional[KLLSketch] = field(default=None, repr=False)
+    _count_error: int = field(default=0, repr=False)
+
+    @property
+    def is_numeric(self) -> bool:
+        return self._values is not None
+
+    @property
+    def approximate(self) -> bool:
+        """Whether the distinct count, value counts, quantiles and histogram are
+        estimates (other statistics are always exact)"""
+        return self._distinct_sketch is not None
+
+    @property
+    def distinct_error(self) -> float:
+        """Relative error of `n_distinct` at 99% confidence (0 when exact)"""
+        return self._distinct_sketch.error_bound if self.approximate else 0.0
+
+    @property
+    def rank_error(self) -> float:
+        """Error of the rank of the quantiles as a fraction of `count` at 99%
+        confidence (0 when exact)"""
+        if not self.approximate or self._quantile_sketch is None:
+            return 0.0
+
+        return self._quantile_sketch.normalized_rank_error
+
+    @property
+    def count_error(self) -> int:
+        """Maximum undercount of each value in `value_counts` (0 when exact)"""
+        return self._count_error
+
+    @property
+    def n_missing(self) -> int:
+        return self.n_rows - self.count
+
+    @property
+    def p_missing(self) -> float:
+        return self.n_missing / self.n_rows if self.n_rows else np.nan
+
+    @property
+    def n_distinct(self) -> int:
+        if self.approximate:
+            tracked = len(self._values if self.is_numeric else self._value_counts)
+            return max(tracked, int(round(self._distinct_sketch.count())))
+
+        if self.is_numeric:
+            return len(self._values)
+
+        # categoricals also count the categories that don't appear in the data
+        return int((self._value_counts > 0).sum())
+
+    @property
+    def p_distinct(self) -> float:
+        return self.n_distinct / self.n_rows if self.n_rows else np.nan
+
+    @cached_property
+    def value_counts(self) -> pd.Series:
+        """Counts of the unique (non-null) values, most frequent first
+
+        Equivalent to `df[column].value_counts()`. In approximate mode only the
+        tracked values are included and they may be undercounted by up to
+        `count_error`.
+        """
+        if not self.is_numeric:
+            return self._value_counts
+
+        index = pd.Index(self._values, name=self.name)
+        if _is_masked_numeric(self.dtype):
+            index = index.astype(self.dtype)
+
+        value_counts = pd.Series(self._counts, index=index, name="count")
+
+        return value_counts.sort_values(ascending=False, kind="stable")
+
+    @property
+    def top(self) -> Tuple[object, int]:
+        """The most frequent value and its count
+
+        In approximate mode no value is tracked when none is frequent enough to
+        stand out from the error of the counts, in which case `(None, 0)` is
+        returned.
+        """
+        if not len(self.value_counts):
+            return None, 0
+
+        return self.value_counts.index[0], self.value_counts.iloc[0]
+
+    @property
+    def min(self):
+        if self._min is not None:
+            return self._min
+
+        if self.is_numeric:
+            return self._values[0] if len(self._values) else np.nan
+
+        return self._value_counts.index[self._value_counts > 0].min()
+
+    @property
+    def max(self):
+        if self._max is not None:
+            return self._max
+
+        if self.is_numeric:
+            return self._values[-1] if len(self._values) else np.nan
+
+        return self._value_counts.index[self._value_counts > 0].max()
+
+    def _check_numeric(self):
+        if not self.is_numeric:
+            raise TypeError(
+                f"Column {self.name} of dtype {self.dtype} isn't numeric: quantiles, "
+                "summary statistics and histograms are only computed for numeric columns"
+            )
+
+    def quantile(self, q: Union[float, Sequence[float]]):
+        """Quantiles of a numeric column, equivalent to `df[column].quantile(q)`"""
+        self._check_numeric()
+
+        if np.isscalar(q):
+            return self.quantile([q])[0]
+
+        if not self.count:
+            return np.full(len(q), np.nan)
+
+        if self.approximate:
+            return self._quantile_sketch.quantile(q)
+
+        return _quantiles(self._values, self._counts, q)
+
+    def describe(self, percentiles: Sequence[float] = (0.25, 0.5, 0.75)) -> pd.Series:
+        """Summary statistics of a numeric column
+
+        Equivalent to `df[column].describe(percentiles=percentiles)`.
+        """
+        self._check_numeric()
+        percentiles = sorted(set(percentiles) | {0.5})
+
+        return pd.Series(
+            [
+                self.count,
+                self.mean,
+                self.std,
+                self.min,
+                *self.quantile(percentiles),
+                self.max,
+            ],
+            index=[
+                "count",
+                "mean",
+                "std",
+                "min",
+                *(f"{p * 100:g}%" for p in percentiles),
+                "max",
+            ],
+            name=self.name,
+            dtype=np.float64,
+        )
+
+    def histogram(self, bins: Union[int, str] = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of a numeric column
+
+        Equivalent to `np.histogram` of the non-null values with an integer number
+        of equal width `bins` or `bins="sturges"`. In approximate mode the counts
+        are estimated from the quantile sketch (the bin edges are exact).
+
+        Returns:
+            tuple: The counts and the bin edges.
+        """
+        self._check_numeric()
+        values, counts = self._values, self._counts
+        value_range = (self.min, self.max) if self.count else None
+
+        if bins == "sturges":
+            # same as numpy's estimator which only depends on the size and range
+            ptp = np.subtract(value_range[1], value_range[0]) if self.count else 0
+            width = ptp / (np.log2(self.count) + 1.0) if self.count else 0
+            bins = int(np.ceil(ptp / width)) if width else 1
+
+        if self.approximate:
+            return self._quantile_sketch.histogram(bins, value_range)
+
+        hist, edges = np.histogram(values, bins=bins, range=value_range, weights=counts)
+
+        return hist.astype(np.int64), edges
+
+
+@dataclass
+class DatasetProfile:
+    """Statistics of every column in a dataset computed by the `DatasetProfiler`
+
+    Attributes:
+        n_rows (int): The number of rows in the dataset.
+        columns (Dict[str, ColumnProfile]): The profile of each column.
+    """
+
+    n_rows: int
+    columns: Dict[str, ColumnProfile]
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+
+class _VectorizedBlock:
+    """Accumulates the statistics of columns that share a numpy dtype
+
+    When `max_tracked_values` is set (approximate mode) only that many distinct
+    values are kept per column and sketches are updated alongside.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        dtype: np.dtype,
+        max_tracked_values: int = None,
+        column_dtypes: List[object] = None,
+    ):
+        self.columns = columns
+        self.dtype = dtype
+        self.max_tracked_values = max_tracked_values
+        # the dtypes reported in the profiles (e.g. `Int64` for a float64 block)
+        self.column_dtypes = column_dtypes or [dtype] * len(columns)
+
+        k = len(columns)
+        self.count = np.zeros(k, dtype=np.int64)
+        self.n_zeros = np.zeros(k, dtype=np.int64)
+        self.mean = np.full(k, np.nan)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+
+        self.values = [[] for _ in columns]
+        self.counts = [[] for _ in columns]
+
+        if max_tracked_values is not None:
+            self.count_error = np.zeros(k, dtype=np.int64)
+            self.min = None
+            self.max = None
+            self.registers = np.zeros((k, 1 << DEFAULT_HLL_PRECISION), dtype=np.uint8)
+            self.quantile_sketches = [KLLSketch(DEFAULT_KLL_K) for _ in columns]
+
+    def update(self, chunk: pd.DataFrame):
+        # one row per column so that reductions along each row use numpy's
+        # pairwise summation like pandas does on a single column
+        if self.dtype.kind == "f":
+            # missing values of nullable columns become NaN
+            values = chunk[self.columns].to_numpy(dtype=self.dtype, na_value=np.nan)
+        else:
+            values = chunk[self.columns].to_numpy(dtype=self.dtype)
+        values = np.ascontiguousarray(values.T)
+        n_rows = values.shape[1]
+
+        if self.dtype.kind == "f":
+            mask = np.isnan(values)
+            count = n_rows - mask.sum(axis=1)
+        else:
+            mask = None
+            count = np.full(len(self.columns), n_rows, dtype=np.int64)
+
+        if self.dtype.kind in "iuf":
+            self.n_zeros += (values == 0).sum(axis=1)
+
+        self._update_moments(values, mask, count)
+        self._update_distinct(values, count)
+
+        self.count += count
+
+    def update_counts(self, values: List[np.ndarray], counts: List[np.ndarray]):
+        """Update the statistics from the distinct (non-null) values of each column
+        and their counts, e.g. computed by a group-by in another dataframe library
+        (exact mode only)"""
+        k = len(self.columns)
+        count = np.array([c.sum() for c in counts], dtype=np.int64)
+        mean = np.full(k, np.nan)
+        m2, m3 = np.zeros(k), np.zeros(k)
+
+        for i in range(k):
+            order = np.argsort(values[i], kind="stable")
+            column_values = values[i][order].astype(self.dtype, copy=False)
+            column_counts = counts[i][order].astype(np.int64, copy=False)
+
+            if self.dtype.kind in "iuf":
+                self.n_zeros[i] += column_counts[column_values == 0].sum()
+
+            if count[i]:
+                weighted = column_values.astype(np.float64)
+                mean[i] = np.dot(weighted, column_counts) / count[i]
+                adjusted = weighted - mean[i]
+                m2[i] = np.dot(adjusted**2, column_counts)
+                m3[i] = np.dot(adjusted**3, column_counts)
+
+            self.values[i].append(column_values)
+            self.counts[i].append(column_counts)
+
+        self._merge_moments(count, mean, m2, m3)
+        self.count += count
+
+    def _update_moments(self, values, mask, count):
+        values = values.astype(np.float64)
+        if mask is not None:
+            np.putmask(values, mask, 0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = values.sum(axis=1, dtype=np.float64) / count
+            adjusted = values - mean[:, None]
+            if mask is not None:
+                np.putmask(adjusted, mask, 0)
+            adjusted2 = adjusted**2
+            m2 = adjusted2.sum(axis=1, dtype=np.float64)
+            m3 = (adjusted2 * adjusted).sum(axis=1, dtype=np.float64)
+
+        self._merge_moments(count, mean, m2, m3)
+
+    def _merge_moments(self, count, mean, m2, m3):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # combine with the previous chunks (Chan et al. / Pébay)
+            n_a, n_b = self.count.astype(np.float64), count.astype(np.float64)
+            n = n_a + n_b
+            delta = mean - self.mean
+            merged_mean = self.mean + delta * n_b / n
+            merged_m2 = self.m2 + m2 + delta**2 * n_a * n_b / n
+            merged_m3 = (
+                self.m3
+                + m3
+                + delta**3 * n_a * n_b * (n_a - n_b) / n**2
+                + 3 * delta * (n_a * m2 - n_b * self.m2) / n
+            )
+
+        first = self.count == 0
+        self.mean = np.where(first, mean, np.where(count == 0, self.mean, merged_mean))
+        self.m2 = np.where(first, m2, np.where(count == 0, self.m2, merged_m2))
+        self.m3 = np.where(first, m3, np.where(count == 0, self.m3, merged_m3))
+
+    def _update_distinct(self, values, count):
+        # sort each column then find the runs of equal values (nulls sort last)
+        values = np.sort(values, axis=1)
+        k, n_rows = values.shape
+
+        if self.max_tracked_values is not None:
+            self._update_sketches(values, count)
+
+        starts = np.empty(values.shape, dtype=bool)
+        starts[:, :1] = True
+        np.not_equal(values[:, 1:], values[:, :-1], out=starts[:, 1:])
+        starts &= np.arange(n_rows) < count[:, None]
+
+        flat_starts = np.flatnonzero(starts)
+        column = flat_starts // n_rows if n_rows else flat_starts
+        ends = np.minimum(
+            np.append(flat_starts[1:], values.size), column * n_rows + count[column]
+        )
+
+        distinct = values.ravel()[flat_starts]
+        counts = ends - flat_starts
+        bounds = np.searchsorted(column, np.arange(k + 1))
+
+        if self.max_tracked_values is not None:
+            # the sketch of distinct values only needs each value once per chunk
+            index, rank = HyperLogLog.register_updates(
+                hash_values(distinct), DEFAULT_HLL_PRECISION
+            )
+            np.maximum.at(self.registers, (column, index), rank)
+
+        for i in range(k):
+            self.values[i].append(distinct[bounds[i] : bounds[i + 1]])
+            self.counts[i].append(counts[bounds[i] : bounds[i + 1]])
+
+            if self.max_tracked_values is not None:
+                self._merge_tracked(i)
+            elif len(self.values[i]) > _MAX_PENDING_CHUNKS:
+                merged = _merge_distinct(self.values[i], self.counts[i])
+                self.values[i], self.counts[i] = [merged[0]], [merged[1]]
+
+    def _update_sketches(self, values, count):
+        # values are sorted with nulls last
+        first = values[:, 0]
+        last = values[np.arange(len(count)), np.maximum(count - 1, 0)]
+        if self.min is None:
+            self.min, self.max = first, last
+        else:
+            self.min = np.fmin(self.min, first)
+            self.max = np.fmax(self.max, last)
+
+        for i, sketch in enumerate(self.quantile_sketches):
+            sketch.update(values[i, : count[i]])
+
+    def _merge_tracked(self, i):
+        values, counts = _merge_distinct(self.values[i], self.counts[i])
+        values, counts, decrement = _truncate_counts(
+            values, counts, self.max_tracked_values
+        )
+
+        self.values[i], self.counts[i] = [values], [counts]
+        self.count_error[i] += decrement
+
+    def merge(self, other: "_VectorizedBlock"):
+        self._merge_moments(other.count, other.mean, other.m2, other.m3)
+        self.count += other.count
+        self.n_zeros += other.n_zeros
+
+        for i in range(len(self.columns)):
+            self.values[i].extend(other.values[i])
+            self.counts[i].extend(other.counts[i])
+
+            if self.max_tracked_values is not None:
+                self.count_error[i] += other.count_error[i]
+                self.quantile_sketches[i].merge(other.quantile_sketches[i])
+                self._merge_tracked(i)
+            elif len(self.values[i]) > _MAX_PENDING_CHUNKS:
+                merged = _merge_distinct(self.values[i], self.counts[i])
+                self.values[i], self.counts[i] = [merged[0]], [merged[1]]
+
+        if self.max_tracked_values is not None:
+            np.maximum(self.registers, other.registers, out=self.registers)
+            if self.min is None:
+                self.min, self.max = other.min, other.max
+            elif other.min is not None:
+                self.min = np.fmin(self.min, other.min)
+                self.max = np.fmax(self.max, other.max)
+
+    def finalize(self, n_rows: int) -> Dict[str, ColumnProfile]:
+        count = self.count.astype(np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(np.where(count > 1, self.m2 / (count - 1), np.nan))
+
+            m2 = _zero_out_fperr(self.m2)
+            m3 = _zero_out_fperr(self.m3)
+            skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5)
+            skewness = np.where(m2 == 0, 0, skewness)
+            skewness[count < 3] = np.nan
+
+        profiles = {}
+        for i, column in enumerate(self.columns):
+            if self.values[i]:
+                values, counts = _merge_distinct(self.values[i], self.counts[i])
+            else:
+                values = np.array([], dtype=self.dtype)
+                counts = np.array([], dtype=np.int64)
+
+            profiles[column] = ColumnProfile(
+                name=column,
+                dtype=self.column_dtypes[i],
+                n_rows=n_rows,
+                count=int(self.count[i]),
+                n_zeros=int(self.n_zeros[i]),
+                mean=self.mean[i],
+                std=std[i],
+                skewness=skewness[i],
+                _values=values,
+                _counts=counts,
+            )
+
+            if self.max_tracked_values is not None and self.count_error[i]:
+                self._add_sketches(profiles[column], i)
+
+        return profiles
+
+    def _add_sketches(self, profile: ColumnProfile, i: int):
+        profile._min = self.min[i]
+        profile._max = self.max[i]
+        profile._count_error = int(self.count_error[i])
+        profile._distinct_sketch = HyperLogLog(
+            DEFAULT_HLL_PRECISION, registers=self.registers[i]
+        )
+        profile._quantile_sketch = self.quantile_sketches[i]
+
+
+class _ColumnAccumulator:
+    """Accumulates the statistics of a column that isn't numeric"""
+
+    def __init__(self, column: str, dtype, max_tracked_values: int = None):
+        self.column = column
+        self.dtype = dtype
+        self.max_tracked_values = max_tracked_values
+
+        self.count = 0
+        self.value_counts = []
+        self.unique = []
+
+        if max_tracked_values is not None:
+            self.count_error = 0
+            self.distinct_sketch = HyperLogLog(DEFAULT_HLL_PRECISION)
+            # only dates have a min and max that is reported
+            self.track_range = pd.api.types.is_datetime64_any_dtype(dtype)
+            self.min = self.max = None
+
+    def update(self, chunk: pd.DataFrame):
+        series = chunk[self.column]
+        value_counts = series.value_counts()
+
+        self.count += int(series.count())
+        self.value_counts.append(value_counts)
+        self.unique.append(series.unique())
+
+        if self.max_tracked_values is not None:
+            self.distinct_sketch.update(pd.Series(value_counts.index[value_counts > 0]))
+            if self.track_range and len(value_counts):
+                self._update_range(series.min(), series.max())
+
+            self._merge_tracked()
+        elif len(self.value_counts) > _MAX_PENDING_CHUNKS:
+            self.value_counts = [_merge_value_counts(self.value_counts)]
+            self.unique = [self._merge_unique()]
+
+    def _update_range(self, min_, max_):
+        if self.min is None:
+            self.min, self.max = min_, max_
+        elif min_ is not None:
+            self.min, self.max = min(self.min, min_), max(self.max, max_)
+
+    def _merge_tracked(self):
+        value_counts = _merge_value_counts(self.value_counts)
+        index, counts, decrement = _truncate_counts(
+            value_counts.index, value_counts.to_numpy(), self.max_tracked_values
+        )
+
+        if decrement:
+            value_counts = pd.Series(counts, index=index, name=value_counts.name)
+
+        self.value_counts = [value_counts]
+        self.unique = [self._merge_unique()[: self.max_tracked_values]]
+        self.count_error += decrement
+
+    def _merge_unique(self):
+        if len(self.unique) == 1:
+            return self.unique[0]
+
+        return pd.concat([pd.Series(unique) for unique in self.unique]).unique()
+
+    def merge(self, other: "_ColumnAccumulator"):
+        self.count += other.count
+        self.value_counts.extend(other.value_counts)
+        self.unique.extend(other.unique)
+
+        if self.max_tracked_values is not None:
+            self.count_error += other.count_error
+            self.distinct_sketch.merge(other.distinct_sketch)
+            if other.min is not None:
+                self._update_range(other.min, other.max)
+
+            self._merge_tracked()
+
+    def finalize(self, n_rows: int) -> ColumnProfile:
+        profile = ColumnProfile(
+            name=self.column,
+            dtype=self.dtype,
+            n_rows=n_rows,
+            count=self.count,
+            unique=self._merge_unique(),
+            _value_counts=_merge_value_counts(self.value_counts),
+        )
+
+        if self.max_tracked_values is not None and self.count_error:
+            profile._min = self.min
+            profile._max = self.max
+            profile._count_error = self.count_error
+            profile._distinct_sketch = self.distinct_sketch
+
+        return profile
+
+
+class DatasetProfiler:
+    """Computes a `DatasetProfile` from chunks of rows of a dataframe
+
+    Profilers that have seen different rows of the same dataset (e.g. in separate
+    workers) can be combined with `merge`.
+
+    Args:
+        approximate (bool, optional): Whether to use sketches to bound the memory
+            used per column. Defaults to the setting of `configure_profiling`.
+        max_tracked_values (int, optional): The number of most frequent values
+            tracked per column in approximate mode. Defaults to the setting of
+            `configure_profiling`.
+
+    Example:
+        ```python
+        profiler = DatasetProfiler()
+        for chunk in chunks:
+            profiler.update(chunk)
+        profile = profiler.finalize()
+        ```
+    """
+
+    def __init__(self, approximate: bool = None, max_tracked_values: int = None):
+        self.n_rows = 0
+        self.columns = None
+
+        if approximate is None:
+            approximate = _approximate
+
+        self.max_tracked_values = None
+        if approximate:
+            self.max_tracked_values = max_tracked_values or _max_tracked_values
+
+        self._blocks = []
+        self._accumulators = []
+
+    def _setup(self, chunk: pd.DataFrame):
+        self.columns = chunk.columns.tolist()
+
+        blocks = {}
+        for column, dtype in chunk.dtypes.items():
+            block_dtype = _vectorized_dtype(dtype)
+            if block_dtype is not None:
+                blocks.setdefault(block_dtype, []).append((column, dtype))
+            else:
+                self._accumulators.append(
+                    _ColumnAccumulator(column, dtype, self.max_tracked_values)
+                )
+
+        self._blocks = [
+            _VectorizedBlock(
+                [column for column, _ in columns],
+                block_dtype,
+                self.max_tracked_values,
+                column_dtypes=[dtype for _, dtype in columns],
+            )
+            for block_dtype, columns in blocks.items()
+        ]
+
+    def update(self, chunk: pd.DataFrame):
+        """Update the statistics of every column with a chunk of rows"""
+        if self.columns is None:
+            self._setup(chunk)
+        elif chunk.columns.tolist() != self.columns:
+            raise ValueError("All chunks must have the same columns")
+
+        for block in self._blocks:
+            block.update(chunk)
+
+        for accumulator in self._accumulators:
+            accumulator.update(chunk)
+
+        self.n_rows += len(chunk)
+
+    def merge(self, other: "DatasetProfiler"):
+        """Merge the statistics of another profiler that has seen other rows of
+        the same dataset (with the same columns and dtypes)"""
+        if other.columns is None:
+            return
+
+        if self.columns is None:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            return
+
+        if (
+            other.max_tracked_values != self.max_tracked_values
+            or [(b.columns, b.column_dtypes) for b in other._blocks]
+            != [(b.columns, b.column_dtypes) for b in self._blocks]
+            or [(a.column, a.dtype) for a in other._accumulators]
+            != [(a.column, a.dtype) for a in self._accumulators]
+        ):
+            raise ValueError(
+                "Can only merge profilers with the same columns, dtypes and settings"
+            )
+
+        for block, other_block in zip(self._blocks, other._blocks):
+            block.merge(other_block)
+
+        for accumulator, other_accumulator in zip(
+            self._accumulators, other._accumulators
+        ):
+            accumulator.merge(other_accumulator)
+
+        self.n_rows += other.n_rows
+
+    def finalize(self) -> DatasetProfile:
+        """Build the profile of the dataset from all the chunks seen so far"""
+        profiles = {}
+        for block in self._blocks:
+            profiles.update(block.finalize(self.n_rows))
+        for accumulator in self._accumulators:
+            profiles[accumulator.column] = accumulator.finalize(self.n_rows)
+
+        return DatasetProfile(
+            n_rows=self.n_rows,
+            columns={column: profiles[column] for column in self.columns or []},
+        )
+
+
+def profile_chunks(
+    chunks: Iterable[pd.DataFrame], approximate: bool = None
+) -> DatasetProfile:
+    """Profile a dataset that is read in chunks of rows (e.g. from disk)
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Dataframes with the same columns.
+        approximate (bool, optional): Whether to profile approximately. Defaults
+            to the setting of `configure_profiling`.
+
+    Returns:
+        DatasetProfile: The profile of the rows of all the chunks.
+    """
+    profiler = DatasetProfiler(approximate=approximate)
+    for chunk in chunks:
+        profiler.update(chunk)
+
+    return profiler.finalize()
+
+
+def _iter_chunks(df: pd.DataFrame, chunk_size: int = None) -> Iterable[pd.DataFrame]:
+    if chunk_size is None:
+        chunk_size = max(1, DEFAULT_CHUNK_CELLS // max(1, len(df.columns)))
+
+    if len(df) <= chunk_size:
+        return [df]
+
+    logger.debug(f"Processing {len(df)} rows in chunks of {chunk_size}")
+
+    return (
+        df.iloc[start : start + chunk_size] for start in range(0, len(df), chunk_size)
+    )
+
+
+def profile_dataframe(
+    df: pd.DataFrame, chunk_size: int = None, approximate: bool = None
+) -> DatasetProfile:
+    """Profile every column of a dataframe in a single pass
+
+    Args:
+        df (pd.DataFrame): The dataframe to profile.
+        chunk_size (int, optional): The number of rows processed at once. Defaults
+            to as many rows as fit in `VALIDMIND_PROFILE_CHUNK_CELLS` values
+            (5 million by default).
+        approximate (bool, optional): Whether to profile approximately. Defaults
+            to the setting of `configure_profiling`.
+
+    Returns:
+        DatasetProfile: The profile of the dataframe.
+    """
+    return profile_chunks(_iter_chunks(df, chunk_size), approximate=approximate)
+
+
+class _CorrelationAccumulator:
+    """Accumulates the sums needed for pairwise-complete Pearson correlations
+
+    For every pair of columns the sums only include the rows where both values are
+    present, like `DataFrame.corr`. Values are shifted by the first value of their
+    column before summing to avoid catastrophic cancellation.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+
+        k = len(columns)
+        self.shift = np.zeros(k)
+        self.n = np.zeros((k, k))
+        self.sum_x = np.zeros((k, k))
+        self.sum_xx = np.zeros((k, k))
+        self.sum_xy = np.zeros((k, k))
+
+    def update(self, chunk: pd.DataFrame):
+        self.update_values(
+            chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+
+    def update_values(self, values: np.ndarray):
+        """Update the sums with a chunk of rows as a 2-D float array (NaN for
+        missing values) with one column per column of the accumulator"""
+        present = ~np.isnan(values)
+        k = len(self.columns)
+
+        # shift by the first value seen in each column
+        unset = (self.n.diagonal() == 0) & present.any(axis=0)
+        first = np.argmax(present[:, unset], axis=0)
+        self.shift[unset] = values[first, np.flatnonzero(unset)]
+
+        shifted = np.where(present, values - self.shift, 0)
+
+        # each statistic is a single matrix product for all pairs of columns
+        self.sum_xy += shifted.T @ shifted
+
+        # pairs with a column that has no missing values in this chunk include all
+        # the rows of the other column so only the rest need a matrix product
+        n = np.repeat(present.sum(axis=0)[:, None], k, axis=1).astype(np.float64)
+        sum_x = np.repeat(shifted.sum(axis=0)[:, None], k, axis=1)
+        sum_xx = np.repeat((shifted**2).sum(axis=0)[:, None], k, axis=1)
+
+        missing = ~present.all(axis=0)
+        if missing.any():
+            present = present.astype(np.float64)
+            n[:, missing] = present.T @ present[:, missing]
+            sum_x[:, missing] = shifted.T @ present[:, missing]
+            sum_xx[:, missing] = (shifted**2).T @ present[:, missing]
+
+        self.n += n
+        self.sum_x += sum_x
+        self.sum_xx += sum_xx
+
+    def finalize(self) -> pd.DataFrame:
+        # sum_x[i, j] sums column i over the rows where column j is also present
+        sum_y, sum_yy = self.sum_x.T, self.sum_xx.T
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self.sum_xy - self.sum_x * sum_y / self.n
+            var_x = self.sum_xx - self.sum_x**2 / self.n
+            var_y = sum_yy - sum_y**2 / self.n
+
+            # a column that is constant over the rows of a pair has no variance
+            var_x = np.where(var_x <= 1e-12 * self.sum_xx, 0, var_x)
+            var_y = np.where(var_y <= 1e-12 * sum_yy, 0, var_y)
+
+            corr = np.clip(cov / np.sqrt(var_x * var_y), -1, 1)
+
+        corr[(self.n == 0) | (var_x == 0) | (var_y == 0)] = np.nan
+
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def pearson_correlation(df: pd.DataFrame, chunk_size: int = None) -> pd.DataFrame:
+    """Pearson correlation matrix of the numeric columns of a dataframe
+
+    Equivalent (up to floating point rounding) to `df.corr(numeric_only=True)`
+    but computed from matrix products over chunks of rows, which is much faster
+    for datasets with many columns.
+
+    Args:
+        df (pd.DataFrame): The dataframe.
+        chunk_size (int, optional): The number of rows processed at once. Defaults
+            to as many rows as fit in `VALIDMIND_PROFILE_CHUNK_CELLS` values.
+
+    Returns:
+        pd.DataFrame: The correlation matrix.
+    """
+    columns = [
+        column
+        for column, dtype in df.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    ]
+
+    accumulator = _CorrelationAccumulator(columns)
+    for chunk in _iter_chunks(df, chunk_size):
+        accumulator.update(chunk)
+
+    return accumulator.finalize()
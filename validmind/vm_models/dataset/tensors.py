@@ -0,0 +1,440 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Dataframe columns of vectors (e.g. embeddings or multi-class probabilities)
+
+pandas can only hold a column of vectors as an object column with one Python object
+per row, so building it from an `(n_rows, n_dims)` array and stacking it back
+into one for `y_pred` or `y_prob` walks every row in Python and keeps thousands of
+small arrays alive. `TensorArray` is a pandas extension array backed by the
+contiguous n-D array itself: adding it to a dataframe doesn't copy or split the
+values and `to_tensor` returns them as is. Each element of the column is one row
+of the array.
+
+Columns are converted to Arrow as fixed-size lists, so dataframes with vector
+columns can be written to parquet or Arrow IPC files and read back with the same
+dtype.
+"""
+
+import numbers
+import re
+from typing import Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+
+
+@register_extension_dtype
+class TensorDtype(ExtensionDtype):
+    """The dtype of a `TensorArray`: the numpy dtype and shape of its elements"""
+
+    type = np.ndarray
+    kind = "O"
+    na_value = np.nan
+
+    def __init__(self, subtype=np.float64, shape: Tuple[int, ...] = ()):
+        self.subtype = np.dtype(subtype)
+        self.shape = tuple(int(n) for n in shape)
+
+    @property
+    def name(self) -> str:
+        return f"tensor[{self.subtype}, {self.shape}]"
+
+    @property
+    def _metadata(self):
+        return ("subtype", "shape")
+
+    @classmethod
+    def construct_from_string(cls, string: str):
+        # only from the full name (e.g. stored in the pandas metadata of parquet
+        # files), not from `astype("tensor")`
+        match = re.fullmatch(r"tensor\[(\w+), \(([\d, ]*)\)\]", str(string))
+        if match is None:
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+
+        shape = [int(n) for n in match.group(2).split(",") if n.strip()]
+        return cls(match.group(1), shape)
+
+    def __from_arrow__(self, array) -> "TensorArray":
+        """Convert a (chunked) fixed-size list array to a `TensorArray`"""
+        import pyarrow as pa
+
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        values = np.empty((len(array), *self.shape), dtype=self.subtype)
+        mask = np.zeros(len(array), dtype=bool)
+
+        start = 0
+        for chunk in chunks:
+            stop = start + len(chunk)
+            mask[start:stop] = chunk.is_null().to_numpy(zero_copy_only=False)
+
+            # flattening drops the missing rows
+            present = chunk
+            for _ in self.shape:
+                present = present.flatten()
+            present = present.to_numpy(zero_copy_only=False).astype(self.subtype)
+
+            rows = values[start:stop]
+            rows[mask[start:stop]] = _missing_row(self.subtype, self.shape)
+            rows[~mask[start:stop]] = present.reshape(-1, *self.shape)
+            start = stop
+
+        return TensorArray(values, mask=mask)
+
+    @classmethod
+    def construct_array_type(cls):
+        return TensorArray
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class TensorArray(ExtensionArray):
+    """A pandas extension array holding one row of an n-D numpy array per element
+
+    Missing rows (e.g. added by a reindex or converted from nulls) are tracked in a
+    boolean mask, so rows of NaNs output by a model aren't missing values. In the
+    array, missing rows hold NaNs (or zeros for non-float arrays).
+
+    pandas can't aggregate groups into array-valued elements so groupby reductions
+    that return an element (`first`, `last`, `min`, `max`...) raise a ValueError
+    ("Must produce aggregated value"). Use `nth`, `head` or `tail` to select rows
+    of groups and `agg(list)` to collect their elements instead.
+
+    Args:
+        values (np.ndarray): The array. Its first dimension is the length of the
+            column. The array is used without copying it.
+        mask (np.ndarray, optional): Boolean mask of the missing rows. Defaults to
+            None (no missing rows).
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(self, values: np.ndarray, mask: np.ndarray = None):
+        values = np.asarray(values)
+        if values.ndim < 2:
+            raise ValueError(
+                f"Expected an array with at least 2 dimensions, got {values.ndim}"
+            )
+
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != values.shape[:1]:
+                raise ValueError(
+                    f"Expected a mask of {len(values)} rows, got {mask.shape}"
+                )
+            if not mask.any():
+                mask = None
+
+        self._ndarray = values
+        self._mask = mask
+        self._dtype = TensorDtype(values.dtype, values.shape[1:])
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        mask = None
+        if isinstance(scalars, TensorArray):
+            values, mask = scalars._ndarray, scalars._mask
+        elif isinstance(scalars, np.ndarray) and scalars.ndim >= 2:
+            values = scalars
+        elif len(scalars) == 0 and isinstance(dtype, TensorDtype):
+            values = np.empty((0, *dtype.shape), dtype=dtype.subtype)
+        else:
+            values, mask = _stack_rows(list(scalars), dtype)
+
+        if isinstance(dtype, TensorDtype) and values.shape[1:] != dtype.shape:
+            # e.g. pandas casting back the results of `groupby().agg(list)`
+            raise ValueError(
+                f"Expected elements of shape {dtype.shape}, got {values.shape[1:]}"
+            )
+
+        if isinstance(dtype, TensorDtype) and values.dtype != dtype.subtype:
+            values = values.astype(dtype.subtype)
+        elif copy:
+            values = values.copy()
+
+        if copy and mask is not None:
+            mask = mask.copy()
+
+        return cls(values, mask=mask)
+
+    @classmethod
+    def _from_factorized(cls, values, original: "TensorArray"):
+        subtype, shape = original.dtype.subtype, original.dtype.shape
+        if not len(values):
+            return cls(np.empty((0, *shape), dtype=subtype))
+
+        mask = np.array([row is None for row in values], dtype=bool)
+        missing = _missing_row(subtype, shape).tobytes()
+        buffer = b"".join(missing if row is None else row for row in values)
+        rows = np.frombuffer(buffer, dtype=subtype).reshape(-1, *shape).copy()
+
+        return cls(rows, mask=mask)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["TensorArray"]):
+        mask = None
+        if any(array._mask is not None for array in to_concat):
+            mask = np.concatenate([array.isna() for array in to_concat])
+
+        return cls(np.concatenate([array._ndarray for array in to_concat]), mask=mask)
+
+    @property
+    def dtype(self) -> TensorDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        mask_nbytes = self._mask.nbytes if self._mask is not None else 0
+        return self._ndarray.nbytes + mask_nbytes
+
+    def __len__(self) -> int:
+        return len(self._ndarray)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            if self._mask is not None and self._mask[item]:
+                return self.dtype.na_value
+            return self._ndarray[item]
+
+        item = check_array_indexer(self, item)
+        if isinstance(item, tuple):
+            # e.g. `array[:, 0]` for 2-D indexing of the column
+            return self._ndarray[item]
+
+        mask = self._mask[item] if self._mask is not None else None
+        return type(self)(self._ndarray[item], mask=mask)
+
+    def __setitem__(self, key, value):
+        key = check_array_indexer(self, key)
+
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            if self._mask is None:
+                self._mask = np.zeros(len(self), dtype=bool)
+            self._mask[key] = True
+            self._ndarray[key] = _missing_row(self.dtype.subtype, self.dtype.shape)
+            return
+
+        mask = None
+        if isinstance(value, TensorArray):
+            value, mask = value._ndarray, value._mask
+        elif isinstance(value, (pd.Series, pd.Index)):
+            value = TensorArray._from_sequence(value.array)
+            value, mask = value._ndarray, value._mask
+
+        self._ndarray[key] = value
+        if mask is not None or self._mask is not None:
+            if self._mask is None:
+                self._mask = np.zeros(len(self), dtype=bool)
+            self._mask[key] = False if mask is None else mask
+
+    def __iter__(self):
+        if self._mask is None:
+            return iter(self._ndarray)
+
+        return (self[i] for i in range(len(self)))
+
+    def __array__(self, dtype=None):
+        # one row per element like an object column
+        rows = np.empty(len(self), dtype=object)
+        for i, row in enumerate(self._ndarray):
+            rows[i] = row
+        if self._mask is not None:
+            rows[self._mask] = self.dtype.na_value
+
+        return rows if dtype is None else rows.astype(dtype)
+
+    def __arrow_array__(self, type=None):
+        # a (nested) fixed-size list array with missing rows as nulls, e.g. so
+        # dataframes with vector columns can be written to parquet
+        import pyarrow as pa
+
+        array = pa.array(np.ascontiguousarray(self._ndarray).reshape(-1))
+        for size in reversed(self.dtype.shape[1:]):
+            array = pa.FixedSizeListArray.from_arrays(array, size)
+
+        mask = pa.array(self._mask) if self._mask is not None else None
+        array = pa.FixedSizeListArray.from_arrays(array, self.dtype.shape[0], mask=mask)
+
+        return array if type is None else array.cast(type)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, TensorArray):
+            other = other._ndarray
+
+        equal = np.asarray(self._ndarray == other)
+        return equal.reshape(len(self), -1).all(axis=1)
+
+    def to_tensor(self, copy: bool = False) -> np.ndarray:
+        """Returns the values as one n-D array (one row per element)
+
+        Missing rows hold NaNs (or zeros for non-float arrays), see `isna`.
+
+        Args:
+            copy (bool, optional): Whether to copy the values. Defaults to False,
+                which returns a read-only view of the values.
+
+        Returns:
+            np.ndarray: The values.
+        """
+        if copy:
+            return self._ndarray.copy()
+
+        values = self._ndarray.view()
+        values.flags.writeable = False
+
+        return values
+
+    def isna(self) -> np.ndarray:
+        if self._mask is None:
+            return np.zeros(len(self), dtype=bool)
+
+        return self._mask.copy()
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.intp)
+        if allow_fill and fill_value is None:
+            fill_value = self.dtype.na_value
+
+        if allow_fill and pd.api.types.is_scalar(fill_value) and pd.isna(fill_value):
+            # rows for -1 indices are missing
+            values = take(
+                self._ndarray,
+                indices,
+                allow_fill=True,
+                fill_value=_missing_row(self.dtype.subtype, ())[()],
+            )
+            mask = take(self.isna(), indices, allow_fill=True, fill_value=True)
+
+            return type(self)(values, mask=mask)
+
+        values = take(
+            self._ndarray, indices, allow_fill=allow_fill, fill_value=fill_value
+        )
+        mask = None
+        if self._mask is not None:
+            mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=False)
+
+        return type(self)(values, mask=mask)
+
+    def copy(self) -> "TensorArray":
+        mask = self._mask.copy() if self._mask is not None else None
+        return type(self)(self._ndarray.copy(), mask=mask)
+
+    def astype(self, dtype, copy=True):
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, TensorDtype):
+            if dtype == self.dtype:
+                return self.copy() if copy else self
+            return type(self)(self._ndarray.astype(dtype.subtype), mask=self._mask)
+
+        return super().astype(dtype, copy=copy)
+
+    def _values_for_factorize(self):
+        # each row's bytes identify its value
+        rows = np.ascontiguousarray(self._ndarray).reshape(len(self), -1)
+        keys = np.empty(len(self), dtype=object)
+        keys[:] = [row.tobytes() for row in rows]
+        keys[self.isna()] = None
+
+        return keys, None
+
+    def unique(self) -> "TensorArray":
+        _, uniques = self.factorize(use_na_sentinel=False)
+
+        return uniques
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        codes, uniques = self.factorize(use_na_sentinel=dropna)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        # arrays aren't hashable so the values are indexed by tuples
+        index = np.empty(len(uniques), dtype=object)
+        missing = uniques.isna()
+        for i, row in enumerate(uniques._ndarray):
+            index[i] = np.nan if missing[i] else tuple(row.ravel().tolist())
+
+        return pd.Series(
+            counts, index=pd.Index(index, tupleize_cols=False), name="count"
+        )
+
+    def _formatter(self, boxed: bool = False):
+        def format_row(row):
+            if not isinstance(row, np.ndarray):
+                return str(row)
+            return np.array2string(row, threshold=6, edgeitems=2, separator=", ")
+
+        return format_row
+
+
+def _missing_row(subtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+    """The row stored for missing values: NaNs or zeros for non-float arrays"""
+    if subtype.kind in "fc":
+        return np.full(shape, np.nan, dtype=subtype)
+
+    return np.zeros(shape, dtype=subtype)
+
+
+def _stack_rows(rows: list, dtype=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack a sequence of rows where missing rows are None or NaN scalars"""
+    mask = np.array(
+        [pd.api.types.is_scalar(row) and pd.isna(row) for row in rows], dtype=bool
+    )
+    if not mask.any():
+        return np.stack([np.asarray(row) for row in rows]), None
+
+    present = [np.asarray(row) for row, missing in zip(rows, mask) if not missing]
+    if present:
+        subtype, shape = np.result_type(*present), present[0].shape
+    elif isinstance(dtype, TensorDtype):
+        subtype, shape = dtype.subtype, dtype.shape
+    else:
+        raise ValueError("Cannot infer the shape of a column of missing values")
+
+    missing_row = _missing_row(np.dtype(subtype), shape)
+    values = np.stack([missing_row if m else np.asarray(r) for r, m in zip(rows, mask)])
+
+    return values, mask
+
+
+def tensor_values(values) -> np.ndarray:
+    """Convert column values to an array, stacking rows of vectors into an n-D array
+
+    Values of an object column whose rows are equal-length sequences of numbers
+    (e.g. a column of lists) are stacked so they can be stored in a `TensorArray`.
+    Other values are returned as a (copied) numpy array.
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.array
+    if isinstance(values, TensorArray):
+        return values.to_tensor(copy=True)
+
+    values = np.array(values)
+
+    if (
+        values.ndim == 1
+        and values.dtype == object
+        and len(values)
+        and all(isinstance(row, (list, tuple, np.ndarray)) for row in values)
+    ):
+        try:
+            stacked = np.stack([np.asarray(row) for row in values])
+        except ValueError:
+            # rows of different lengths
+            return values
+
+        if stacked.dtype != object and stacked.dtype.kind in "biufc":
+            return stacked
+
+    return values
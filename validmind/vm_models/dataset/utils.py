@@ -2,6 +2,8 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
+import hashlib
+import pickle
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Union
 
@@ -12,6 +14,8 @@ from validmind.errors import MissingOrInvalidModelPredictFnError
 from validmind.logging import get_logger
 from validmind.vm_models.model import ModelTask
 
+from .tensors import TensorArray
+
 logger = get_logger(__name__)
 
 
@@ -83,6 +87,84 @@ def as_df(series_or_frame: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
     return series_or_frame
 
 
+def column_view(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Select a subset of columns from a dataframe without copying the column data
+
+    `df[columns]` consolidates the selected columns into new blocks which copies
+    every value. Building the frame from the individual columns with `copy=False`
+    keeps each column backed by the same buffer as the source dataframe. (Passing
+    `columns=` as well would make pandas read every value of the columns.)
+    """
+    return pd.DataFrame(
+        {col: df[col] for col in columns},
+        index=df.index,
+        copy=False,
+    )
+
+
+def pandas_copy_on_write() -> bool:
+    """Check if pandas' copy-on-write mode is enabled (only available for pandas>=2)"""
+    try:
+        return bool(pd.get_option("mode.copy_on_write"))
+    except KeyError:
+        return False
+
+
+def readonly_view(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Select a subset of columns as a read-only, zero-copy projection
+
+    NumPy-backed columns are wrapped in read-only views of the source buffers so
+    that element-wise writes (e.g. `df.loc[0, "col"] = 1`) raise an error instead
+    of silently modifying the source dataframe. Operations that produce new data
+    (assigning a whole column, `fillna(inplace=True)`, `sort_values` etc.) leave
+    the source untouched and only allocate the columns they replace. Columns of
+    vectors (see `TensorArray`) get a read-only view of their array too. Columns
+    backed by other pandas extension arrays (categorical, nullable ints...) can't
+    be flagged as read-only so they are copied.
+    """
+    data = {}
+    for col in columns:
+        series = df[col]
+        if isinstance(series.dtype, np.dtype):
+            values = series.to_numpy().view()
+            values.flags.writeable = False
+            data[col] = pd.Series(values, index=series.index, name=col, copy=False)
+        elif isinstance(series.array, TensorArray):
+            values = TensorArray(series.array.to_tensor(), mask=series.array.isna())
+            data[col] = pd.Series(values, index=series.index, name=col, copy=False)
+        else:
+            data[col] = series.copy()
+
+    return pd.DataFrame(data, index=df.index, copy=False)
+
+
+def fingerprint_values(name, values: Union[pd.Series, pd.Index]) -> str:
+    """Compute an exact fingerprint of a column (or index) from its data
+
+    NumPy-backed data (including columns of vectors) is hashed directly from its
+    buffer. Other data (objects, strings, categoricals...) is hashed with pandas'
+    vectorized object hashing and anything pandas can't hash (e.g. lists) falls
+    back to pickling.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((name, str(values.dtype), len(values))).encode())
+
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        digest.update(np.ascontiguousarray(values.to_numpy()).view(np.uint8))
+    elif isinstance(values.array, TensorArray):
+        tensor = np.ascontiguousarray(values.array.to_tensor())
+        digest.update(tensor.reshape(-1).view(np.uint8))
+        digest.update(values.array.isna().view(np.uint8))
+    else:
+        try:
+            hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            digest.update(hashed.view(np.uint8))
+        except TypeError:
+            digest.update(pickle.dumps(values.to_numpy()))
+
+    return digest.hexdigest()
+
+
 def _is_probabilties(output):
     """Check if the output from the predict method is probabilities."""
     if not isinstance(output, np.ndarray) or output.ndim > 1:
@@ -97,6 +179,16 @@ def _is_probabilties(output):
     return np.all((output >= 0) & (output <= 1)) and np.any((output > 0) & (output < 1))
 
 
+def _predict(model, X, **kwargs):
+    try:
+        return model.predict(X, **kwargs)
+    except MissingOrInvalidModelPredictFnError:
+        raise MissingOrInvalidModelPredictFnError(
+            "Cannot compute predictions for model's that don't support inference. "
+            "You can pass `prediction_values` or `prediction_columns` to use precomputed predictions"
+        )
+
+
 def compute_predictions(model, X, **kwargs) -> tuple:
     probability_values = None
 
@@ -109,16 +201,14 @@ def compute_predictions(model, X, **kwargs) -> tuple:
         # model that doesn't support predict_proba()
         logger.info("Not running predict_proba() for unsupported models.")
 
-    try:
-        logger.info("Running predict()... This may take a while")
-        prediction_values = model.predict(X, **kwargs)
-        logger.info("Done running predict()")
-    except MissingOrInvalidModelPredictFnError:
-        raise MissingOrInvalidModelPredictFnError(
-            "Cannot compute predictions for model's that don't support inference. "
-            "You can pass `prediction_values` or `prediction_columns` to use precomputed predictions"
-        )
+    logger.info("Running predict()... This may take a while")
+    prediction_values = _predict(model, X, **kwargs)
+    logger.info("Done running predict()")
 
+    return _postprocess_predictions(model, probability_values, prediction_values)
+
+
+def _postprocess_predictions(model, probability_values, prediction_values) -> tuple:
     if model.attributes.task is ModelTask.REGRESSION:
         logger.info("Model is configured for regression.")
         return probability_values, prediction_values
@@ -141,6 +231,116 @@ def compute_predictions(model, X, **kwargs) -> tuple:
     return probability_values, prediction_values
 
 
+def labels_from_probabilities(model, probability_values):
+    """Derive class labels from the probabilities of a classifier
+
+    Only possible when the underlying model exposes its `classes_` (sklearn-style
+    estimators). Returns None otherwise so the caller can fall back to `predict()`.
+    """
+    classes = getattr(getattr(model, "model", None), "classes_", None)
+    if classes is None or probability_values is None:
+        return None
+
+    classes = np.asarray(classes)
+    probability_values = np.asarray(probability_values)
+
+    if probability_values.ndim == 1 and len(classes) == 2:
+        return classes[(probability_values > 0.5).astype(int)]
+
+    if probability_values.ndim == 2 and probability_values.shape[1] == len(classes):
+        return classes[probability_values.argmax(axis=1)]
+
+    return None
+
+
+@dataclass
+class PredictionCheckpoint:
+    """Predictions computed so far by a chunked `assign_predictions()` call
+
+    Kept on the dataset until all chunks are done so that an interrupted call
+    can be resumed from the last completed chunk.
+    """
+
+    key: tuple
+    n_rows: int
+    rows_done: int = 0
+    predict_proba: bool = True
+    prediction_values: np.ndarray = None
+    probability_values: np.ndarray = None
+
+    @staticmethod
+    def _write(values, output, start, stop, n_rows):
+        output = np.asarray(output)
+        if len(output) != stop - start:
+            raise ValueError(
+                f"Model returned {len(output)} values for a chunk of {stop - start} rows"
+            )
+
+        if values is None:
+            values = np.empty((n_rows, *output.shape[1:]), dtype=output.dtype)
+        elif values.dtype != output.dtype:
+            # e.g. longer strings or floats after ints in a later chunk
+            values = values.astype(np.result_type(values, output))
+
+        values[start:stop] = output
+
+        return values
+
+    def write(self, start, stop, prediction_values, probability_values=None):
+        self.prediction_values = self._write(
+            self.prediction_values, prediction_values, start, stop, self.n_rows
+        )
+        if probability_values is not None:
+            self.probability_values = self._write(
+                self.probability_values, probability_values, start, stop, self.n_rows
+            )
+        self.rows_done = stop
+
+
+def compute_predictions_chunked(
+    model, get_chunk, checkpoint: PredictionCheckpoint, chunk_size: int, **kwargs
+) -> tuple:
+    """Compute predictions by streaming chunks of rows through the model
+
+    Each chunk is passed through `predict_proba()` once and labels are derived from
+    the probabilities when possible instead of running `predict()` as well. Results
+    are written into preallocated arrays on the `checkpoint` as chunks complete.
+
+    Args:
+        model (VMModel): The model to compute predictions for.
+        get_chunk (callable): Returns the model input for the rows `[start, stop)`.
+        checkpoint (PredictionCheckpoint): Holds the results and progress so far.
+        chunk_size (int): The number of rows per chunk.
+        kwargs: Additional keyword arguments passed to the model's `predict` method.
+    """
+    n_rows = checkpoint.n_rows
+
+    for start in range(checkpoint.rows_done, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        X = get_chunk(start, stop)
+
+        probability_values = None
+        if checkpoint.predict_proba:
+            try:
+                probability_values = model.predict_proba(X)
+            except MissingOrInvalidModelPredictFnError:
+                logger.info("Not running predict_proba() for unsupported models.")
+                checkpoint.predict_proba = False
+
+        prediction_values = None
+        if not kwargs:
+            prediction_values = labels_from_probabilities(model, probability_values)
+        if prediction_values is None:
+            prediction_values = _predict(model, X, **kwargs)
+
+        checkpoint.write(start, stop, prediction_values, probability_values)
+        logger.info(f"Computed predictions for {stop}/{n_rows} rows")
+
+    return _postprocess_predictions(
+        model, checkpoint.probability_values, checkpoint.prediction_values
+    )
+
+
 def convert_index_to_datetime(df):
     """
     Attempts to convert the index of the dataset to a datetime index
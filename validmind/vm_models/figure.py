@@ -8,25 +8,80 @@ Figure objects track the figure schema supported by the ValidMind API
 
 import base64
 import json
-from dataclasses import dataclass
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Optional
-
-import ipywidgets as widgets
-import matplotlib
-import plotly.graph_objs as go
+from typing import List, Optional
 
 from ..client_config import client_config
 from ..errors import InvalidFigureForObjectError, UnsupportedFigureError
+from ..logging import get_logger
 from ..utils import get_full_typename
+from .figure_export import get_export_pool
+
+logger = get_logger(__name__)
+
+# directory that rendered figures are spilled to instead of being kept in memory
+_render_cache_dir = os.getenv("VALIDMIND_FIGURE_CACHE_DIR")
+
+# matplotlib's pyplot keeps global figure state that is not thread-safe so any work
+# with matplotlib figures (running tests that use pyplot and rendering) is serialized
+matplotlib_lock = threading.RLock()
+
+
+def configure_render_cache(cache_dir: Optional[str] = None):
+    """Configure where rendered figures are kept
+
+    Each figure is rendered (to PNG and, for plotly figures, JSON) at most once
+    and the result is reused to display it, upload it and describe it. Rendered
+    figures are kept in memory unless a `cache_dir` is provided, in which case
+    they are written to files in that directory that are removed when the figure
+    is garbage collected. The directory can also be set with the
+    `VALIDMIND_FIGURE_CACHE_DIR` environment variable.
+
+    Args:
+        cache_dir (str, optional): Directory to write rendered figures to. Defaults to None (keep in memory).
+    """
+    global _render_cache_dir
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    _render_cache_dir = cache_dir
+
+
+def _spill(data: bytes, suffix: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=f".{suffix}", dir=_render_cache_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+    return path
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
 
 def is_matplotlib_figure(figure) -> bool:
-    return isinstance(figure, matplotlib.figure.Figure)
+    # matplotlib and plotly are slow to import so we check if they have been loaded
+    # instead of importing them since the figure can't be one of theirs otherwise
+    mpl_figure = sys.modules.get("matplotlib.figure")
+
+    return mpl_figure is not None and isinstance(figure, mpl_figure.Figure)
 
 
 def is_plotly_figure(figure) -> bool:
-    return isinstance(figure, (go.Figure, go.FigureWidget))
+    go = sys.modules.get("plotly.graph_objs")
+
+    return go is not None and isinstance(figure, (go.Figure, go.FigureWidget))
 
 
 def is_png_image(figure) -> bool:
@@ -47,6 +102,16 @@ class Figure:
 
     _type: str = "plot"
 
+    # rendered bytes (or spilled file paths) by format for `_figure_rendered`
+    _renders: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _figure_rendered: object = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _render_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _spilled: list = field(default_factory=list, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """
         Set default params if not provided
@@ -66,8 +131,83 @@ class Figure:
             and self.figure
             and is_plotly_figure(self.figure)
         ):
+            import plotly.graph_objs as go
+
             self.figure = go.FigureWidget(self.figure)
 
+        weakref.finalize(self, _remove_files, self._spilled)
+
+    def __getstate__(self):
+        # locks can't be pickled and renders are recreated on demand
+        state = self.__dict__.copy()
+        state["_renders"] = {}
+        state["_figure_rendered"] = None
+        state["_spilled"] = []
+        del state["_render_lock"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._render_lock = threading.Lock()
+        weakref.finalize(self, _remove_files, self._spilled)
+
+    def _render_figure(self, format: str) -> bytes:
+        if is_matplotlib_figure(self.figure):
+            buffer = BytesIO()
+            with matplotlib_lock:
+                self.figure.savefig(buffer, format="png", bbox_inches="tight")
+
+            return buffer.getvalue()
+
+        if is_plotly_figure(self.figure):
+            if format == "json":
+                return self.figure.to_json().encode("utf-8")
+
+            return get_export_pool().submit(self.figure).result()
+
+        raise UnsupportedFigureError(
+            f"Unrecognized figure type: {get_full_typename(self.figure)}"
+        )
+
+    def _get_render(self, format: str):
+        # must be called while holding the render lock
+        if self._figure_rendered is not self.figure:
+            self._renders.clear()
+            self._figure_rendered = self.figure
+
+        return self._renders.get(format)
+
+    def _set_render(self, format: str, data: bytes):
+        # must be called while holding the render lock
+        if _render_cache_dir is not None:
+            data = _spill(data, format)
+            self._spilled.append(data)
+
+        self._renders[format] = data
+
+        return data
+
+    def _render(self, format: str = "png") -> bytes:
+        """
+        Renders a matplotlib or plotly figure to PNG or JSON (plotly only) bytes.
+        Each format is only rendered once and then reused, so the figure must not
+        be modified after it's first displayed, logged or described.
+        """
+        if is_png_image(self.figure):
+            return self.figure
+
+        with self._render_lock:
+            data = self._get_render(format)
+            if data is None:
+                data = self._set_render(format, self._render_figure(format))
+
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                return f.read()
+
+        return data
+
     def _get_for_object_type(self):
         """
         Returns the type of the object this figure is for
@@ -91,10 +231,10 @@ class Figure:
         we would render images as-is, but Plotly FigureWidgets don't work well
         on Google Colab when they are combined with ipywidgets.
         """
+        import ipywidgets as widgets
+
         if is_matplotlib_figure(self.figure):
-            tmpfile = BytesIO()
-            self.figure.savefig(tmpfile, format="png")
-            encoded = base64.b64encode(tmpfile.getvalue()).decode("utf-8")
+            encoded = base64.b64encode(self._render("png")).decode("utf-8")
             return widgets.HTML(
                 value=f"""
                 <img style="width:100%; height: auto;" src="data:image/png;base64,{encoded}"/>
@@ -105,8 +245,7 @@ class Figure:
             # FigureWidget can be displayed as-is but not on Google Colab. In this case
             # we just return the image representation of the figure.
             if client_config.running_on_colab:
-                png_file = self.figure.to_image(format="png")
-                encoded = base64.b64encode(png_file).decode("utf-8")
+                encoded = base64.b64encode(self._render("png")).decode("utf-8")
                 return widgets.HTML(
                     value=f"""
                     <img style="width:100%; height: auto;" src="data:image/png;base64,{encoded}"/>
@@ -142,18 +281,8 @@ class Figure:
         """
         Returns a base64 encoded URL for the figure
         """
-        if is_matplotlib_figure(self.figure):
-            buffer = BytesIO()
-            self.figure.savefig(buffer, format="png")
-            buffer.seek(0)
-
-            b64_data = base64.b64encode(buffer.read()).decode("utf-8")
-
-            return f"data:image/png;base64,{b64_data}"
-
-        elif is_plotly_figure(self.figure):
-            bytes = self.figure.to_image(format="png")
-            b64_data = base64.b64encode(bytes).decode("utf-8")
+        if is_matplotlib_figure(self.figure) or is_plotly_figure(self.figure):
+            b64_data = base64.b64encode(self._render("png")).decode("utf-8")
 
             return f"data:image/png;base64,{b64_data}"
 
@@ -169,24 +298,17 @@ class Figure:
     def serialize_files(self):
         """Creates a `requests`-compatible files object to be sent to the API"""
         if is_matplotlib_figure(self.figure):
-            buffer = BytesIO()
-            self.figure.savefig(buffer, bbox_inches="tight")
-            buffer.seek(0)
-            return {"image": (f"{self.key}.png", buffer, "image/png")}
+            return {"image": (f"{self.key}.png", self._render("png"), "image/png")}
 
         elif is_plotly_figure(self.figure):
             # When using plotly, we need to use we will produce two files:
             # - a JSON file that will be used to display the figure in the UI
             # - a PNG file that will be used to display the figure in documents
             return {
-                "image": (
-                    f"{self.key}.png",
-                    self.figure.to_image(format="png"),
-                    "image/png",
-                ),
+                "image": (f"{self.key}.png", self._render("png"), "image/png"),
                 "json_image": (
                     f"{self.key}.json",
-                    self.figure.to_json(),
+                    self._render("json"),
                     "application/json",
                 ),
             }
@@ -197,3 +319,38 @@ class Figure:
         raise UnsupportedFigureError(
             f"Unrecognized figure type: {get_full_typename(self.figure)}"
         )
+
+
+def render_figures(figures: List[Figure]):
+    """Render the PNG images of a batch of figures ahead of using them
+
+    Plotly figures are exported concurrently by the workers of the export pool
+    (see `validmind.vm_models.figure_export`) while matplotlib figures are
+    rendered in the calling thread. Figures that fail to render are skipped here
+    and raise when they're rendered on their own.
+    """
+    pending = []
+    for figure in figures:
+        if not is_plotly_figure(figure.figure):
+            continue
+
+        with figure._render_lock:
+            if figure._get_render("png") is not None:
+                continue
+
+        pending.append((figure, figure.figure, get_export_pool().submit(figure.figure)))
+
+    for figure, source, future in pending:
+        try:
+            data = future.result()
+        except Exception as e:
+            logger.debug(f"Failed to export figure {figure.key}: {e}")
+            continue
+
+        with figure._render_lock:
+            if figure._get_render("png") is None and figure.figure is source:
+                figure._set_render("png", data)
+
+    for figure in figures:
+        if is_matplotlib_figure(figure.figure):
+            figure._render("png")
@@ -0,0 +1,164 @@
+# Copyright © 2023-2024 ValidMind Inc. All rights reserved.
+# See the LICENSE file in the root of this repository for details.
+# SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
+
+"""
+Pool of workers that export plotly figures to images concurrently
+"""
+
+import atexit
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import List
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# each worker runs its own kaleido (chromium) process so we cap the default size
+DEFAULT_MAX_WORKERS = int(
+    os.getenv("VALIDMIND_FIGURE_EXPORT_WORKERS", min(os.cpu_count() or 1, 8))
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _has_kaleido_scopes() -> bool:
+    """Whether the installed kaleido provides the `kaleido.scopes` API (< 1.0)"""
+    try:
+        return find_spec("kaleido.scopes") is not None
+    except ImportError:
+        return False
+
+
+class PlotlyExportPool:
+    """Long-lived pool of workers that export plotly figures to images
+
+    Plotly's `to_image` sends every figure through a single kaleido process, so
+    figures are exported one at a time. Each worker in this pool owns a kaleido
+    scope whose process is started the first time the worker exports a figure and
+    is reused for every figure after that, so up to `max_workers` figures are
+    exported concurrently.
+
+    With a single worker, or without kaleido's scopes API (kaleido < 1.0, which
+    kaleido 1.0 replaced), figures are exported with plotly's `to_image` instead.
+
+    Args:
+        max_workers (int, optional): The number of export workers. Defaults to the
+            number of cores (at most 8) or the `VALIDMIND_FIGURE_EXPORT_WORKERS`
+            environment variable.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(1, max_workers)
+
+        self._executor = None
+        self._scopes = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def concurrent(self) -> bool:
+        return self.max_workers > 1 and _has_kaleido_scopes()
+
+    def _get_scope(self):
+        scope = getattr(self._local, "scope", None)
+        if scope is not None:
+            return scope
+
+        import plotly.io as pio
+        from kaleido.scopes.plotly import PlotlyScope
+
+        # export with the same plotly.js bundle and defaults as plotly's `to_image`
+        default = pio.kaleido.scope
+        scope = PlotlyScope(plotlyjs=default.plotlyjs, mathjax=default.mathjax)
+        scope.default_width = default.default_width
+        scope.default_height = default.default_height
+        scope.default_scale = default.default_scale
+
+        self._local.scope = scope
+        with self._lock:
+            self._scopes.append(scope)
+
+        return scope
+
+    def _export(self, figure, format: str) -> bytes:
+        return self._get_scope().transform(figure, format=format)
+
+    def submit(self, figure, format: str = "png") -> Future:
+        """Export a plotly figure to an image in one of the workers
+
+        Args:
+            figure: The plotly figure to export
+            format (str, optional): The image format. Defaults to "png".
+
+        Returns:
+            Future: A future that resolves to the image bytes
+        """
+        if not self.concurrent:
+            future = Future()
+            try:
+                future.set_result(figure.to_image(format=format))
+            except Exception as e:
+                future.set_exception(e)
+
+            return future
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="vm-figure-export",
+                )
+
+            return self._executor.submit(self._export, figure, format)
+
+    def export(self, figures: list, format: str = "png") -> List[bytes]:
+        """Export a batch of plotly figures to images concurrently
+
+        Args:
+            figures (list): The plotly figures to export
+            format (str, optional): The image format. Defaults to "png".
+
+        Returns:
+            List[bytes]: The image bytes of each figure in the same order
+        """
+        futures = [self.submit(figure, format) for figure in figures]
+
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Stop the workers and their kaleido processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            scopes, self._scopes = self._scopes, []
+
+        if executor is not None:
+            executor.shutdown()
+
+        for scope in scopes:
+            scope._shutdown_kaleido()
+
+
+_export_pool = PlotlyExportPool()
+atexit.register(lambda: _export_pool.shutdown())
+
+
+def get_export_pool() -> PlotlyExportPool:
+    """Get the pool used to export plotly figures to images"""
+    return _export_pool
+
+
+def configure_export_pool(max_workers: int = DEFAULT_MAX_WORKERS):
+    """Configure the number of workers that export plotly figures to images
+
+    Args:
+        max_workers (int, optional): The number of export workers. Defaults to the
+            number of cores (at most 8).
+    """
+    global _export_pool
+
+    _export_pool.shutdown()
+    _export_pool = PlotlyExportPool(max_workers=max_workers)
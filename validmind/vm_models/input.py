@@ -12,6 +12,9 @@ class VMInput(ABC):
     Base class for ValidMind Input types
     """
 
+    # future of the input being logged in the background (see `init_dataset`)
+    _log_future = None
+
     def with_options(self, **kwargs) -> "VMInput":
         """
         Allows for setting options on the input object that are passed by the user
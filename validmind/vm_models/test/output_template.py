@@ -5,7 +5,6 @@
 from datetime import datetime
 
 from dateutil import parser
-from jinja2 import Environment
 
 
 def format_date(value, format="%Y-%m-%d"):
@@ -36,6 +35,8 @@ def _generate_empty_historical_data(value):
 class OutputTemplate:
     def __init__(self, template_string, template_engine=None):
         if template_engine is None:
+            from jinja2 import Environment
+
             template_engine = Environment()
             template_engine.filters["date"] = format_date
             template_engine.filters["number"] = format_number
@@ -2,10 +2,29 @@
 # See the LICENSE file in the root of this repository for details.
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, List, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_float_dtype
+
+
+def _to_records(df: pd.DataFrame) -> List[dict]:
+    """Convert a DataFrame to records with NaN and +/-Inf values replaced by None
+
+    The values are replaced in bulk here so the records can be JSON encoded as-is.
+    """
+    missing = df.isna().to_numpy()
+    for i, dtype in enumerate(df.dtypes):
+        if is_float_dtype(dtype):
+            values = df.iloc[:, i].to_numpy(dtype="float64", na_value=np.nan)
+            missing[:, i] |= np.isinf(values)
+
+    if missing.any():
+        df = df.astype(object).mask(missing, None)
+
+    return df.to_dict(orient="records")
 
 
 @dataclass
@@ -27,25 +46,39 @@ class ResultTable:
     type: str = "table"
     metadata: ResultTableMetadata = None
 
+    # records of `_serialized_data` so they're only computed once per table
+    _records: list = field(default=None, init=False, repr=False, compare=False)
+    _serialized_data: Any = field(default=None, init=False, repr=False, compare=False)
+
     def serialize(self, as_df=False):
         """
         Serializes the Figure to a dictionary so it can be sent to the API.
 
         This method accepts as_df parameter to return the data as a DataFrame
         if we're returning the data to R.
+
+        The records are computed once and reused, so the table data should not be
+        modified in place after the table is serialized (replacing it is fine).
         """
         table_result = {
             "type": self.type,
         }
 
-        # Convert to a DataFrame so that we can round the values in a standard way
-        table_df = pd.DataFrame(self.data) if isinstance(self.data, list) else self.data
-        table_df = table_df.round(4)
+        if as_df or self._serialized_data is not self.data:
+            # Convert to a DataFrame so that we can round the values in a standard way
+            table_df = (
+                pd.DataFrame(self.data) if isinstance(self.data, list) else self.data
+            )
+            table_df = table_df.round(4)
 
-        if as_df:
-            table_result["data"] = table_df
-        else:
-            table_result["data"] = table_df.to_dict(orient="records")
+            if as_df:
+                table_result["data"] = table_df
+            else:
+                self._records = _to_records(table_df)
+                self._serialized_data = self.data
+
+        if not as_df:
+            table_result["data"] = self._records
 
         if self.metadata is not None:
             table_result["metadata"] = vars(self.metadata)
@@ -72,5 +105,8 @@ class ResultSummary:
     def serialize(self, as_df=False):
         """
         Serializes the ResultSummary to a list of results
+
+        Each result table memoizes its records, so serializing the summary for the
+        test description and again when logging it only converts the tables once.
         """
         return [result.serialize(as_df) for result in self.results]
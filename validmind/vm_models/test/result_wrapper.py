@@ -12,20 +12,27 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
-from ipywidgets import HTML, GridBox, Layout, VBox
 
 from ... import api_client
 from ...ai.test_descriptions import AI_REVISION_NAME, DescriptionFuture
 from ...input_registry import input_registry
 from ...logging import get_logger
-from ...utils import NumpyEncoder, display, run_async, test_id_to_name
+from ...utils import (
+    NumpyEncoder,
+    display,
+    lazy_import,
+    run_async,
+    test_id_to_name,
+)
 from ..dataset import VMDataset
-from ..figure import Figure
+from ..figure import Figure, render_figures
 from .metric_result import MetricResult
 from .output_template import OutputTemplate
 from .result_summary import ResultSummary
 from .threshold_test_result import ThresholdTestResults
 
+ipywidgets = lazy_import("ipywidgets")
+
 logger = get_logger(__name__)
 
 
@@ -67,9 +74,9 @@ def plot_figures(figures: List[Figure]) -> None:
     plots = [figure.to_widget() for figure in figures]
     num_columns = 2 if len(figures) > 1 else 1
 
-    return GridBox(
+    return ipywidgets.GridBox(
         plots,
-        layout=Layout(grid_template_columns=f"repeat({num_columns}, 1fr)"),
+        layout=ipywidgets.Layout(grid_template_columns=f"repeat({num_columns}, 1fr)"),
     )
 
 
@@ -79,7 +86,7 @@ def _summary_tables_to_widget(summary: ResultSummary):
 
     for table in summary.results:
         if table.metadata and table.metadata.title:
-            widgets.append(HTML(f"<h4>{table.metadata.title}</h4>"))
+            widgets.append(ipywidgets.HTML(f"<h4>{table.metadata.title}</h4>"))
 
         df_html = (
             pd.DataFrame(table.data)
@@ -115,7 +122,7 @@ def _summary_tables_to_widget(summary: ResultSummary):
             .set_properties(**{"text-align": "left"})
             .to_html(escape=False)
         )
-        widgets.append(HTML(df_html))
+        widgets.append(ipywidgets.HTML(df_html))
 
     return widgets
 
@@ -213,6 +220,8 @@ class ResultWrapper(ABC):
         """Log the result... May be overridden by subclasses"""
 
         self._validate_section_id_for_block(section_id, position)
+        # make sure the inputs are logged before the results that reference them
+        input_registry.wait_until_logged(getattr(self, "inputs", None))
         run_async(self.log_async, section_id=section_id, position=position)
 
 
@@ -230,7 +239,9 @@ class FailedResultWrapper(ResultWrapper):
         return f'FailedResult(result_id="{self.result_id}")'
 
     def to_widget(self):
-        return HTML(f"<h3 style='color: red;'>{self.message}</h3><p>{self.error}</p>")
+        return ipywidgets.HTML(
+            f"<h3 style='color: red;'>{self.message}</h3><p>{self.error}</p>"
+        )
 
     async def log_async(self):
         pass
@@ -260,7 +271,7 @@ class MetricResultWrapper(ResultWrapper):
             return ""
 
         vbox_children = [
-            HTML(f"<h1>{test_id_to_name(self.result_id)}</h1>"),
+            ipywidgets.HTML(f"<h1>{test_id_to_name(self.result_id)}</h1>"),
         ]
 
         if self.result_metadata:
@@ -269,11 +280,11 @@ class MetricResultWrapper(ResultWrapper):
                 metric_description = metric_description.get_description()
                 self.result_metadata[0]["text"] = metric_description
 
-            vbox_children.append(HTML(metric_description))
+            vbox_children.append(ipywidgets.HTML(metric_description))
 
         if self.scalar is not None:
             vbox_children.append(
-                HTML(
+                ipywidgets.HTML(
                     "<h3>Unit Metrics</h3>"
                     f"<p>{test_id_to_name(self.result_id)} "
                     f"(<i>{self.result_id}</i>): "
@@ -282,10 +293,10 @@ class MetricResultWrapper(ResultWrapper):
             )
 
         if self.metric:
-            vbox_children.append(HTML("<h3>Tables</h3>"))
+            vbox_children.append(ipywidgets.HTML("<h3>Tables</h3>"))
             if self.output_template:
                 vbox_children.append(
-                    HTML(
+                    ipywidgets.HTML(
                         OutputTemplate(self.output_template).render(
                             value=self.metric.value
                         )
@@ -295,11 +306,11 @@ class MetricResultWrapper(ResultWrapper):
                 vbox_children.extend(_summary_tables_to_widget(self.metric.summary))
 
         if self.figures:
-            vbox_children.append(HTML("<h3>Plots</h3>"))
+            vbox_children.append(ipywidgets.HTML("<h3>Plots</h3>"))
             plot_widgets = plot_figures(self.figures)
             vbox_children.append(plot_widgets)
 
-        return VBox(vbox_children)
+        return ipywidgets.VBox(vbox_children)
 
     def _get_filtered_summary(self):
         """Check if the metric summary has columns from input datasets with matching row counts."""
@@ -388,6 +399,10 @@ class MetricResultWrapper(ResultWrapper):
             )
 
         if self.figures:
+            # export the images of all the figures concurrently before uploading them
+            await asyncio.get_running_loop().run_in_executor(
+                None, render_figures, self.figures
+            )
             tasks.extend([api_client.log_figure(figure) for figure in self.figures])
 
         if hasattr(self, "result_metadata") and self.result_metadata:
@@ -453,18 +468,18 @@ class ThresholdTestResultWrapper(ResultWrapper):
             """
         )
 
-        vbox_children.append(HTML("".join(description_html)))
+        vbox_children.append(ipywidgets.HTML("".join(description_html)))
 
         if self.test_results.summary:
-            vbox_children.append(HTML("<h3>Tables</h3>"))
+            vbox_children.append(ipywidgets.HTML("<h3>Tables</h3>"))
             vbox_children.extend(_summary_tables_to_widget(self.test_results.summary))
 
         if self.figures:
-            vbox_children.append(HTML("<h3>Plots</h3>"))
+            vbox_children.append(ipywidgets.HTML("<h3>Plots</h3>"))
             plot_widgets = plot_figures(self.figures)
             vbox_children.append(plot_widgets)
 
-        return VBox(vbox_children)
+        return ipywidgets.VBox(vbox_children)
 
     async def log_async(self, section_id: str = None, position: int = None):
         tasks = [
@@ -474,6 +489,10 @@ class ThresholdTestResultWrapper(ResultWrapper):
         ]
 
         if self.figures:
+            # export the images of all the figures concurrently before uploading them
+            await asyncio.get_running_loop().run_in_executor(
+                None, render_figures, self.figures
+            )
             tasks.extend([api_client.log_figure(figure) for figure in self.figures])
 
         if hasattr(self, "result_metadata") and self.result_metadata:
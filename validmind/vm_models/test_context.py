@@ -13,8 +13,11 @@ TestContext
 # https://app.shortcut.com/validmind/story/2468/allow-arbitrary-test-context
 # There is more changes to come around how we handle test inputs, so once we iron out that, we can refactor
 
-from dataclasses import dataclass
-from typing import ClassVar, List, Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Hashable, List, Optional
 
 from validmind.input_registry import input_registry
 
@@ -38,6 +41,71 @@ CONTEXT_NAMES = {
 
 logger = get_logger(__name__)
 
+# the context of the test being run in the current thread
+_current_context = ContextVar("current_test_context", default=None)
+
+
+def get_current_context() -> Optional["TestContext"]:
+    """Get the context of the test being run in the current thread, if any"""
+    return _current_context.get()
+
+
+class ArtifactCache:
+    """Cache for artifacts that tests derive from their inputs
+
+    Holds intermediate results such as correlation matrices or ROC curves so that
+    they are computed once per run instead of once per test. Each artifact is only
+    computed once even when tests run concurrently. Cached artifacts are shared
+    between tests and must not be modified.
+    """
+
+    def __init__(self):
+        self._artifacts = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        # hashes of the dataset columns that datasets don't cache themselves
+        self._fingerprints = {}
+
+    def fingerprint(self, dataset: VMDataset, columns: List[str]) -> str:
+        """Get the fingerprint of a dataset's columns for keying artifacts
+
+        Columns shared with the user's dataframe are only hashed once per run (see
+        `VMDataset.fingerprint`) so finding a cached artifact doesn't cost a pass
+        over the data.
+        """
+        return dataset.fingerprint(columns, memo=self._fingerprints)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get an artifact by key, computing it with `compute` if it isn't cached
+
+        Args:
+            key (Hashable): Identifies the artifact and the inputs it's derived from
+            compute (Callable): Function that computes the artifact
+
+        Returns:
+            Any: The cached or newly computed artifact
+        """
+        with self._lock:
+            if key in self._artifacts:
+                return self._artifacts[key]
+
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self._artifacts:
+                self._artifacts[key] = compute()
+
+        return self._artifacts[key]
+
+    def clear(self):
+        with self._lock:
+            self._artifacts.clear()
+            self._locks.clear()
+            self._fingerprints.clear()
+
+    def __len__(self):
+        return len(self._artifacts)
+
 
 @dataclass
 class TestContext:
@@ -55,6 +123,24 @@ class TestContext:
     model: VMModel = None
     models: List[VMModel] = None
 
+    # Artifacts derived from the test inputs that are shared between tests
+    artifacts: ArtifactCache = field(
+        default_factory=ArtifactCache, repr=False, compare=False
+    )
+
+    @contextmanager
+    def activate(self):
+        """Make this the current context while running a test
+
+        Lets the functions in `validmind.tests.artifacts` share their results
+        between the tests that are run with this context.
+        """
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
+
     def set_context_data(self, key, value):
         if self.context_data is None:
             self.context_data = {}
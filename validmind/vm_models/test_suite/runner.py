@@ -3,16 +3,26 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 import asyncio
-
-import ipywidgets as widgets
-from IPython.display import display
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 from ...logging import get_logger
-from ...utils import is_notebook, run_async, run_async_check
+from ...tests.utils import uses_pyplot
+from ...utils import (
+    is_notebook,
+    lazy_import,
+    run_async,
+    run_async_check,
+    wait_for_background_tasks,
+)
+from ..figure import matplotlib_lock
 from ..test_context import TestContext, TestInput
 from .summary import TestSuiteSummary
+from .test import TestSuiteTest
 from .test_suite import TestSuite
 
+widgets = lazy_import("ipywidgets")
+ipython_display = lazy_import("IPython.display")
+
 logger = get_logger(__name__)
 
 
@@ -28,9 +38,9 @@ class TestSuiteRunner:
 
     _test_configs: dict = None
 
-    pbar: widgets.IntProgress = None
-    pbar_description: widgets.Label = None
-    pbar_box: widgets.HBox = None
+    pbar: "widgets.IntProgress" = None
+    pbar_description: "widgets.Label" = None
+    pbar_box: "widgets.HBox" = None
 
     def __init__(self, suite: TestSuite, input: TestInput, config: dict = None):
         self.suite = suite
@@ -106,7 +116,7 @@ class TestSuiteRunner:
         self.pbar = widgets.IntProgress(max=num_tasks, orientation="horizontal")
         self.pbar_box = widgets.HBox([self.pbar_description, self.pbar])
 
-        display(self.pbar_box)
+        ipython_display.display(self.pbar_box)
 
     def _stop_progress_bar(self):
         self.pbar_description.value = "Test suite complete!"
@@ -117,27 +127,48 @@ class TestSuiteRunner:
 
         This method will be called after the test suite has been run and all results have been
         collected. This method will log the results to ValidMind.
+
+        The results of all tests are uploaded concurrently. The number of requests that are
+        in flight at once and the retries for transient failures are handled by the API client
+        (see `validmind.api_client.init`). Failed uploads don't stop the other results from
+        being sent: they are summarized at the end and the first error is raised.
         """
         self.pbar_description.value = (
             f"Sending results of test suite '{self.suite.suite_id}' to ValidMind..."
         )
 
         tests = [test for section in self.suite.sections for test in section.tests]
-        # TODO: use asyncio.gather here for better performance
-        for test in tests:
-            self.pbar_description.value = (
-                f"Sending result to ValidMind: {test.test_id}..."
-            )
 
+        async def log_test(test):
             try:
                 await test.log_async()
-            except Exception as e:
-                self.pbar_description.value = "Failed to send result to ValidMind"
-                logger.error(f"Failed to log result: {test.result}")
+            finally:
+                self.pbar.value += 1
 
-                raise e
+        results = await asyncio.gather(
+            *[log_test(test) for test in tests], return_exceptions=True
+        )
+        failed = [
+            (test, error)
+            for test, error in zip(tests, results)
+            if isinstance(error, Exception)
+        ]
 
-            self.pbar.value += 1
+        if not failed:
+            return
+
+        self.pbar_description.value = (
+            f"Failed to send {len(failed)} of {len(tests)} results to ValidMind"
+        )
+        logger.error(
+            f"Failed to log {len(failed)} of {len(tests)} results:\n"
+            + "\n".join(
+                f"  - {test.test_id}: ({error.__class__.__name__}) {error}"
+                for test, error in failed
+            )
+        )
+
+        raise failed[0][1]
 
     async def _check_progress(self):
         done = False
@@ -163,7 +194,59 @@ class TestSuiteRunner:
         )
         summary.display()
 
-    def run(self, send: bool = True, fail_fast: bool = False):
+    def _run_test(self, test: TestSuiteTest, fail_fast: bool = False):
+        if uses_pyplot(test._test_class):
+            with matplotlib_lock:
+                test.run(fail_fast=fail_fast)
+        else:
+            test.run(fail_fast=fail_fast)
+
+    def _run_tests(self, tests, fail_fast: bool = False):
+        """Runs the tests one after the other"""
+        for test in tests:
+            self.pbar_description.value = f"Running {test.test_type}: {test.name}"
+            test.run(fail_fast=fail_fast)
+            self.pbar.value += 1
+
+    def _run_tests_parallel(self, tests, max_workers: int, fail_fast: bool = False):
+        """Runs the tests concurrently on a thread pool
+
+        Results are stored on each test so the order of the sections and tests in the
+        suite is kept regardless of the order in which the tests complete. Most tests
+        spend their time in numpy/pandas/sklearn code that releases the GIL. Tests
+        that use matplotlib's global pyplot state are run one at a time.
+        """
+        self.pbar_description.value = (
+            f"Running {len(tests)} tests with {max_workers} workers..."
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="validmind-test"
+        ) as executor:
+            pending = {
+                executor.submit(self._run_test, test, fail_fast): test for test in tests
+            }
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_EXCEPTION)
+
+                for future in done:
+                    test = pending.pop(future)
+                    error = future.exception()
+
+                    if error is not None:
+                        # only raised by `test.run()` in fail fast mode
+                        for remaining in pending:
+                            remaining.cancel()
+
+                        raise error
+
+                    self.pbar_description.value = (
+                        f"Completed {test.test_type}: {test.name}"
+                    )
+                    self.pbar.value += 1
+
+    def run(self, send: bool = True, fail_fast: bool = False, max_workers: int = None):
         """Runs the test suite, renders the summary and sends the results to ValidMind
 
         Args:
@@ -171,20 +254,30 @@ class TestSuiteRunner:
                 Defaults to True.
             fail_fast (bool, optional): Whether to stop running tests after the first
                 failure. Defaults to False.
+            max_workers (int, optional): The number of threads used to run tests in
+                parallel. Tests are run one after the other when not set or set to 1.
+                Defaults to None.
         """
         self._start_progress_bar(send=send)
 
+        tests = []
         for section in self.suite.sections:
             for test in section.tests:
                 if test._test_class is None:
                     self.pbar.value += 1
                     continue
 
-                self.pbar_description.value = f"Running {test.test_type}: {test.name}"
-                test.run(fail_fast=fail_fast)
-                self.pbar.value += 1
+                tests.append(test)
+
+        if max_workers and max_workers > 1:
+            self._run_tests_parallel(tests, max_workers, fail_fast=fail_fast)
+        else:
+            self._run_tests(tests, fail_fast=fail_fast)
 
         if send:
+            # inputs logged in the background are awaited by the tests that use them
+            # (see `TestSuiteTest.log_async`) so waiting here keeps the loop unblocked
+            wait_for_background_tasks()
             run_async(self.log_results)
             run_async_check(self._check_progress)
 
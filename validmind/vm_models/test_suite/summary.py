@@ -5,13 +5,13 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-import ipywidgets as widgets
-
 from ...logging import get_logger
-from ...utils import display, md_to_html
+from ...utils import display, lazy_import, md_to_html
 from ..test.result_wrapper import FailedResultWrapper
 from .test_suite import TestSuiteSection, TestSuiteTest
 
+widgets = lazy_import("ipywidgets")
+
 logger = get_logger(__name__)
 
 
@@ -29,7 +29,7 @@ class TestSuiteSectionSummary:
     tests: List[TestSuiteTest]
     description: Optional[str] = None
 
-    _widgets: List[widgets.Widget] = None
+    _widgets: List["widgets.Widget"] = None
 
     def __post_init__(self):
         self._build_summary()
@@ -79,7 +79,7 @@ class TestSuiteSummary:
     sections: List[TestSuiteSection]
     show_link: bool = True
 
-    _widgets: List[widgets.Widget] = None
+    _widgets: List["widgets.Widget"] = None
 
     def __post_init__(self):
         self._build_summary()
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0 AND ValidMind Commercial
 
 from ...errors import should_raise_on_fail_fast
+from ...input_registry import input_registry
 from ...logging import get_logger, log_performance
 from ...tests import LoadTestError
 from ...tests import load_test as load_test_class
@@ -90,6 +91,13 @@ class TestSuiteTest:
                 result_id=self.test_id,
             )
 
+    def _get_context(self) -> TestContext:
+        # tests loaded without a context still get one so they can use artifacts
+        if self._test_instance.context is None:
+            self._test_instance.context = TestContext()
+
+        return self._test_instance.context
+
     def run(self, fail_fast: bool = False):
         """Run the test"""
         if not self._test_instance:
@@ -100,11 +108,12 @@ class TestSuiteTest:
             self._test_instance.validate_inputs()
 
             # run the test and log the performance if LOG_LEVEL is set to DEBUG
-            log_performance(
-                func=self._test_instance.run,
-                name=self.test_id,
-                logger=logger,
-            )()  # this is a decorator so we need to call it
+            with self._get_context().activate():
+                log_performance(
+                    func=self._test_instance.run,
+                    name=self.test_id,
+                    logger=logger,
+                )()  # this is a decorator so we need to call it
 
         except Exception as e:
             if fail_fast and should_raise_on_fail_fast(e):
@@ -149,4 +158,7 @@ class TestSuiteTest:
         if not self.result:
             raise ValueError("Cannot log test result before running the test")
 
+        # make sure the inputs are logged before the result that references them
+        input_registry.wait_until_logged(getattr(self.result, "inputs", None))
+
         await self.result.log_async()